@@ -1,5 +1,20 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+# Nicht benötigte Module gar nicht erst einpacken: kleineres Bundle, weniger
+# zu entpacken/scannen beim Kaltstart. Dashboard, Button-Manager & Co. werden
+# zur Laufzeit lazy importiert – PyInstaller findet sie trotzdem (Analyse
+# erfasst auch Imports innerhalb von Funktionen).
+EXCLUDES = [
+    'tkinter', 'unittest', 'test', 'lib2to3', 'pydoc_data',
+    'tests', 'benchmarks', 'pytest', 'pytestqt',
+    'PySide6.QtQml', 'PySide6.QtQuick', 'PySide6.QtQuickWidgets', 'PySide6.QtQuick3D',
+    'PySide6.QtWebEngineCore', 'PySide6.QtWebEngineWidgets', 'PySide6.QtWebChannel',
+    'PySide6.QtMultimedia', 'PySide6.QtMultimediaWidgets', 'PySide6.QtCharts',
+    'PySide6.QtDataVisualization', 'PySide6.QtPdf', 'PySide6.QtPdfWidgets',
+    'PySide6.QtSql', 'PySide6.QtBluetooth', 'PySide6.QtPositioning', 'PySide6.QtLocation',
+    'PySide6.Qt3DCore', 'PySide6.Qt3DRender', 'PySide6.Qt3DExtras', 'PySide6.QtDesigner',
+]
+
 
 a = Analysis(
     ['main.py'],
@@ -10,7 +25,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=EXCLUDES,
     noarchive=False,
     optimize=0,
 )
@@ -25,7 +40,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,              # UPX-gepackte Qt-DLLs kosten beim Start Entpackzeit
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -38,7 +53,7 @@ coll = COLLECT(
     a.binaries,
     a.datas,
     strip=False,
-    upx=True,
+    upx=False,
     upx_exclude=[],
     name='MasterGUI',
 )
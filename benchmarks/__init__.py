@@ -0,0 +1,17 @@
+"""
+benchmarks
+==========
+
+Reproduzierbare Last-Benchmarks (kein Teil der normalen Testsuite).
+
+* ``benchmarks.synthetic``    – erzeugt Configs mit beliebig vielen Buttons,
+  Menütiefe und Fan-out.
+* ``benchmarks.bench_config`` – misst Laden/Speichern/Löschen, Aufbau von
+  MasterWindow und ButtonManager sowie Navigation (offscreen) und vergleicht
+  mit ``benchmarks/baseline_config.json``.
+
+Aufruf::
+
+    python -m benchmarks.bench_config --sizes 100 1000 --out bench.json
+    python -m benchmarks.bench_config --update-baseline
+"""
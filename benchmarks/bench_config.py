@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+benchmarks.bench_config
+=======================
+Skalierungs-Benchmark für Config-Verarbeitung und Button-Oberfläche.
+
+Pro Größe und Menüform (``flach``/``tief``) werden gemessen:
+
+* ``load_config``        – inkl. Schema-Validierung (Cache geleert)
+* ``load_config_cached`` – Validierung per Hash-Cache übersprungen
+* ``save_config``
+* ``delete_button_recursive`` – erstes Top-Level-Menü samt Unterbaum
+* ``master_window``      – MasterWindow-Konstruktion (offscreen)
+* ``rebuild_pages``      – erneuter Seitenaufbau
+* ``navigate``           – 20× Menü öffnen/zurück bzw. blättern (Summe)
+* ``button_manager``     – ButtonManager samt Baum
+
+Gemessen wird das Minimum aus ``--repeat`` Läufen. Ergebnisse gehen als
+JSON nach ``--out``; mit ``--baseline`` wird verglichen und bei einer
+Verschlechterung über ``--threshold`` (relativ, plus 5 ms Rauschgrenze)
+mit Exitcode 1 beendet.
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks.synthetic import make_config  # noqa: E402
+
+SIZES = (100, 1_000, 10_000, 100_000)
+# Menüform → (Tiefe, Fan-out)
+SHAPES = {"flach": (1, 32), "tief": (6, 4)}
+# UI-Messungen darüber überspringen (MasterWindow baut alle Seiten vorab)
+UI_MAX = 10_000
+BASELINE = Path(__file__).with_name("baseline_config.json")
+THRESHOLD = 0.30
+NOISE_S = 0.005
+NAV_STEPS = 20
+
+Results = Dict[str, Dict[str, Optional[float]]]
+
+
+def _best(fn: Callable[[], None], repeat: int, setup: Callable[[], None] | None = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+# -------------------------------------------------------------------
+def bench_storage(cfg: dict, repeat: int, workdir: Path) -> Dict[str, float]:
+    from core import storage
+
+    path = workdir / "config.json"
+    saved_cache = storage._VALID_CACHE
+    storage._VALID_CACHE = workdir / ".cache" / "config_valid.sha1"   # Repo-Cache nicht anfassen
+    try:
+        return _bench_storage(storage, cfg, path, repeat)
+    finally:
+        storage._VALID_CACHE = saved_cache
+
+
+def _bench_storage(storage, cfg: dict, path: Path, repeat: int) -> Dict[str, float]:
+    storage.save_config(path, copy.deepcopy(cfg))
+
+    def clear_cache() -> None:
+        storage._VALID_CACHE.unlink(missing_ok=True)
+
+    out = {
+        "load_config": _best(lambda: storage.load_config(path), repeat, clear_cache),
+        "load_config_cached": _best(lambda: storage.load_config(path), repeat),
+        "save_config": _best(lambda: storage.save_config(path, cfg), repeat),
+    }
+    first_menu = next((b["id"] for b in cfg["buttons"] if b["action"] == "MENU"), None)
+    if first_menu is not None:
+        work: List[dict] = []
+        out["delete_button_recursive"] = _best(
+            lambda: storage.delete_button_recursive(work[-1], first_menu),
+            repeat,
+            lambda: work.append(copy.deepcopy(cfg)),
+        )
+    return out
+
+
+def bench_ui(cfg: dict, repeat: int, workdir: Path) -> Dict[str, float]:
+    from PySide6.QtWidgets import QApplication
+
+    from ui.button_manager import ButtonManager
+    from ui.master_window import MasterWindow
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    windows: list = []
+
+    def build() -> None:
+        windows.append(MasterWindow(cfg, workdir / "config.json"))
+
+    def dispose() -> None:
+        while windows:
+            windows.pop().deleteLater()
+        app.processEvents()
+
+    out = {"master_window": _best(build, repeat, dispose)}
+    mw = windows[-1]
+    out["rebuild_pages"] = _best(mw._rebuild_pages, repeat)
+
+    menus = [b for b in cfg["buttons"] if b["action"] == "MENU" and b["parent"] is None]
+
+    def navigate() -> None:
+        for i in range(NAV_STEPS):
+            if menus:
+                mw._on_click(menus[i % len(menus)])
+                mw._on_next_clicked()
+                mw._go_back()
+            else:
+                mw._on_next_clicked()
+                mw._on_prev_clicked()
+    out["navigate"] = _best(navigate, repeat, mw._go_home)
+    dispose()
+
+    managers: list = []
+    out["button_manager"] = _best(
+        lambda: managers.append(ButtonManager(cfg, workdir / "config.json")), repeat,
+    )
+    for m in managers:
+        m.deleteLater()
+    app.processEvents()
+    return out
+
+
+def run(sizes=SIZES, shapes=tuple(SHAPES), repeat: int = 3, ui_max: int = UI_MAX,
+        log: Callable[[str], None] = print) -> Results:
+    results: Results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("MGUI_LOG_DIR", str(Path(tmp) / "logs"))
+        for n in sizes:
+            for shape in shapes:
+                depth, fanout = SHAPES[shape]
+                cfg = make_config(n, depth=depth, fanout=fanout)
+                key = f"{n}/{shape}"
+                row: Dict[str, Optional[float]] = dict(bench_storage(cfg, repeat, Path(tmp)))
+                if n <= ui_max:
+                    row.update(bench_ui(cfg, repeat, Path(tmp)))
+                results[key] = row
+                log(f"{key:>12}  " + "  ".join(f"{k}={v * 1000:0.1f}ms" for k, v in row.items()))
+    return results
+
+
+def compare(current: Results, baseline: Results, threshold: float = THRESHOLD) -> List[str]:
+    """Liste der Regressionen (leer = alles im Rahmen)."""
+    problems = []
+    for key, row in current.items():
+        for name, value in row.items():
+            base = baseline.get(key, {}).get(name)
+            if value is None or base is None:
+                continue
+            if value > base * (1 + threshold) and value - base > NOISE_S:
+                problems.append(f"{key} {name}: {value * 1000:0.1f} ms "
+                                f"(Baseline {base * 1000:0.1f} ms, +{(value / base - 1) * 100:0.0f}%)")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    ap.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--ui-max", type=int, default=UI_MAX,
+                    help="UI-Messungen nur bis zu dieser Button-Anzahl")
+    ap.add_argument("--out", type=Path, help="Ergebnisse als JSON schreiben")
+    ap.add_argument("--baseline", type=Path, default=BASELINE)
+    ap.add_argument("--threshold", type=float, default=THRESHOLD)
+    ap.add_argument("--update-baseline", action="store_true",
+                    help="Ergebnisse als neue Baseline speichern statt zu vergleichen")
+    args = ap.parse_args(argv)
+
+    results = run(args.sizes, args.shapes, args.repeat, args.ui_max)
+    doc = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.out:
+        args.out.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+        print(f"Baseline geschrieben: {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"Keine Baseline ({args.baseline}) – Vergleich übersprungen.")
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    problems = compare(results, baseline, args.threshold)
+    for p in problems:
+        print("REGRESSION:", p)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+benchmarks.bench_runner
+=======================
+Durchsatz- und Reaktionszeit-Harness für ScriptRunner + Task-Dashboard.
+
+``run``: startet N Jobs gleichzeitig (benchmarks.gen_output als Skript) über
+``core.runner.start_local`` – derselbe Weg wie ein Button-Klick – mit
+sichtbarem Dashboard (offscreen) und misst:
+
+* ``lines_per_s``      – im GUI-Thread angekommene Zeilen / Wandzeit
+* ``log_mb_per_s``     – geschriebene Log-Bytes / Wandzeit
+* ``signal_latency``   – Zeitstempel in der Zeile → Ankunft im GUI-Slot (p50/p95/p99/max)
+* ``loop_lag``         – Verspätung eines 10-ms-Timers im GUI-Thread (p50/p95/max)
+
+``record``: führt ein echtes Skript aus und speichert seine Ausgabe samt
+Zeitabständen (JSONL). ``run --replay`` spielt sie in jedem Job identisch
+ab – so lassen sich Runner-Varianten mit derselben Last vergleichen.
+
+Beispiele::
+
+    python -m benchmarks.bench_runner run --jobs 8 --lines 50000 --out runner.json
+    python -m benchmarks.bench_runner run --jobs 4 --rate 2000 --size 200
+    python -m benchmarks.bench_runner record mein_skript.py aufnahme.jsonl
+    python -m benchmarks.bench_runner run --jobs 4 --replay aufnahme.jsonl --speed 0
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from core.metrics import LATENCY_BUCKETS, Histogram  # noqa: E402
+from core.progress_protocol import ENV_FLAG  # noqa: E402
+from util.paths import project_root  # noqa: E402
+
+# Messintervall für die Event-Loop-Verzögerung
+LAG_PROBE_MS = 10
+# Abbruch, falls Jobs hängen
+TIMEOUT_S = 600
+
+
+# -------------------------------------------------------------------
+# Aufzeichnen
+# -------------------------------------------------------------------
+def record(script: Path, out: Path) -> int:
+    """Führt ``script`` aus und speichert jede Zeile mit Zeitpunkt; liefert die Zeilenzahl."""
+    env = os.environ.copy()
+    env[ENV_FLAG] = "1"
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(project_root()), env.get("PYTHONPATH")) if p)
+    start = time.monotonic()
+    n = 0
+    with subprocess.Popen([sys.executable, str(script)], stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, text=True, env=env) as proc, \
+            Path(out).open("w", encoding="utf-8") as f:
+        for line in proc.stdout:                 # type: ignore[union-attr]
+            f.write(json.dumps([round(time.monotonic() - start, 6), line.rstrip("\n")],
+                               ensure_ascii=False) + "\n")
+            n += 1
+    return n
+
+
+# -------------------------------------------------------------------
+# Last fahren
+# -------------------------------------------------------------------
+def _generator_script(workdir: Path, args: List[str]) -> Path:
+    path = workdir / "gen_job.py"
+    path.write_text(
+        "import sys\n"
+        "from benchmarks.gen_output import main\n"
+        f"sys.exit(main({args!r}))\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _summary(hist: Histogram) -> Dict[str, Optional[float]]:
+    return {
+        "p50": hist.quantile(0.5),
+        "p95": hist.quantile(0.95),
+        "p99": hist.quantile(0.99),
+        "max": hist.max(),
+        "samples": hist.count(),
+    }
+
+
+def run_load(jobs: int = 4, lines: int = 20_000, size: int = 80, rate: float = 0.0,
+             progress_every: int = 100, replay: Optional[Path] = None, speed: float = 1.0,
+             pool: Optional[int] = None, dashboard: bool = True) -> Dict[str, object]:
+    from PySide6.QtCore import QEventLoop, QObject, Qt, QThreadPool, QTimer, Slot
+    from PySide6.QtWidgets import QApplication
+
+    from core.dispatcher import dispatcher
+    from core.log_manager import log_manager
+    from core.log_search import log_index
+    from core.runner import start_local
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    latency = Histogram("bench_signal_latency_seconds", "", buckets=LATENCY_BUCKETS)
+    lag = Histogram("bench_loop_lag_seconds", "", buckets=LATENCY_BUCKETS)
+
+    class Collector(QObject):
+        """Lebt im GUI-Thread – Signale aus den Workern kommen also gequeued an."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.ids: set = set()
+            self.lines = 0
+            self.done = 0
+            self.loop = QEventLoop()
+
+        @Slot(str, int, str)
+        def on_progress(self, job_id: str, _pct: int, msg: str) -> None:
+            if job_id not in self.ids:
+                return
+            head = msg.split(" ", 2)
+            if len(head) < 3 or not head[0].isdigit():
+                return                           # Start-/Endmeldungen des Runners
+            self.lines += 1
+            try:
+                latency.observe(max(0.0, time.time() - float(head[1])))
+            except ValueError:
+                pass
+
+        @Slot(str, str)
+        def on_error(self, job_id: str, _err: str) -> None:
+            self.on_end(job_id)
+
+        @Slot(str)
+        def on_end(self, job_id: str) -> None:
+            if job_id in self.ids:
+                self.done += 1
+                if self.done >= len(self.ids):
+                    self.loop.quit()
+
+    saved_pool = QThreadPool.globalInstance().maxThreadCount()
+    QThreadPool.globalInstance().setMaxThreadCount(max(saved_pool, pool or jobs))
+    saved_log_dir = os.environ.get("MGUI_LOG_DIR")
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        os.environ["MGUI_LOG_DIR"] = str(workdir / "logs")
+        if replay is not None:
+            gen_args = ["--replay", str(Path(replay).resolve()), "--speed", str(speed)]
+        else:
+            gen_args = ["--lines", str(lines), "--size", str(size),
+                        "--progress-every", str(progress_every)]
+        if rate:
+            gen_args += ["--rate", str(rate)]
+        script = _generator_script(workdir, gen_args)
+
+        dash = None
+        if dashboard:
+            from ui.task_dashboard import TaskDashboard
+            dash = TaskDashboard()
+            dash.show()
+
+        collector = Collector()
+        dispatcher.job_progress.connect(collector.on_progress, Qt.QueuedConnection)
+        for sig in (dispatcher.job_finished, dispatcher.job_aborted):
+            sig.connect(collector.on_end, Qt.QueuedConnection)
+        dispatcher.job_error.connect(collector.on_error, Qt.QueuedConnection)
+
+        due = [time.monotonic() + LAG_PROBE_MS / 1000]
+
+        def probe() -> None:
+            now = time.monotonic()
+            lag.observe(max(0.0, now - due[0]))
+            due[0] = now + LAG_PROBE_MS / 1000
+        probe_timer = QTimer()
+        probe_timer.setTimerType(Qt.PreciseTimer)
+        probe_timer.setInterval(LAG_PROBE_MS)
+        probe_timer.timeout.connect(probe)
+        QTimer.singleShot(TIMEOUT_S * 1000, collector.loop.quit)
+
+        t0 = time.perf_counter()
+        for i in range(jobs):
+            job_id = f"bench-{i}"
+            collector.ids.add(job_id)
+            start_local(job_id, script)
+        due[0] = time.monotonic() + LAG_PROBE_MS / 1000
+        probe_timer.start()
+        collector.loop.exec()
+        wall = time.perf_counter() - t0
+        probe_timer.stop()
+        app.processEvents()
+
+        log_bytes = sum(p.stat().st_size for p in log_manager.root.glob("bench-*.log*"))
+        dispatcher.job_progress.disconnect(collector.on_progress)
+        for sig in (dispatcher.job_finished, dispatcher.job_aborted):
+            sig.disconnect(collector.on_end)
+        dispatcher.job_error.disconnect(collector.on_error)
+        if dash is not None:
+            dash.close()
+            dash.deleteLater()
+        log_index.flush()
+        log_index.close()                        # DB liegt im Temp-Verzeichnis
+        if saved_log_dir is None:
+            os.environ.pop("MGUI_LOG_DIR", None)
+        else:
+            os.environ["MGUI_LOG_DIR"] = saved_log_dir
+    QThreadPool.globalInstance().setMaxThreadCount(saved_pool)
+
+    return {
+        "jobs": jobs,
+        "completed": collector.done,
+        "lines": collector.lines,
+        "wall_s": wall,
+        "lines_per_s": collector.lines / wall if wall else None,
+        "log_mb_per_s": log_bytes / wall / 1e6 if wall else None,
+        "signal_latency": _summary(latency),
+        "loop_lag": _summary(lag),
+    }
+
+
+def _print(result: Dict[str, object]) -> None:
+    def ms(v) -> str:
+        return "–" if v is None else f"{v * 1000:0.1f} ms"
+    lat, lag = result["signal_latency"], result["loop_lag"]
+    print(f"Jobs {result['completed']}/{result['jobs']}  Zeilen {result['lines']}  "
+          f"Dauer {result['wall_s']:0.2f} s")
+    print(f"Durchsatz        {result['lines_per_s']:0.0f} Zeilen/s, "
+          f"Log {result['log_mb_per_s']:0.2f} MB/s")
+    print(f"Signal-Latenz    p50 {ms(lat['p50'])}  p95 {ms(lat['p95'])}  "
+          f"p99 {ms(lat['p99'])}  max {ms(lat['max'])}")
+    print(f"Event-Loop-Lag   p50 {ms(lag['p50'])}  p95 {ms(lag['p95'])}  max {ms(lag['max'])}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Runner-Durchsatz und GUI-Reaktionszeit messen")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="Last fahren und messen")
+    r.add_argument("--jobs", type=int, default=4)
+    r.add_argument("--lines", type=int, default=20_000, help="Zeilen pro Job")
+    r.add_argument("--size", type=int, default=80, help="Zeichen pro Zeile")
+    r.add_argument("--rate", type=float, default=0.0, help="Zeilen/s pro Job (0 = unbegrenzt)")
+    r.add_argument("--progress-every", type=int, default=100)
+    r.add_argument("--replay", type=Path, help="Aufzeichnung statt synthetischer Zeilen")
+    r.add_argument("--speed", type=float, default=1.0, help="Abspielfaktor (0 = ohne Pausen)")
+    r.add_argument("--pool", type=int, help="Threads im Pool (Standard: --jobs)")
+    r.add_argument("--no-dashboard", action="store_true")
+    r.add_argument("--out", type=Path, help="Ergebnis als JSON schreiben")
+
+    rec = sub.add_parser("record", help="Ausgabe eines Skripts aufzeichnen")
+    rec.add_argument("script", type=Path)
+    rec.add_argument("out", type=Path)
+
+    args = ap.parse_args(argv)
+    if args.cmd == "record":
+        print(f"{record(args.script, args.out)} Zeilen aufgezeichnet → {args.out}")
+        return 0
+
+    result = run_load(args.jobs, args.lines, args.size, args.rate, args.progress_every,
+                      args.replay, args.speed, args.pool, not args.no_dashboard)
+    _print(result)
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0 if result["completed"] == result["jobs"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+benchmarks.gen_output
+=====================
+Lastgenerator als Job-Skript: schreibt Zeilen mit einstellbarer Rate,
+Länge und Fortschrittsmarken nach stdout – oder spielt eine mit
+``benchmarks.bench_runner record`` aufgezeichnete Ausgabe wieder ab.
+
+Jede Zeile beginnt mit ``<laufnummer> <time.time()>``; daraus misst der
+Harness die Latenz bis zur Ankunft im GUI-Thread. Fortschrittsmarken
+enden auf ``<n>%`` (Freitext-Erkennung von core.job).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+# stdout spätestens so oft leeren (Sekunden) – wie ein Skript mit print(flush=…)
+FLUSH_S = 0.02
+
+
+def synthetic(lines: int, size: int, progress_every: int) -> Iterator[Tuple[float, str]]:
+    """(Soll-Zeitpunkt relativ, Text) – Zeitpunkt 0 = so schnell wie möglich."""
+    filler = ("lorem ipsum dolor sit amet " * (size // 27 + 1))[:max(0, size)]
+    for i in range(lines):
+        if progress_every and i % progress_every == progress_every - 1:
+            yield 0.0, f"Schritt {i + 1}/{lines} {(i + 1) * 100 // lines}%"
+        else:
+            yield 0.0, filler
+
+
+def recorded(path: Path, speed: float) -> Iterator[Tuple[float, str]]:
+    """Aufzeichnung (JSONL ``[t, zeile]``); ``speed`` 0 = ohne Pausen."""
+    with Path(path).open(encoding="utf-8") as f:
+        for raw in f:
+            t, line = json.loads(raw)
+            yield (t / speed if speed else 0.0), line
+
+
+def emit(source: Iterator[Tuple[float, str]], rate: float = 0.0) -> int:
+    """Gibt die Zeilen aus; ``rate`` > 0 begrenzt auf Zeilen/s. Liefert die Anzahl."""
+    out = sys.stdout
+    start = last_flush = time.monotonic()
+    n = 0
+    for due, text in source:
+        if rate:
+            due = max(due, n / rate)
+        wait = start + due - time.monotonic()
+        if wait > 0:
+            out.flush()
+            time.sleep(wait)
+        out.write(f"{n} {time.time():.6f} {text}\n")
+        n += 1
+        now = time.monotonic()
+        if now - last_flush >= FLUSH_S:
+            out.flush()
+            last_flush = now
+    out.flush()
+    return n
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Lastgenerator für bench_runner")
+    ap.add_argument("--lines", type=int, default=10_000)
+    ap.add_argument("--size", type=int, default=80, help="Zeichen pro Zeile")
+    ap.add_argument("--rate", type=float, default=0.0, help="Zeilen/s (0 = unbegrenzt)")
+    ap.add_argument("--progress-every", type=int, default=100)
+    ap.add_argument("--replay", type=Path, help="Aufzeichnung statt synthetischer Zeilen")
+    ap.add_argument("--speed", type=float, default=1.0,
+                    help="Abspielgeschwindigkeit der Aufzeichnung (0 = ohne Pausen)")
+    args = ap.parse_args(argv)
+    if args.replay:
+        emit(recorded(args.replay, args.speed), args.rate)
+    else:
+        emit(synthetic(args.lines, args.size, args.progress_every), args.rate)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+benchmarks.synthetic
+====================
+Synthetische config.json-Inhalte für Benchmarks: ``n`` Buttons, davon etwa
+ein Zehntel MENUs in bis zu ``depth`` Ebenen mit je ``fanout`` Untermenüs;
+die übrigen (SCRIPT/LINK/FOLDER) werden reihum auf alle Ebenen verteilt.
+Deterministisch – gleiche Parameter, gleiche Config.
+"""
+from __future__ import annotations
+
+import itertools
+from typing import List, Optional
+
+LEAF_ACTIONS = ("SCRIPT", "LINK", "FOLDER")
+
+
+def make_config(n: int, depth: int = 3, fanout: int = 8, menu_ratio: float = 0.1) -> dict:
+    buttons: List[dict] = []
+    menu_budget = max(1, int(n * menu_ratio)) if depth > 0 else 0
+    menus: List[Optional[str]] = [None]          # None = Startseite
+    frontier: List[Optional[str]] = [None]
+    for level in range(depth):
+        nxt: List[Optional[str]] = []
+        for parent in frontier:
+            for _ in range(fanout):
+                if len(buttons) >= menu_budget:
+                    break
+                btn_id = f"menu_{len(buttons)}"
+                buttons.append(_button(btn_id, "MENU", parent))
+                nxt.append(btn_id)
+        menus.extend(nxt)
+        frontier = nxt
+        if not nxt:
+            break
+
+    parents = itertools.cycle(menus)
+    for i in range(len(buttons), n):
+        action = LEAF_ACTIONS[i % len(LEAF_ACTIONS)]
+        buttons.append(_button(f"btn_{i}", action, next(parents)))
+
+    return {
+        "buttons": buttons,
+        "theme": {"stylesheet": "", "background": ""},
+        "window_title": f"Benchmark {n}",
+    }
+
+
+def _button(btn_id: str, action: str, parent: Optional[str]) -> dict:
+    btn = {
+        "id": btn_id,
+        "label": btn_id,
+        "action": action,
+        "icon": "",
+        "parent": parent,
+        "description": f"Synthetischer Button {btn_id}",
+    }
+    if action == "SCRIPT":
+        btn["payload"] = f"scripts/{btn_id}.py"
+    elif action == "LINK":
+        btn["payload"] = f"https://example.invalid/{btn_id}"
+    elif action == "FOLDER":
+        btn["payload"] = "scripts"
+    return btn
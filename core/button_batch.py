@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+core.button_batch
+=================
+
+Sammel-Änderungen an ``config["buttons"]`` als *eine* Transaktion (Qt-frei):
+Import aus CSV/JSON, Mehrfach-Bearbeitung (Icon, Aktion, Parent …) und
+Löschen mehrerer Buttons::
+
+    batch = ButtonBatch(config)
+    batch.add(read_import(Path("tools.csv")))
+    batch.edit(["Export", "Upload"], icon="assets/icons/cloud.png")
+    batch.commit(cfg_path)          # prüfen, einmal speichern
+
+Alle Schritte arbeiten auf einer Kopie der Button-Liste. Erst ``commit()``
+prüft das Ergebnis – Schema sowie Baum (Parent existiert und ist MENU,
+keine Zyklen, Buttons mit Unterpunkten bleiben MENU) – und speichert genau
+einmal. Schlägt etwas fehl, bleibt die Config unverändert (BatchError mit
+allen gefundenen Problemen).
+
+Import-Formate:
+
+* **CSV** (Trennzeichen ``,`` ``;`` oder Tab, UTF-8 auch mit BOM wie aus
+  Excel): Spalten ``id, action, payload, icon, parent, label,
+  description, row, col`` – nur ``id`` und ``action`` sind Pflicht, leere
+  Zellen gelten als nicht angegeben.
+* **JSON**: Liste von Buttons oder ``{"buttons": [...]}`` (wie config.json).
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from core import storage
+from core.button_index import ButtonIndex
+from core.storage import StorageError
+
+DEFAULT_ICON = "assets/icons/placeholder.png"       # wie im Button-Editor
+CSV_COLUMNS = ("id", "action", "payload", "icon", "parent", "label", "description", "row", "col")
+# per Sammel-Bearbeitung änderbar (ID nicht – sie ist zugleich Referenz der Kinder)
+EDITABLE = ("label", "action", "payload", "icon", "parent", "description", "limits")
+# so viele Probleme stehen in der Fehlermeldung, der Rest nur als Anzahl
+MAX_SHOWN = 20
+
+
+class BatchError(StorageError):
+    """Import/Transaktion abgelehnt; ``problems`` enthält alle Fundstellen."""
+
+    def __init__(self, problems: List[str]) -> None:
+        self.problems = problems
+        text = "\n".join(problems[:MAX_SHOWN])
+        if len(problems) > MAX_SHOWN:
+            text += f"\n… und {len(problems) - MAX_SHOWN} weitere"
+        super().__init__(text)
+
+
+# -------------------------------------------------------------------
+# Import-Dateien lesen
+# -------------------------------------------------------------------
+def read_import(path: Path) -> List[dict]:
+    """CSV/JSON lesen, normalisieren und je Eintrag prüfen; wirft BatchError."""
+    path = Path(path)
+    try:
+        text = path.read_text(encoding="utf-8-sig")
+    except (OSError, UnicodeDecodeError) as exc:
+        raise BatchError([f"{path.name}: {exc}"])
+    if path.suffix.lower() == ".json":
+        rows = _json_rows(text, path.name)
+    else:
+        rows = _csv_rows(text, path.name)
+
+    validator = _button_validator()
+    buttons, problems = [], []
+    for where, raw in rows:
+        btn = _canonical(raw)
+        errors = sorted(validator.iter_errors(_with_defaults(btn)), key=lambda e: list(e.path))
+        if errors:
+            problems.extend(f"{where}: {_describe(e)}" for e in errors)
+        else:
+            buttons.append(btn)
+    if problems:
+        raise BatchError(problems)
+    return buttons
+
+
+def _json_rows(text: str, name: str) -> List[tuple]:
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise BatchError([f"{name}: {exc}"])
+    if isinstance(data, dict):
+        data = data.get("buttons")
+    if not isinstance(data, list):
+        raise BatchError([f"{name}: erwartet eine Liste von Buttons oder {{\"buttons\": [...]}}"])
+    rows = []
+    for i, item in enumerate(data, 1):
+        if not isinstance(item, dict):
+            raise BatchError([f"Eintrag {i}: kein Objekt"])
+        rows.append((f"Eintrag {i}", item))
+    return rows
+
+
+def _csv_rows(text: str, name: str) -> List[tuple]:
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(io.StringIO(text), dialect=dialect)
+    header = [c.strip().lower() for c in reader.fieldnames or ()]
+    unknown = [c for c in header if c and c not in CSV_COLUMNS]
+    if unknown or "id" not in header:
+        problems = [f"{name}: unbekannte Spalte '{c}'" for c in unknown]
+        if "id" not in header:
+            problems.append(f"{name}: Spalte 'id' fehlt")
+        raise BatchError(problems)
+    reader.fieldnames = header
+    rows = []
+    for record in reader:
+        values = {k: (v or "").strip() for k, v in record.items() if k}
+        if not any(values.values()):
+            continue                                  # Leerzeile
+        # Zeile 1 = Kopfzeile; line_num zählt auch Umbrüche in Zellen mit
+        rows.append((f"Zeile {reader.line_num}", _from_csv(values)))
+    return rows
+
+
+def _from_csv(values: Dict[str, str]) -> dict:
+    btn: dict = {k: v for k, v in values.items() if v and k not in ("row", "col")}
+    if values.get("row") or values.get("col"):
+        btn["position"] = {
+            "row": _int_or_text(values.get("row", "")),
+            "col": _int_or_text(values.get("col", "")),
+        }
+    return btn
+
+
+def _int_or_text(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return value                                  # Schema meldet den Fehler
+
+
+def _canonical(raw: dict) -> dict:
+    """Schreibweisen vereinheitlichen – nur Felder, die der Import enthält."""
+    btn = dict(raw)
+    if isinstance(btn.get("action"), str):
+        btn["action"] = btn["action"].strip().upper()
+    if "parent" in btn and not btn["parent"]:
+        btn["parent"] = None
+    return btn
+
+
+def _with_defaults(btn: dict) -> dict:
+    """Fehlende Felder wie der Button-Editor ergänzen (neue Buttons)."""
+    btn = dict(btn)
+    if isinstance(btn.get("id"), str):
+        btn.setdefault("label", btn["id"])
+    btn.setdefault("icon", DEFAULT_ICON)
+    btn.setdefault("parent", None)
+    if btn.get("action") == "MENU":
+        btn["payload"] = ""
+    return btn
+
+
+def _button_validator():
+    from jsonschema.validators import validator_for     # teuer → erst hier
+    schema = storage.SCHEMA["definitions"]["button"]
+    return validator_for(storage.SCHEMA)(schema)
+
+
+def _describe(error) -> str:
+    field = ".".join(str(p) for p in error.path)
+    return f"{field}: {error.message}" if field else error.message
+
+
+# -------------------------------------------------------------------
+# Transaktion
+# -------------------------------------------------------------------
+class ButtonBatch:
+    def __init__(self, config: dict) -> None:
+        self._config = config
+        # flache Kopien: Änderungen ersetzen Felder, verschachtelte Dicts bleiben geteilt
+        self.buttons: List[dict] = [dict(b) for b in config["buttons"]]
+        self.index = ButtonIndex(self.buttons)
+        self._touched: List[dict] = []
+        self._problems: List[str] = []
+        self.added = self.updated = self.deleted = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def add(self, buttons: Iterable[dict], update_existing: bool = False) -> None:
+        """
+        Buttons anhängen. ``update_existing``: vorhandene ID → nur die
+        angegebenen Felder übernehmen (wie ``edit``).
+        """
+        for btn in buttons:
+            current = self.index.get(btn["id"]) if update_existing else None
+            if current is not None:
+                self._apply(current, {k: v for k, v in btn.items() if k != "id"})
+                self._touched.append(current)
+                self.updated += 1
+            else:
+                new = _with_defaults(btn)
+                self.buttons.append(new)
+                self._touched.append(new)
+                self.added += 1
+        self.index.rebuild()
+
+    def edit(self, ids: Iterable[str], **changes) -> None:
+        """
+        Felder für alle ``ids`` setzen (erster Treffer je ID); ``None``
+        entfernt ein optionales Feld, bei ``parent`` heißt es Startebene.
+        """
+        unknown = sorted(set(changes) - set(EDITABLE))
+        if unknown:
+            raise ValueError(f"nicht änderbar: {', '.join(unknown)}")
+        for bid in ids:
+            btn = self.index.get(bid)
+            if btn is None:
+                self._problems.append(f"'{bid}': Button nicht gefunden.")
+                continue
+            self._apply(btn, changes)
+            self._touched.append(btn)
+            self.updated += 1
+        self.index.rebuild()
+
+    def move(self, ids: Iterable[str], parent_id: Optional[str]) -> None:
+        self.edit(ids, parent=parent_id)
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Buttons samt Nachkommen löschen – ein Durchlauf für alle ``ids``."""
+        gone: set = set()
+        for bid in ids:
+            if bid not in gone:
+                gone |= self.index.subtree_ids(bid)
+        before = len(self.buttons)
+        self.buttons[:] = [b for b in self.buttons if b["id"] not in gone]
+        self.deleted += before - len(self.buttons)
+        self.index.rebuild()
+
+    def problems(self) -> List[str]:
+        """Baum-Prüfung für alle neuen/geänderten Buttons."""
+        out = list(self._problems)
+        alive = {id(b) for b in self.buttons}
+        seen: set = set()
+        for btn in self._touched:
+            if id(btn) not in alive or id(btn) in seen:
+                continue
+            seen.add(id(btn))
+            pid = btn["parent"]
+            if pid is not None:
+                parent = self.index.get(pid)
+                if parent is None:
+                    out.append(f"'{btn['id']}': Parent '{pid}' existiert nicht.")
+                elif parent["action"] != "MENU":
+                    out.append(f"'{btn['id']}': Parent '{pid}' ist kein MENU ({parent['action']}).")
+                elif self._in_own_subtree(btn):
+                    out.append(f"'{btn['id']}': kann nicht unter einen eigenen Unterpunkt verschoben werden.")
+            if (btn["action"] != "MENU" and self.index.get(btn["id"]) is btn
+                    and self.index.has_children(btn["id"])):
+                out.append(f"'{btn['id']}': hat Unterpunkte und muss MENU bleiben.")
+        return out
+
+    def commit(self, cfg_path: Path) -> None:
+        """Prüfen und einmal speichern; erst danach sieht die Config die Änderungen."""
+        problems = self.problems()
+        if problems:
+            raise BatchError(problems)
+        draft = dict(self._config, buttons=self.buttons)
+        storage.save_config(cfg_path, draft)          # Schema-Prüfung + ein Schreibvorgang
+        self._config["buttons"] = self.buttons
+
+    def summary(self) -> str:
+        return f"{self.added} neu, {self.updated} geändert, {self.deleted} gelöscht"
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _apply(btn: dict, changes: dict) -> None:
+        moved = "parent" in changes and changes["parent"] != btn["parent"]
+        for key, value in changes.items():
+            if value is None and key != "parent":
+                btn.pop(key, None)
+            else:
+                btn[key] = value
+        if btn["action"] == "MENU":
+            btn["payload"] = ""
+        if moved and "position" not in changes:
+            btn.pop("position", None)     # alte Rasterposition gilt in der neuen Ebene nicht
+
+    def _in_own_subtree(self, btn: dict) -> bool:
+        seen = set()
+        pid = btn["parent"]
+        while pid is not None and pid not in seen:
+            if pid == btn["id"]:
+                return True
+            seen.add(pid)
+            parent = self.index.get(pid)
+            pid = parent["parent"] if parent else None
+        return False
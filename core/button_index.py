@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+core.button_index
+=================
+
+Index über ``config["buttons"]`` (Qt-frei): ID → Button und
+Parent-ID → Kinder in einem Durchlauf (O(n)) statt einer Listensuche pro
+Knoten. Reihenfolge der Kinder = Reihenfolge in der Config; bei doppelten
+IDs gewinnt – wie in core.storage – der erste Treffer.
+
+Der Index ist eine Momentaufnahme: nach Änderungen an der Button-Liste
+``rebuild()`` aufrufen.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set
+
+_EMPTY: List[dict] = []
+
+
+class ButtonIndex:
+    def __init__(self, buttons: List[dict]) -> None:
+        self.rebuild(buttons)
+
+    def rebuild(self, buttons: Optional[List[dict]] = None) -> None:
+        if buttons is not None:
+            self._buttons = buttons
+        self._by_id: Dict[str, dict] = {}
+        self._children: Dict[Optional[str], List[dict]] = {}
+        for b in self._buttons:
+            self._by_id.setdefault(b["id"], b)
+            self._children.setdefault(b.get("parent"), []).append(b)
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._buttons)
+
+    def get(self, btn_id: str) -> Optional[dict]:
+        return self._by_id.get(btn_id)
+
+    def children(self, parent_id: Optional[str]) -> List[dict]:
+        """Direkte Kinder (nicht kopiert – nur lesen)."""
+        return self._children.get(parent_id, _EMPTY)
+
+    def has_children(self, parent_id: Optional[str]) -> bool:
+        return parent_id in self._children
+
+    def subtree_ids(self, btn_id: str) -> Set[str]:
+        """``btn_id`` und die IDs aller Nachkommen."""
+        found = {btn_id}
+        todo = [btn_id]
+        while todo:
+            for child in self._children.get(todo.pop(), _EMPTY):
+                if child["id"] not in found:
+                    found.add(child["id"])
+                    todo.append(child["id"])
+        return found
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+core.cli
+========
+
+Headless-Einstieg für CI/cron – ohne QApplication, ohne QtWidgets::
+
+    python -m core.cli list
+    python -m core.cli run "Backup"                 # Button-ID
+    python -m core.cli run "Tools/Backup/Nightly"   # Menü-Pfad
+    python -m core.cli run "Tools"                  # MENU → alle Skripte parallel
+    python -m core.cli pipeline Export Upload       # nacheinander, Stopp bei Fehler
+    python -m core.cli import tools.csv --update    # Buttons aus CSV/JSON übernehmen
+    python -m core.cli discover --apply gui_tools   # Buttons aus Werkzeug-Ordnern
+
+Die Ausführung läuft über core.job – dieselben Regeln für Log
+(<Projekt-Root>/logs, siehe core.log_manager), Fortschritt, Limits und
+Abbruch wie in der GUI.
+Exit-Code: 0 = alles ok, 1 = mindestens ein Job fehlgeschlagen,
+2 = Aufruf-/Config-Fehler, 130 = per Strg+C abgebrochen.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.job import Job
+from core.log_manager import log_manager
+from core.models import JobLimits
+from core.storage import StorageError, load_config
+from util.paths import project_root, to_absolute
+
+
+class CliError(Exception):
+    """Ungültige Button-Angabe o. Ä. → Exit-Code 2."""
+
+
+# -------------------------------------------------------------------
+# Buttons auflösen
+# -------------------------------------------------------------------
+def resolve_button(config: dict, ref: str) -> dict:
+    """
+    ``ref`` ist eine Button-ID oder ein Menü-Pfad „A/B/C“ ab der Startebene.
+    Bei doppelten IDs gewinnt – wie überall – der erste Treffer.
+    """
+    buttons = config["buttons"]
+    if "/" in ref:
+        parent = None
+        found = None
+        for part in ref.strip("/").split("/"):
+            found = next(
+                (b for b in buttons if b["parent"] == parent and b["id"] == part), None
+            )
+            if found is None:
+                break
+            parent = found["id"]
+        if found is not None:
+            return found
+    btn = next((b for b in buttons if b["id"] == ref), None)
+    if btn is None:
+        raise CliError(f"Button '{ref}' nicht gefunden.")
+    return btn
+
+
+def scripts_below(config: dict, menu_id: str) -> List[dict]:
+    """Alle SCRIPT-Buttons unterhalb eines MENU (rekursiv, Konfig-Reihenfolge)."""
+    result: List[dict] = []
+    seen = {menu_id}
+    todo = [menu_id]
+    while todo:
+        pid = todo.pop(0)
+        for b in config["buttons"]:
+            if b["parent"] != pid:
+                continue
+            if b["action"] == "MENU" and b["id"] not in seen:
+                seen.add(b["id"])
+                todo.append(b["id"])
+            elif b["action"] == "SCRIPT":
+                result.append(b)
+    return result
+
+
+def _job_for(btn: dict) -> Job:
+    if btn["action"] != "SCRIPT":
+        raise CliError(f"Button '{btn['id']}' ist kein SCRIPT ({btn['action']}).")
+    payload = btn.get("payload") or ""
+    if not payload:
+        raise CliError(f"Button '{btn['id']}' hat kein Skript.")
+    return Job(
+        os.urandom(8).hex(),
+        to_absolute(payload),
+        JobLimits.from_config(btn.get("limits")),
+    )
+
+
+# -------------------------------------------------------------------
+# Terminal-Ausgabe
+# -------------------------------------------------------------------
+class TerminalSink:
+    """
+    Empfängt core.job-Events. Ausgabezeilen gehen mit Präfix nach stdout;
+    auf einem TTY steht darunter eine Statuszeile mit dem Fortschritt
+    aller laufenden Jobs.
+    """
+
+    def __init__(self, quiet: bool = False, stream=None) -> None:
+        self.quiet = quiet
+        self.stream = stream or sys.stdout
+        self.tty = self.stream.isatty()
+        self._lock = threading.Lock()
+        self._names: Dict[str, str] = {}
+        self._percent: Dict[str, int] = {}
+        self._status_shown = False
+
+    def add(self, job: Job, name: str) -> None:
+        self._names[job.job_id] = name
+
+    def __call__(self, name: str, job_id: str, *args) -> None:
+        label = self._names.get(job_id, job_id)
+        with self._lock:
+            if name == "job_progress":
+                pct, msg = args
+                if pct >= 0:
+                    self._percent[job_id] = pct
+                if not self.quiet:
+                    self._line(f"[{label}] {msg}")
+                else:
+                    self._status()
+            elif name == "job_error":
+                self._percent.pop(job_id, None)
+                self._line(f"[{label}] ❌ Fehler: {args[0]}", force=True)
+            elif name in ("job_finished", "job_aborted"):
+                self._percent.pop(job_id, None)
+                if self.quiet:
+                    state = "✅ Fertig" if name == "job_finished" else "⏹ Abgebrochen"
+                    self._line(f"[{label}] {state}", force=True)
+
+    # --------------------------------
+    def _line(self, text: str, force: bool = False) -> None:
+        if self.quiet and not force:
+            return
+        if self._status_shown:
+            self.stream.write("\r\x1b[K")
+            self._status_shown = False
+        self.stream.write(text + "\n")
+        self._status()
+
+    def _status(self) -> None:
+        if not self.tty or not self._percent:
+            self.stream.flush()
+            return
+        parts = [f"{self._names.get(j, j)} {p}%" for j, p in self._percent.items()]
+        self.stream.write("\r\x1b[K" + " | ".join(parts))
+        self._status_shown = True
+        self.stream.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._status_shown:
+                self.stream.write("\r\x1b[K")
+                self._status_shown = False
+            self.stream.flush()
+
+
+# -------------------------------------------------------------------
+# Ausführung
+# -------------------------------------------------------------------
+def run_parallel(jobs: List[tuple[Job, str]], sink: TerminalSink) -> bool:
+    """Startet alle Jobs gleichzeitig; True, wenn alle mit Exitcode 0 enden."""
+    threads = []
+    for job, name in jobs:
+        sink.add(job, name)
+        t = threading.Thread(target=job.run, args=(sink,), name=f"job-{name}", daemon=True)
+        t.start()
+        threads.append(t)
+    try:
+        for t in threads:
+            while t.is_alive():
+                t.join(0.2)                  # join mit Timeout → Strg+C bleibt möglich
+    except KeyboardInterrupt:
+        for job, _ in jobs:
+            job.abort()
+        for t in threads:
+            t.join()
+        raise
+    return all(job.succeeded for job, _ in jobs)
+
+
+def run_pipeline(jobs: List[tuple[Job, str]], sink: TerminalSink) -> bool:
+    """Führt die Jobs nacheinander aus und stoppt beim ersten Fehler."""
+    for job, name in jobs:
+        if not run_parallel([(job, name)], sink):
+            return False
+    return True
+
+
+# -------------------------------------------------------------------
+def _print_tree(config: dict) -> None:
+    def walk(parent: Optional[str], depth: int, seen: set) -> None:
+        for b in config["buttons"]:
+            if b["parent"] != parent:
+                continue
+            print(f"{'  ' * depth}{b['id']}  [{b['action']}]")
+            if b["action"] == "MENU" and b["id"] not in seen:
+                walk(b["id"], depth + 1, seen | {b["id"]})
+    walk(None, 0, set())
+
+
+def _import(config: dict, args) -> int:
+    from core.button_batch import ButtonBatch, read_import
+    try:
+        batch = ButtonBatch(config)
+        batch.add(read_import(args.file), update_existing=args.update)
+        batch.commit(args.config)
+    except StorageError as exc:
+        print(f"❌ Import abgelehnt:\n{exc}", file=sys.stderr)
+        return 2
+    print(f"✅ {args.file.name}: {batch.summary()}")
+    return 0
+
+
+def _discover(config: dict, args) -> int:
+    from core.button_batch import ButtonBatch
+    from core.discovery import DEFAULT_WORKERS, Scanner, plan, settings
+    opts = settings(config)
+    folders = args.folders or opts.get("folders") or []
+    if not folders:
+        print("❌ Keine Ordner (Argument oder config: discovery.folders).", file=sys.stderr)
+        return 2
+    scanner = Scanner(workers=opts.get("workers", DEFAULT_WORKERS))
+    results = []
+    for folder in folders:
+        path = to_absolute(folder)
+        if not path.is_dir():
+            print(f"❌ Kein Ordner: {folder}", file=sys.stderr)
+            return 2
+        res = scanner.scan(path)
+        results.append(res)
+        print(f"{folder}: {res.file_count} Dateien, {len(res.dirs)} Ordner "
+              f"({res.scanned} gelesen, {res.reused} aus Cache) in {res.seconds * 1000:0.0f} ms")
+    scanner.save()
+    proposal = plan(config, results)
+    for btn in proposal.add:
+        print(f"  + {btn['parent'] or ''}/{btn['id']}  [{btn['action']}]")
+    for bid in proposal.stale:
+        print(f"  - {bid}  (Datei fehlt{'' if args.prune else ', --prune entfernt'})")
+    if not args.apply or not proposal:
+        return 0
+    try:
+        batch = ButtonBatch(config)
+        proposal.apply(batch, prune=args.prune)
+        batch.commit(args.config)
+    except StorageError as exc:
+        print(f"❌ Übernahme abgelehnt:\n{exc}", file=sys.stderr)
+        return 2
+    print(f"✅ {batch.summary()}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="python -m core.cli", description=__doc__.split("\n\n")[1])
+    ap.add_argument("--config", type=Path, default=project_root() / "config.json",
+                    help="Pfad zur config.json (Standard: Projekt-Root)")
+    ap.add_argument("-q", "--quiet", action="store_true",
+                    help="Skript-Ausgabe unterdrücken, nur Status/Fehler")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("list", help="Button-Baum anzeigen")
+    p_run = sub.add_parser("run", help="Button oder ganzes MENU (parallel) ausführen")
+    p_run.add_argument("button", help="Button-ID oder Menü-Pfad A/B/C")
+    p_pipe = sub.add_parser("pipeline", help="Buttons nacheinander ausführen")
+    p_pipe.add_argument("buttons", nargs="+", help="Button-IDs oder Menü-Pfade")
+    p_imp = sub.add_parser("import", help="Buttons aus CSV/JSON übernehmen (ein Speichervorgang)")
+    p_imp.add_argument("file", type=Path, help="CSV- oder JSON-Datei (siehe core.button_batch)")
+    p_imp.add_argument("--update", action="store_true",
+                       help="vorhandene IDs aktualisieren statt zusätzlich anlegen")
+    p_disc = sub.add_parser("discover", help="Werkzeug-Ordner scannen und Buttons vorschlagen")
+    p_disc.add_argument("folders", nargs="*", help="Ordner (Standard: config discovery.folders)")
+    p_disc.add_argument("--apply", action="store_true", help="Vorschlag übernehmen")
+    p_disc.add_argument("--prune", action="store_true",
+                        help="mit --apply: Buttons auf verschwundene Dateien löschen")
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        config = load_config(args.config)
+    except StorageError as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 2
+    log_manager.configure(config.get("logs"))
+
+    if args.cmd == "list":
+        _print_tree(config)
+        return 0
+    if args.cmd == "import":
+        return _import(config, args)
+    if args.cmd == "discover":
+        return _discover(config, args)
+
+    sink = TerminalSink(quiet=args.quiet)
+    try:
+        if args.cmd == "run":
+            btn = resolve_button(config, args.button)
+            if btn["action"] == "MENU":
+                targets = scripts_below(config, btn["id"])
+                if not targets:
+                    raise CliError(f"MENU '{btn['id']}' enthält keine Skripte.")
+            else:
+                targets = [btn]
+            jobs = [(_job_for(b), b["id"]) for b in targets]
+            ok = run_parallel(jobs, sink)
+        else:
+            jobs = [(_job_for(resolve_button(config, ref)), ref) for ref in args.buttons]
+            ok = run_pipeline(jobs, sink)
+    except CliError as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        sink.close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+core.daemon
+===========
+
+Optionaler Job-Daemon: eigener Prozess, der die Skript-Ausführung
+übernimmt, damit laufende Jobs ein Schließen oder Abstürzen der GUI
+überleben.
+
+* Start:  ``python -m core.daemon`` (macht ``core.daemon_client`` automatisch)
+* Transport: QLocalServer (Unix-Domain-Socket bzw. Named Pipe unter Windows)
+* Protokoll: eine JSON-Nachricht pro Zeile
+
+Client → Daemon::
+
+    {"cmd": "run",   "job_id": "...", "script": "/abs/pfad.py", "limits": {...}}
+    {"cmd": "abort", "job_id": "..."}
+    {"cmd": "shutdown"}
+
+Daemon → Client: jedes Dispatcher-Signal als ``{"ev": <signal>, "args": [...]}``
+sowie beim Verbinden ein ``{"ev": "snapshot", "jobs": [...]}`` mit allen
+bekannten Jobs, damit sich eine (neu gestartete) GUI wieder anhängen kann.
+Vor einem angeforderten Ende geht ``{"ev": "shutdown"}`` an alle Clients –
+die starten den Daemon dann nicht von selbst neu.
+Mehrere GUIs dürfen gleichzeitig verbunden sein.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict
+from pathlib import Path
+from typing import Deque, Dict, List
+
+from PySide6.QtCore import QCoreApplication, QObject, QTimer
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from core.dispatcher import dispatcher
+from core.models import JobLimits
+from util.paths import project_root
+
+# Signale, die 1:1 an alle Clients gehen (Reihenfolge der Argumente wie im Dispatcher)
+FORWARDED_SIGNALS = (
+    "job_started", "job_progress", "job_finished", "job_error",
+    "job_aborted", "job_progress_info", "job_resources", "job_released",
+)
+# Anzahl beendeter Jobs, die der Daemon für neue Clients vorhält
+KEEP_FINISHED = 500
+# Zeilen pro Job im Snapshot (Rest steht im Log)
+TAIL_LINES = 200
+# Daemon beendet sich, wenn so lange weder Client noch laufender Job existiert
+IDLE_EXIT_S = 300
+
+
+def server_name() -> str:
+    """Socket-Name pro Installation (Projekt-Root), damit Kopien sich nicht stören."""
+    digest = hashlib.sha1(str(project_root()).encode("utf-8")).hexdigest()[:12]
+    return f"master-gui-jobs-{digest}"
+
+
+def pack(msg: dict) -> bytes:
+    return (json.dumps(msg, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _jsonable(arg):
+    """ResourceStats/ProgressInfo (Dataclasses) → dict."""
+    return asdict(arg) if hasattr(arg, "__dataclass_fields__") else arg
+
+
+# -------------------------------------------------------------------
+class _JobState:
+    __slots__ = ("job_id", "name", "started", "state", "percent", "error",
+                 "tail", "stats", "info")
+
+    def __init__(self, job_id: str, name: str) -> None:
+        self.job_id = job_id
+        self.name = name
+        self.started = time.time()
+        self.state = "running"          # running | finished | error | aborted
+        self.percent = 0
+        self.error = ""
+        self.tail: Deque[str] = deque(maxlen=TAIL_LINES)
+        self.stats: dict | None = None
+        self.info: dict | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "job_id": self.job_id, "name": self.name, "started": self.started,
+            "state": self.state, "percent": self.percent, "error": self.error,
+            "tail": list(self.tail), "stats": self.stats, "info": self.info,
+        }
+
+
+class JobDaemon(QObject):
+    """Besitzt alle Runner des Daemons und verteilt ihre Signale an die Clients."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._clients: List[QLocalSocket] = []
+        self._buffers: Dict[QLocalSocket, bytearray] = {}
+        self._jobs: "OrderedDict[str, _JobState]" = OrderedDict()
+        self._idle_since = time.monotonic()
+
+        self._slots = {name: (lambda *args, _n=name: self._on_signal(_n, args))
+                       for name in FORWARDED_SIGNALS}
+        for name, slot in self._slots.items():
+            getattr(dispatcher, name).connect(slot)
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.timeout.connect(self._check_idle)
+        self._idle_timer.start(10_000)
+
+    # ------------------------------------------------------------------
+    def listen(self) -> bool:
+        """Startet den Server; False, wenn bereits ein Daemon läuft."""
+        name = server_name()
+        probe = QLocalSocket()
+        probe.connectToServer(name)
+        if probe.waitForConnected(300):
+            probe.disconnectFromServer()
+            return False
+        QLocalServer.removeServer(name)       # verwaister Socket nach Absturz
+        return self._server.listen(name)
+
+    def close(self) -> None:
+        """Server schließen und vom Dispatcher lösen (Tests, eingebettete Nutzung)."""
+        for name, slot in self._slots.items():
+            getattr(dispatcher, name).disconnect(slot)
+        self._slots.clear()
+        self._idle_timer.stop()
+        for sock in self._clients:
+            sock.readyRead.disconnect()
+            sock.disconnected.disconnect()
+            sock.abort()
+            sock.deleteLater()
+        self._clients.clear()
+        self._buffers.clear()
+        self._server.close()
+
+    # ------------------------------------------------------------------
+    # Verbindungen
+    # ------------------------------------------------------------------
+    def _on_new_connection(self) -> None:
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            self._clients.append(sock)
+            self._buffers[sock] = bytearray()
+            sock.readyRead.connect(lambda s=sock: self._on_ready_read(s))
+            sock.disconnected.connect(lambda s=sock: self._on_disconnected(s))
+            sock.write(pack({
+                "ev": "snapshot",
+                "jobs": [j.as_dict() for j in self._jobs.values()],
+            }))
+
+    def _on_disconnected(self, sock: QLocalSocket) -> None:
+        if sock in self._clients:
+            self._clients.remove(sock)
+        self._buffers.pop(sock, None)
+        sock.deleteLater()
+        self._idle_since = time.monotonic()
+
+    def _on_ready_read(self, sock: QLocalSocket) -> None:
+        buf = self._buffers.get(sock)
+        if buf is None:
+            return
+        buf += bytes(sock.readAll())
+        while (nl := buf.find(b"\n")) >= 0:
+            raw = bytes(buf[:nl])
+            del buf[:nl + 1]
+            try:
+                msg = json.loads(raw)
+            except ValueError:
+                continue
+            self._handle(msg)
+
+    # ------------------------------------------------------------------
+    # Kommandos
+    # ------------------------------------------------------------------
+    def _handle(self, msg: dict) -> None:
+        cmd = msg.get("cmd")
+        if cmd == "run":
+            from core.runner import start_local
+            start_local(
+                msg["job_id"],
+                Path(msg["script"]),
+                JobLimits.from_config(msg.get("limits")),
+            )
+        elif cmd == "abort":
+            dispatcher.job_abort_req.emit(msg.get("job_id", ""))
+        elif cmd == "shutdown":
+            for sock in self._clients:          # gewolltes Ende → kein Auto-Neustart
+                sock.write(pack({"ev": "shutdown"}))
+                sock.flush()
+            QCoreApplication.quit()
+
+    # ------------------------------------------------------------------
+    # Dispatcher → Job-Tabelle + Broadcast
+    # ------------------------------------------------------------------
+    def _on_signal(self, name: str, args: tuple) -> None:
+        job_id = args[0]
+        if name == "job_started":
+            self._jobs[job_id] = _JobState(job_id, args[1])
+            self._trim()
+        job = self._jobs.get(job_id)
+        if job is not None:
+            if name == "job_progress":
+                if args[1] >= 0:
+                    job.percent = args[1]
+                job.tail.append(args[2])
+            elif name == "job_finished":
+                job.state = "finished"
+            elif name == "job_aborted":
+                job.state = "aborted"
+            elif name == "job_error":
+                job.state, job.error = "error", args[1]
+            elif name == "job_resources":
+                job.stats = asdict(args[1])
+            elif name == "job_progress_info":
+                job.info = asdict(args[1])
+
+        data = pack({"ev": name, "args": [_jsonable(a) for a in args]})
+        for sock in self._clients:
+            sock.write(data)
+
+    def _trim(self) -> None:
+        finished = [j for j in self._jobs.values() if j.state != "running"]
+        for job in finished[:max(0, len(finished) - KEEP_FINISHED)]:
+            del self._jobs[job.job_id]
+
+    def _check_idle(self) -> None:
+        busy = self._clients or any(j.state == "running" for j in self._jobs.values())
+        if busy:
+            self._idle_since = time.monotonic()
+        elif time.monotonic() - self._idle_since > IDLE_EXIT_S:
+            QCoreApplication.quit()
+
+
+# -------------------------------------------------------------------
+def main() -> int:
+    app = QCoreApplication(sys.argv)
+    try:                                  # Log-Policy wie in der GUI
+        from core.log_manager import log_manager
+        from core.storage import StorageError, load_config
+        log_manager.configure(load_config(project_root() / "config.json").get("logs"))
+    except StorageError:
+        pass
+    daemon = JobDaemon()
+    if not daemon.listen():
+        print("Job-Daemon läuft bereits oder Socket nicht verfügbar.", file=sys.stderr)
+        return 1
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+core.daemon_client
+==================
+
+GUI-Seite des Job-Daemons (siehe core.daemon).
+
+``attach()`` verbindet sich mit dem Daemon (startet ihn bei Bedarf
+losgelöst von der GUI) und meldet sich als Backend bei core.runner an.
+Alle Daemon-Events werden auf dem lokalen ``dispatcher`` erneut
+ausgesendet – Dashboard & Co. merken keinen Unterschied.
+
+Nur ``attach()`` beim Programmstart wartet (kurz) auf den Daemon. Reißt
+die Verbindung später ab, verbindet sich der Client asynchron neu
+(``connectToServer`` + Signale, der GUI-Thread blockiert nie) und startet
+den Daemon neu, wenn keiner antwortet – erneut erst nach SPAWN_TIMEOUT_S. Nach einem gewollten Ende
+(``shutdown_daemon()`` oder ``{"ev": "shutdown"}`` von einer anderen GUI)
+gibt es keinen Neustart – Jobs laufen dann wieder lokal.
+
+Solange keine Verbindung besteht, startet ``run()`` Jobs ebenfalls lokal
+(``runner.start_local``) statt sie zu verwerfen. Bricht die Verbindung ab,
+gelten alle noch laufenden Daemon-Jobs als fehlgeschlagen
+(``job_error`` + ``job_released``) – ein neuer Daemon kennt sie nicht mehr.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtNetwork import QLocalSocket
+
+from core.daemon import FORWARDED_SIGNALS, pack, server_name
+from core.dispatcher import dispatcher
+from core.models import JobLimits
+from core.progress_protocol import ProgressInfo
+from core.resources import ResourceStats
+from core import runner
+from util.paths import project_root
+
+# Wartezeit auf einen frisch gestarteten Daemon
+SPAWN_TIMEOUT_S = 5.0
+RECONNECT_MS = 2_000
+# Takt der Verbindungsversuche, solange ein neu gestarteter Daemon hochfährt
+SPAWN_POLL_MS = 250
+
+
+def _spawn_daemon() -> None:
+    """Startet den Daemon als eigenständigen Prozess (überlebt die GUI)."""
+    if getattr(sys, "frozen", False):
+        args = [sys.executable, "--job-daemon"]
+    else:
+        args = [sys.executable, "-m", "core.daemon"]
+    kw: dict = {
+        "cwd": os.getcwd(),
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+    }
+    if sys.platform.startswith("win"):
+        kw["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kw["start_new_session"] = True
+        env = os.environ.copy()
+        root = str(project_root())
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (root, env.get("PYTHONPATH")) if p)
+        kw["env"] = env
+    subprocess.Popen(args, **kw)
+
+
+class DaemonClient(QObject):
+    """Eine Verbindung GUI ↔ Daemon; spiegelt Daemon-Signale auf den Dispatcher."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._sock = QLocalSocket(self)
+        self._sock.readyRead.connect(self._on_ready_read)
+        self._sock.disconnected.connect(self._on_disconnected)
+        self._sock.connected.connect(self._on_connected)
+        self._sock.errorOccurred.connect(self._on_connect_failed)
+        self._buf = bytearray()
+        self._stopped = False                # Daemon gewollt beendet → nicht neu starten
+        self._connecting = False             # asynchroner Versuch läuft
+        self._spawned_at: float | None = None    # Neustart in diesem Ausfall (monotonic)
+        self._running: set = set()           # Daemon-Jobs, deren Ende noch aussteht
+        self._reconnect = QTimer(self)
+        self._reconnect.setInterval(RECONNECT_MS)
+        self._reconnect.timeout.connect(self._try_reconnect)
+        dispatcher.job_abort_req.connect(self._on_abort_req)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def connect_or_spawn(self) -> bool:
+        """
+        Verbindet sich; startet den Daemon, falls keiner läuft. Blockiert bis
+        zu SPAWN_TIMEOUT_S – nur für den Programmstart (``attach``).
+        """
+        if self._connect(300):
+            return True
+        _spawn_daemon()
+        deadline = time.monotonic() + SPAWN_TIMEOUT_S
+        while time.monotonic() < deadline:
+            if self._connect(250):
+                return True
+            time.sleep(0.05)                 # Socket existiert noch nicht → kurz warten
+        return False
+
+    def is_connected(self) -> bool:
+        return self._sock.state() == QLocalSocket.ConnectedState
+
+    def run(self, job_id: str, script_path: Path, limits: Optional[JobLimits]) -> None:
+        """Backend-Schnittstelle für core.runner.run_script_async."""
+        if not self.is_connected():          # (Neu-)Verbindung läuft → lokal ausführen
+            runner.start_local(job_id, Path(script_path), limits)
+            return
+        self._running.add(job_id)
+        self._send({
+            "cmd": "run",
+            "job_id": job_id,
+            "script": str(Path(script_path).resolve()),
+            "limits": asdict(limits) if limits else None,
+        })
+
+    def shutdown_daemon(self) -> None:
+        """Daemon beenden; danach laufen Jobs wieder in diesem Prozess."""
+        self._send({"cmd": "shutdown"})
+        self._stop()
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _connect(self, timeout_ms: int) -> bool:
+        self._connecting = False
+        self._sock.abort()
+        self._sock.connectToServer(server_name())
+        return self._sock.waitForConnected(timeout_ms)
+
+    def _stop(self) -> None:
+        self._stopped = True
+        self._reconnect.stop()
+        if runner.backend() is self:
+            runner.use_backend(None)
+
+    def _send(self, msg: dict) -> None:
+        if self.is_connected():
+            self._sock.write(pack(msg))
+            self._sock.flush()
+
+    def _on_abort_req(self, job_id: str) -> None:
+        self._send({"cmd": "abort", "job_id": job_id})
+
+    def _on_disconnected(self) -> None:
+        for jid in sorted(self._running):    # Ende kommt nie mehr an
+            dispatcher.job_error.emit(jid, "Verbindung zum Job-Daemon verloren")
+            dispatcher.job_released.emit(jid)
+        self._running.clear()
+        # Daemon unerwartet weg (z. B. abgestürzt) → periodisch neu verbinden/starten
+        if not self._stopped:
+            self._spawned_at = None
+            self._reconnect.start(RECONNECT_MS)
+
+    def _try_reconnect(self) -> None:
+        """Timer-Slot: startet nur einen asynchronen Versuch, wartet nie."""
+        if self._stopped or self._connecting or self.is_connected():
+            return
+        self._connecting = True
+        self._sock.abort()
+        self._sock.connectToServer(server_name())
+
+    def _on_connected(self) -> None:
+        self._connecting = False
+        self._spawned_at = None
+        self._reconnect.stop()
+
+    def _on_connect_failed(self, _error) -> None:
+        if not self._connecting:             # Fehler einer bestehenden Verbindung
+            return
+        self._connecting = False
+        if self._stopped:
+            return
+        now = time.monotonic()
+        if self._spawned_at is None:         # niemand da → einmal neu starten
+            _spawn_daemon()
+            self._spawned_at = now
+            self._reconnect.start(SPAWN_POLL_MS)
+        elif now - self._spawned_at > SPAWN_TIMEOUT_S:
+            self._reconnect.start(RECONNECT_MS)      # später noch einmal versuchen
+            self._spawned_at = None
+
+    def _on_ready_read(self) -> None:
+        self._buf += bytes(self._sock.readAll())
+        while (nl := self._buf.find(b"\n")) >= 0:
+            raw = bytes(self._buf[:nl])
+            del self._buf[:nl + 1]
+            try:
+                msg = json.loads(raw)
+            except ValueError:
+                continue
+            self._handle(msg)
+
+    def _handle(self, msg: dict) -> None:
+        ev = msg.get("ev")
+        if ev == "shutdown":
+            self._stop()
+            return
+        if ev == "snapshot":
+            for job in msg.get("jobs", []):
+                self._replay(job)
+                if job.get("state") == "running":
+                    self._running.add(job["job_id"])
+            return
+        if ev not in FORWARDED_SIGNALS:
+            return
+        args = msg.get("args", [])
+        if ev == "job_started":
+            self._running.add(args[0])
+        elif ev in ("job_finished", "job_error", "job_aborted", "job_released"):
+            self._running.discard(args[0])
+        if ev == "job_resources":
+            args[1] = ResourceStats(**args[1])
+        elif ev == "job_progress_info":
+            args[1] = ProgressInfo(**args[1])
+        getattr(dispatcher, ev).emit(*args)
+
+    @staticmethod
+    def _replay(job: dict) -> None:
+        """Bereits bekannten Job nach (Re-)Attach auf dem Dispatcher nachspielen."""
+        jid = job["job_id"]
+        dispatcher.job_started.emit(jid, job["name"])
+        for line in job.get("tail", []):
+            dispatcher.job_progress.emit(jid, -1, line)
+        dispatcher.job_progress.emit(jid, job.get("percent", 0), "(wieder verbunden)")
+        if job.get("info"):
+            dispatcher.job_progress_info.emit(jid, ProgressInfo(**job["info"]))
+        if job.get("stats"):
+            dispatcher.job_resources.emit(jid, ResourceStats(**job["stats"]))
+        state = job.get("state")
+        if state == "finished":
+            dispatcher.job_finished.emit(jid)
+        elif state == "aborted":
+            dispatcher.job_aborted.emit(jid)
+        elif state == "error":
+            dispatcher.job_error.emit(jid, job.get("error", ""))
+        if state != "running":
+            dispatcher.job_released.emit(jid)
+
+
+# -------------------------------------------------------------------
+_client: DaemonClient | None = None
+
+
+def attach(parent: QObject | None = None) -> DaemonClient | None:
+    """
+    Hängt die GUI an den Job-Daemon und leitet run_script_async dorthin um.
+    Liefert None, wenn der Daemon nicht erreichbar ist (→ Jobs laufen lokal).
+    """
+    global _client
+    if _client is None:
+        client = DaemonClient(parent)
+        if not client.connect_or_spawn():
+            client.deleteLater()
+            return None
+        _client = client
+        runner.use_backend(client)
+    return _client
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+core.discovery
+==============
+
+Buttons aus Werkzeug-Ordnern (z. B. ``gui_tools``) ableiten – Qt-frei.
+
+* ``Scanner.scan(ordner)`` läuft mit ``os.scandir`` parallel über einen
+  Thread-Pool (ein Auftrag pro Verzeichnis) und sammelt Skripte und
+  Dokumente (``KINDS``). Versteckte Einträge und ``SKIP_DIRS`` bleiben außen vor.
+* Pro Verzeichnis merkt sich ``.cache/discovery.json`` mtime und Inode.
+  Stimmen beide beim nächsten Lauf, wird der Inhalt aus dem Cache genommen –
+  ein erneuter Scan über 100 000 Dateien kostet dann ein ``stat`` je
+  Verzeichnis, gelesen werden nur geänderte Verzeichnisse. Verzeichnisse,
+  die sich im Moment des Scans noch ändern konnten (``RACY_S``), werden
+  beim nächsten Mal sicherheitshalber neu gelesen.
+* ``plan(config, ergebnisse)`` schlägt Buttons vor: je Ordner ein MENU
+  (Struktur wie auf der Platte), je Datei SCRIPT bzw. FILE. Dateien, auf die
+  schon ein Button zeigt, bleiben unberührt; ``stale`` listet Buttons,
+  deren Datei in einem gescannten Ordner nicht mehr existiert.
+  Übernommen wird über core.button_batch (eine Transaktion).
+
+Konfiguration (optional)::
+
+    "discovery": {"folders": ["gui_tools"], "workers": 8}
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.button_batch import DEFAULT_ICON, ButtonBatch
+from core.button_index import ButtonIndex
+from util.paths import project_root, to_relative
+
+# Dateiendung → Aktion
+KINDS = {
+    ".py": "SCRIPT", ".pyw": "SCRIPT",
+    ".pdf": "FILE", ".docx": "FILE", ".doc": "FILE", ".xlsx": "FILE", ".xls": "FILE",
+    ".pptx": "FILE", ".md": "FILE", ".txt": "FILE", ".html": "FILE", ".htm": "FILE",
+}
+SKIP_DIRS = {"__pycache__", "node_modules", "venv", "site-packages"}
+CACHE_PATH = project_root() / ".cache" / "discovery.json"
+CACHE_VERSION = 1
+# jünger als das → beim nächsten Scan nicht dem Cache trauen (mtime-Auflösung)
+RACY_S = 2.0
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 2) * 2)
+
+
+@dataclass
+class DirInfo:
+    path: str                                   # absolut, normalisiert
+    files: List[Tuple[str, str]]                # (Name, Aktion), sortiert
+    dirs: List[str]                             # Unterordner, sortiert
+
+
+@dataclass
+class ScanResult:
+    root: str
+    dirs: Dict[str, DirInfo] = field(default_factory=dict)
+    scanned: int = 0                            # neu gelesene Verzeichnisse
+    reused: int = 0                             # aus dem Cache
+    seconds: float = 0.0
+
+    @property
+    def file_count(self) -> int:
+        return sum(len(d.files) for d in self.dirs.values())
+
+
+def settings(config: dict) -> dict:
+    return config.get("discovery") or {}
+
+
+# -------------------------------------------------------------------
+# Scan
+# -------------------------------------------------------------------
+class Scanner:
+    def __init__(self, cache_path: Optional[Path] = None,
+                 workers: int = DEFAULT_WORKERS, use_cache: bool = True) -> None:
+        self.cache_path = (cache_path or CACHE_PATH) if use_cache else None
+        self.workers = max(1, workers)
+        self._cache: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def scan(self, root: str | Path) -> ScanResult:
+        t0 = time.perf_counter()
+        cache = self._load()
+        top = str(Path(root).expanduser().resolve())
+        result = ScanResult(top)
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="discovery") as pool:
+            pending = {pool.submit(self._visit, top, cache)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    info, fresh = fut.result()
+                    if info is None:
+                        continue
+                    result.dirs[info.path] = info
+                    if fresh:
+                        result.scanned += 1
+                    else:
+                        result.reused += 1
+                    pending.update(pool.submit(self._visit, os.path.join(info.path, d), cache)
+                                   for d in info.dirs)
+        # verschwundene Unterordner aus dem Cache werfen
+        prefix = top.rstrip(os.sep) + os.sep
+        with self._lock:
+            for key in [k for k in cache if (k == top or k.startswith(prefix))
+                        and k not in result.dirs]:
+                del cache[key]
+        result.seconds = time.perf_counter() - t0
+        return result
+
+    def save(self) -> None:
+        if self.cache_path is None or self._cache is None:
+            return
+        with self._lock:
+            raw = json.dumps({"version": CACHE_VERSION, "dirs": self._cache},
+                             separators=(",", ":"))
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(".tmp")
+            tmp.write_text(raw, encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass                                # Cache ist optional
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _load(self) -> Dict[str, dict]:
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path is not None:
+                try:
+                    data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                    if data.get("version") == CACHE_VERSION and isinstance(data["dirs"], dict):
+                        self._cache = data["dirs"]
+                except (OSError, ValueError, KeyError, AttributeError):
+                    pass
+        return self._cache
+
+    def _visit(self, path: str, cache: Dict[str, dict]) -> Tuple[Optional[DirInfo], bool]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, False
+        entry = cache.get(path)
+        if (isinstance(entry, dict) and entry.get("m") == st.st_mtime_ns
+                and entry.get("i") == st.st_ino):
+            try:
+                return DirInfo(path, [(str(n), str(k)) for n, k in entry["f"]],
+                               [str(d) for d in entry["d"]]), False
+            except (KeyError, TypeError, ValueError):
+                pass                            # kaputter Eintrag → neu lesen
+        try:
+            files, dirs = _read_dir(path)
+        except OSError:
+            return None, False
+        racy = time.time() - st.st_mtime_ns / 1e9 < RACY_S
+        with self._lock:
+            cache[path] = {"m": None if racy else st.st_mtime_ns, "i": st.st_ino,
+                           "f": files, "d": dirs}
+        return DirInfo(path, files, dirs), True
+
+
+def _read_dir(path: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    files, dirs = [], []
+    with os.scandir(path) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in SKIP_DIRS:
+                        dirs.append(name)
+                    continue
+            except OSError:
+                continue
+            kind = KINDS.get(os.path.splitext(name)[1].lower())
+            if kind:
+                files.append((name, kind))
+    files.sort()
+    dirs.sort()
+    return files, dirs
+
+
+# -------------------------------------------------------------------
+# Vorschlag
+# -------------------------------------------------------------------
+@dataclass
+class Plan:
+    add: List[dict] = field(default_factory=list)       # neue Buttons (Eltern zuerst)
+    stale: List[str] = field(default_factory=list)      # IDs, deren Datei fehlt
+
+    def __bool__(self) -> bool:
+        return bool(self.add or self.stale)
+
+    def apply(self, batch: ButtonBatch, prune: bool = False) -> None:
+        batch.add(self.add)
+        if prune and self.stale:
+            batch.delete(self.stale)
+
+
+def plan(config: dict, results: Iterable[ScanResult]) -> Plan:
+    buttons = config["buttons"]
+    index = ButtonIndex(buttons)
+    taken = {b["id"] for b in buttons}
+    known = {_norm(b["payload"]) for b in buttons if b.get("payload")}
+    out = Plan()
+    found: set = set()
+    roots: List[str] = []
+
+    menus = {(b["parent"], b["label"]): b["id"] for b in reversed(buttons) if b["action"] == "MENU"}
+
+    def claim(name: str, parent: Optional[str]) -> str:
+        """Freie ID: ``name``, dann ``parent/name``, dann mit Zähler ``-2``, ``-3`` …"""
+        candidates = [name] if parent is None else [name, f"{parent}/{name}"]
+        for cid in candidates:
+            if cid not in taken:
+                taken.add(cid)
+                return cid
+        n = 2
+        while f"{candidates[-1]}-{n}" in taken:
+            n += 1
+        taken.add(f"{candidates[-1]}-{n}")
+        return f"{candidates[-1]}-{n}"
+
+    def menu_for(name: str, parent: Optional[str]) -> str:
+        if (parent, name) in menus:
+            return menus[(parent, name)]            # schon vorhanden
+        cid = menus[(parent, name)] = claim(name, parent)
+        out.add.append({"id": cid, "label": name, "action": "MENU", "payload": "",
+                        "icon": DEFAULT_ICON, "parent": parent, "description": ""})
+        return cid
+
+    for res in results:
+        roots.append(os.path.normcase(res.root.rstrip(os.sep) + os.sep))
+        rel_root = to_relative(res.root)
+        wanted = _non_empty(res)
+
+        def walk(path: str, menu: str) -> None:
+            info = res.dirs[path]
+            rel_dir = os.path.relpath(path, res.root)
+            # Unterordner zuerst: Menüs behalten bevorzugt den nackten Namen,
+            # eine gleichnamige Datei daneben weicht auf „menu/stem“ aus.
+            subs = [(os.path.join(path, d), d) for d in info.dirs]
+            subs = [(sub, menu_for(d, menu)) for sub, d in subs if sub in wanted]
+            for name, kind in info.files:
+                full = os.path.join(path, name)
+                found.add(os.path.normcase(full))
+                if os.path.normcase(full) in known:
+                    continue
+                payload = os.path.normpath(os.path.join(rel_root, rel_dir, name))
+                stem = os.path.splitext(name)[0]
+                out.add.append({"id": claim(stem, menu), "label": stem, "action": kind,
+                                "payload": payload, "icon": DEFAULT_ICON, "parent": menu,
+                                "description": os.path.normpath(os.path.join(rel_dir, name))})
+            for sub, sub_menu in subs:
+                walk(sub, sub_menu)
+
+        if res.root in wanted:
+            walk(res.root, menu_for(os.path.basename(res.root), None))
+
+    # Buttons auf Dateien in gescannten Ordnern, die es nicht mehr gibt
+    stale: Dict[str, bool] = {}
+    for b in buttons:
+        path = _norm(b["payload"]) if b.get("payload") and b["action"] in ("SCRIPT", "FILE") else ""
+        gone = bool(path) and any(path.startswith(r) for r in roots) and path not in found
+        stale[b["id"]] = stale.get(b["id"], True) and gone     # nur wenn ALLE mit der ID weg sind
+    out.stale = [bid for bid, gone in stale.items() if gone and not index.has_children(bid)]
+    return out
+
+
+def _non_empty(res: ScanResult) -> set:
+    """Verzeichnisse, unter denen (rekursiv) mindestens eine Datei liegt."""
+    keep: set = set()
+    for path in sorted(res.dirs, key=len, reverse=True):      # Kinder vor Eltern
+        info = res.dirs[path]
+        if info.files or any(os.path.join(path, d) in keep for d in info.dirs):
+            keep.add(path)
+    return keep
+
+
+def _norm(payload: str) -> str:
+    return os.path.normcase(os.path.normpath(os.path.join(project_root(), os.path.expanduser(payload))))
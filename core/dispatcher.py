@@ -3,8 +3,65 @@
 Signal-Router für Job-Events.
 Jede GUI-Komponente kann sich an die Signale hängen,
 ohne direkte Referenzen aufeinander zu benötigen.
+
+Job-bezogenes Routing
+---------------------
+* ``dispatcher.jobs`` – thread-sichere Registry job_id → Runner
+  (Abbruch-Wunsch wird in O(1) genau an diesen Runner geleitet).
+* ``dispatcher.subscribe(job_id, "job_progress", cb)`` – Callback nur für
+  *einen* Job. Gebundene Methoden werden schwach referenziert; alle
+  Abos eines Jobs verschwinden automatisch mit ``job_released``.
 """
-from PySide6.QtCore import QObject, Signal
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Callable, Dict, List, Protocol
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class JobHandle(Protocol):
+    def abort(self) -> None: ...
+
+
+class JobRegistry:
+    """Thread-sichere Registry aller *laufenden* Jobs (Runner registrieren sich selbst)."""
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, JobHandle] = {}
+        self._lock = threading.Lock()
+
+    def register(self, job_id: str, handle: JobHandle) -> None:
+        with self._lock:
+            self._jobs[job_id] = handle
+
+    def unregister(self, job_id: str) -> JobHandle | None:
+        with self._lock:
+            return self._jobs.pop(job_id, None)
+
+    def get(self, job_id: str) -> JobHandle | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def ids(self) -> List[str]:
+        with self._lock:
+            return list(self._jobs)
+
+    def __contains__(self, job_id: object) -> bool:
+        with self._lock:
+            return job_id in self._jobs
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+
+def _ref(cb: Callable) -> Callable[[], Callable | None]:
+    """Gebundene Methoden schwach referenzieren, alles andere stark."""
+    if hasattr(cb, "__self__") and hasattr(cb, "__func__"):
+        return weakref.WeakMethod(cb)
+    return lambda: cb
 
 
 class Dispatcher(QObject):
@@ -20,6 +77,104 @@ class Dispatcher(QObject):
     job_abort_req = Signal(str)
     # Runner meldet “abgebrochen”
     job_aborted   = Signal(str)
+    # job_id, core.progress_protocol.ProgressInfo (strukturierter Fortschritt)
+    job_progress_info = Signal(str, object)
+    # job_id, core.resources.ResourceStats (live bzw. Endwerte)
+    job_resources = Signal(str, object)
+    # Runner ist fertig, es folgen keine Events mehr → Abos aufräumen
+    job_released  = Signal(str)
+
+    # Signale, die zusätzlich job-spezifisch geroutet werden
+    ROUTED = (
+        "job_progress", "job_finished", "job_error", "job_aborted",
+        "job_progress_info", "job_resources",
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.jobs = JobRegistry()
+        # job_id → signal → [Callback-Referenzen]
+        self._subs: Dict[str, Dict[str, List[Callable]]] = {}
+        self._subs_lock = threading.Lock()
+
+        # Router sind Slots dieses QObjects → laufen im GUI-Thread (queued aus Workern)
+        self.job_abort_req.connect(self._route_abort)
+        self.job_progress.connect(self._on_progress)
+        self.job_finished.connect(self._on_finished)
+        self.job_error.connect(self._on_error)
+        self.job_aborted.connect(self._on_aborted)
+        self.job_progress_info.connect(self._on_progress_info)
+        self.job_resources.connect(self._on_resources)
+        self.job_released.connect(self._drop_subscriptions)
+
+    # ------------------------------------------------------------------
+    # Job-Abos
+    # ------------------------------------------------------------------
+    def subscribe(self, job_id: str, signal: str, callback: Callable) -> None:
+        """``callback(*args_ohne_job_id)`` für ``signal`` – nur für ``job_id``."""
+        if signal not in self.ROUTED:
+            raise ValueError(f"Signal '{signal}' wird nicht job-spezifisch geroutet.")
+        with self._subs_lock:
+            self._subs.setdefault(job_id, {}).setdefault(signal, []).append(_ref(callback))
+
+    def unsubscribe(self, job_id: str, callback: Callable | None = None) -> None:
+        """Entfernt ``callback`` (oder alle Abos) für ``job_id``."""
+        with self._subs_lock:
+            if callback is None:
+                self._subs.pop(job_id, None)
+                return
+            for refs in self._subs.get(job_id, {}).values():
+                refs[:] = [r for r in refs if r() not in (None, callback)]
+
+    def subscription_count(self) -> int:
+        with self._subs_lock:
+            return sum(len(r) for sigs in self._subs.values() for r in sigs.values())
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    @Slot(str, int, str)
+    def _on_progress(self, job_id: str, percent: int, msg: str) -> None:
+        self._route("job_progress", job_id, (percent, msg))
+
+    @Slot(str)
+    def _on_finished(self, job_id: str) -> None:
+        self._route("job_finished", job_id, ())
+
+    @Slot(str, str)
+    def _on_error(self, job_id: str, err: str) -> None:
+        self._route("job_error", job_id, (err,))
+
+    @Slot(str)
+    def _on_aborted(self, job_id: str) -> None:
+        self._route("job_aborted", job_id, ())
+
+    @Slot(str, object)
+    def _on_progress_info(self, job_id: str, info: object) -> None:
+        self._route("job_progress_info", job_id, (info,))
+
+    @Slot(str, object)
+    def _on_resources(self, job_id: str, stats: object) -> None:
+        self._route("job_resources", job_id, (stats,))
+
+    @Slot(str)
+    def _route_abort(self, job_id: str) -> None:
+        handle = self.jobs.get(job_id)
+        if handle is not None:
+            handle.abort()
+
+    def _route(self, name: str, job_id: str, args: tuple) -> None:
+        with self._subs_lock:
+            refs = self._subs.get(job_id, {}).get(name)
+            callbacks = [r() for r in refs] if refs else ()
+        for cb in callbacks:
+            if cb is not None:
+                cb(*args)
+
+    @Slot(str)
+    def _drop_subscriptions(self, job_id: str) -> None:
+        with self._subs_lock:
+            self._subs.pop(job_id, None)
 
 
 # Singleton-Instanz
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+core.health
+===========
+
+Prüft Payload und Icon der Buttons, bevor jemand klickt (Qt-frei):
+
+* SCRIPT/FILE: Datei existiert; SCRIPT außerdem lesbar (``.py``/``.pyw``,
+  läuft über den Interpreter) bzw. ausführbar (alles andere, nur POSIX).
+* FOLDER: Ordner existiert.  LINK: URL-Syntax (Schema + Host bzw. Pfad).
+* Icon (falls gesetzt): Datei existiert.
+
+Ergebnisse hängen nur an ``key(btn)`` = (Aktion, Payload, Icon) – doppelte
+oder unveränderte Buttons werden nicht erneut geprüft.
+
+``StatCache`` merkt sich ``os.stat`` je Pfad zusammen mit der mtime des
+Elternordners. Solange sich der Ordner nicht ändert (Datei angelegt,
+gelöscht, umbenannt), reicht beim nächsten Lauf ein ``stat`` pro Ordner;
+nach ``MAX_AGE_S`` wird trotzdem neu geprüft (z. B. geänderte Rechte).
+Gedacht für einen Hintergrund-Thread (ui.health_monitor) – ein
+``HealthChecker`` gehört genau einem Thread.
+"""
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import time
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+from util.paths import project_root
+
+Key = Tuple[str, str, str]                  # (Aktion, Payload, Icon)
+OK: Tuple[str, ...] = ()
+
+URL_SCHEMES = {"http", "https", "ftp", "mailto", "file"}
+NO_ICON = ("", ".")                         # "" wird beim Speichern zu "."
+# Stat-Ergebnisse spätestens nach so vielen Sekunden neu holen
+MAX_AGE_S = 600.0
+# jünger als das → Ordner-mtime nicht trauen (Auflösung, wie core.discovery)
+RACY_S = 2.0
+
+
+def key(btn: dict) -> Key:
+    return btn["action"], btn.get("payload") or "", btn.get("icon") or ""
+
+
+def _abs(path: str) -> str:
+    """Wie util.paths.to_absolute, aber ohne ``resolve()`` (keine Syscalls)."""
+    return os.path.normpath(os.path.join(project_root(), os.path.expanduser(path)))
+
+
+def valid_url(url: str) -> bool:
+    parts = urlparse(url.strip())
+    if parts.scheme.lower() not in URL_SCHEMES:
+        return False
+    if parts.scheme.lower() in ("mailto", "file"):
+        return bool(parts.path)
+    return bool(parts.netloc)
+
+
+# -------------------------------------------------------------------
+# Stat-Cache
+# -------------------------------------------------------------------
+class StatCache:
+    def __init__(self, max_age_s: float = MAX_AGE_S) -> None:
+        self.max_age_s = max_age_s
+        self._entries: Dict[str, tuple] = {}        # Pfad → (Ordner-mtime, stat, Zeitpunkt)
+        self._dirs: Dict[str, Optional[int]] = {}   # Ordner → mtime, nur für einen Lauf
+        self.file_stats = 0                         # tatsächliche stat()-Aufrufe auf Pfade
+
+    def begin(self) -> None:
+        """Neuer Prüflauf: Ordner-mtimes neu lesen."""
+        self._dirs.clear()
+
+    def stat(self, path: str) -> Optional[os.stat_result]:
+        dir_mtime = self._dir_mtime(os.path.dirname(path))
+        now = time.monotonic()
+        entry = self._entries.get(path)
+        if (entry and dir_mtime is not None and entry[0] == dir_mtime
+                and now - entry[2] < self.max_age_s):
+            return entry[1]
+        self.file_stats += 1
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            st = None
+        racy = dir_mtime is None or time.time() - dir_mtime / 1e9 < RACY_S
+        self._entries[path] = (None if racy else dir_mtime, st, now)
+        return st
+
+    def _dir_mtime(self, path: str) -> Optional[int]:
+        if path not in self._dirs:
+            try:
+                self._dirs[path] = os.stat(path).st_mtime_ns
+            except (OSError, ValueError):
+                self._dirs[path] = None
+        return self._dirs[path]
+
+
+# -------------------------------------------------------------------
+# Prüfung
+# -------------------------------------------------------------------
+class HealthChecker:
+    def __init__(self, stats: Optional[StatCache] = None) -> None:
+        self.stats = stats or StatCache()
+
+    def check(self, keys: Iterable[Key]) -> Dict[Key, Tuple[str, ...]]:
+        """Alle ``keys`` prüfen; Ergebnis enthält auch die fehlerfreien (``OK``)."""
+        self.stats.begin()
+        return {k: self.problems(k) for k in set(keys)}
+
+    def problems(self, k: Key) -> Tuple[str, ...]:
+        action, payload, icon = k
+        out = []
+        if action == "LINK":
+            if not valid_url(payload):
+                out.append(f"Ungültige URL: {payload or '(leer)'}")
+        elif action in ("SCRIPT", "FILE", "FOLDER"):
+            out.extend(self._path_problems(action, payload))
+        if icon not in NO_ICON:
+            st = self.stats.stat(_abs(icon))
+            if st is None or not stat.S_ISREG(st.st_mode):
+                out.append(f"Icon fehlt: {icon}")
+        return tuple(out)
+
+    def _path_problems(self, action: str, payload: str) -> Iterable[str]:
+        if not payload:
+            return ["Kein Pfad angegeben"]
+        path = _abs(payload)
+        st = self.stats.stat(path)
+        if st is None:
+            return [f"Nicht gefunden: {payload}"]
+        if action == "FOLDER":
+            return [] if stat.S_ISDIR(st.st_mode) else [f"Kein Ordner: {payload}"]
+        if not stat.S_ISREG(st.st_mode):
+            return [f"Keine Datei: {payload}"]
+        if action == "SCRIPT" and not _runnable(path, st):
+            return [f"Nicht ausführbar: {payload}"]
+        return []
+
+
+def _runnable(path: str, st: os.stat_result) -> bool:
+    if os.path.splitext(path)[1].lower() in (".py", ".pyw"):
+        return bool(st.st_mode & 0o444)             # läuft über den Interpreter
+    if sys.platform.startswith("win"):
+        return True                                 # Windows: über die Dateiendung
+    return bool(st.st_mode & 0o111)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+core.instance_server
+====================
+
+Server-Seite des Single-Instance-Modus (Client: core.single_instance).
+
+* ``claim()`` nimmt ``<Projekt-Root>/.cache/instance.lock`` (QLockFile –
+  verwaiste Locks abgestürzter Instanzen erkennt Qt selbst an der PID).
+* ``listen()`` öffnet den lokalen Socket, sobald das Hauptfenster steht;
+  vorher wartende zweite Starts versuchen es so lange erneut. Scheitert
+  das, gibt die Instanz das Lock wieder frei (weitere Starts laufen dann
+  ohne Wartezeit eigenständig).
+* Jede Anfrage wird mit ``{"ok": true}`` quittiert und als
+  ``request(argv)``-Signal im GUI-Thread weitergereicht.
+"""
+from __future__ import annotations
+
+import json
+
+from PySide6.QtCore import QLockFile, QObject, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from core.single_instance import lock_path, pack, server_address
+
+# Ab so alten Lock-Dateien darf Qt sie als verwaist behandeln (ms)
+STALE_LOCK_MS = 0                    # 0 = nur per PID-Prüfung
+
+
+class InstanceServer(QObject):
+    request = Signal(list)           # argv der zweiten Instanz
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        path = lock_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = QLockFile(str(path))
+        self._lock.setStaleLockTime(STALE_LOCK_MS)
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers: dict[QLocalSocket, bytearray] = {}
+        self.error = ""                  # Grund, falls listen() scheitert
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def claim(self) -> bool:
+        """True = diese Instanz ist die erste (Lock gehalten)."""
+        return self._lock.tryLock(0)
+
+    def listen(self) -> bool:
+        """
+        Socket öffnen; nur mit gehaltenem Lock (dann ist ein alter Socket verwaist).
+        Klappt das nicht, wird das Lock freigegeben – sonst warteten spätere
+        Starts STARTUP_WAIT_S lang auf einen Server, der nie antwortet.
+        """
+        if not self._lock.isLocked():
+            return False
+        QLocalServer.removeServer(server_address())
+        if self._server.listen(server_address()):
+            return True
+        self.error = self._server.errorString()
+        self._lock.unlock()
+        return False
+
+    def close(self) -> None:
+        self._server.close()
+        if self._lock.isLocked():
+            self._lock.unlock()
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _on_new_connection(self) -> None:
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            self._buffers[sock] = bytearray()
+            sock.readyRead.connect(lambda s=sock: self._on_ready_read(s))
+            sock.disconnected.connect(lambda s=sock: self._on_disconnected(s))
+
+    def _on_disconnected(self, sock: QLocalSocket) -> None:
+        self._buffers.pop(sock, None)
+        sock.deleteLater()
+
+    def _on_ready_read(self, sock: QLocalSocket) -> None:
+        buf = self._buffers.get(sock)
+        if buf is None:
+            return
+        buf += bytes(sock.readAll())
+        while (nl := buf.find(b"\n")) >= 0:
+            raw = bytes(buf[:nl])
+            del buf[:nl + 1]
+            try:
+                msg = json.loads(raw)
+            except ValueError:
+                continue
+            if msg.get("cmd") != "activate":
+                continue
+            sock.write(pack({"ok": True}))       # erst quittieren – der Client wartet
+            sock.flush()
+            self.request.emit(list(msg.get("argv", [])))
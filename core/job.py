@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+core.job
+========
+
+Qt-freier Kern der Skript-Ausführung. Wird von ``core.runner.ScriptRunner``
+(GUI/Daemon, Events → core.dispatcher) und von ``core.cli`` (Terminal)
+gleichermaßen benutzt – damit gelten überall dieselben Regeln für Log,
+Fortschritt, Limits und Abbruch.
+
+Events gehen an einen ``emit(name, *args)``-Callback; die Namen entsprechen
+den Signalen von core.dispatcher (``job_progress``, ``job_finished`` …).
+Zusätzlich hält ``Job.output`` (core.output_buffer) die jüngste Ausgabe
+samt Fortschritts-Stichproben begrenzt im Speicher.
+"""
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from core import tracing
+from core.log_manager import log_manager
+from core.log_search import log_index
+from core.metrics import SPAWN_LATENCY, job_metrics
+from core.models import JobLimits
+from core.output_buffer import OutputBuffer
+from core.progress_protocol import ENV_FLAG, PREFIX, parse_message
+from core.resources import ResourceStats, sampler
+from core.supervisor import apply_limits, limit_command, popen_kwargs, supervisor
+from util.paths import project_root
+
+# emit("job_progress", job_id, 42, "…") usw.
+Emit = Callable[..., None]
+
+# Fallback-Fortschritt aus Freitext: “... 42%” am Ende oder “[42%] ...”
+_PCT_END_RE = re.compile(r"(\d{1,3})\s*%$")
+_PCT_BRACKET_RE = re.compile(r"\[(\d{1,3})%]")
+# Log spätestens so oft auf die Platte (Log-Viewer folgt der Datei)
+LOG_FLUSH_S = 0.25
+
+
+class Job:
+    """
+    Führt das gegebene Skript im Subprozess aus und meldet stdout/stderr Zeile
+    für Zeile. Fortschritts-Parsing: erkennt “... 42%” am Zeilenende oder
+    “[42%] ...”. Sobald ein Skript das strukturierte Protokoll benutzt, wird
+    die Freitext-Erkennung für diesen Job abgeschaltet.
+    """
+
+    def __init__(self, job_id: str, script_path: Path, limits: Optional[JobLimits] = None):
+        self.job_id = job_id
+        self.script_path = script_path
+        self.limits = limits or JobLimits()
+        self.returncode: int | None = None
+        self.stats: ResourceStats | None = None   # Peak/Summen nach Job-Ende
+        self.output = OutputBuffer()                 # jüngste Zeilen fürs Dashboard
+        self._proc: subprocess.Popen | None = None
+        self._abort_flag = False
+        self._expired: str | None = None     # Grund bei Timeout/Stall
+        self._structured = False             # Skript spricht progress_protocol
+        self._created = time.monotonic()     # Klick/Auftrag → Spawn-Latenz
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def succeeded(self) -> bool:
+        """Exitcode 0 und weder abgebrochen noch per Timeout/Stall beendet."""
+        return self.returncode == 0 and not self._abort_flag and not self._expired
+
+    def abort(self) -> None:
+        """
+        Bricht das laufende Skript samt Kindprozessen ab. Kehrt sofort zurück;
+        die Eskalation SIGTERM → SIGKILL übernimmt der Supervisor.
+        """
+        self._abort_flag = True
+        supervisor.terminate(self.job_id)
+
+    def run(self, emit: Emit) -> None:
+        """Blockiert bis zum Ende des Skripts (läuft in einem Worker-Thread)."""
+        self._progress(emit, 0, "Starte Skript …")
+        start_ts = time.time()
+        log_index.job_started(self.job_id, self.script_path.name, start_ts)
+
+        try:
+            with tracing.span("spawn", "job", script=self.script_path.name):
+                self._proc = subprocess.Popen(
+                    limit_command([sys.executable, str(self.script_path)], self.limits),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1,
+                    text=True,
+                    env=self._child_env(),
+                    **popen_kwargs()
+                )
+                apply_limits(self._proc.pid, self.limits)
+            SPAWN_LATENCY.observe(time.monotonic() - self._created)
+            watch = supervisor.watch(self.job_id, self._proc, self.limits, self._on_expire)
+            sampler.track(
+                self.job_id, self._proc.pid,
+                lambda stats: emit("job_resources", self.job_id, stats),
+            )
+            if self._abort_flag:                      # Stop kam vor dem Start
+                supervisor.terminate(self.job_id)
+
+            with log_manager.open_job_log(self.job_id) as log_f:
+                last_flush = time.monotonic()
+                batch_ns, batch_lines = time.perf_counter_ns(), 0   # Trace: Zeilen je Flush
+                for line in self._proc.stdout:        # type: ignore[arg-type]
+                    watch.touch()
+                    batch_lines += 1
+                    line = line.rstrip("\n")
+
+                    if line.startswith(PREFIX):       # strukturierte Meldung
+                        info = parse_message(line)
+                        if info is not None:
+                            self._structured = True
+                            line = info.describe()
+                            progress = info.effective_percent()
+                            emit("job_progress_info", self.job_id, info)
+                        else:
+                            progress = None
+                    elif self._structured:
+                        progress = None
+                    else:                             # Fortschritt ermitteln (optional)
+                        progress = self._extract_percent(line)
+
+                    part, lineno = log_f.write_line(line)
+                    log_index.add_line(self.job_id, lineno, line, part)
+                    now = time.monotonic()
+                    if now - last_flush >= LOG_FLUSH_S:
+                        log_f.flush()
+                        last_flush = now
+                        end_ns = time.perf_counter_ns()
+                        tracing.complete("ingest", batch_ns, end_ns, "job",
+                                         {"job_id": self.job_id, "lines": batch_lines})
+                        job_metrics.on_output(batch_lines)
+                        batch_ns, batch_lines = end_ns, 0
+                    self._progress(emit, progress if progress is not None else -1, line)
+
+                    if self._abort_flag:
+                        break
+                if batch_lines:
+                    tracing.complete("ingest", batch_ns, time.perf_counter_ns(), "job",
+                                     {"job_id": self.job_id, "lines": batch_lines})
+                    job_metrics.on_output(batch_lines)
+
+            rc = self.returncode = self._proc.wait()
+            dur = time.time() - start_ts
+
+            if self._expired:
+                emit("job_error", self.job_id, self._expired)
+            elif self._abort_flag:
+                emit("job_aborted", self.job_id)
+                self._progress(emit, 100, f"⏹ Abgebrochen nach {dur:0.1f}s")
+            elif rc == 0:
+                emit("job_finished", self.job_id)
+                self._progress(emit, 100, f"✅ Fertig in {dur:0.1f}s")
+            else:
+                emit("job_error", self.job_id, f"Exitcode {rc}")
+        except Exception as exc:
+            emit("job_error", self.job_id, str(exc))
+
+        finally:
+            supervisor.unwatch(self.job_id)
+            self.stats = sampler.untrack(self.job_id)
+            log_index.job_ended(self.job_id, self._state(), self.returncode, time.time(), self.stats)
+            if self.stats is not None:
+                emit("job_resources", self.job_id, self.stats)
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _progress(self, emit: Emit, percent: int, msg: str) -> None:
+        """Zeile in den Ringpuffer und als ``job_progress`` melden."""
+        self.output.append(msg)
+        if percent >= 0:
+            self.output.add_sample(percent)
+        emit("job_progress", self.job_id, percent, msg)
+
+    def _state(self) -> str:
+        """Endzustand wie im Dashboard: finished | aborted | error."""
+        if self.succeeded:
+            return "finished"
+        if self._abort_flag and not self._expired:
+            return "aborted"
+        return "error"
+
+    def _on_expire(self, reason: str) -> None:
+        """Vom Supervisor-Thread bei Timeout/Stall – Abbruch folgt dort."""
+        self._expired = reason
+
+    @staticmethod
+    def _child_env() -> dict:
+        """Umgebung fürs Skript: Protokoll aktiv + core.progress_client importierbar."""
+        env = os.environ.copy()
+        env[ENV_FLAG] = "1"
+        root = str(project_root())
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (root, env.get("PYTHONPATH")) if p)
+        return env
+
+    @staticmethod
+    def _extract_percent(text: str) -> int | None:
+        """
+        Versucht am Zeilenende eine Prozentzahl (0-100) zu finden.
+        """
+        if "%" not in text:                  # schneller Ausstieg für normale Zeilen
+            return None
+        m = _PCT_END_RE.search(text) or _PCT_BRACKET_RE.search(text)
+        if m:
+            try:
+                val = int(m.group(1))
+                return max(0, min(val, 100))
+            except ValueError:
+                return None
+        return None
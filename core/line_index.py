@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+core.line_index
+===============
+
+Zeilen-Index über eine (wachsende) Textdatei per ``mmap`` – Qt-frei.
+
+* Öffnen kostet konstant: gemappt wird sofort, indiziert wird in
+  Häppchen (``index_more``), die der Aufrufer z. B. per Timer abarbeitet.
+* ``tail(n)`` liefert die letzten Zeilen auch ohne fertigen Index
+  (Rückwärtssuche ab Dateiende).
+* Wächst die Datei, wird nur der neue Teil nachindiziert; schrumpft sie
+  (neu angelegt/rotiert), beginnt der Index von vorn.
+* Komprimierte Logs (.gz/.zst, siehe core.log_manager) werden häppchenweise
+  in eine temporäre Datei entpackt und von dort gemappt – der Speicherbedarf
+  bleibt so unabhängig von der Log-Größe.
+
+Pro Zeile wird nur ihr Start-Offset gespeichert (8 Byte in einem ``array``);
+der Text selbst bleibt im Page-Cache des Betriebssystems.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import tempfile
+from array import array
+from itertools import accumulate, islice
+from pathlib import Path
+from typing import IO, List, Optional
+
+from core.log_manager import COMPRESSED, open_log
+
+# Bytes pro index_more()-Aufruf (≈ einige ms)
+CHUNK_BYTES = 4 * 1024 * 1024
+# Überlange Zeilen werden für die Anzeige abgeschnitten
+MAX_LINE_BYTES = 16 * 1024
+
+
+def _decode(raw: bytes) -> str:
+    if len(raw) > MAX_LINE_BYTES:
+        raw = raw[:MAX_LINE_BYTES]
+    return raw.decode("utf-8", errors="replace").rstrip("\r")
+
+
+class LineIndex:
+    """Offsets aller Zeilenanfänge einer Datei; Zeilen werden bei Bedarf gelesen."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._fh = None
+        self._src: Optional[IO[bytes]] = None   # Dekompressor (nur .gz/.zst)
+        self._mm: Optional[mmap.mmap] = None
+        self._size = 0                       # gemappte Größe
+        self._scanned = 0                    # bis hier indiziert
+        self._offsets = array("q", [0])      # Start jeder Zeile nach einem '\n'
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def complete(self) -> bool:
+        """True, wenn alle gemappten (bzw. entpackten) Bytes indiziert sind."""
+        return self._scanned >= self._size and self._src is None
+
+    def line_count(self) -> int:
+        """Bekannte Zeilen (inkl. unvollständiger letzter Zeile, sobald komplett)."""
+        n = len(self._offsets) - 1
+        if self.complete and self._size > self._offsets[-1]:
+            n += 1
+        return n
+
+    def refresh(self) -> bool:
+        """Dateigröße prüfen und neu mappen; True, wenn sich etwas geändert hat."""
+        if self.path.suffix in COMPRESSED:      # wächst nicht; entpackt wird in index_more
+            if self._fh is not None:
+                return False
+            try:
+                self._src = open_log(self.path)
+            except OSError:
+                return False
+            self._fh = tempfile.TemporaryFile()
+            return True
+        try:
+            size = os.stat(self.path).st_size
+        except OSError:
+            if self._fh is not None:
+                self._reset()
+                return True
+            return False
+        if size == self._size and self._fh is not None:
+            return False
+        if size < self._size:                # gekürzt/neu angelegt → neu indizieren
+            self._reset()
+        self._map(size)
+        return True
+
+    def index_more(self, budget: int = CHUNK_BYTES) -> int:
+        """Indiziert bis zu ``budget`` weitere Bytes; liefert die Zahl neuer Zeilen."""
+        if self._src is not None and self._scanned >= self._size:
+            self._inflate(budget)
+        if self._mm is None or self._scanned >= self._size:
+            return 0
+        start = self._scanned
+        end = min(self._size, start + budget)
+        parts = self._mm[start:end].split(b"\n")
+        before = len(self._offsets)
+        # Offsets hinter jedem '\n' – das letzte Teilstück ist (noch) keine Zeile
+        steps = (len(p) + 1 for p in islice(parts, len(parts) - 1))
+        self._offsets.extend(islice(accumulate(steps, initial=start), 1, None))
+        self._scanned = end
+        return len(self._offsets) - before
+
+    def index_all(self) -> None:
+        while not self.complete:
+            self.index_more()
+
+    def lines(self, first: int, count: int) -> List[str]:
+        """Zeilen ``first`` … ``first + count - 1`` (soweit indiziert)."""
+        if self._mm is None:
+            return []
+        last = min(first + count, self.line_count())
+        result = []
+        offsets = self._offsets
+        for i in range(max(0, first), last):
+            start = offsets[i]
+            end = offsets[i + 1] - 1 if i + 1 < len(offsets) else self._size
+            result.append(_decode(self._mm[start:end]))
+        return result
+
+    def tail(self, count: int) -> List[str]:
+        """Die letzten ``count`` Zeilen – unabhängig vom Indexstand."""
+        if self._mm is None or count <= 0:
+            return []
+        mm = self._mm
+        end = self._size
+        if end and mm[end - 1:end] == b"\n":
+            end -= 1
+        result = []
+        while len(result) < count and end > 0:
+            nl = mm.rfind(b"\n", 0, end)
+            result.append(_decode(mm[nl + 1:end]))
+            end = nl
+        if end == 0 and self._size and len(result) < count and mm[0:1] == b"\n":
+            result.append("")
+        result.reverse()
+        return result
+
+    def close(self) -> None:
+        self._reset()
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _inflate(self, budget: int) -> None:
+        """Nächstes Stück entpacken und an die Temp-Datei hängen."""
+        try:
+            data = self._src.read(budget)
+        except (OSError, EOFError):          # defekt/abgeschnitten → bis hier anzeigen
+            data = b""
+        if not data:
+            self._src.close()
+            self._src = None
+            return
+        self._fh.seek(0, os.SEEK_END)
+        self._fh.write(data)
+        self._fh.flush()
+        self._map(self._size + len(data))
+
+    def _map(self, size: int) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fh is None:
+            self._fh = open(self.path, "rb")
+        self._size = size
+        if size:                             # leere Dateien lassen sich nicht mappen
+            self._mm = mmap.mmap(self._fh.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _reset(self) -> None:
+        if self._src is not None:
+            self._src.close()
+            self._src = None
+        if self._mm is not None:
+            self._mm.close()
+        if self._fh is not None:
+            self._fh.close()
+        self._fh = None
+        self._mm = None
+        self._size = 0
+        self._scanned = 0
+        self._offsets = array("q", [0])
+
+    def __del__(self) -> None:
+        try:
+            self._reset()
+        except Exception:
+            pass
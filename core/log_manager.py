@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+core.log_manager
+================
+
+Verwaltung der Job-Logs (Qt-frei) – unabhängig vom Arbeitsverzeichnis
+immer unter ``<Projekt-Root>/logs`` (bzw. ``$MGUI_LOG_DIR``).
+
+* ``open_job_log(job_id)`` liefert den Schreiber für ``Job.run``; wird ein
+  einzelnes Log größer als ``rotate_mb``, geht es in ``<job_id>.1.log``,
+  ``<job_id>.2.log`` … weiter. Erhalten bleiben der Anfang (Teil 0) und
+  die letzten ``keep_parts - 1`` Teile (der aktuelle zählt mit, daher
+  ``keep_parts`` ≥ 2 – so erzwingt es auch das Schema); verworfene Teile melden
+  ``on_part_removed`` (Suchindex vergisst ihre Zeilen).
+* ``maintain()`` läuft gelegentlich im Hintergrund (angestoßen durch neue
+  Jobs): komprimiert kalte Logs (gzip bzw. zstd, falls die Standardbibliothek
+  es kennt), löscht zu alte und hält die Gesamtgröße unter ``max_total_mb``.
+  Logs laufender Jobs werden nie angefasst – auch nicht die eines anderen
+  Prozesses (Job-Daemon, CLI): der Schreiber hält auf seinen aktuellen Teil
+  ein geteiltes ``flock``, das erst mit dem Prozess verschwindet. Ohne
+  ``fcntl`` (Windows) gilt stattdessen: zuletzt vor ``LIVE_S`` geschrieben.
+* ``open_log(path)`` liest .log/.log.gz/.log.zst einheitlich als Stream.
+
+Konfiguration optional in der config.json::
+
+    "logs": {"max_age_days": 30, "max_total_mb": 1024, "rotate_mb": 256,
+             "keep_parts": 4, "compress_after_h": 1, "compression": "gzip"}
+"""
+from __future__ import annotations
+
+import gzip
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import IO, Callable, Dict, List, Optional, Tuple
+
+from util.paths import project_root
+
+try:                                    # nur POSIX
+    import fcntl
+except ImportError:                     # pragma: no cover – Windows
+    fcntl = None
+
+ENV_DIR = "MGUI_LOG_DIR"
+# Wartung höchstens so oft (Sekunden)
+MAINTAIN_EVERY_S = 600
+COMPRESSED = (".gz", ".zst")
+# ohne fcntl: so kurz nach dem letzten Schreiben gilt ein Log als aktiv
+LIVE_S = 15 * 60
+
+
+def _zstd():
+    """``compression.zstd`` (Python ≥ 3.14) oder None."""
+    try:
+        from compression import zstd     # type: ignore[import-not-found]
+        return zstd
+    except ImportError:
+        return None
+
+
+def open_log(path: Path) -> IO[bytes]:
+    """Öffnet ein (ggf. komprimiertes) Log binär zum sequentiellen Lesen."""
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    if path.suffix == ".zst":
+        zstd = _zstd()
+        if zstd is None:
+            raise OSError(f"{path.name}: zstd wird von diesem Python nicht unterstützt")
+        return zstd.open(path, "rb")
+    return open(path, "rb")
+
+
+def parse_log_name(name: str) -> Optional[Tuple[str, int]]:
+    """``abc.log`` → ("abc", 0), ``abc.3.log.gz`` → ("abc", 3); sonst None."""
+    for suffix in COMPRESSED:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    if not name.endswith(".log"):
+        return None
+    stem = name[:-4]
+    job_id, _, part = stem.rpartition(".")
+    if job_id and part.isdigit():
+        return job_id, int(part)
+    return stem, 0
+
+
+@dataclass
+class LogPolicy:
+    max_age_days: float = 30
+    max_total_mb: float = 1024
+    rotate_mb: float = 256
+    keep_parts: int = 4
+    compress_after_h: float = 1
+    compression: str = "gzip"            # gzip | zstd | none
+
+    @classmethod
+    def from_config(cls, cfg: Optional[dict]) -> "LogPolicy":
+        cfg = cfg or {}
+        return cls(**{f.name: cfg[f.name] for f in fields(cls) if cfg.get(f.name) is not None})
+
+
+# -------------------------------------------------------------------
+class JobLogWriter:
+    """Schreibt das Log eines Jobs zeilenweise und rotiert bei ``rotate_mb``."""
+
+    def __init__(self, manager: "LogManager", job_id: str) -> None:
+        self._manager = manager
+        self.job_id = job_id
+        self.part = 0
+        self.lineno = 0                      # nächste Zeile im aktuellen Teil
+        self._limit = max(1, int(manager.policy.rotate_mb * 1024 * 1024))
+        self._size = 0                       # Zeichen ≈ Bytes (reicht für die Grenze)
+        self._f = self._open()
+
+    def write_line(self, line: str) -> Tuple[int, int]:
+        """Schreibt ``line``; liefert (Teil, Zeilennummer) für den Suchindex."""
+        data = line + "\n"
+        if self._size + len(data) > self._limit and self.lineno:
+            self._rotate()
+        self._f.write(data)
+        self._size += len(data)
+        pos = (self.part, self.lineno)
+        self.lineno += 1
+        return pos
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+        self._manager._release(self.job_id)
+
+    def __enter__(self) -> "JobLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --------------------------------
+    def _open(self):
+        f = self._manager.part_path(self.job_id, self.part).open("w", encoding="utf-8")
+        if fcntl is not None:            # „wird geschrieben“ – auch für andere Prozesse
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except OSError:
+                pass
+        return f
+
+    def _rotate(self) -> None:
+        old = self._f
+        self.part += 1
+        self.lineno = 0
+        self._size = 0
+        self._f = self._open()           # erst den neuen Teil sperren, dann den alten freigeben
+        old.close()
+        # Anfang + letzte keep_parts-1 Teile behalten; der aktuelle Teil bleibt
+        # immer (keep_parts < 2 aus Code statt Config wirkt daher wie 2)
+        drop = self.part - max(1, self._manager.policy.keep_parts - 1)
+        if drop > 0:
+            self._manager.part_path(self.job_id, drop).unlink(missing_ok=True)
+            for cb in self._manager.on_part_removed:
+                cb(self.job_id, drop)
+
+
+# -------------------------------------------------------------------
+class LogManager:
+    def __init__(self) -> None:
+        self.policy = LogPolicy()
+        # Callbacks für gelöschte Jobs bzw. verworfene Teile (Suchindex bereinigen)
+        self.on_removed: List[Callable[[List[str]], None]] = []
+        self.on_part_removed: List[Callable[[str, int], None]] = []
+        self._active: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._last_maintain = 0.0
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Pfade
+    # ------------------------------------------------------------------
+    @property
+    def root(self) -> Path:
+        override = os.environ.get(ENV_DIR)
+        return Path(override) if override else project_root() / "logs"
+
+    def configure(self, cfg: Optional[dict]) -> None:
+        """Übernimmt den ``"logs"``-Abschnitt der config.json."""
+        self.policy = LogPolicy.from_config(cfg)
+
+    def part_path(self, job_id: str, part: int = 0) -> Path:
+        name = f"{job_id}.log" if part == 0 else f"{job_id}.{part}.log"
+        return self.root / name
+
+    def find(self, job_id: str, part: int = 0) -> Path:
+        """Vorhandene Datei eines Teils (auch komprimiert); sonst der Klartext-Pfad."""
+        plain = self.part_path(job_id, part)
+        for candidate in (plain, *(plain.with_name(plain.name + s) for s in COMPRESSED)):
+            if candidate.exists():
+                return candidate
+        return plain
+
+    def parts(self, job_id: str) -> List[Path]:
+        """Alle vorhandenen Teile eines Jobs, nach Teilnummer sortiert."""
+        found = []
+        for path in self.root.glob(f"{job_id}.*"):
+            parsed = parse_log_name(path.name)
+            if parsed and parsed[0] == job_id:
+                found.append((parsed[1], path))
+        return [p for _, p in sorted(found)]
+
+    def latest(self, job_id: str) -> Path:
+        """Jüngster Teil – das, was ein laufender Job gerade schreibt."""
+        parts = self.parts(job_id)
+        return parts[-1] if parts else self.part_path(job_id)
+
+    # ------------------------------------------------------------------
+    # Schreiben
+    # ------------------------------------------------------------------
+    def open_job_log(self, job_id: str) -> JobLogWriter:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._active[job_id] = self._active.get(job_id, 0) + 1
+        self.maintain_soon()
+        return JobLogWriter(self, job_id)
+
+    def _release(self, job_id: str) -> None:
+        with self._lock:
+            n = self._active.get(job_id, 0) - 1
+            if n > 0:
+                self._active[job_id] = n
+            else:
+                self._active.pop(job_id, None)
+
+    # ------------------------------------------------------------------
+    # Wartung
+    # ------------------------------------------------------------------
+    def maintain_soon(self) -> None:
+        """Startet maintain() im Hintergrund, falls die letzte Runde lange her ist."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_maintain < MAINTAIN_EVERY_S and self._last_maintain:
+                return
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._last_maintain = now
+            self._thread = threading.Thread(target=self.maintain, name="log-maintain", daemon=True)
+            self._thread.start()
+
+    def maintain(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Komprimieren, Alters- und Größen-Retention. Liefert Zähler (für Tests/Log)."""
+        now = time.time() if now is None else now
+        policy = self.policy
+        stats = {"compressed": 0, "removed": 0}
+        with self._lock:
+            active = set(self._active)
+
+        # job_id → [(pfad, größe, mtime)]
+        jobs: Dict[str, List[Tuple[Path, int, float]]] = {}
+        try:
+            entries = list(os.scandir(self.root))
+        except OSError:
+            return stats
+        for entry in entries:
+            parsed = parse_log_name(entry.name)
+            if parsed is None or parsed[0] in active or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            jobs.setdefault(parsed[0], []).append((Path(entry.path), st.st_size, st.st_mtime))
+
+        # 0) Jobs, die gerade (in irgendeinem Prozess) schreiben, bleiben unberührt
+        for job_id in [j for j, files in jobs.items() if self._is_live(files, now)]:
+            del jobs[job_id]
+
+        removed: List[str] = []
+        # 1) zu alt → weg
+        max_age = policy.max_age_days * 86_400
+        for job_id, files in list(jobs.items()):
+            if now - max(m for _, _, m in files) > max_age:
+                self._remove(files)
+                removed.append(job_id)
+                del jobs[job_id]
+
+        # 2) kalte Klartext-Logs komprimieren
+        method = policy.compression
+        if method == "zstd" and _zstd() is None:
+            method = "gzip"
+        if method != "none":
+            cold = now - policy.compress_after_h * 3_600
+            for job_id, files in jobs.items():
+                for i, (path, size, mtime) in enumerate(files):
+                    if path.suffix == ".log" and mtime < cold:
+                        packed = self._compress(path, method)
+                        if packed is not None:
+                            files[i] = (packed, packed.stat().st_size, mtime)
+                            stats["compressed"] += 1
+
+        # 3) Gesamtgröße begrenzen – älteste Jobs zuerst
+        limit = policy.max_total_mb * 1024 * 1024
+        total = sum(s for files in jobs.values() for _, s, _ in files)
+        for job_id in sorted(jobs, key=lambda j: max(m for _, _, m in jobs[j])):
+            if total <= limit:
+                break
+            total -= sum(s for _, s, _ in jobs[job_id])
+            self._remove(jobs[job_id])
+            removed.append(job_id)
+
+        stats["removed"] = len(removed)
+        if removed:
+            for cb in self.on_removed:
+                cb(removed)
+        return stats
+
+    @staticmethod
+    def _is_live(files: List[Tuple[Path, int, float]], now: float) -> bool:
+        """Schreibt noch jemand? Geprüft wird der jüngste Klartext-Teil."""
+        plain = [(parse_log_name(p.name)[1], p, m) for p, _, m in files if p.suffix == ".log"]
+        if not plain:
+            return False                 # komprimiert → fertig geschrieben
+        _, path, mtime = max(plain)
+        if fcntl is None:
+            return now - mtime < LIVE_S
+        try:
+            with path.open("rb") as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True                  # geteiltes Lock eines Schreibers
+        except OSError:
+            return False                 # inzwischen verschwunden o. ä.
+        return False
+
+    @staticmethod
+    def _remove(files: List[Tuple[Path, int, float]]) -> None:
+        for path, _, _ in files:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:              # z. B. unter Windows noch geöffnet
+                pass
+
+    @staticmethod
+    def _compress(path: Path, method: str) -> Optional[Path]:
+        suffix = ".zst" if method == "zstd" else ".gz"
+        target = path.with_name(path.name + suffix)
+        tmp = target.with_name(target.name + ".tmp")
+        try:
+            st = path.stat()
+            with path.open("rb") as src:
+                if method == "zstd":
+                    dst = _zstd().open(tmp, "wb")
+                else:
+                    dst = gzip.open(tmp, "wb", compresslevel=6)
+                with dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.utime(tmp, (st.st_atime, st.st_mtime))      # Alter bleibt für Retention
+            os.replace(tmp, target)
+            path.unlink()
+            return target
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return None
+
+
+# Singleton-Instanz
+log_manager: LogManager = LogManager()
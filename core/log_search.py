@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+core.log_search
+===============
+
+Volltext-Index über alle Job-Logs (SQLite FTS5, Qt-frei).
+
+* ``core.job.Job`` meldet Start, jede Log-Zeile und das Ende an
+  ``log_index``; geschrieben wird ausschließlich im eigenen Writer-Thread
+  (gebündelt in Transaktionen) – der Job-Thread legt nur in eine Queue.
+* Tabelle ``jobs`` hält die Metadaten (Skript, Start/Ende, Status, Exitcode,
+  Peak-RSS sowie CPU-/I/O-Summen aus core.resources), ``lines`` den
+  durchsuchbaren Text samt Zeilennummer im Log.
+* ``backfill()`` nimmt ältere Logs ohne Metadaten nachträglich auf
+  (auch rotierte Teile und komprimierte Logs).
+* Löscht core.log_manager Logs (Retention) oder verwirft es rotierte
+  Teile, verschwinden auch ihre Zeilen.
+* ``history()`` liefert abgeschlossene Jobs seitenweise – das Dashboard
+  lädt damit Jobs nach, die es aus dem Speicher entlassen hat.
+* Ohne FTS5 im SQLite-Build wird auf eine normale Tabelle + LIKE
+  zurückgefallen (langsamer, aber funktionsgleich).
+"""
+from __future__ import annotations
+
+import atexit
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from core.log_manager import log_manager, open_log, parse_log_name
+from core.resources import ResourceStats
+
+# Schreib-Transaktion spätestens nach so vielen Einträgen bzw. Sekunden
+BATCH_ROWS = 2_000
+BATCH_S = 0.5
+# Ältere Index-Versionen werden verworfen und per backfill() neu aufgebaut
+SCHEMA_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id     TEXT PRIMARY KEY,
+    script     TEXT NOT NULL DEFAULT '',
+    started    REAL,
+    ended      REAL,
+    state      TEXT NOT NULL DEFAULT 'running',
+    returncode INTEGER,
+    cpu_s       REAL,
+    peak_rss    INTEGER,
+    read_bytes  INTEGER,
+    write_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS jobs_started ON jobs(started);
+"""
+_FTS = ("CREATE VIRTUAL TABLE IF NOT EXISTS lines "
+        "USING fts5(text, job_id UNINDEXED, part UNINDEXED, lineno UNINDEXED)")
+_PLAIN = """
+CREATE TABLE IF NOT EXISTS lines (text TEXT, job_id TEXT, part INTEGER, lineno INTEGER);
+CREATE INDEX IF NOT EXISTS lines_job ON lines(job_id);
+"""
+
+
+@dataclass
+class SearchHit:
+    job_id: str
+    script: str
+    started: float | None
+    state: str
+    part: int                   # Log-Teil (siehe core.log_manager)
+    lineno: int                 # 0-basiert innerhalb des Teils, wie core.line_index
+    text: str
+
+
+def _fts_query(text: str) -> str:
+    """Benutzereingabe → FTS5-Ausdruck: alle Wörter (UND), ``wort*`` = Präfix."""
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+@dataclass
+class JobRecord:
+    job_id: str
+    script: str
+    started: float | None
+    ended: float | None
+    state: str                  # finished | aborted | error
+    returncode: int | None
+    stats: ResourceStats | None = None      # Peak/Summen; None = nicht gemessen
+
+
+class LogIndex:
+    """SQLite-Index; schreibt über einen einzigen Hintergrund-Thread."""
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        self._db_path = Path(db_path) if db_path else None
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.fts: bool | None = None         # None = noch nicht geprüft
+
+    @property
+    def db_path(self) -> Path:
+        """Standard: ``search.sqlite`` im Log-Verzeichnis des log_manager."""
+        return self._db_path or log_manager.root / "search.sqlite"
+
+    # ------------------------------------------------------------------
+    # Schreiben (aus beliebigen Threads, nicht blockierend)
+    # ------------------------------------------------------------------
+    def job_started(self, job_id: str, script: str, started: float) -> None:
+        self._put(("start", job_id, script, started))
+
+    def add_line(self, job_id: str, lineno: int, text: str, part: int = 0) -> None:
+        self._put(("line", text, job_id, part, lineno))
+
+    def job_ended(self, job_id: str, state: str, returncode: int | None, ended: float,
+                  stats: ResourceStats | None = None) -> None:
+        self._put(("end", job_id, state, returncode, ended, stats))
+
+    def backfill(self, log_dir: Optional[Path] = None) -> None:
+        """Logs in ``log_dir`` (Standard: log_manager.root) ohne Index-Eintrag nachtragen."""
+        self._put(("backfill", Path(log_dir) if log_dir else log_manager.root))
+
+    def forget(self, job_ids: List[str]) -> None:
+        """Jobs samt Zeilen aus dem Index entfernen (Logs wurden gelöscht)."""
+        self._put(("forget", list(job_ids)))
+
+    def forget_part(self, job_id: str, part: int) -> None:
+        """Zeilen eines verworfenen Log-Teils entfernen (Rotation, core.log_manager)."""
+        self._put(("forget_part", job_id, part))
+
+    def flush(self) -> None:
+        """Wartet, bis alles Eingereichte geschrieben ist."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(("stop",))
+            self._thread.join()
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Lesen (eigene Verbindung pro Aufruf; WAL erlaubt paralleles Schreiben)
+    # ------------------------------------------------------------------
+    def search(
+        self,
+        text: str,
+        *,
+        script: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        states: Optional[tuple[str, ...]] = None,
+        limit: int = 500,
+    ) -> List[SearchHit]:
+        if not text.strip() or not self.db_path.exists():
+            return []
+        con = self._connect()
+        try:
+            if self.fts is None:
+                row = con.execute("SELECT sql FROM sqlite_master WHERE name = 'lines'").fetchone()
+                if row is None:
+                    return []
+                self.fts = "fts5" in row[0].lower()
+            if self.fts:
+                sql = ("SELECT l.job_id, j.script, j.started, j.state, l.part, l.lineno, l.text "
+                       "FROM lines l JOIN jobs j ON j.job_id = l.job_id "
+                       "WHERE lines MATCH ?")
+                args: list = [_fts_query(text)]
+            else:
+                sql = ("SELECT l.job_id, j.script, j.started, j.state, l.part, l.lineno, l.text "
+                       "FROM lines l JOIN jobs j ON j.job_id = l.job_id "
+                       "WHERE l.text LIKE ?")
+                args = [f"%{text.strip()}%"]
+            if script:
+                sql += " AND j.script = ?"
+                args.append(script)
+            if since is not None:
+                sql += " AND j.started >= ?"
+                args.append(since)
+            if until is not None:
+                sql += " AND j.started <= ?"
+                args.append(until)
+            if states:
+                sql += f" AND j.state IN ({','.join('?' * len(states))})"
+                args.extend(states)
+            sql += " ORDER BY j.started DESC, l.part, l.lineno LIMIT ?"
+            args.append(limit)
+            return [SearchHit(*row) for row in con.execute(sql, args)]
+        except sqlite3.OperationalError:     # z. B. ungültiger Suchausdruck
+            return []
+        finally:
+            con.close()
+
+    def history(self, *, before: Optional[float] = None, limit: int = 200) -> List[JobRecord]:
+        """Abgeschlossene Jobs, jüngste zuerst; ``before`` = Startzeit-Cursor fürs Blättern."""
+        if not self.db_path.exists():
+            return []
+        sql = ("SELECT job_id, script, started, ended, state, returncode, "
+               "cpu_s, peak_rss, read_bytes, write_bytes FROM jobs "
+               "WHERE state IN ('finished', 'aborted', 'error') AND started IS NOT NULL")
+        args: list = []
+        if before is not None:
+            sql += " AND started < ?"
+            args.append(before)
+        sql += " ORDER BY started DESC LIMIT ?"
+        args.append(limit)
+        con = self._connect()
+        try:
+            return [self._record(row) for row in con.execute(sql, args)]
+        except sqlite3.OperationalError:     # Index noch nicht angelegt
+            return []
+        finally:
+            con.close()
+
+    def scripts(self) -> List[str]:
+        if not self.db_path.exists():
+            return []
+        con = self._connect()
+        try:
+            return [r[0] for r in con.execute(
+                "SELECT DISTINCT script FROM jobs WHERE script != '' ORDER BY script")]
+        finally:
+            con.close()
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _record(row: tuple) -> JobRecord:
+        cpu_s, peak_rss, read_bytes, write_bytes = row[6:]
+        stats = None if cpu_s is None else ResourceStats(
+            cpu_s=cpu_s, peak_rss=peak_rss or 0,
+            read_bytes=read_bytes or 0, write_bytes=write_bytes or 0,
+        )
+        return JobRecord(*row[:6], stats=stats)
+
+    def _put(self, item: tuple) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._writer, name="log-index", daemon=True
+                    )
+                    self._thread.start()
+                    atexit.register(self.close)
+        self._queue.put(item)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(self.db_path, timeout=10)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
+    def _init_schema(self, con: sqlite3.Connection) -> None:
+        if con.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            con.executescript("DROP TABLE IF EXISTS lines; DROP TABLE IF EXISTS jobs;")
+            con.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        con.executescript(_SCHEMA)
+        try:
+            con.execute(_FTS)
+            self.fts = True
+        except sqlite3.OperationalError:     # SQLite ohne FTS5
+            self.fts = False
+            con.executescript(_PLAIN)
+        con.commit()
+
+    def _writer(self) -> None:
+        con = self._connect()
+        self._init_schema(con)
+        lines: list = []
+        pending = 0                          # entnommene, noch nicht bestätigte Einträge
+        deadline = 0.0
+        stop = False
+        while not stop:
+            try:
+                timeout = max(0.0, deadline - time.monotonic()) if pending else None
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is not None:
+                if not pending:
+                    deadline = time.monotonic() + BATCH_S
+                pending += 1
+                kind = item[0]
+                if kind == "line":
+                    lines.append(item[1:])
+                elif kind == "stop":
+                    stop = True
+                else:
+                    self._guarded(con, self._write_lines, con, lines)
+                    self._guarded(con, self._apply, con, item)
+            if pending and (item is None or stop or len(lines) >= BATCH_ROWS
+                            or time.monotonic() >= deadline):
+                self._guarded(con, self._write_lines, con, lines)
+                self._guarded(con, con.commit)
+                for _ in range(pending):
+                    self._queue.task_done()
+                pending = 0
+        con.close()
+
+    @staticmethod
+    def _guarded(con: sqlite3.Connection, fn, *args) -> None:
+        """Index ist Komfort – DB-Fehler dürfen den Writer nicht beenden."""
+        try:
+            fn(*args)
+        except sqlite3.Error as exc:
+            print(f"⚠️  Log-Index: {exc}", file=sys.stderr)
+            con.rollback()
+            if args and isinstance(args[-1], list):
+                args[-1].clear()
+
+    @staticmethod
+    def _write_lines(con: sqlite3.Connection, lines: list) -> None:
+        if lines:
+            con.executemany(
+                "INSERT INTO lines(text, job_id, part, lineno) VALUES (?, ?, ?, ?)", lines
+            )
+            lines.clear()
+
+    def _apply(self, con: sqlite3.Connection, item: tuple) -> None:
+        kind = item[0]
+        if kind == "start":
+            _, job_id, script, started = item
+            con.execute(
+                "INSERT OR REPLACE INTO jobs(job_id, script, started, state) VALUES (?, ?, ?, 'running')",
+                (job_id, script, started),
+            )
+        elif kind == "end":
+            _, job_id, state, rc, ended, stats = item
+            res = stats.as_dict() if stats is not None else {}
+            con.execute(
+                "UPDATE jobs SET state = ?, returncode = ?, ended = ?, cpu_s = ?, peak_rss = ?, "
+                "read_bytes = ?, write_bytes = ? WHERE job_id = ?",
+                (state, rc, ended, res.get("cpu_s"), res.get("peak_rss"),
+                 res.get("read_bytes"), res.get("write_bytes"), job_id),
+            )
+        elif kind == "backfill":
+            self._backfill(con, item[1])
+        elif kind == "forget":
+            for job_id in item[1]:
+                con.execute("DELETE FROM lines WHERE job_id = ?", (job_id,))
+                con.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        elif kind == "forget_part":
+            con.execute("DELETE FROM lines WHERE job_id = ? AND part = ?", item[1:])
+
+    @staticmethod
+    def _backfill(con: sqlite3.Connection, log_dir: Path) -> None:
+        known = {r[0] for r in con.execute("SELECT job_id FROM jobs")}
+        found: dict = {}                     # job_id → [(teil, pfad)]
+        for path in log_dir.iterdir() if log_dir.is_dir() else ():
+            parsed = parse_log_name(path.name)
+            if parsed and parsed[0] not in known:
+                found.setdefault(parsed[0], []).append((parsed[1], path))
+        def rows(job_id: str, parts: list):
+            for part, path in sorted(parts):     # gestreamt – auch für GB-Logs
+                with open_log(path) as f:
+                    for n, raw in enumerate(f):
+                        yield raw.decode("utf-8", "replace").rstrip("\r\n"), job_id, part, n
+
+        for job_id, parts in sorted(found.items()):
+            try:
+                mtime = max(p.stat().st_mtime for _, p in parts)
+                con.execute(
+                    "INSERT INTO jobs(job_id, script, started, ended, state) "
+                    "VALUES (?, '', ?, ?, 'unknown')",
+                    (job_id, mtime, mtime),
+                )
+                con.executemany(
+                    "INSERT INTO lines(text, job_id, part, lineno) VALUES (?, ?, ?, ?)",
+                    rows(job_id, parts),
+                )
+                con.commit()
+            except (OSError, EOFError):
+                con.rollback()
+
+
+# Singleton-Instanz (DB liegt neben den Logs)
+log_index: LogIndex = LogIndex()
+log_manager.on_removed.append(log_index.forget)
+log_manager.on_part_removed.append(log_index.forget_part)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+core.memory_diag
+================
+
+Speicher-Buchhaltung für lange laufende Sitzungen (Qt-frei).
+
+Ein ``MemorySnapshot`` hält zu einem Zeitpunkt fest:
+
+* RSS des Prozesses (``/proc/self/statm``, sonst ``None``)
+* Python-Objekte je Typ (``gc.get_objects()``)
+* Zähler aus registrierten *Proben* – z. B. lebende Qt-Widgets je Klasse
+  oder Dispatcher-Abos (liefert die UI, siehe ui.diagnostics_dialog)
+* optional einen ``tracemalloc``-Snapshot (Allokationen je Quellzeile)
+
+``diff(a, b)`` vergleicht zwei Snapshots: Zuwachs je Objekttyp, je
+Widget-Klasse und die größten Allokations-Zuwächse. ``MemoryTracker``
+nimmt periodisch Snapshots, behält einen Verlauf und schreibt je Probe
+eine Zeile nach ``<logs>/diagnostics/memory.log``.
+
+Einschalten per config.json ``"diagnostics": {"memory": true,
+"memory_interval_s": 60}`` oder Umgebungsvariable ``MGUI_MEMORY=1``
+(bzw. ``=<sekunden>``). ``tracemalloc`` läuft nur, wenn eingeschaltet –
+es kostet spürbar Speicher und Zeit.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import gc
+import os
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from core.log_manager import log_manager
+from core.resources import _PAGE_SIZE, PROC_AVAILABLE
+
+ENV_FLAG = "MGUI_MEMORY"
+# Standard-Abstand zwischen zwei automatischen Snapshots (Sekunden)
+INTERVAL_S = 60.0
+# gemerkte Snapshots im Verlauf und Einträge pro Diff-Abschnitt
+MAX_HISTORY = 240
+TOP_N = 15
+# Stack-Tiefe für tracemalloc (1 = nur die allozierende Zeile)
+TRACE_FRAMES = 1
+
+Probe = Callable[[], Dict[str, int]]
+
+
+def settings(cfg: Optional[dict]) -> Optional[float]:
+    """Snapshot-Intervall in Sekunden, falls aktiv – sonst None."""
+    env = os.environ.get(ENV_FLAG, "").strip()
+    if env == "0":                       # Umgebung schlägt Config
+        return None
+    if env:
+        return float(env) if env.replace(".", "", 1).isdigit() and env != "1" else INTERVAL_S
+    cfg = cfg or {}
+    if cfg.get("memory"):
+        return float(cfg.get("memory_interval_s", INTERVAL_S))
+    return None
+
+
+def rss_bytes() -> Optional[int]:
+    """Aktueller Resident Set Size – ohne ``/proc`` unbekannt."""
+    if not PROC_AVAILABLE:
+        return None
+    try:
+        return int(Path("/proc/self/statm").read_text().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def object_counts() -> Dict[str, int]:
+    """Anzahl vom GC verfolgter Objekte je Typ (``modul.Klasse`` außer Builtins)."""
+    counts: Counter = Counter()
+    for obj in gc.get_objects():
+        t = type(obj)
+        mod = t.__module__
+        counts[t.__qualname__ if mod == "builtins" else f"{mod}.{t.__qualname__}"] += 1
+    return dict(counts)
+
+
+# -------------------------------------------------------------------
+# Snapshot & Diff
+# -------------------------------------------------------------------
+@dataclass
+class MemorySnapshot:
+    taken: float                                         # time.time()
+    label: str = ""
+    rss: Optional[int] = None
+    objects: Dict[str, int] = field(default_factory=dict)
+    probes: Dict[str, Dict[str, int]] = field(default_factory=dict)   # Probe → Zähler
+    traced: Optional[tracemalloc.Snapshot] = None
+    traced_bytes: Optional[int] = None
+
+    @property
+    def object_total(self) -> int:
+        return sum(self.objects.values())
+
+    def probe_total(self, name: str) -> int:
+        return sum(self.probes.get(name, {}).values())
+
+    def summary(self) -> str:
+        when = _dt.datetime.fromtimestamp(self.taken).strftime("%Y-%m-%d %H:%M:%S")
+        parts = [when]
+        if self.label:
+            parts.append(self.label)
+        if self.rss is not None:
+            parts.append(f"RSS {self.rss / 2**20:0.1f} MB")
+        parts.append(f"Objekte {self.object_total}")
+        parts.extend(f"{name} {self.probe_total(name)}" for name in self.probes)
+        if self.traced_bytes is not None:
+            parts.append(f"tracemalloc {self.traced_bytes / 2**20:0.1f} MB")
+        return "  ".join(parts)
+
+
+def _delta(a: Dict[str, int], b: Dict[str, int], top: int) -> List[Tuple[str, int, int]]:
+    """(Schlüssel, Stand in b, Zuwachs) – größte Änderungen zuerst, ohne Nullen."""
+    rows = [(k, b.get(k, 0), b.get(k, 0) - a.get(k, 0)) for k in a.keys() | b.keys()]
+    rows = [r for r in rows if r[2]]
+    rows.sort(key=lambda r: (-abs(r[2]), r[0]))
+    return rows[:top]
+
+
+@dataclass
+class SnapshotDiff:
+    seconds: float
+    rss: Optional[int]                                   # Zuwachs in Bytes
+    objects: List[Tuple[str, int, int]]
+    probes: Dict[str, List[Tuple[str, int, int]]]
+    allocations: List[str]                               # tracemalloc, formatiert
+
+    def growth(self, probe: str) -> int:
+        """Netto-Zuwachs einer Probe über alle Schlüssel (nicht nur die Top-N)."""
+        return sum(d for _k, _n, d in self.probes.get(probe, []))
+
+    def format(self) -> str:
+        lines = [f"Zeitraum {self.seconds:0.0f} s"]
+        if self.rss is not None:
+            lines.append(f"RSS {self.rss / 2**20:+0.2f} MB")
+        lines.append("")
+        lines.append("Python-Objekte (Typ, Stand, Änderung):")
+        lines.extend(f"    {k:<50} {n:>9} {d:+8}" for k, n, d in self.objects)
+        for name, rows in self.probes.items():
+            lines.append("")
+            lines.append(f"{name}:")
+            lines.extend(f"    {k:<50} {n:>9} {d:+8}" for k, n, d in rows)
+        if self.allocations:
+            lines.append("")
+            lines.append("Allokationen (größter Zuwachs):")
+            lines.extend(f"    {a}" for a in self.allocations)
+        return "\n".join(lines)
+
+
+def diff(a: MemorySnapshot, b: MemorySnapshot, top: int = TOP_N) -> SnapshotDiff:
+    """Was ist zwischen ``a`` und ``b`` dazugekommen?"""
+    allocations: List[str] = []
+    if a.traced is not None and b.traced is not None:
+        for stat in b.traced.compare_to(a.traced, "lineno")[:top]:
+            if stat.size_diff:
+                frame = stat.traceback[0]
+                allocations.append(
+                    f"{Path(frame.filename).name}:{frame.lineno}  "
+                    f"{stat.size_diff / 1024:+0.1f} KiB  ({stat.count_diff:+} Blöcke)"
+                )
+    full = {name: _delta(a.probes.get(name, {}), b.probes.get(name, {}), 10**9)
+            for name in a.probes.keys() | b.probes.keys()}
+    return SnapshotDiff(
+        seconds=b.taken - a.taken,
+        rss=b.rss - a.rss if a.rss is not None and b.rss is not None else None,
+        objects=_delta(a.objects, b.objects, top),
+        probes={name: rows for name, rows in sorted(full.items())},
+        allocations=allocations,
+    )
+
+
+# -------------------------------------------------------------------
+# Tracker
+# -------------------------------------------------------------------
+class MemoryTracker:
+    """Verlauf von Snapshots; nur Basis und jüngster behalten ihren tracemalloc-Teil."""
+
+    def __init__(self, trace: bool = False, log_path: Optional[Path] = None) -> None:
+        self._probes: Dict[str, Probe] = {}
+        self._history: Deque[MemorySnapshot] = deque(maxlen=MAX_HISTORY)
+        self._baseline: Optional[MemorySnapshot] = None
+        self._log_path = log_path
+        self._lock = threading.Lock()
+        self.trace = trace
+
+    @property
+    def log_path(self) -> Path:
+        return self._log_path or log_manager.root / "diagnostics" / "memory.log"
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def add_probe(self, name: str, probe: Probe) -> None:
+        """``probe()`` liefert Zähler je Schlüssel, z. B. Widgets je Klasse."""
+        self._probes[name] = probe
+
+    def start_tracing(self) -> None:
+        self.trace = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    def stop_tracing(self) -> None:
+        self.trace = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        with self._lock:
+            for snap in self._history:
+                snap.traced = None
+
+    def take(self, label: str = "") -> MemorySnapshot:
+        """Neuen Snapshot aufnehmen, im Verlauf ablegen und protokollieren."""
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+        gc.collect()
+        snap = MemorySnapshot(taken=time.time(), label=label, rss=rss_bytes(),
+                              objects=object_counts())
+        for name, probe in self._probes.items():
+            try:
+                snap.probes[name] = dict(probe())
+            except Exception as exc:                     # Diagnose darf nie selbst stören
+                snap.probes[name] = {f"Fehler: {exc}": 0}
+        if tracemalloc.is_tracing():
+            snap.traced = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ))
+            snap.traced_bytes = tracemalloc.get_traced_memory()[0]
+        with self._lock:
+            if self._history and self._history[-1] is not self._baseline:
+                self._history[-1].traced = None          # nur Basis + jüngster behalten
+            self._history.append(snap)
+            if self._baseline is None:
+                self._baseline = snap
+        self._log(snap)
+        return snap
+
+    def set_baseline(self, snap: Optional[MemorySnapshot] = None) -> MemorySnapshot:
+        snap = snap or self.take("Basis")
+        with self._lock:
+            self._baseline = snap
+        return snap
+
+    def baseline(self) -> Optional[MemorySnapshot]:
+        return self._baseline
+
+    def history(self) -> List[MemorySnapshot]:
+        """Snapshots, ältester zuerst."""
+        with self._lock:
+            return list(self._history)
+
+    def diff_to_baseline(self) -> Optional[SnapshotDiff]:
+        base = self._baseline
+        if base is None:
+            return None
+        return diff(base, self.take())
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _log(self, snap: MemorySnapshot) -> None:
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.log_path.open("a", encoding="utf-8") as f:
+                f.write(snap.summary() + "\n")
+        except OSError:
+            pass
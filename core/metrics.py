@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+core.metrics
+============
+
+Leichtgewichtige Laufzeit-Metriken (Qt-frei): Zähler, Gauges und
+Histogramme mit festen Buckets – ein Lock, ein Dict-Zugriff pro Messung.
+
+* ``metrics.render()`` liefert alles im Prometheus-Textformat,
+  ``metrics.serve(port)`` stellt es unter ``http://127.0.0.1:<port>/metrics``
+  bereit, ``metrics.write(path)`` schreibt es als Datei (Textfile-Collector).
+* ``JobMetrics`` hängt sich an die Job-Signale (core.dispatcher) und zählt
+  Starts/Enden, laufende Jobs und Laufzeit pro Skript – das funktioniert für
+  lokale wie für Daemon-Jobs, weil der Daemon diese Signale weiterreicht.
+* Ausgabezeilen, Spawn-Latenz und Warteschlange misst dagegen der Prozess,
+  der die Jobs ausführt (core.job / core.runner). Läuft ein Job-Daemon,
+  landen sie in *dessen* Registry und bleiben in der GUI bei 0.
+* Perzentile (p50/p95/p99) werden wie bei Prometheus aus den Buckets
+  interpoliert; dafür muss nichts pro Messung gespeichert werden.
+
+Konfiguration optional in der config.json::
+
+    "metrics": {"port": 9464}
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+Labels = Tuple[str, ...]
+
+# Bucket-Grenzen (Sekunden)
+DURATION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _fmt(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _label_str(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    parts = [f'{n}="{v}"' for n, v in zip(names, (_escape(v) for v in values))]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# -------------------------------------------------------------------
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monoton steigender Zähler (optional pro Label-Kombination)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def total(self) -> float:
+        """Summe über alle Label-Kombinationen."""
+        with self._lock:
+            return sum(self._values.values())
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_label_str(self.labelnames, k)} {_fmt(v)}" for k, v in items
+        ]
+
+
+class Gauge(Counter):
+    """Momentanwert (darf fallen)."""
+
+    kind = "gauge"
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def dec(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        self.inc(-amount, labels)
+
+
+class Histogram(_Metric):
+    """Verteilung mit festen Buckets; ``quantile()`` interpoliert innerhalb."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DURATION_BUCKETS) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels → [zähler pro bucket …, +Inf], summe
+        self._data: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            data = self._data.get(labels)
+            if data is None:
+                data = self._data[labels] = ([0] * (len(self.buckets) + 1), [0.0, 0.0])
+            data[0][i] += 1
+            data[1][0] += value
+            data[1][1] = max(data[1][1], value)
+
+    def label_sets(self) -> List[Labels]:
+        with self._lock:
+            return sorted(self._data)
+
+    def count(self, labels: Labels = ()) -> int:
+        with self._lock:
+            data = self._data.get(labels)
+            return sum(data[0]) if data else 0
+
+    def max(self, labels: Labels = ()) -> Optional[float]:
+        with self._lock:
+            data = self._data.get(labels)
+            return data[1][1] if data else None
+
+    def quantile(self, q: float, labels: Labels = ()) -> Optional[float]:
+        """Geschätztes Quantil (0 < q < 1); None ohne Messungen."""
+        with self._lock:
+            data = self._data.get(labels)
+            if not data:
+                return None
+            counts, (_, peak) = list(data[0]), data[1]
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for i, n in enumerate(counts):
+            if seen + n >= rank and n:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else peak
+                return min(peak, lower + (upper - lower) * (rank - seen) / n)
+            seen += n
+        return peak
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(c), s[0])) for k, (c, s) in self._data.items())
+        lines = self._header()
+        for labels, (counts, total) in items:
+            acc = 0
+            for bound, n in zip((*self.buckets, math.inf), counts):
+                acc += n
+                le = _label_str(self.labelnames, labels, f'le="{_fmt(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {acc}")
+            suffix = _label_str(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_fmt(total)}")
+            lines.append(f"{self.name}_count{suffix} {acc}")
+        return lines
+
+
+class RecentRate:
+    """Ereignisse der letzten Minute in 60 Sekunden-Fächern (für „pro Minute“-Anzeigen)."""
+
+    SLOTS = 60
+
+    def __init__(self) -> None:
+        self._slots = [0.0] * self.SLOTS
+        self._second = int(time.monotonic())
+        self._lock = threading.Lock()
+
+    def add(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._advance(int(time.monotonic()))
+            self._slots[self._second % self.SLOTS] += amount
+
+    def per_minute(self) -> float:
+        with self._lock:
+            self._advance(int(time.monotonic()))
+            return sum(self._slots)
+
+    def _advance(self, second: int) -> None:
+        for s in range(max(self._second, second - self.SLOTS) + 1, second + 1):
+            self._slots[s % self.SLOTS] = 0.0       # übersprungene Sekunden leeren
+        self._second = max(self._second, second)
+
+
+# -------------------------------------------------------------------
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._server: ThreadingHTTPServer | None = None
+
+    def _add(self, metric: _Metric):
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DURATION_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """Alle Metriken im Prometheus-Textformat (Version 0.0.4)."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Atomar als Datei schreiben (z. B. für den node_exporter-Textfile-Collector)."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> int:
+        """HTTP-Endpunkt ``/metrics`` im Hintergrund; liefert den tatsächlichen Port."""
+        if self._server is not None:
+            return self._server.server_address[1]
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer   # ~30 ms → erst hier
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:                     # noqa: N802 (http.server-API)
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:         # kein Rauschen auf stderr
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http",
+                         daemon=True).start()
+        return self._server.server_address[1]
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# Singleton-Instanz
+metrics: Registry = Registry()
+
+# -------------------------------------------------------------------
+# Standard-Metriken des Launchers
+# -------------------------------------------------------------------
+JOBS_STARTED = metrics.counter("mgui_jobs_started_total", "Gestartete Jobs")
+JOBS_ENDED = metrics.counter("mgui_jobs_ended_total", "Beendete Jobs nach Endzustand", ("state",))
+JOBS_RUNNING = metrics.gauge("mgui_jobs_running", "Laufende Jobs")
+QUEUE_DEPTH = metrics.gauge("mgui_job_queue_depth", "Jobs im Thread-Pool, die noch auf einen Worker warten")
+JOB_DURATION = metrics.histogram("mgui_job_duration_seconds", "Job-Laufzeit pro Skript", ("script",))
+SPAWN_LATENCY = metrics.histogram(
+    "mgui_spawn_latency_seconds", "Klick/Auftrag bis gestarteter Prozess", buckets=LATENCY_BUCKETS,
+)
+LOOP_LAG = metrics.histogram(
+    "mgui_event_loop_lag_seconds", "Verspätung des GUI-Event-Loops", buckets=LATENCY_BUCKETS,
+)
+OUTPUT_LINES = metrics.counter("mgui_output_lines_total", "Von Jobs gemeldete Ausgabezeilen")
+
+
+class JobMetrics:
+    """
+    Zählt Job-Ereignisse aus den Dispatcher-Signalen. Merkt sich nur die
+    laufenden Jobs (Skript + Startzeit) – der Speicher wächst nicht mit.
+    """
+
+    def __init__(self) -> None:
+        self._running: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        # Anzeige „pro Minute“ im Dashboard (Prometheus rechnet selbst per rate())
+        self.started = RecentRate()
+        self.finished = RecentRate()
+        self.failed = RecentRate()           # Fehler + Abbrüche
+        self.lines = RecentRate()
+
+    def attach(self, dispatcher) -> None:
+        dispatcher.job_started.connect(self.on_started)
+        dispatcher.job_finished.connect(lambda job_id: self.on_ended(job_id, "finished"))
+        dispatcher.job_aborted.connect(lambda job_id: self.on_ended(job_id, "aborted"))
+        dispatcher.job_error.connect(lambda job_id, _err: self.on_ended(job_id, "error"))
+
+    def on_started(self, job_id: str, script: str) -> None:
+        with self._lock:
+            if job_id in self._running:
+                return
+            self._running[job_id] = (script, time.monotonic())
+            running = len(self._running)
+        JOBS_STARTED.inc()
+        JOBS_RUNNING.set(running)
+        self.started.add()
+
+    def on_output(self, lines: int) -> None:
+        """
+        Gelesene stdout-Zeilen eines Jobs (gebündelt von core.job). Nicht aus
+        ``job_progress`` – dort stehen auch Status- und Wiederverbindungs-Meldungen.
+        """
+        OUTPUT_LINES.inc(lines)
+        self.lines.add(lines)
+
+    def on_ended(self, job_id: str, state: str) -> None:
+        with self._lock:
+            entry = self._running.pop(job_id, None)
+            running = len(self._running)
+        if entry is None:                    # doppelt gemeldet / unbekannt
+            return
+        script, started = entry
+        JOBS_ENDED.inc(labels=(state,))
+        JOBS_RUNNING.set(running)
+        JOB_DURATION.observe(time.monotonic() - started, (script,))
+        (self.finished if state == "finished" else self.failed).add()
+
+
+# Singleton-Instanz
+job_metrics: JobMetrics = JobMetrics()
@@ -8,7 +8,7 @@ nutzen können, ohne PySide-Klassen durchs Projekt zu reichen.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Tuple
 
@@ -21,6 +21,27 @@ class ButtonAction(Enum):
     MENU     = "MENU"          # Container für Children
 
 
+@dataclass
+class JobLimits:
+    """
+    Optionale Grenzen für SCRIPT-Buttons (config.json → button["limits"]).
+    ``None`` bedeutet jeweils „unbegrenzt“.
+    """
+    memory_mb:   int | None = None      # RLIMIT_AS (nur POSIX)
+    cpu_seconds: int | None = None      # RLIMIT_CPU (nur POSIX)
+    open_files:  int | None = None      # RLIMIT_NOFILE (nur POSIX)
+    timeout_s:   float | None = None    # Wall-Clock-Limit
+    stall_s:     float | None = None    # Abbruch nach N s ohne Ausgabe
+
+    @classmethod
+    def from_config(cls, cfg: dict | None) -> "JobLimits":
+        cfg = cfg or {}
+        return cls(**{f.name: cfg.get(f.name) for f in fields(cls)})
+
+    def has_rlimits(self) -> bool:
+        return any(v is not None for v in (self.memory_mb, self.cpu_seconds, self.open_files))
+
+
 @dataclass
 class ButtonModel:
     id:          str
@@ -30,3 +51,4 @@ class ButtonModel:
     parent:      str | None
     description: str = ""
     position:    Tuple[int, int] | None = None      # (row, col)
+    limits:      JobLimits | None = None
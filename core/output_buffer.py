@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+core.output_buffer
+==================
+
+Ringpuffer fester Größe für die jüngste Ausgabe eines Jobs (Qt-frei).
+
+* ``core.job.Job`` füllt ihn mit jeder Zeile und jedem Fortschrittswert;
+  der Speicherbedarf ist pro Job begrenzt, egal wie viel ein Skript ausgibt.
+* Lesen ist thread-sicher (Worker schreibt, GUI liest).
+* Für den Log-Viewer hat er dieselbe Lese-Schnittstelle wie
+  ``core.line_index.LineIndex`` – Jobwechsel im Dashboard zeigen so sofort
+  den Puffer an, ohne die Log-Datei anzufassen.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+# Zeilen/Fortschritts-Stichproben pro Job
+RECENT_LINES = 2_000
+RECENT_SAMPLES = 256
+# Überlange Zeilen werden im Puffer gekürzt (die Datei bleibt vollständig)
+MAX_LINE_CHARS = 4_096
+
+
+class OutputBuffer:
+    """Letzte Ausgabezeilen + (Zeitpunkt, Prozent)-Stichproben eines Jobs."""
+
+    def __init__(self, max_lines: int = RECENT_LINES, max_samples: int = RECENT_SAMPLES) -> None:
+        self._lines: Deque[str] = deque(maxlen=max_lines)
+        self._samples: Deque[Tuple[float, int]] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+        self.total = 0                       # jemals angehängte Zeilen
+        self._seen = -1                      # total beim letzten refresh()
+
+    # ------------------------------------------------------------------
+    # Schreiben (Worker-Thread)
+    # ------------------------------------------------------------------
+    def append(self, line: str) -> None:
+        if len(line) > MAX_LINE_CHARS:
+            line = line[:MAX_LINE_CHARS] + " …"
+        with self._lock:
+            self._lines.append(line)
+            self.total += 1
+
+    def add_sample(self, percent: int) -> None:
+        with self._lock:
+            if not self._samples or self._samples[-1][1] != percent:
+                self._samples.append((time.monotonic(), percent))
+
+    # ------------------------------------------------------------------
+    # Lesen
+    # ------------------------------------------------------------------
+    @property
+    def dropped(self) -> int:
+        """Zeilen, die aus dem Puffer gefallen sind (stehen nur noch in der Datei)."""
+        with self._lock:
+            return self.total - len(self._lines)
+
+    def samples(self) -> List[Tuple[float, int]]:
+        with self._lock:
+            return list(self._samples)
+
+    def eta(self) -> Optional[float]:
+        """Geschätzte Restzeit in Sekunden aus den Stichproben (None = unbekannt)."""
+        with self._lock:
+            if len(self._samples) < 2:
+                return None
+            (t0, p0), (t1, p1) = self._samples[0], self._samples[-1]
+        if p1 <= p0 or p1 >= 100 or t1 <= t0:
+            return None
+        return (100 - p1) * (t1 - t0) / (p1 - p0)
+
+    # --- Schnittstelle wie LineIndex (für ui.log_viewer) --------------
+    size = property(lambda self: self.total)
+    complete = True
+
+    def refresh(self) -> bool:
+        total = self.total
+        changed = total != self._seen
+        self._seen = total
+        return changed
+
+    def index_more(self, budget: int = 0) -> int:
+        return 0
+
+    def line_count(self) -> int:
+        with self._lock:
+            return len(self._lines)
+
+    def lines(self, first: int, count: int) -> List[str]:
+        with self._lock:
+            n = len(self._lines)
+            first = max(0, first)
+            if first >= n:
+                return []
+            if first == 0 and count >= n:
+                return list(self._lines)
+            # deque-Slicing gibt es nicht; rotieren wäre teurer als kopieren
+            return [self._lines[i] for i in range(first, min(n, first + count))]
+
+    def tail(self, count: int) -> List[str]:
+        with self._lock:
+            n = len(self._lines)
+            return [self._lines[i] for i in range(max(0, n - count), n)]
+
+    def close(self) -> None:
+        """Puffer gehört dem Job – der Viewer gibt ihn nur frei."""
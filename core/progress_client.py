@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+core.progress_client
+====================
+
+Mini-Helfer für Skripte, die strukturierten Fortschritt an die Master-GUI
+melden wollen. Der ScriptRunner legt den Projekt-Root in ``PYTHONPATH``,
+damit reicht im Skript::
+
+    from core.progress_client import report, Progress
+
+    report(10, stage="Vorbereitung")
+
+    with Progress(total=len(files), stage="Import", unit="Dateien") as p:
+        for f in files:
+            ...
+            p.advance()
+
+Außerhalb der GUI (z. B. im Terminal) wird eine lesbare Zeile ausgegeben.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import Any, Optional
+
+from core.progress_protocol import ENV_FLAG, ProgressInfo, encode
+
+_ENABLED = os.environ.get(ENV_FLAG) == "1"
+
+
+def report(
+    percent: Optional[float] = None,
+    *,
+    stage: Optional[str] = None,
+    done: Optional[int] = None,
+    total: Optional[int] = None,
+    rate: Optional[float] = None,
+    unit: Optional[str] = None,
+    message: Optional[str] = None,
+    **metrics: Any,
+) -> None:
+    """Sendet genau eine Fortschritts-Meldung."""
+    info = ProgressInfo(percent, stage, done, total, rate, unit, message, metrics)
+    line = encode(info) if _ENABLED else info.describe()
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+class Progress:
+    """
+    Zähler mit automatischer Durchsatz-Berechnung. Meldungen werden auf
+    ``max_rate`` pro Sekunde gedrosselt, damit enge Schleifen die GUI
+    nicht fluten.
+    """
+
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        stage: Optional[str] = None,
+        unit: Optional[str] = None,
+        max_rate: float = 10.0,
+    ) -> None:
+        self.total = total
+        self.stage = stage
+        self.unit = unit
+        self.done = 0
+        self._min_gap = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._t0 = time.monotonic()
+        self._last = 0.0
+
+    def __enter__(self) -> "Progress":
+        self._emit()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._emit()
+
+    def advance(self, n: int = 1, **metrics: Any) -> None:
+        self.done += n
+        now = time.monotonic()
+        if now - self._last >= self._min_gap or (self.total and self.done >= self.total):
+            self._emit(**metrics)
+
+    def set_stage(self, stage: str) -> None:
+        self.stage = stage
+        self._emit()
+
+    # --------------------------------
+    def _emit(self, **metrics: Any) -> None:
+        now = time.monotonic()
+        self._last = now
+        elapsed = now - self._t0
+        rate = self.done / elapsed if elapsed > 0 and self.done else None
+        report(
+            stage=self.stage, done=self.done, total=self.total,
+            rate=rate, unit=self.unit, **metrics,
+        )
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+core.progress_protocol
+======================
+
+Strukturierter Fortschritts-Kanal zwischen Skript und ScriptRunner.
+
+Ein Skript meldet Fortschritt als *eine* stdout-Zeile der Form::
+
+    \x1emgui {"percent": 42, "stage": "Import", "done": 420, "total": 1000}
+
+Das führende ASCII-Record-Separator-Zeichen (``\x1e``) kommt in normalen
+Log-Zeilen praktisch nicht vor – die Erkennung ist ein ``startswith`` und
+kann nie auf gewöhnliche Zeilen mit „%“ am Ende anspringen.
+
+Skripte benutzen dafür ``core.progress_client``; dieses Modul enthält nur
+das Format selbst und ist bewusst frei von Qt-Abhängigkeiten.
+"""
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+PREFIX = "\x1emgui "
+# Umgebungsvariable, die der Runner setzt → Client schreibt Protokoll-Zeilen
+ENV_FLAG = "MGUI_PROGRESS"
+# längere Zeilen werden ignoriert (Schutz vor Riesen-JSON)
+MAX_MESSAGE_LEN = 64 * 1024
+
+
+@dataclass
+class ProgressInfo:
+    percent: Optional[float] = None         # 0-100
+    stage:   Optional[str] = None           # z. B. "Download"
+    done:    Optional[int] = None           # bearbeitete Elemente
+    total:   Optional[int] = None           # Gesamtzahl Elemente
+    rate:    Optional[float] = None         # Durchsatz (unit/s)
+    unit:    Optional[str] = None           # Einheit für done/total/rate
+    message: Optional[str] = None           # freier Text
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    # --------------------------------
+    def effective_percent(self) -> int | None:
+        """Prozentwert, notfalls aus done/total abgeleitet (0-100)."""
+        pct = self.percent
+        if pct is None and self.done is not None and self.total:
+            try:
+                pct = self.done * 100.0 / self.total
+            except OverflowError:                   # riesige Ganzzahlen
+                return None
+        if pct is None or not math.isfinite(pct):
+            return None
+        return max(0, min(int(pct), 100))
+
+    def describe(self) -> str:
+        """Menschenlesbare Kurzform – landet im Log und in der Live-Ansicht."""
+        parts = []
+        if self.stage:
+            parts.append(f"[{self.stage}]")
+        pct = self.effective_percent()
+        if pct is not None:
+            parts.append(f"{pct}%")
+        if self.done is not None:
+            unit = f" {self.unit}" if self.unit else ""
+            total = f"/{self.total}" if self.total is not None else ""
+            parts.append(f"({self.done}{total}{unit})")
+        if self.rate is not None:
+            parts.append(f"{self.rate:0.1f} {self.unit or 'it'}/s")
+        if self.message:
+            parts.append(self.message)
+        if self.metrics:
+            parts.append(" ".join(f"{k}={v}" for k, v in self.metrics.items()))
+        return " ".join(parts)
+
+
+_FIELDS = set(ProgressInfo.__dataclass_fields__) - {"metrics"}
+
+
+def encode(info: ProgressInfo) -> str:
+    """Protokoll-Zeile (ohne Zeilenumbruch) für ``info``."""
+    data = {k: v for k, v in asdict(info).items() if v not in (None, {})}
+    return PREFIX + json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def parse_message(line: str) -> ProgressInfo | None:
+    """
+    Dekodiert eine Protokoll-Zeile. Liefert None für normale Log-Zeilen
+    und für kaputte Nachrichten.
+    """
+    if not line.startswith(PREFIX) or len(line) > MAX_MESSAGE_LEN:
+        return None
+    try:
+        data = json.loads(line[len(PREFIX):])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    info = ProgressInfo(**{k: v for k, v in data.items() if k in _FIELDS})
+    metrics = data.get("metrics")
+    if isinstance(metrics, dict):
+        info.metrics = metrics
+    # Typen defensiv normalisieren – Skripte sind nicht vertrauenswürdig
+    for key, typ in (("percent", float), ("rate", float), ("done", int), ("total", int)):
+        val = getattr(info, key)
+        if val is not None:
+            try:
+                if isinstance(val, float) and not math.isfinite(val):
+                    raise ValueError(val)               # json.loads kennt NaN/Infinity/1e999
+                val = typ(val)
+                if isinstance(val, float) and not math.isfinite(val):
+                    raise ValueError(val)               # z. B. "1e999" als String
+                setattr(info, key, val)
+            except (TypeError, ValueError, OverflowError):
+                setattr(info, key, None)
+    for key in ("stage", "unit", "message"):
+        val = getattr(info, key)
+        if val is not None and not isinstance(val, str):
+            setattr(info, key, str(val))
+    return info
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+core.resources
+==============
+
+Ressourcen-Sampler für laufende Jobs.
+
+Ein *einziger* Hintergrund-Thread (für alle Jobs gemeinsam) liest periodisch
+``/proc/<pid>`` des Skript-Prozesses und aller seiner Nachkommen und ermittelt
+CPU-Zeit, RSS sowie Lese-/Schreib-Bytes. Live-Werte gehen an den
+``on_sample``-Callback aus ``track()`` (Runner → ``dispatcher.job_resources``),
+die Endwerte (Peak/Summe) liefert ``untrack()`` zurück (core.job legt sie
+mit dem Job in core.log_search ab).
+
+Die Werte eines Jobs schützt ein eigenes Lock: ``untrack()`` nimmt den
+letzten Stand im Thread des Aufrufers, während der Sampler-Thread womöglich
+gerade denselben Job liest.
+
+Ohne ``/proc`` (z. B. Windows) bleibt der Sampler inaktiv – alle Aufrufe
+sind dann No-Ops.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+_PROC = Path("/proc")
+PROC_AVAILABLE: bool = (_PROC / "self" / "stat").exists()
+
+if PROC_AVAILABLE:
+    _CLK_TCK = os.sysconf("SC_CLK_TCK")
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+else:
+    _CLK_TCK = 100
+    _PAGE_SIZE = 4096
+
+
+@dataclass
+class ResourceStats:
+    """Momentaufnahme bzw. Endstand eines Jobs (Prozess + Nachkommen)."""
+    cpu_s:       float = 0.0        # CPU-Zeit gesamt (user + system)
+    rss:         int = 0            # aktueller RSS in Bytes
+    peak_rss:    int = 0            # höchster beobachteter RSS
+    read_bytes:  int = 0            # gelesene Bytes (Storage) gesamt
+    write_bytes: int = 0            # geschriebene Bytes (Storage) gesamt
+    procs:       int = 0            # Anzahl lebender Prozesse im Baum
+
+    def as_dict(self) -> dict:
+        return {
+            "cpu_s": round(self.cpu_s, 2),
+            "peak_rss": self.peak_rss,
+            "read_bytes": self.read_bytes,
+            "write_bytes": self.write_bytes,
+        }
+
+
+@dataclass
+class _Tracked:
+    root_pid: int
+    on_sample: Callable[["ResourceStats"], None] | None = None
+    stats: ResourceStats = field(default_factory=ResourceStats)
+    # pid → letzter Wert; beendete Kinder zählen mit ihrem letzten Stand weiter
+    cpu_by_pid: Dict[int, float] = field(default_factory=dict)
+    io_by_pid: Dict[int, tuple] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    done: bool = False                  # untrack() lief → keine Live-Werte mehr
+
+
+def human_bytes(n: int) -> str:
+    """Kompakte Darstellung (B, KB, MB, GB) für Tabellen-Spalten."""
+    val = float(n)
+    for unit in ("B", "KB", "MB", "GB"):
+        if val < 1024 or unit == "GB":
+            return f"{val:0.0f} {unit}" if unit == "B" else f"{val:0.1f} {unit}"
+        val /= 1024
+    return f"{val:0.1f} GB"
+
+
+# -------------------------------------------------------------------
+# /proc-Parsing (bewusst ohne Abhängigkeiten wie psutil)
+# -------------------------------------------------------------------
+def _read_stat(pid: int) -> tuple[int, float, int] | None:
+    """Liefert (ppid, cpu_s, rss_bytes) oder None, wenn der Prozess weg ist."""
+    try:
+        raw = (_PROC / str(pid) / "stat").read_bytes()
+    except OSError:
+        return None
+    # comm kann Leerzeichen/Klammern enthalten → ab letzter ')' splitten
+    rest = raw[raw.rfind(b")") + 2:].split()
+    try:
+        ppid = int(rest[1])
+        cpu = (int(rest[11]) + int(rest[12])) / _CLK_TCK
+        rss = int(rest[21]) * _PAGE_SIZE
+    except (IndexError, ValueError):
+        return None
+    return ppid, cpu, rss
+
+
+def start_time(pid: int) -> int | None:
+    """
+    Startzeitpunkt (Ticks seit Boot) – zusammen mit der PID eindeutig, damit
+    ein Signal nie einen Prozess trifft, der eine freigewordene PID erbt.
+    """
+    try:
+        raw = (_PROC / str(pid) / "stat").read_bytes()
+        return int(raw[raw.rfind(b")") + 2:].split()[19])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _read_io(pid: int) -> tuple[int, int] | None:
+    try:
+        raw = (_PROC / str(pid) / "io").read_bytes()
+    except OSError:
+        return None
+    rd = wr = 0
+    for line in raw.splitlines():
+        if line.startswith(b"read_bytes:"):
+            rd = int(line.split()[1])
+        elif line.startswith(b"write_bytes:"):
+            wr = int(line.split()[1])
+    return rd, wr
+
+
+def _children_via_task(pid: int) -> List[int] | None:
+    """Kinder über /proc/<pid>/task/*/children (CONFIG_PROC_CHILDREN)."""
+    kids: List[int] = []
+    try:
+        tasks = list((_PROC / str(pid) / "task").iterdir())
+    except OSError:
+        return []
+    for t in tasks:
+        try:
+            kids.extend(int(x) for x in (t / "children").read_text().split())
+        except FileNotFoundError:
+            return None                          # Kernel ohne children-Datei
+        except (OSError, ValueError):
+            continue
+    return kids
+
+
+def _ppid_map() -> Dict[int, List[int]]:
+    """Fallback: einmaliger Scan über /proc → ppid → [Kinder]."""
+    tree: Dict[int, List[int]] = {}
+    for entry in os.scandir(_PROC):
+        if not entry.name.isdigit():
+            continue
+        st = _read_stat(int(entry.name))
+        if st:
+            tree.setdefault(st[0], []).append(int(entry.name))
+    return tree
+
+
+def _walk_tree(root: int, ppids: Dict[int, List[int]] | None) -> Set[int]:
+    seen: Set[int] = set()
+    todo = [root]
+    while todo:
+        pid = todo.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        kids = ppids.get(pid, []) if ppids is not None else _children_via_task(pid)
+        todo.extend(kids or [])
+    return seen
+
+
+def process_tree(root: int) -> Set[int]:
+    """
+    Alle PIDs des Prozessbaums unter ``root`` (inkl. root selbst).
+    Ohne /proc wird nur ``root`` geliefert.
+    """
+    if not PROC_AVAILABLE:
+        return {root}
+    ppids = None if _children_via_task(os.getpid()) is not None else _ppid_map()
+    return _walk_tree(root, ppids)
+
+
+# -------------------------------------------------------------------
+class ResourceSampler:
+    """
+    Gemeinsamer Sampler-Thread für alle Jobs.
+    Der Thread startet erst beim ersten ``track()`` und schläft,
+    solange kein Job läuft.
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self.interval = interval
+        self._jobs: Dict[str, _Tracked] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+        self._use_children_file: bool | None = None    # None = noch unbekannt
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def track(
+        self,
+        job_id: str,
+        pid: int,
+        on_sample: Callable[[ResourceStats], None] | None = None,
+    ) -> None:
+        """
+        Beginnt mit der Überwachung eines Job-Prozesses. ``on_sample`` wird
+        pro Intervall im Sampler-Thread mit einer Kopie der Werte aufgerufen.
+        """
+        if not PROC_AVAILABLE:
+            return
+        with self._lock:
+            self._jobs[job_id] = _Tracked(pid, on_sample)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="ResourceSampler", daemon=True
+                )
+                self._thread.start()
+            self._wakeup.notify()
+
+    def untrack(self, job_id: str) -> ResourceStats | None:
+        """
+        Beendet die Überwachung und liefert die Endwerte
+        (Peak-RSS, CPU- und I/O-Summen) zurück.
+        """
+        with self._lock:
+            tracked = self._jobs.pop(job_id, None)
+        if tracked is None:
+            return None
+        ppids = self._ppid_lookup()
+        with tracked.lock:                            # wartet auf einen laufenden Sample
+            self._sample(tracked, ppids)              # letzter Stand, falls noch lebendig
+            tracked.done = True
+            return replace(tracked.stats, rss=0, procs=0)
+
+    def snapshot(self, job_id: str) -> ResourceStats | None:
+        with self._lock:
+            tracked = self._jobs.get(job_id)
+        if tracked is None:
+            return None
+        with tracked.lock:
+            return replace(tracked.stats)
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._jobs:
+                    self._wakeup.wait()
+                jobs = list(self._jobs.items())
+
+            ppids = self._ppid_lookup()
+            for _job_id, tracked in jobs:
+                with tracked.lock:
+                    if tracked.done:                  # inzwischen beendet
+                        continue
+                    self._sample(tracked, ppids)
+                    # unter dem Lock: kein Live-Wert überholt die Endwerte aus untrack()
+                    if tracked.on_sample is not None:
+                        tracked.on_sample(replace(tracked.stats))
+
+            with self._lock:
+                self._wakeup.wait(self.interval)
+
+    def _ppid_lookup(self) -> Dict[int, List[int]] | None:
+        """Nur wenn /proc/<pid>/task/*/children fehlt: ein Scan für ALLE Jobs."""
+        if self._use_children_file is None:
+            self._use_children_file = _children_via_task(os.getpid()) is not None
+        return None if self._use_children_file else _ppid_map()
+
+    def _sample(self, tracked: _Tracked, ppids: Dict[int, List[int]] | None) -> None:
+        """Aktualisiert ``tracked.stats``; Aufrufer hält ``tracked.lock``."""
+        rss_total = 0
+        alive = 0
+        for pid in _walk_tree(tracked.root_pid, ppids):
+            st = _read_stat(pid)
+            if st is None:
+                continue
+            alive += 1
+            tracked.cpu_by_pid[pid] = st[1]
+            rss_total += st[2]
+            io = _read_io(pid)
+            if io is not None:
+                tracked.io_by_pid[pid] = io
+
+        s = tracked.stats
+        s.cpu_s = sum(tracked.cpu_by_pid.values())
+        s.rss = rss_total
+        s.peak_rss = max(s.peak_rss, rss_total)
+        s.read_bytes = sum(v[0] for v in tracked.io_by_pid.values())
+        s.write_bytes = sum(v[1] for v in tracked.io_by_pid.values())
+        s.procs = alive
+
+
+# Singleton-Instanz (analog zu core.dispatcher)
+sampler: ResourceSampler = ResourceSampler()
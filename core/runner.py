@@ -5,149 +5,143 @@ ScriptRunner – führt ein externes Python-Skript non-blocking aus.
 Features
 --------
 * läuft in QThreadPool → blockiert die GUI nicht
-* schreibt Log in logs/<job_id>.log
+* schreibt Log nach <Projekt-Root>/logs/<job_id>.log (core.log_manager)
 * sendet Fortschritt + Nachrichten über core.dispatcher
-* Abbruch-Unterstützung via dispatcher.job_abort_req
+* Abbruch-Unterstützung via dispatcher.job_abort_req (O(1) über dispatcher.jobs)
+* CPU/RSS/I/O-Sampling über core.resources (Endwerte in ``runner.stats``)
+* jüngste Ausgabe begrenzt im Speicher (``runner.output``, core.output_buffer)
+* eigene Prozessgruppe, optionale rlimits, Timeout/Stall-Watchdog und
+  asynchroner Baum-Abbruch über core.supervisor
+* optionaler strukturierter Fortschritt (core.progress_protocol)
+* Warteschlangenlänge des Pools als Metrik (core.metrics)
+
+Die eigentliche Ausführung steckt Qt-frei in core.job (auch für core.cli).
 """
 from __future__ import annotations
 
 import os
-import re
-import subprocess
-import sys
-import time
 from pathlib import Path
+from typing import Optional
 
-from PySide6.QtCore import QRunnable, Slot, QThreadPool
+from PySide6.QtCore import QRunnable, QThreadPool
 
 from core.dispatcher import dispatcher
+from core.job import Job
+from core.metrics import QUEUE_DEPTH
+from core.models import JobLimits
+from core.output_buffer import OutputBuffer
+from core.resources import ResourceStats
 
-# Globale Registry für Stop-Button (Dashboard) → Runner
-RUNNERS: dict[str, "ScriptRunner"] = {}
+# Globale, thread-sichere Registry für Stop-Button (Dashboard) → Runner
+RUNNERS = dispatcher.jobs
+
+
+def _emit(name: str, *args) -> None:
+    """core.job-Events → gleichnamiges Dispatcher-Signal."""
+    getattr(dispatcher, name).emit(*args)
 
 
 class ScriptRunner(QRunnable):
     """
-    Führt das gegebene Skript im Subprozess aus und leitet stdout/stderr Zeile für
-    Zeile an das Dashboard weiter. Fortschritts-Parsing: erkennt “... 42%”
-    am Zeilenende oder “[42%] ...”.
+    QRunnable-Hülle um core.job.Job: führt das Skript im globalen Pool aus
+    und leitet alle Events über core.dispatcher an die GUI weiter.
     """
-    def __init__(self, job_id: str, script_path: Path):
+    def __init__(self, job_id: str, script_path: Path, limits: Optional[JobLimits] = None):
         super().__init__()
         self.setAutoDelete(False)            # wichtig fürs Abbrechen
         self.job_id = job_id
         self.script_path = script_path
-        self._proc: subprocess.Popen | None = None
-        self._abort_flag = False
-        self._log_path = Path("logs") / f"{job_id}.log"
-        self._log_path.parent.mkdir(exist_ok=True, parents=True)
-
-        # Abbruch-Signal annehmen
-        dispatcher.job_abort_req.connect(self._on_abort_req)
-        RUNNERS[job_id] = self               # registrieren
+        self.job = Job(job_id, script_path, limits)
+        # registrieren → dispatcher.job_abort_req landet direkt hier
+        dispatcher.jobs.register(job_id, self)
+        self._pool: QThreadPool | None = None
+        self._queued = False                 # zählt in QUEUE_DEPTH (enqueue → run/discard)
+
+    @property
+    def stats(self) -> ResourceStats | None:
+        """Peak/Summen nach Job-Ende (siehe core.resources)."""
+        return self.job.stats
+
+    @property
+    def output(self) -> OutputBuffer:
+        """Ringpuffer der jüngsten Ausgabe (bleibt nach Job-Ende lesbar)."""
+        return self.job.output
 
     # ------------------------------------------------------------------
     # Public API für das Dashboard (falls direkter Aufruf gewünscht)
     # ------------------------------------------------------------------
     def abort(self) -> None:
-        """Bricht das laufende Skript ab (falls möglich)."""
-        self._abort_flag = True
-        if self._proc and self._proc.poll() is None:
-            self._proc.terminate()           # sanft
-            time.sleep(0.2)
-            if self._proc.poll() is None:
-                self._proc.kill()            # hart
-
-    # ------------------------------------------------------------------
-    # Intern
-    # ------------------------------------------------------------------
-    @Slot(str)
-    def _on_abort_req(self, job_id: str) -> None:
-        if job_id == self.job_id:
-            self.abort()
+        """Bricht das laufende Skript samt Kindprozessen ab (asynchron)."""
+        if not self.discard():               # wartet noch → gar nicht erst starten
+            self.job.abort()
+
+    def enqueue(self, pool: QThreadPool) -> None:
+        """In den Pool einreihen; bis ein Worker frei ist, zählt der Job als wartend."""
+        self._pool = pool
+        self._queued = True
+        QUEUE_DEPTH.inc()
+        pool.start(self)
+
+    def discard(self) -> bool:
+        """Noch wartenden Runner aus dem Pool nehmen (gilt als abgebrochen). False = läuft schon."""
+        if self._pool is None or not self._pool.tryTake(self):
+            return False
+        self._dequeue()
+        dispatcher.job_aborted.emit(self.job_id)
+        dispatcher.jobs.unregister(self.job_id)
+        dispatcher.job_released.emit(self.job_id)
+        return True
+
+    def _dequeue(self) -> None:
+        if self._queued:
+            self._queued = False
+            QUEUE_DEPTH.dec()
 
     # ---------------------------------------
     def run(self) -> None:                   # QRunnable entry-point
-        dispatcher.job_progress.emit(self.job_id, 0, "Starte Skript …")
-        start_ts = time.time()
-
+        self._dequeue()
         try:
-            self._proc = subprocess.Popen(
-                [sys.executable, str(self.script_path)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                bufsize=1,
-                text=True
-            )
-
-            with self._log_path.open("w", encoding="utf-8") as log_f:
-                for line in self._proc.stdout:        # type: ignore[arg-type]
-                    line = line.rstrip("\n")
-                    log_f.write(line + "\n")
-
-                    # Fortschritt ermitteln (optional)
-                    progress = self._extract_percent(line)
-                    dispatcher.job_progress.emit(
-                        self.job_id,
-                        progress if progress is not None else -1,
-                        line
-                    )
-
-                    if self._abort_flag:
-                        break
-
-            rc = self._proc.wait()
-            dur = time.time() - start_ts
-
-            if self._abort_flag:
-                dispatcher.job_aborted.emit(self.job_id)
-                dispatcher.job_progress.emit(
-                    self.job_id, 100,
-                    f"⏹ Abgebrochen nach {dur:0.1f}s"
-                )
-            elif rc == 0:
-                dispatcher.job_finished.emit(self.job_id)
-                dispatcher.job_progress.emit(
-                    self.job_id, 100,
-                    f"✅ Fertig in {dur:0.1f}s"
-                )
-            else:
-                dispatcher.job_error.emit(
-                    self.job_id,
-                    f"Exitcode {rc}"
-                )
-        except Exception as exc:
-            dispatcher.job_error.emit(self.job_id, str(exc))
-
+            self.job.run(_emit)
         finally:
-            RUNNERS.pop(self.job_id, None)   # Clean-up
-
-    # ----------------------------
-    @staticmethod
-    def _extract_percent(text: str) -> int | None:
-        """
-        Versucht am Zeilenende eine Prozentzahl (0-100) zu finden.
-        """
-        m = re.search(r"(\d{1,3})\s*%$", text) or re.search(r"\[(\d{1,3})%]", text)
-        if m:
-            try:
-                val = int(m.group(1))
-                return max(0, min(val, 100))
-            except ValueError:
-                return None
-        return None
+            dispatcher.jobs.unregister(self.job_id)     # Clean-up
+            dispatcher.job_released.emit(self.job_id)   # Job-Abos aufräumen
 
 
 # --------------------------------------------------------------
 # Hilfsfunktion – bequem starten ohne direkte Runner-Erzeugung
 # --------------------------------------------------------------
-def run_script_async(script_path: Path) -> str:
+# Optionales Backend (z. B. core.daemon_client.DaemonClient) mit
+# ``run(job_id, script_path, limits)`` – None = Jobs laufen in diesem Prozess.
+_backend = None
+
+
+def use_backend(backend) -> None:
+    """Leitet run_script_async an ein anderes Backend um (None = lokal)."""
+    global _backend
+    _backend = backend
+
+
+def backend():
+    """Aktuelles Backend (None = Jobs laufen in diesem Prozess)."""
+    return _backend
+
+
+def start_local(job_id: str, script_path: Path, limits: Optional[JobLimits] = None) -> None:
+    """Startet einen Runner mit vorgegebener job_id im globalen Pool dieses Prozesses."""
+    runner = ScriptRunner(job_id, script_path, limits)
+    dispatcher.job_started.emit(job_id, script_path.name)
+    runner.enqueue(QThreadPool.globalInstance())
+
+
+def run_script_async(script_path: Path, limits: Optional[JobLimits] = None) -> str:
     """
-    Erzeugt eine Runner-Instanz und schmeißt sie in den globalen Pool.
+    Erzeugt eine Runner-Instanz und schmeißt sie in den globalen Pool
+    (bzw. übergibt an den Job-Daemon, falls aktiv).
     Liefert die job_id zurück.
     """
     job_id = os.urandom(8).hex()
-    runner = ScriptRunner(job_id, script_path)
-    dispatcher.job_started.emit(job_id, script_path.name)
-    QThreadPool.globalInstance().start(runner)
+    if _backend is not None:
+        _backend.run(job_id, script_path, limits)
+    else:
+        start_local(job_id, script_path, limits)
     return job_id
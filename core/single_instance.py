@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+core.single_instance
+====================
+
+Nur eine GUI pro Installation (Projekt-Root) – Client-Seite, nur Stdlib.
+
+Ein zweiter Start ruft ganz am Anfang von ``main.py`` – noch *vor* dem
+Import von PySide6 – ``forward_if_running(argv)`` auf: Läuft bereits eine
+Instanz, bekommt sie die Anfrage über den lokalen Socket (Unix-Domain-Socket
+bzw. Named Pipe unter Windows) und der neue Prozess beendet sich nach
+wenigen Millisekunden. Die Server-Seite (QLockFile + QLocalServer) steckt in
+core.instance_server.
+
+Protokoll: eine JSON-Zeile pro Richtung::
+
+    → {"cmd": "activate", "argv": [...]}
+    ← {"ok": true}
+
+Unterstützte Argumente: ``--run <Button-ID|Menü/Pfad>`` (mehrfach möglich),
+sonst wird das Fenster nur nach vorne geholt. Abschalten mit
+``--new-instance`` oder ``MGUI_MULTI_INSTANCE=1``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Sequence
+
+from util.paths import project_root
+
+ENV_FLAG = "MGUI_MULTI_INSTANCE"
+NEW_INSTANCE = "--new-instance"
+# Argumente, bei denen der Guard gar nicht greift (eigene Prozessrollen/Messungen)
+_BYPASS = (NEW_INSTANCE, "--job-daemon", "--startup-report")
+# Zeit für Verbindung + Antwort der laufenden Instanz
+TIMEOUT_S = 2.0
+# Wartezeit, falls die andere Instanz gerade erst hochfährt (Lock gehalten, Socket fehlt)
+STARTUP_WAIT_S = 10.0
+
+
+def enabled(argv: Sequence[str]) -> bool:
+    if os.environ.get(ENV_FLAG, "0") not in ("", "0"):
+        return False
+    return not any(a == b or a.startswith(b + "=") for a in argv for b in _BYPASS)
+
+
+def server_name() -> str:
+    """Name pro Installation – wie beim Job-Daemon, eigener Präfix."""
+    digest = hashlib.sha1(str(project_root()).encode("utf-8")).hexdigest()[:12]
+    return f"master-gui-ui-{digest}"
+
+
+def server_address() -> str:
+    """Windows: Pipe-Name (ohne Präfix); sonst voller Socket-Pfad im Temp-Verzeichnis."""
+    if sys.platform.startswith("win"):
+        return server_name()
+    tmp = os.environ.get("TMPDIR") or "/tmp"      # wie QDir::tempPath()
+    return str(Path(tmp) / server_name())
+
+
+def lock_path() -> Path:
+    return project_root() / ".cache" / "instance.lock"
+
+
+def run_targets(argv: Sequence[str]) -> List[str]:
+    """Button-Referenzen aus ``--run X`` bzw. ``--run=X``."""
+    targets, it = [], iter(argv)
+    for arg in it:
+        if arg == "--run":
+            value = next(it, None)
+            if value:
+                targets.append(value)
+        elif arg.startswith("--run="):
+            targets.append(arg.split("=", 1)[1])
+    return targets
+
+
+def pack(msg: dict) -> bytes:
+    return (json.dumps(msg, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# -------------------------------------------------------------------
+# Client
+# -------------------------------------------------------------------
+def forward(argv: Sequence[str], timeout: float = TIMEOUT_S) -> bool:
+    """Anfrage an die laufende Instanz; True = angenommen."""
+    # --run nimmt Button-IDs/Menü-Pfade, keine Dateipfade → kein Arbeitsverzeichnis nötig
+    msg = pack({"cmd": "activate", "argv": list(argv)})
+    try:
+        if sys.platform.startswith("win"):
+            reply = _exchange_pipe(msg, timeout)
+        else:
+            reply = _exchange_unix(msg, timeout)
+    except OSError:
+        return False
+    try:
+        return bool(json.loads(reply).get("ok"))
+    except ValueError:
+        return False
+
+
+def forward_if_running(argv: Sequence[str], wait: float = 0.0) -> bool:
+    """
+    Schneller Weg für ``main.py``: True, wenn eine laufende Instanz die
+    Anfrage übernommen hat (Aufrufer beendet sich dann). ``wait`` > 0
+    versucht es so lange erneut – für den Fall, dass die andere Instanz
+    das Lock schon hält, ihr Socket aber noch nicht lauscht.
+    """
+    if not enabled(argv):
+        return False
+    deadline = time.monotonic() + wait
+    while True:
+        if forward(argv):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+def _exchange_unix(msg: bytes, timeout: float) -> bytes:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(server_address())
+        sock.sendall(msg)
+        buf = b""
+        while not buf.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            buf += chunk
+        return buf
+
+
+def _exchange_pipe(msg: bytes, timeout: float) -> bytes:
+    """
+    Wie ``_exchange_unix``; Pipes kennen kein ``settimeout`` – der Austausch
+    läuft daher in einem Thread, ein hängendes ``ReadFile`` bricht
+    ``CancelIoEx`` nach ``timeout`` ab.
+    """
+    import ctypes
+    import msvcrt
+    # Die laufende Instanz darf ihr Fenster in den Vordergrund holen
+    ctypes.windll.user32.AllowSetForegroundWindow(-1)      # ASFW_ANY
+    state: dict = {}
+
+    def talk() -> None:
+        try:
+            with open(rf"\\.\pipe\{server_name()}", "r+b", buffering=0) as pipe:
+                state["pipe"] = pipe
+                pipe.write(msg)
+                buf = b""
+                while not buf.endswith(b"\n"):
+                    chunk = pipe.read(4096)
+                    if not chunk:
+                        break
+                    buf += chunk
+                state["reply"] = buf
+        except (OSError, ValueError) as exc:
+            state["error"] = exc
+
+    worker = threading.Thread(target=talk, name="single-instance", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        pipe = state.get("pipe")
+        if pipe is not None:
+            try:
+                ctypes.windll.kernel32.CancelIoEx(msvcrt.get_osfhandle(pipe.fileno()), None)
+            except (OSError, ValueError):
+                pass
+        raise TimeoutError(f"Keine Antwort der laufenden Instanz nach {timeout}s")
+    if "error" in state:
+        raise OSError(str(state["error"]))
+    return state.get("reply", b"")
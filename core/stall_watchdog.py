@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+core.stall_watchdog
+===================
+
+Erkennt Hänger des GUI-Threads und hält fest, *wo* er hing (Qt-frei).
+
+* Der GUI-Thread ruft ``beat()`` in kurzen Abständen (Timer im Event-Loop).
+* Ein Hilfs-Thread prüft, wie lange der letzte Herzschlag her ist. Wird
+  ``threshold_s`` überschritten, liest er per ``sys._current_frames()`` den
+  Python-Stack des GUI-Threads – also genau den Slot, der gerade blockiert.
+* Sobald wieder Herzschläge kommen, wird der Hänger mit Dauer und obersten
+  Frames abgeschlossen: in ``stalls()`` (für die Diagnose-Ansicht), an
+  ``on_stall``-Callbacks und als Eintrag in ``<logs>/diagnostics/stalls.log``.
+
+Ausgeschaltet existiert weder Timer noch Thread. Einschalten per
+config.json ``"diagnostics": {"stall_watchdog": true, "stall_ms": 250}``
+oder Umgebungsvariable ``MGUI_STALL_WATCHDOG=1`` (bzw. ``=<ms>``).
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, List, Optional
+
+from core.log_manager import log_manager
+
+ENV_FLAG = "MGUI_STALL_WATCHDOG"
+# Standard-Schwelle und Herzschlag-Intervall (Sekunden)
+STALL_S = 0.25
+HEARTBEAT_S = 0.05
+# Frames pro Hänger (innerste zuerst) und gemerkte Hänger
+MAX_FRAMES = 12
+MAX_STALLS = 100
+
+
+@dataclass
+class Stall:
+    started: float                       # Wanduhr (time.time) des letzten Herzschlags
+    duration: float = 0.0                # Sekunden
+    frames: List[str] = field(default_factory=list)   # innerster Frame zuerst
+
+    @property
+    def culprit(self) -> str:
+        return self.frames[0] if self.frames else "?"
+
+    def format(self) -> str:
+        when = _dt.datetime.fromtimestamp(self.started).strftime("%Y-%m-%d %H:%M:%S")
+        lines = [f"{when}  GUI blockiert für {self.duration * 1000:0.0f} ms"]
+        lines.extend(f"    {frame}" for frame in self.frames)
+        return "\n".join(lines)
+
+
+def settings(cfg: Optional[dict]) -> Optional[float]:
+    """Schwelle in Sekunden, falls der Watchdog aktiv sein soll – sonst None."""
+    env = os.environ.get(ENV_FLAG, "").strip()
+    if env == "0":                       # Umgebung schlägt Config
+        return None
+    if env:
+        return int(env) / 1000 if env.isdigit() and env != "1" else STALL_S
+    cfg = cfg or {}
+    if cfg.get("stall_watchdog"):
+        return cfg.get("stall_ms", STALL_S * 1000) / 1000
+    return None
+
+
+class StallWatchdog:
+    def __init__(self, threshold_s: float = STALL_S, thread_id: Optional[int] = None,
+                 log_path: Optional[Path] = None) -> None:
+        self.threshold_s = threshold_s
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._log_path = log_path
+        self.on_stall: List[Callable[[Stall], None]] = []
+        self._stalls: Deque[Stall] = deque(maxlen=MAX_STALLS)
+        self._lock = threading.Lock()
+        self._last_beat = time.monotonic()
+        self._current: Stall | None = None   # laufender Hänger (vom Hilfs-Thread erkannt)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def log_path(self) -> Path:
+        return self._log_path or log_manager.root / "diagnostics" / "stalls.log"
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread is None:
+            self._last_beat = time.monotonic()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def beat(self) -> None:
+        """Vom überwachten Thread aufrufen; schließt einen erkannten Hänger ab."""
+        now = time.monotonic()
+        with self._lock:
+            stall, self._current = self._current, None
+            gap = now - self._last_beat
+            self._last_beat = now
+        if stall is not None:
+            stall.duration = gap
+            self._record(stall)
+
+    def stalls(self) -> List[Stall]:
+        """Bisherige Hänger, jüngster zuletzt."""
+        with self._lock:
+            return list(self._stalls)
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _watch(self) -> None:
+        interval = max(0.01, self.threshold_s / 4)
+        while not self._stop.wait(interval):
+            with self._lock:
+                gap = time.monotonic() - self._last_beat
+                if self._current is not None or gap < self.threshold_s:
+                    continue
+            stall = Stall(started=time.time() - gap, frames=self._capture())
+            with self._lock:
+                if time.monotonic() - self._last_beat >= self.threshold_s:
+                    self._current = stall        # sonst kam der Herzschlag inzwischen
+
+    def _capture(self) -> List[str]:
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return []
+        summary = traceback.extract_stack(frame)[::-1][:MAX_FRAMES]
+        return [f"{Path(f.filename).name}:{f.lineno} in {f.name}" for f in summary]
+
+    def _record(self, stall: Stall) -> None:
+        with self._lock:
+            self._stalls.append(stall)
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.log_path.open("a", encoding="utf-8") as f:
+                f.write(stall.format() + "\n")
+        except OSError:
+            pass                             # Diagnose darf nie selbst stören
+        for cb in self.on_stall:
+            cb(stall)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+core.startup
+============
+
+Startzeit-Bericht für ``main.py --startup-report`` (Qt-frei).
+
+* ``startup.enable_import_timing()`` hängt sich vor den ersten schweren
+  Imports in ``builtins.__import__`` ein und misst je neu geladenem Modul
+  die eigene und die kumulierte Zeit (wie ``python -X importtime``, aber
+  auch in der PyInstaller-EXE verfügbar).
+* ``startup.mark("fenster")`` hält Phasen fest (Sekunden seit Import dieses
+  Moduls – also seit Programmstart, da ``main.py`` es zuerst lädt).
+* ``format()``/``write()`` liefern den Bericht: Phasen, Zeit bis zum ersten
+  Zeichnen, langsamste Imports. Geschrieben wird nach
+  ``<logs>/diagnostics/startup.txt``.
+
+Ohne Flag bleibt der Import-Hook draußen; ``mark()`` kostet dann einen
+Listen-Eintrag.
+"""
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+FLAG = "--startup-report"
+# Bericht: so viele Imports (nach eigener Zeit sortiert)
+TOP_IMPORTS = 25
+
+T0 = time.perf_counter()
+
+
+@dataclass
+class ImportTiming:
+    name: str
+    self_s: float        # ohne verschachtelte Imports
+    total_s: float       # inkl. verschachtelter Imports
+    depth: int
+
+
+class StartupReport:
+    def __init__(self) -> None:
+        self.phases: List[Tuple[str, float]] = []
+        self.imports: List[ImportTiming] = []
+        self._orig_import = None
+        self._stack: List[List[float]] = []      # je offener Import: [Start, Zeit der Kinder]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @staticmethod
+    def requested(argv: Optional[List[str]] = None) -> bool:
+        return any(a == FLAG or a.startswith(FLAG + "=") for a in (argv or sys.argv))
+
+    @staticmethod
+    def quit_after(argv: Optional[List[str]] = None) -> bool:
+        """``--startup-report=quit`` beendet nach dem ersten Zeichnen (für Messreihen)."""
+        return f"{FLAG}=quit" in (argv or sys.argv)
+
+    def mark(self, phase: str) -> float:
+        """Phase festhalten; liefert die Sekunden seit Programmstart."""
+        t = time.perf_counter() - T0
+        self.phases.append((phase, t))
+        return t
+
+    def enable_import_timing(self) -> None:
+        if self._orig_import is None:
+            self._orig_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def disable_import_timing(self) -> None:
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def format(self, top: int = TOP_IMPORTS) -> str:
+        lines = ["Startzeit-Bericht", "", "Phase                              seit Start"]
+        lines.extend(f"  {name:<32} {t * 1000:8.1f} ms" for name, t in self.phases)
+        if self.imports:
+            total = sum(i.self_s for i in self.imports)
+            lines += ["", f"Imports: {len(self.imports)} Module, {total * 1000:0.1f} ms",
+                      "  eigen [ms]  kumuliert [ms]  Modul"]
+            slowest = sorted(self.imports, key=lambda i: i.self_s, reverse=True)[:top]
+            lines.extend(f"  {i.self_s * 1000:10.1f}  {i.total_s * 1000:14.1f}  {i.name}"
+                         for i in slowest)
+        return "\n".join(lines)
+
+    def write(self, path: Optional[Path] = None) -> Optional[Path]:
+        from core.log_manager import log_manager
+        target = Path(path) if path else log_manager.root / "diagnostics" / "startup.txt"
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(self.format() + "\n", encoding="utf-8")
+        except OSError:
+            return None
+        return target
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig_import
+        try:
+            full = importlib.util.resolve_name("." * level + name,
+                                               (globals or {}).get("__package__")) if level else name
+        except (ImportError, ValueError):
+            full = name
+        if full in sys.modules:
+            return orig(name, globals, locals, fromlist, level)
+        self._stack.append([time.perf_counter(), 0.0])
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            start, children = self._stack.pop()
+            total = time.perf_counter() - start
+            if self._stack:
+                self._stack[-1][1] += total
+            self.imports.append(ImportTiming(full, total - children, total, len(self._stack)))
+
+
+# Singleton
+startup = StartupReport()
@@ -6,16 +6,21 @@ core.storage
 Laden, Validieren und Speichern der config.json.
 CRUD-Helpers für Buttons.  *Keine* ID-Eindeutigkeits-Pflicht,
 damit der Anwender Buttons mit gleichem Namen (ID) anlegen darf.
+
+jsonschema wird erst bei Bedarf importiert (~100 ms). Bereits validierte
+Config-Inhalte merkt sich ``.cache/config_valid.sha1`` (Hash über Inhalt
++ Schema), damit z. B. core.cli schnell startet.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import List
 
-from jsonschema import validate, ValidationError
-
-from util.paths import to_relative
+from core.button_index import ButtonIndex
+from core.tracing import span, traced
+from util.paths import project_root, to_relative
 
 
 # -------------------------------------------------------------------
@@ -39,6 +44,63 @@ SCHEMA = {
         },
         "window_title": {               # neu: Fenstertitel erlaubt
             "type": "string"
+        },
+        "job_daemon": {                 # Jobs im separaten Daemon-Prozess ausführen
+            "type": "boolean"
+        },
+        "logs": {                       # Retention/Rotation/Kompression (core.log_manager)
+            "type": "object",
+            "properties": {
+                "max_age_days":     {"type": "number", "minimum": 0},
+                "max_total_mb":     {"type": "number", "minimum": 0},
+                "rotate_mb":        {"type": "number", "exclusiveMinimum": 0},
+                "keep_parts":       {"type": "integer", "minimum": 2},
+                "compress_after_h": {"type": "number", "minimum": 0},
+                "compression":      {"type": "string", "enum": ["gzip", "zstd", "none"]}
+            },
+            "additionalProperties": False
+        },
+        "dashboard": {                  # Task-Dashboard (ui.job_model)
+            "type": "object",
+            "properties": {
+                "keep_finished": {"type": "integer", "minimum": 0}
+            },
+            "additionalProperties": False
+        },
+        "metrics": {                    # Prometheus-Endpunkt (core.metrics)
+            "type": "object",
+            "properties": {
+                "port": {"type": "integer", "minimum": 0, "maximum": 65535}
+            },
+            "additionalProperties": False
+        },
+        "discovery": {                  # Buttons aus Werkzeug-Ordnern (core.discovery)
+            "type": "object",
+            "properties": {
+                "folders": {"type": "array", "items": {"type": "string"}},
+                "workers": {"type": "integer", "minimum": 1}
+            },
+            "additionalProperties": False
+        },
+        "health": {                     # Payload-/Icon-Prüfung im Hintergrund (core.health)
+            "type": "object",
+            "properties": {
+                "enabled":    {"type": "boolean"},
+                "interval_s": {"type": "number", "exclusiveMinimum": 0}
+            },
+            "additionalProperties": False
+        },
+        "diagnostics": {                # Stall-Watchdog, Tracing, Speicher (core.stall_watchdog …)
+            "type": "object",
+            "properties": {
+                "stall_watchdog": {"type": "boolean"},
+                "stall_ms":       {"type": "number", "exclusiveMinimum": 0},
+                "trace":          {"type": "boolean"},
+                "memory":         {"type": "boolean"},
+                "memory_interval_s": {"type": "number", "exclusiveMinimum": 0},
+                "tracemalloc":    {"type": "boolean"}
+            },
+            "additionalProperties": False
         }
     },
     "required": ["buttons", "theme"],
@@ -65,6 +127,17 @@ SCHEMA = {
                     },
                     "required": ["row", "col"],
                     "additionalProperties": False
+                },
+                "limits": {             # nur SCRIPT: Ressourcen-/Zeitgrenzen
+                    "type": "object",
+                    "properties": {
+                        "memory_mb":   {"type": "integer", "minimum": 1},
+                        "cpu_seconds": {"type": "integer", "minimum": 1},
+                        "open_files":  {"type": "integer", "minimum": 1},
+                        "timeout_s":   {"type": "number", "exclusiveMinimum": 0},
+                        "stall_s":     {"type": "number", "exclusiveMinimum": 0}
+                    },
+                    "additionalProperties": False
                 }
             },
             "required": ["id", "action", "icon", "parent"],
@@ -78,31 +151,76 @@ class StorageError(Exception):
     """Basis-Exception für alle Storage-Operationen."""
 
 
+# -------------------------------------------------------------------
+# Validierung (lazy + Cache)
+# -------------------------------------------------------------------
+_VALID_CACHE = project_root() / ".cache" / "config_valid.sha1"
+
+
+def _digest(raw: bytes) -> str:
+    h = hashlib.sha1(json.dumps(SCHEMA, sort_keys=True).encode("utf-8"))
+    h.update(raw)
+    return h.hexdigest()
+
+
+def _known_valid(digest: str) -> bool:
+    try:
+        return _VALID_CACHE.read_text(encoding="ascii").strip() == digest
+    except OSError:
+        return False
+
+
+def _remember_valid(digest: str) -> None:
+    try:
+        _VALID_CACHE.parent.mkdir(exist_ok=True)
+        _VALID_CACHE.write_text(digest, encoding="ascii")
+    except OSError:
+        pass                                # Cache ist optional
+
+
+def validate_config(data: dict, what: str = "Config error") -> None:
+    """Prüft ``data`` gegen SCHEMA; wirft StorageError."""
+    with span("validate_config", "config"):
+        from jsonschema import ValidationError, validate   # teuer → erst hier
+        try:
+            validate(data, SCHEMA)
+        except ValidationError as exc:
+            raise StorageError(f"{what}: {exc}")
+
+
 # -------------------------------------------------------------------
 # Laden & Speichern
 # -------------------------------------------------------------------
+@traced("load_config", "config")
 def load_config(cfg_path: Path) -> dict:
     """Liest und validiert die Konfigurationsdatei."""
     try:
-        data = json.loads(cfg_path.read_text(encoding="utf-8"))
-        validate(data, SCHEMA)
-        return data
-    except (OSError, json.JSONDecodeError, ValidationError) as exc:
+        raw = cfg_path.read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
         raise StorageError(f"Config error: {exc}")
+    digest = _digest(raw)
+    if not _known_valid(digest):
+        validate_config(data)
+        _remember_valid(digest)
+    return data
 
 
+@traced("save_config", "config")
 def save_config(cfg_path: Path, config: dict) -> None:
     """Schreibt die geänderte Config zurück auf die Platte (schön formatiert)."""
+    # relative Pfade erzwingen, um Portabilität zu wahren
+    for b in config["buttons"]:
+        if b.get("payload") and b["action"] != "LINK":     # URLs sind keine Pfade
+            b["payload"] = to_relative(b["payload"])
+        b["icon"] = to_relative(b["icon"])
+    validate_config(config, "Save error")  # letzte Sicherung
+    raw = json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
     try:
-        # relative Pfade erzwingen, um Portabilität zu wahren
-        for b in config["buttons"]:
-            if b.get("payload"):
-                b["payload"] = to_relative(b["payload"])
-            b["icon"] = to_relative(b["icon"])
-        validate(config, SCHEMA)            # letzte Sicherung
-        cfg_path.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8")
-    except (OSError, ValidationError) as exc:
+        cfg_path.write_bytes(raw)
+    except OSError as exc:
         raise StorageError(f"Save error: {exc}")
+    _remember_valid(_digest(raw))
 
 
 # -------------------------------------------------------------------
@@ -131,12 +249,5 @@ def update_button(config: dict, btn: dict) -> None:
 
 def delete_button_recursive(config: dict, btn_id: str) -> None:
     """Löscht Button UND alle Nachkommen (rekursiv)."""
-    to_delete = {btn_id}
-    changed = True
-    while changed:
-        changed = False
-        for b in config["buttons"]:
-            if b["parent"] in to_delete and b["id"] not in to_delete:
-                to_delete.add(b["id"])
-                changed = True
+    to_delete = ButtonIndex(config["buttons"]).subtree_ids(btn_id)
     config["buttons"] = [b for b in config["buttons"] if b["id"] not in to_delete]
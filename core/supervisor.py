@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+core.supervisor
+===============
+
+Prozessbaum-Überwachung für ScriptRunner-Jobs.
+
+* Jobs starten in eigener Session/Prozessgruppe (``popen_kwargs``),
+  optional mit rlimits (Speicher, CPU-Sekunden, offene Dateien). Die
+  setzt ``apply_limits`` direkt nach dem Start per ``prlimit`` – kein
+  ``preexec_fn``, das ist aus Worker-Threads nicht sicher. Ohne
+  ``prlimit`` (z. B. macOS) setzt ein kleiner Wrapper die Grenzen und
+  ersetzt sich per ``exec`` durch das Skript (``limit_command``).
+* Ein *einziger* Watchdog-Thread prüft Wall-Clock-Timeout und
+  Stall-Zeit (keine Ausgabe seit N s) aller Jobs.
+* Abbruch ist asynchron: SIGTERM an den ganzen Baum, nach einer
+  Gnadenfrist SIGKILL – ohne dass irgendein Thread dafür schläft.
+  Die Prozessgruppe bekommt das Signal immer – auch wenn der Job-Prozess
+  schon beendet ist, denn verbliebene Kinder halten sonst stdout offen.
+  Das ist sicher: eine PGID wird nicht neu vergeben, solange die Gruppe
+  Mitglieder hat. Gemerkte Nachkommen außerhalb der Gruppe (``setsid``)
+  nur, wenn PID *und* Startzeit noch passen.
+"""
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from core.models import JobLimits
+from core.resources import process_tree, start_time
+
+try:                                    # nur POSIX
+    import resource as _resource
+except ImportError:                     # pragma: no cover – Windows
+    _resource = None
+
+_IS_WIN = sys.platform.startswith("win")
+
+# Zeit zwischen SIGTERM und SIGKILL
+KILL_GRACE_S = 3.0
+# Auflösung des Watchdogs, solange Timeouts/Stalls überwacht werden
+_TICK_S = 0.25
+
+
+# -------------------------------------------------------------------
+# Prozess-Start
+# -------------------------------------------------------------------
+def _rlimit_pairs(limits: JobLimits | None) -> List[tuple]:
+    if limits is None or not limits.has_rlimits() or _resource is None:
+        return []
+    pairs = []
+    if limits.memory_mb is not None:
+        n = limits.memory_mb * 1024 * 1024
+        pairs.append((_resource.RLIMIT_AS, (n, n)))
+    if limits.cpu_seconds is not None:
+        # soft → SIGXCPU, hard (+5 s) → SIGKILL
+        pairs.append((_resource.RLIMIT_CPU, (limits.cpu_seconds, limits.cpu_seconds + 5)))
+    if limits.open_files is not None:
+        pairs.append((_resource.RLIMIT_NOFILE, (limits.open_files, limits.open_files)))
+    return pairs
+
+
+# argv[1] = "res:soft:hard,…", argv[2:] = eigentliches Kommando
+_LIMIT_EXEC = (
+    "import os, resource, sys\n"
+    "for item in filter(None, sys.argv[1].split(',')):\n"
+    "    res, soft, hard = map(int, item.split(':'))\n"
+    "    resource.setrlimit(res, (soft, hard))\n"
+    "os.execv(sys.argv[2], sys.argv[2:])\n"
+)
+
+
+def popen_kwargs() -> dict:
+    """
+    Zusätzliche Popen-Argumente: eigene Session (POSIX) bzw.
+    eigene Prozessgruppe (Windows).
+    """
+    if _IS_WIN:
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def limit_command(cmd: Sequence[str], limits: JobLimits | None) -> List[str]:
+    """
+    Kommando ggf. in den rlimit-Wrapper packen – nur wo ``apply_limits``
+    nicht greift (kein ``prlimit``). Windows: rlimits gibt es nicht.
+    """
+    pairs = _rlimit_pairs(limits)
+    if not pairs or hasattr(_resource, "prlimit"):
+        return list(cmd)
+    spec = ",".join(f"{res}:{soft}:{hard}" for res, (soft, hard) in pairs)
+    return [sys.executable, "-c", _LIMIT_EXEC, spec, *cmd]
+
+
+def apply_limits(pid: int, limits: JobLimits | None) -> None:
+    """rlimits am gerade gestarteten Prozess setzen (Linux, ``prlimit``)."""
+    if not hasattr(_resource, "prlimit"):
+        return
+    for res, val in _rlimit_pairs(limits):
+        try:
+            _resource.prlimit(pid, res, val)
+        except (ProcessLookupError, PermissionError):
+            return                      # schon beendet
+        except (OSError, ValueError) as exc:
+            print(f"⚠️  rlimit für PID {pid} nicht gesetzt: {exc}", file=sys.stderr)
+
+
+# -------------------------------------------------------------------
+# Signale an den ganzen Baum
+# -------------------------------------------------------------------
+def _remember(pids: Iterable[int]) -> Dict[int, Optional[int]]:
+    """PID → Startzeit, um wiederverwendete PIDs später zu erkennen."""
+    return {p: start_time(p) for p in pids}
+
+
+def _signal_tree(proc: subprocess.Popen, pids: Dict[int, Optional[int]], force: bool) -> None:
+    if _IS_WIN:
+        if proc.poll() is not None:     # taskkill /T braucht den lebenden Wurzelprozess
+            return
+        args = ["taskkill", "/PID", str(proc.pid), "/T"] + (["/F"] if force else [])
+        try:                            # nicht warten – taskkill läuft nebenher
+            subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+        return
+
+    sig = signal.SIGKILL if force else signal.SIGTERM
+    try:
+        # Session-Leader → pgid == pid; nach seinem Ende trifft das die übrigen
+        # Gruppenmitglieder (ohne Mitglieder: ProcessLookupError)
+        os.killpg(proc.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+    # Nachkommen, die sich per setsid() aus der Gruppe gelöst haben
+    for p, started in pids.items():
+        if p == proc.pid or started is None or start_time(p) != started:
+            continue                    # unbekannt oder PID inzwischen neu vergeben
+        try:
+            os.kill(p, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+# -------------------------------------------------------------------
+@dataclass
+class Watch:
+    """Überwachungs-Eintrag eines Jobs. ``last_output`` setzt der Runner."""
+    job_id: str
+    proc: subprocess.Popen
+    limits: JobLimits
+    on_expire: Callable[[str], None]
+    started: float = field(default_factory=time.monotonic)
+    last_output: float = field(default_factory=time.monotonic)
+    kill_at: float | None = None        # SIGKILL-Eskalation geplant
+    known_pids: Dict[int, Optional[int]] = field(default_factory=dict)   # PID → Startzeit
+
+    def touch(self) -> None:
+        """Pro Ausgabezeile – bewusst nur eine Attribut-Zuweisung."""
+        self.last_output = time.monotonic()
+
+
+class Supervisor:
+    """
+    Gemeinsamer Watchdog-Thread für alle Jobs (startet beim ersten ``watch()``).
+    """
+
+    def __init__(self, grace: float = KILL_GRACE_S) -> None:
+        self.grace = grace
+        self._watches: Dict[str, Watch] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def watch(
+        self,
+        job_id: str,
+        proc: subprocess.Popen,
+        limits: JobLimits | None,
+        on_expire: Callable[[str], None],
+    ) -> Watch:
+        """
+        Registriert einen gestarteten Prozess. ``on_expire(grund)`` wird
+        (im Watchdog-Thread) aufgerufen, bevor Timeout/Stall den Baum beendet.
+        """
+        w = Watch(job_id, proc, limits or JobLimits(), on_expire)
+        with self._lock:
+            self._watches[job_id] = w
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="JobSupervisor", daemon=True
+                )
+                self._thread.start()
+            self._wakeup.notify()
+        return w
+
+    def unwatch(self, job_id: str) -> None:
+        """Job ist fertig. Eine bereits geplante SIGKILL-Eskalation bleibt bestehen."""
+        with self._lock:
+            w = self._watches.get(job_id)
+            if w is not None and w.kill_at is None:
+                del self._watches[job_id]
+
+    def terminate(self, job_id: str) -> None:
+        """SIGTERM an den Baum, SIGKILL nach ``grace`` Sekunden. Kehrt sofort zurück."""
+        with self._lock:
+            w = self._watches.get(job_id)
+            if w is None or w.kill_at is not None:
+                return
+            w.kill_at = time.monotonic() + self.grace
+            self._wakeup.notify()
+        # Baum VOR dem Signal merken – danach hängen Waisen an init
+        if w.proc.poll() is None:
+            w.known_pids = _remember(process_tree(w.proc.pid))
+        _signal_tree(w.proc, w.known_pids, force=False)
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._watches:
+                    self._wakeup.wait()
+                watches = list(self._watches.values())
+
+            now = time.monotonic()
+            expired: List[tuple[Watch, str]] = []
+            next_due = float("inf")
+            for w in watches:
+                if w.kill_at is not None:
+                    if now >= w.kill_at:
+                        self._kill(w)
+                    else:
+                        next_due = min(next_due, w.kill_at - now)
+                    continue
+                lim = w.limits
+                if lim.timeout_s is not None and now - w.started >= lim.timeout_s:
+                    expired.append((w, f"Zeitlimit von {lim.timeout_s:g}s überschritten"))
+                elif lim.stall_s is not None and now - w.last_output >= lim.stall_s:
+                    expired.append((w, f"Keine Ausgabe seit {lim.stall_s:g}s"))
+                elif lim.timeout_s is not None or lim.stall_s is not None:
+                    next_due = min(next_due, _TICK_S)
+
+            for w, reason in expired:
+                w.on_expire(reason)
+                self.terminate(w.job_id)
+
+            if expired:
+                continue
+            with self._lock:
+                # ohne Fristen schlafen bis zum nächsten watch()/terminate()
+                self._wakeup.wait(None if next_due == float("inf") else next_due)
+
+    def _kill(self, w: Watch) -> None:
+        pids = dict(w.known_pids)
+        if w.proc.poll() is None:       # seit SIGTERM neu hinzugekommene Kinder
+            pids.update(_remember(process_tree(w.proc.pid) - pids.keys()))
+        _signal_tree(w.proc, pids, force=True)
+        with self._lock:
+            self._watches.pop(w.job_id, None)
+
+
+# Singleton-Instanz (analog zu core.dispatcher)
+supervisor: Supervisor = Supervisor()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+core.tracing
+============
+
+Optionale Zeitmessung heißer Pfade im Chrome-Trace-Format (Qt-frei).
+Die Datei lässt sich in ``chrome://tracing`` oder https://ui.perfetto.dev
+öffnen.
+
+* ``with span("rebuild_pages"): …`` bzw. ``@traced("save_config")`` –
+  ausgeschaltet liefert ``span()`` ein geteiltes Null-Objekt und ``traced``
+  ruft die Funktion direkt auf: eine Abfrage von ``_active`` pro Aufruf.
+* ``complete(name, start_ns, end_ns)`` trägt eine bereits gemessene
+  Spanne nach (z. B. gebündelte Zeilen im Job-Thread).
+* Ereignisse landen in einer begrenzten ``deque`` – ``append`` ist atomar,
+  Worker-Threads (QThreadPool) brauchen also kein Lock; Threadnamen
+  werden als Metadaten mitgeschrieben.
+
+Einschalten per Umgebungsvariable ``MGUI_TRACE=1`` (bzw. ``=<datei.json>``,
+wirkt ab Programmstart – auch für das Laden der Config) oder per
+config.json ``"diagnostics": {"trace": true}``. Geschrieben wird beim
+Beenden nach ``<logs>/diagnostics/trace-<pid>.json``.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+
+from core.log_manager import log_manager
+
+ENV_FLAG = "MGUI_TRACE"
+# Obergrenze gepufferter Ereignisse (älteste fallen heraus)
+MAX_EVENTS = 1_000_000
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_active = False
+_path: Optional[Path] = None
+_events: Deque[dict] = deque(maxlen=MAX_EVENTS)
+_threads: Dict[int, str] = {}
+_pid = os.getpid()
+
+
+class _NullSpan:
+    """Ausgeschaltet: tut nichts, wird für jeden Aufruf wiederverwendet."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: Optional[dict]) -> None:
+        self.name, self.cat, self.args = name, cat, args
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        complete(self.name, self.start, time.perf_counter_ns(), self.cat, self.args)
+
+
+# -------------------------------------------------------------------
+# Public API
+# -------------------------------------------------------------------
+def span(name: str, cat: str = "app", **args):
+    """Kontextmanager für eine Spanne; ausgeschaltet ein Null-Objekt."""
+    if not _active:
+        return _NULL
+    return _Span(name, cat, args or None)
+
+
+def traced(name: Optional[str] = None, cat: str = "app") -> Callable[[F], F]:
+    """Dekorator: jeder Aufruf wird (falls aktiv) als Spanne aufgezeichnet."""
+    def deco(fn: F) -> F:
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*a, **kw):
+            if not _active:
+                return fn(*a, **kw)
+            with _Span(label, cat, None):
+                return fn(*a, **kw)
+        return wrapper  # type: ignore[return-value]
+    return deco
+
+
+def complete(name: str, start_ns: int, end_ns: int, cat: str = "app",
+             args: Optional[dict] = None) -> None:
+    """Fertig gemessene Spanne (perf_counter_ns) als Chrome-„X“-Ereignis ablegen."""
+    if not _active:
+        return
+    tid = threading.get_ident()
+    if tid not in _threads:
+        _threads[tid] = threading.current_thread().name
+    event = {"name": name, "cat": cat, "ph": "X", "pid": _pid, "tid": tid,
+             "ts": start_ns / 1000, "dur": (end_ns - start_ns) / 1000}
+    if args:
+        event["args"] = args
+    _events.append(event)
+
+
+def enabled() -> bool:
+    return _active
+
+
+def enable(path: Optional[Path] = None) -> None:
+    """Aufzeichnung starten; geschrieben wird beim Beenden (oder per ``write()``)."""
+    global _active, _path
+    if path is not None:
+        _path = Path(path)
+    if not _active:
+        _active = True
+        atexit.register(write)
+
+
+def disable() -> None:
+    global _active
+    _active = False
+
+
+def trace_path() -> Path:
+    return _path or log_manager.root / "diagnostics" / f"trace-{_pid}.json"
+
+
+def write(path: Optional[Path] = None) -> Optional[Path]:
+    """Schreibt alle bisherigen Ereignisse als Chrome-Trace-JSON; liefert den Pfad."""
+    events = list(_events)
+    if not events:
+        return None
+    meta = [{"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": n}}
+            for tid, n in list(_threads.items())]
+    target = Path(path) if path else trace_path()
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f)
+    except OSError:
+        return None
+    return target
+
+
+def configure(cfg: Optional[dict]) -> None:
+    """Übernimmt ``"diagnostics": {"trace": true}`` aus der config.json."""
+    if (cfg or {}).get("trace"):
+        enable()
+
+
+# Früh einschalten, damit auch Config-Laden & Start erfasst werden
+if os.environ.get(ENV_FLAG, "0") not in ("", "0"):
+    _env = os.environ[ENV_FLAG]
+    enable(None if _env == "1" else Path(_env))
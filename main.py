@@ -2,34 +2,138 @@
 import sys
 from pathlib import Path
 
+# Zweiter Start: Anfrage (Fenster zeigen, --run X) an die laufende Instanz
+# weiterreichen und sofort beenden – noch bevor PySide6 geladen wird
+if __name__ == "__main__":
+    from core import single_instance
+    if single_instance.forward_if_running(sys.argv[1:]):
+        sys.exit(0)
+
+# Vor allen schweren Imports: optionaler Startzeit-Bericht (--startup-report)
+from core.startup import startup
+if startup.requested():
+    startup.enable_import_timing()
+
+from PySide6.QtCore import QEvent, QObject, QTimer
 from PySide6.QtWidgets import QApplication
 
 from core.storage import load_config, StorageError
 from core.theming import apply_theme
 from ui.master_window import MasterWindow
 
+
+class _FirstPaint(QObject):
+    """Hält das erste Paint-Event des Hauptfensters fest und gibt den Bericht aus."""
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            startup.mark("erstes Zeichnen")
+            startup.disable_import_timing()
+            print(startup.format())
+            if path := startup.write():
+                print("Bericht:", path)
+            if startup.quit_after():
+                QTimer.singleShot(0, QApplication.quit)
+        return False
+
+
 def main():
-    # 1) Config laden
+    # 0) PyInstaller-EXE als Job-Daemon gestartet (siehe core.daemon_client)
+    if "--job-daemon" in sys.argv:
+        from core.daemon import main as daemon_main
+        sys.exit(daemon_main())
+
+    startup.mark("Imports")
+
+    # 0.1) Single-Instance: Lock nehmen – hält es schon eine andere, gerade
+    #      startende Instanz, die Anfrage an sie weiterreichen
+    from core import single_instance
+    guard = None
+    if single_instance.enabled(sys.argv[1:]):
+        from core.instance_server import InstanceServer
+        guard = InstanceServer()
+        if not guard.claim():
+            if single_instance.forward_if_running(sys.argv[1:], wait=single_instance.STARTUP_WAIT_S):
+                return
+            print("⚠️ Andere Instanz reagiert nicht – starte trotzdem.")
+            guard = None
+
+    # 1) Config laden (Schema-Prüfung nur bei geänderter Datei, siehe core.storage)
     try:
         config = load_config(Path("config.json"))
-        print("⚡️ Config geladen:", config)
+        startup.mark("Config geladen")
     except StorageError as e:
         print("❌ Konnte Config nicht laden:", e)
         return
 
+    # 1.0) Optional: Trace heißer Pfade (MGUI_TRACE wirkt schon ab Start)
+    from core import tracing
+    tracing.configure(config.get("diagnostics"))
+
+    # 1.1) Log-Retention/Rotation aus der Config
+    from core.log_manager import log_manager
+    log_manager.configure(config.get("logs"))
+
+    # 1.2) Metriken: Zähler an den Job-Signalen, optional HTTP-Endpunkt
+    from core.dispatcher import dispatcher
+    from core.metrics import job_metrics, metrics
+    job_metrics.attach(dispatcher)
+    port = (config.get("metrics") or {}).get("port")
+    if port:
+        try:
+            metrics.serve(port)
+        except OSError as e:
+            print(f"⚠️ Metrik-Endpunkt auf Port {port} nicht verfügbar:", e)
+
     # 2) Qt-Anwendung initialisieren
     app = QApplication(sys.argv)
+    startup.mark("QApplication")
 
-    # 2.1) QSS-Stylesheet laden
+    # 2.0) Optional: Stall-Watchdog und Speicher-Snapshots (Diagnose-Menü)
+    from core import memory_diag, stall_watchdog
+    diagnostics = config.get("diagnostics")
+    if stall_watchdog.settings(diagnostics) is not None or memory_diag.settings(diagnostics) is not None:
+        from ui.diagnostics_dialog import install_memory_tracker, install_watchdog
+        install_watchdog(app, diagnostics)
+        install_memory_tracker(app, diagnostics)
+
+    # 2.1) Optional: Jobs über den Job-Daemon (überleben GUI-Neustarts)
+    if config.get("job_daemon") or "--daemon" in sys.argv:
+        from core import daemon_client
+        if daemon_client.attach(app) is None:
+            print("⚠️ Job-Daemon nicht erreichbar – Jobs laufen lokal.")
+
+    # 2.2) QSS-Stylesheet laden
     apply_theme(config["theme"])
+    startup.mark("Theme")
 
-    # 3) Hauptfenster erzeugen
+    # 3) Hauptfenster erzeugen (Dashboard & Dialoge erst bei Bedarf)
     window = MasterWindow(config)
     # 3.1) Hintergrundbild aus Config (via apply_background – QPalette)
     window.apply_background(config["theme"].get("background", ""))
+    startup.mark("Hauptfenster")
+
+    if startup.requested():
+        probe = _FirstPaint(window)
+        window.installEventFilter(probe)
+    # 3.1.1) Event-Loop-Verzögerung ab Start messen (nicht erst mit dem Dashboard)
+    from ui.metrics_panel import EventLoopProbe
+    EventLoopProbe(app)
 
     window.show()
 
+    # 3.2) Ab jetzt weitere Starts annehmen; eigene Kommandozeile (--run X) wie eine Anfrage
+    if guard is not None:
+        guard.request.connect(window.handle_instance_request)
+        if guard.listen():
+            app.aboutToQuit.connect(guard.close)
+        else:
+            print(f"⚠️ Single-Instance-Socket nicht verfügbar ({guard.error}) – "
+                  "weitere Starts laufen eigenständig.")
+    if single_instance.run_targets(sys.argv[1:]):
+        QTimer.singleShot(0, lambda: window.handle_instance_request(sys.argv[1:]))
+
     # 4) Event-Loop starten
     sys.exit(app.exec())
 
@@ -0,0 +1,27 @@
+import json
+import sys
+
+from benchmarks import bench_runner
+
+
+def test_small_load_run(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    result = bench_runner.run_load(jobs=2, lines=300, progress_every=50)
+    assert result["completed"] == 2
+    assert result["lines"] == 600
+    assert result["signal_latency"]["samples"] == 600
+    assert result["log_mb_per_s"] > 0
+
+
+def test_record_and_replay(tmp_path, capsys):
+    script = tmp_path / "s.py"
+    script.write_text("for i in range(5):\n    print('zeile', i)\n", encoding="utf-8")
+    rec = tmp_path / "rec.jsonl"
+    assert bench_runner.record(script, rec) == 5
+    assert [json.loads(l)[1] for l in rec.read_text().splitlines()][-1] == "zeile 4"
+
+    from benchmarks.gen_output import emit, recorded
+    capsys.readouterr()
+    assert emit(recorded(rec, speed=0)) == 5
+    out = capsys.readouterr().out.splitlines()
+    assert out[0].startswith("0 ") and out[0].endswith(" zeile 0")
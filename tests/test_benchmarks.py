@@ -0,0 +1,21 @@
+from benchmarks import bench_config
+from benchmarks.synthetic import make_config
+
+
+def test_synthetic_config_shape():
+    cfg = make_config(1_000, depth=3, fanout=4)
+    ids = {b["id"] for b in cfg["buttons"]}
+    assert len(cfg["buttons"]) == 1_000 and len(ids) == 1_000
+    assert all(b["parent"] is None or b["parent"] in ids for b in cfg["buttons"])
+    assert {b["action"] for b in cfg["buttons"]} >= {"MENU", "SCRIPT"}
+
+
+def test_small_run_and_regression_check(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    results = bench_config.run(sizes=(100,), shapes=("tief",), repeat=1, log=lambda _: None)
+    row = results["100/tief"]
+    assert {"load_config", "save_config", "master_window", "button_manager"} <= set(row)
+
+    slower = {"100/tief": {k: v * 2 + 0.01 for k, v in row.items()}}
+    assert bench_config.compare(results, slower) == []
+    assert bench_config.compare(slower, results)         # +100 % → Regression
@@ -0,0 +1,108 @@
+import json
+import time
+
+import pytest
+
+from core import cli, storage
+from core.button_batch import BatchError, ButtonBatch, read_import
+
+
+def _btn(bid, parent=None, action="SCRIPT", **kw):
+    return {"id": bid, "action": action, "payload": "", "icon": "", "parent": parent, **kw}
+
+
+def _config(tmp_path):
+    cfg = {"theme": {"stylesheet": "", "background": ""}, "buttons": [
+        _btn("Tools", action="MENU"), _btn("Backup", "Tools", position={"row": 0, "col": 1}),
+        _btn("Export", "Tools"), _btn("Hilfe", action="LINK"),
+    ]}
+    path = tmp_path / "config.json"
+    storage.save_config(path, cfg)
+    return cfg, path
+
+
+def test_csv_import_excel_style(tmp_path):
+    src = tmp_path / "tools.csv"
+    src.write_text(
+        "﻿ID;Action;Payload;Parent;Row;Col\n"
+        "Team;menu;;;;\n"
+        "Lint;script;tools/lint.py;Team;0;2\n"
+        ";;;;;\n"
+        "Wiki;LINK;https://wiki;Team;;\n",
+        encoding="utf-8",
+    )
+    rows = read_import(src)
+    assert [b["id"] for b in rows] == ["Team", "Lint", "Wiki"]
+    assert rows[0] == {"id": "Team", "action": "MENU"}          # leere Zellen = nicht angegeben
+    assert rows[1]["position"] == {"row": 0, "col": 2}
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text("id,action,row\nA,SCRIPT,x\nB,PYTHON,\n", encoding="utf-8")
+    with pytest.raises(BatchError) as err:
+        read_import(bad)
+    assert sorted({p.split(":")[0] for p in err.value.problems}) == ["Zeile 2", "Zeile 3"]
+
+
+def test_batch_is_one_save_and_all_or_nothing(tmp_path, monkeypatch):
+    cfg, path = _config(tmp_path)
+    before = path.read_bytes()
+    original = cfg["buttons"]
+
+    batch = ButtonBatch(cfg)
+    batch.add([{"id": "Neu", "action": "SCRIPT", "parent": "Hilfe"}])    # Parent kein MENU
+    batch.move(["Tools"], "Tools")                                      # Zyklus
+    batch.edit(["Tools"], action="LINK")                                # hat Kinder
+    with pytest.raises(BatchError) as err:
+        batch.commit(path)
+    assert len(err.value.problems) == 3
+    assert cfg["buttons"] is original and path.read_bytes() == before
+
+    saves = []
+    real_save = storage.save_config
+    monkeypatch.setattr(storage, "save_config", lambda *a: saves.append(1) or real_save(*a))
+    batch = ButtonBatch(cfg)
+    batch.add([{"id": "Archiv", "action": "MENU"}])
+    batch.move(["Backup", "Export"], "Archiv")
+    batch.edit(["Backup", "Export", "Hilfe"], icon="assets/icons/tool.png")
+    batch.delete(["Tools"])
+    batch.commit(path)
+
+    assert saves == [1]
+    assert batch.summary() == "1 neu, 5 geändert, 1 gelöscht"
+    by_id = {b["id"]: b for b in cfg["buttons"]}
+    assert set(by_id) == {"Archiv", "Backup", "Export", "Hilfe"}
+    assert by_id["Backup"]["parent"] == "Archiv" and "position" not in by_id["Backup"]
+    assert by_id["Hilfe"]["icon"] == "assets/icons/tool.png"
+    assert original[1]["parent"] == "Tools"           # alte Liste unangetastet
+    assert json.loads(path.read_text(encoding="utf-8"))["buttons"] == cfg["buttons"]
+
+
+def test_import_update_existing_keeps_unlisted_fields(tmp_path):
+    cfg, path = _config(tmp_path)
+    src = tmp_path / "update.json"
+    src.write_text(json.dumps({"buttons": [{"id": "Backup", "action": "SCRIPT", "payload": "b.py"}]}))
+    batch = ButtonBatch(cfg)
+    batch.add(read_import(src), update_existing=True)
+    batch.commit(path)
+    backup = [b for b in cfg["buttons"] if b["id"] == "Backup"]
+    assert len(backup) == 1
+    assert backup[0]["payload"] == "b.py" and backup[0]["parent"] == "Tools"
+    assert backup[0]["position"] == {"row": 0, "col": 1}
+
+
+def test_cli_import_2000_buttons(tmp_path, capsys):
+    cfg, path = _config(tmp_path)
+    lines = ["id,action,payload,parent", "Team,MENU,,"]
+    lines += [f"Tool {i},SCRIPT,tools/t{i}.py,Team" for i in range(2000)]
+    src = tmp_path / "team.csv"
+    src.write_text("\n".join(lines), encoding="utf-8")
+
+    t0 = time.perf_counter()
+    assert cli.main(["--config", str(path), "import", str(src)]) == 0
+    assert time.perf_counter() - t0 < 10.0
+    assert "2001 neu" in capsys.readouterr().out
+    assert len(storage.load_config(path)["buttons"]) == 2005
+
+    src.write_text("id,action,parent\nX,SCRIPT,Gibtsnicht\n", encoding="utf-8")
+    assert cli.main(["--config", str(path), "import", str(src)]) == 2
+    assert "Parent 'Gibtsnicht' existiert nicht" in capsys.readouterr().err
@@ -0,0 +1,151 @@
+import time
+
+from PySide6.QtCore import QItemSelectionModel
+from PySide6.QtTest import QAbstractItemModelTester
+
+from benchmarks.synthetic import make_config
+from core import storage
+from ui.button_manager import ButtonManager
+from ui.button_tree_model import FETCH_BATCH, ButtonIdRole
+
+
+def _btn(bid, parent=None, action="SCRIPT", **kw):
+    return {"id": bid, "action": action, "payload": "", "icon": "", "parent": parent, **kw}
+
+
+def test_opens_fast_on_50k_buttons(qtbot, tmp_path):
+    cfg = make_config(50_000, depth=1, fanout=32)
+    t0 = time.perf_counter()
+    mgr = ButtonManager(cfg, tmp_path / "config.json")
+    qtbot.addWidget(mgr)
+    mgr.show()
+    qtbot.wait(10)
+    assert time.perf_counter() - t0 < 2.0
+    assert mgr.model.rowCount() <= 2 * FETCH_BATCH          # nur die ersten Blöcke geladen
+    assert mgr.model.canFetchMore(mgr.tree.rootIndex())
+
+
+def test_edits_keep_selection_and_expansion(qtbot, tmp_path):
+    cfg = {"theme": {}, "buttons": [
+        _btn("Tools", action="MENU"), _btn("Backup", "Tools"), _btn("Export", "Tools"),
+        _btn("Hilfe", action="LINK"),
+    ]}
+    mgr = ButtonManager(cfg, tmp_path / "config.json")
+    qtbot.addWidget(mgr)
+    mgr.show()
+    model, tree = mgr.model, mgr.tree
+    tools = model.index_of("Tools")
+    tree.expand(tools)
+    qtbot.waitUntil(lambda: model.rowCount(tools) == 2)
+    tree.selectionModel().select(model.index_of("Export"),
+                                 QItemSelectionModel.Select | QItemSelectionModel.Rows)
+
+    events = []
+    for name in ("modelReset", "rowsInserted", "rowsRemoved", "dataChanged"):
+        getattr(model, name).connect(lambda *a, n=name: events.append(n))
+
+    storage.add_button(cfg, _btn("Restore", "Tools"))
+    storage.update_button(cfg, _btn("Hilfe", action="LINK", description="neu"))
+    storage.delete_button_recursive(cfg, "Backup")
+    mgr._reload_tree()
+
+    assert "modelReset" not in events
+    assert events.count("rowsInserted") == 1 and events.count("rowsRemoved") == 1
+    assert "dataChanged" in events
+    assert tree.isExpanded(model.index_of("Tools"))
+    assert mgr._current_ids() == ["Export"]
+    kids = [model.index(r, 0, model.index_of("Tools")).data(ButtonIdRole)
+            for r in range(model.rowCount(model.index_of("Tools")))]
+    assert kids == ["Export", "Restore"]
+    assert "neu" in model.index_of("Hilfe").data(0x0003)          # ToolTipRole
+
+
+def test_partially_loaded_level(qtbot, tmp_path):
+    cfg = {"theme": {}, "buttons": [_btn(f"b{i}") for i in range(FETCH_BATCH + 100)]}
+    mgr = ButtonManager(cfg, tmp_path / "config.json")
+    qtbot.addWidget(mgr)
+    mgr.show()
+    model = mgr.model
+    loaded = model.rowCount()
+    assert loaded == FETCH_BATCH
+
+    storage.delete_button_recursive(cfg, "b3")
+    storage.add_button(cfg, _btn("neu"))
+    mgr._reload_tree()
+    assert model.rowCount() == loaded - 1                  # neuer Button liegt im ungeladenen Rest
+    model.fetchMore(mgr.tree.rootIndex())
+    assert model.rowCount() == len(cfg["buttons"])
+    assert model.index(model.rowCount() - 1, 0).data(ButtonIdRole) == "neu"
+
+
+def test_sync_is_consistent_for_model_tester(qtbot, qtlog, tmp_path):
+    cfg = {"theme": {}, "buttons": [
+        _btn("Tools", action="MENU"), _btn("Backup", "Tools"), _btn("Export", "Tools"),
+        _btn("Leer", action="MENU"), _btn("x", "Leer"), _btn("Hilfe", action="LINK"),
+    ]}
+    mgr = ButtonManager(cfg, tmp_path / "config.json")
+    qtbot.addWidget(mgr)
+    mgr.show()
+    model, tree = mgr.model, mgr.tree
+    tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Warning)
+    tree.expandAll()
+    qtbot.waitUntil(lambda: model.rowCount(model.index_of("Leer")) == 1)
+
+    seen = []                                # was eine View mitten im Signal sieht
+
+    def probe(parent, *_):
+        seen.append((model.hasChildren(parent), model.rowCount(parent),
+                     model.canFetchMore(parent)))
+        model.fetchMore(parent)
+    signals = (model.rowsAboutToBeRemoved, model.rowsRemoved,
+               model.rowsAboutToBeInserted, model.rowsInserted)
+    for sig in signals:
+        sig.connect(probe)
+
+    storage.delete_button_recursive(cfg, "x")               # Menü wird leer
+    storage.delete_button_recursive(cfg, "Backup")
+    storage.add_button(cfg, _btn("Neu", "Hilfe"))           # Blatt bekommt Kinder
+    storage.add_button(cfg, _btn("Restore", "Tools"))
+    mgr._reload_tree()
+    for sig in signals:
+        sig.disconnect(probe)
+
+    assert seen and all(not fetch for _has, _rows, fetch in seen)
+    assert all(has for has, rows, _fetch in seen if rows)
+    assert not [r for r in qtlog.records if "FAIL" in r.message]
+    assert model.rowCount(model.index_of("Leer")) == 0
+    assert [model.index(r, 0, model.index_of("Tools")).data(ButtonIdRole)
+            for r in range(model.rowCount(model.index_of("Tools")))] == ["Export", "Restore"]
+    assert model.canFetchMore(model.index_of("Hilfe"))
+    del tester
+
+
+def test_bulk_delete_and_import_save_once(qtbot, tmp_path, monkeypatch):
+    cfg = {"theme": {"stylesheet": "", "background": ""}, "buttons": [
+        _btn("Tools", action="MENU"), _btn("Backup", "Tools"), _btn("Hilfe", action="LINK"),
+        _btn("Web", action="LINK"),
+    ]}
+    path = tmp_path / "config.json"
+    mgr = ButtonManager(cfg, path)
+    qtbot.addWidget(mgr)
+    mgr.show()
+    monkeypatch.setattr("ui.button_manager.QMessageBox.information", lambda *a: None)
+    saves = []
+    real_save = storage.save_config
+    monkeypatch.setattr(storage, "save_config", lambda *a: saves.append(1) or real_save(*a))
+    resets = []
+    mgr.model.modelReset.connect(lambda: resets.append(1))
+
+    for bid in ("Tools", "Hilfe"):
+        mgr.tree.selectionModel().select(mgr.model.index_of(bid),
+                                         QItemSelectionModel.Select | QItemSelectionModel.Rows)
+    mgr._on_delete()
+    assert [b["id"] for b in cfg["buttons"]] == ["Web"]
+    assert mgr.model.rowCount() == 1 and saves == [1]
+
+    src = tmp_path / "tools.csv"
+    src.write_text("id,action,payload\n" + "\n".join(f"T{i},SCRIPT,t{i}.py" for i in range(300)))
+    assert mgr.import_file(src, update_existing=False)
+    assert saves == [1, 1] and not resets
+    assert len(cfg["buttons"]) == 301
+    qtbot.waitUntil(lambda: mgr.model.rowCount() == 301)
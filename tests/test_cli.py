@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from core import cli
+
+
+def _write_config(tmp_path: Path) -> Path:
+    ok = tmp_path / "ok.py"
+    ok.write_text("print('hallo 50%')\n", encoding="utf-8")
+    bad = tmp_path / "bad.py"
+    bad.write_text("raise SystemExit(3)\n", encoding="utf-8")
+    cfg = {
+        "buttons": [
+            {"id": "Tools", "action": "MENU", "icon": "", "parent": None},
+            {"id": "Ok", "action": "SCRIPT", "payload": str(ok), "icon": "", "parent": "Tools"},
+            {"id": "Bad", "action": "SCRIPT", "payload": str(bad), "icon": "", "parent": None},
+            {"id": "Web", "action": "LINK", "payload": "https://example.org", "icon": "", "parent": None},
+        ],
+        "theme": {"stylesheet": "", "background": ""},
+    }
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(cfg), encoding="utf-8")
+    return path
+
+
+def test_run_menu_path_and_pipeline(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path / "logs"))
+    cfg = _write_config(tmp_path)
+
+    assert cli.main(["--config", str(cfg), "run", "Tools/Ok"]) == 0
+    assert "[Ok] hallo 50%" in capsys.readouterr().out
+
+    assert cli.main(["--config", str(cfg), "run", "Tools"]) == 0
+    assert cli.main(["--config", str(cfg), "-q", "pipeline", "Bad", "Ok"]) == 1
+    assert "Exitcode 3" in capsys.readouterr().out
+    assert cli.main(["--config", str(cfg), "run", "Web"]) == 2
+    assert cli.main(["--config", str(cfg), "run", "Gibtsnicht"]) == 2
+
+
+def test_cli_does_not_import_qt():
+    code = "import sys, core.cli; print(any(m.startswith('PySide6') for m in sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    assert out.stdout.strip() == "False"
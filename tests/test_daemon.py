@@ -0,0 +1,129 @@
+import json
+import os
+import time
+
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from core import daemon, daemon_client, runner
+from core.daemon import JobDaemon, pack
+from core.daemon_client import DaemonClient
+from core.dispatcher import dispatcher
+
+
+def _isolate(monkeypatch, tag):
+    name = f"mgui-test-{os.getpid()}-{tag}"
+    monkeypatch.setattr(daemon, "server_name", lambda: name)
+    monkeypatch.setattr(daemon_client, "server_name", lambda: name)
+    return name
+
+
+class _Peer:
+    """Roh-Client/-Verbindung, die JSON-Zeilen sammelt."""
+
+    def __init__(self, sock: QLocalSocket) -> None:
+        self.sock = sock
+        self.msgs = []
+        self._buf = b""
+        sock.readyRead.connect(self._read)
+
+    def _read(self) -> None:
+        self._buf += bytes(self.sock.readAll())
+        *lines, self._buf = self._buf.split(b"\n")
+        self.msgs += [json.loads(line) for line in lines if line]
+
+    def events(self, ev):
+        return [m for m in self.msgs if m.get("ev") == ev]
+
+
+def test_daemon_runs_jobs_and_replays_snapshot(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path / "logs"))
+    name = _isolate(monkeypatch, "server")
+    quits = []
+    monkeypatch.setattr(daemon.QCoreApplication, "quit", lambda: quits.append(1))
+    script = tmp_path / "hallo.py"
+    script.write_text("print('hallo 50%')\n", encoding="utf-8")
+
+    jd = JobDaemon()
+    assert jd.listen()
+    try:
+        first = _Peer(QLocalSocket())
+        first.sock.connectToServer(name)
+        qtbot.waitUntil(lambda: bool(first.events("snapshot")))
+        assert first.events("snapshot")[0]["jobs"] == []
+
+        first.sock.write(pack({"cmd": "run", "job_id": "d1", "script": str(script), "limits": None}))
+        qtbot.waitUntil(lambda: bool(first.events("job_released")), timeout=10_000)
+        assert first.events("job_started")[0]["args"] == ["d1", "hallo.py"]
+        assert ["d1", 50, "hallo 50%"] in [m["args"] for m in first.events("job_progress")]
+        assert first.events("job_finished")[0]["args"] == ["d1"]
+
+        second = _Peer(QLocalSocket())
+        second.sock.connectToServer(name)
+        qtbot.waitUntil(lambda: bool(second.events("snapshot")))
+        (job,) = second.events("snapshot")[0]["jobs"]
+        assert (job["job_id"], job["state"], job["percent"]) == ("d1", "finished", 100)
+        assert "hallo 50%" in job["tail"]
+
+        second.sock.write(pack({"cmd": "shutdown"}))
+        qtbot.waitUntil(lambda: bool(first.events("shutdown") and second.events("shutdown")))
+        assert quits == [1]
+    finally:
+        jd.close()
+
+
+def test_client_reconnects_without_blocking_and_respects_shutdown(qtbot, monkeypatch):
+    name = _isolate(monkeypatch, "client")
+    monkeypatch.setattr(daemon_client, "RECONNECT_MS", 50)
+    monkeypatch.setattr(daemon_client, "SPAWN_POLL_MS", 50)
+    server = QLocalServer()
+    peers = []
+    server.newConnection.connect(lambda: peers.append(_Peer(server.nextPendingConnection())))
+    spawned = []
+
+    def fake_spawn():                        # „Daemon startet“ = Server lauscht wieder
+        spawned.append(1)
+        server.listen(name)
+    monkeypatch.setattr(daemon_client, "_spawn_daemon", fake_spawn)
+
+    assert server.listen(name)
+    client = DaemonClient()
+    started, errors, local = [], [], []
+    dispatcher.job_started.connect(lambda *a: started.append(a))
+    dispatcher.job_error.connect(lambda *a: errors.append(a))
+    monkeypatch.setattr(runner, "start_local", lambda *a: local.append(a))
+    try:
+        assert client.connect_or_spawn() and not spawned
+        qtbot.waitUntil(lambda: len(peers) == 1)
+        runner.use_backend(client)
+        peers[0].sock.write(pack({"ev": "job_started", "args": ["x1", "a.py"]}))
+        qtbot.waitUntil(lambda: ("x1", "a.py") in started)
+
+        # Daemon stürzt ab: Socket weg → asynchron neu starten und verbinden
+        server.close()
+        peers[0].sock.abort()
+        qtbot.waitUntil(lambda: not client.is_connected())
+        assert errors == [("x1", "Verbindung zum Job-Daemon verloren")]
+
+        # ohne Verbindung wird nichts verworfen – der Job läuft lokal
+        client.run("x2", "b.py", None)
+        assert [a[0] for a in local] == ["x2"]
+        t0 = time.monotonic()
+        client._try_reconnect()
+        assert time.monotonic() - t0 < 0.1
+        qtbot.waitUntil(client.is_connected, timeout=3000)
+        qtbot.waitUntil(lambda: len(peers) == 2)
+        assert spawned == [1]
+
+        # gewolltes Ende (auch von einer anderen GUI) → kein Neustart, Jobs wieder lokal
+        peers[1].sock.write(pack({"ev": "shutdown"}))
+        peers[1].sock.flush()
+        qtbot.waitUntil(lambda: runner.backend() is None)
+        server.close()
+        peers[1].sock.abort()
+        qtbot.waitUntil(lambda: not client.is_connected())
+        qtbot.wait(300)
+        assert spawned == [1] and not client.is_connected()
+    finally:
+        runner.use_backend(None)
+        client.deleteLater()
+        server.close()
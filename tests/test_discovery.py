@@ -0,0 +1,151 @@
+import os
+import time
+
+from core import discovery
+from core.button_batch import ButtonBatch
+from core.discovery import Scanner, plan
+
+
+def _tree(root):
+    files = ["backup.py", "Handbuch.pdf", "ignore.bin", "net/ping.py", "net/dns/lookup.py",
+             "leer/sub/.hidden.py", "__pycache__/x.py"]
+    for rel in files:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+    _age(root)
+
+
+def _age(root):
+    """mtime in die Vergangenheit – sonst gilt alles als „gerade geändert“ (RACY_S)."""
+    old = time.time() - 60
+    for dirpath, _dirs, _files in os.walk(root):
+        os.utime(dirpath, (old, old))
+
+
+def _cfg():
+    return {"theme": {"stylesheet": "", "background": ""}, "buttons": []}
+
+
+def test_incremental_rescan_reads_only_changed_dirs(tmp_path):
+    tools = tmp_path / "gui_tools"
+    _tree(tools)
+    scanner = Scanner(tmp_path / "cache.json", workers=4)
+    first = scanner.scan(tools)
+    assert first.scanned == len(first.dirs) == 5 and first.file_count == 4
+    scanner.save()
+
+    again = Scanner(tmp_path / "cache.json").scan(tools)         # Cache von der Platte
+    assert (again.scanned, again.reused) == (0, 5)
+
+    (tools / "net" / "trace.py").write_text("", encoding="utf-8")
+    changed = scanner.scan(tools)
+    assert changed.scanned == 1 and changed.file_count == 5
+    assert ("trace.py", "SCRIPT") in changed.dirs[str(tools / "net")].files
+
+
+def test_plan_mirrors_folders_and_is_idempotent(tmp_path, monkeypatch):
+    monkeypatch.setattr(discovery, "project_root", lambda: tmp_path)
+    monkeypatch.setattr("util.paths._PROJECT_ROOT", tmp_path)
+    tools = tmp_path / "gui_tools"
+    _tree(tools)
+    cfg, path = _cfg(), tmp_path / "config.json"
+    scanner = Scanner(use_cache=False)
+
+    proposal = plan(cfg, [scanner.scan(tools)])
+    got = {(b["parent"], b["id"], b["action"]) for b in proposal.add}
+    assert got == {
+        (None, "gui_tools", "MENU"), ("gui_tools", "backup", "SCRIPT"),
+        ("gui_tools", "Handbuch", "FILE"), ("gui_tools", "net", "MENU"),
+        ("net", "ping", "SCRIPT"), ("net", "dns", "MENU"), ("dns", "lookup", "SCRIPT"),
+    }
+    assert next(b for b in proposal.add if b["id"] == "lookup")["payload"] == \
+        os.path.join("gui_tools", "net", "dns", "lookup.py")
+
+    batch = ButtonBatch(cfg)
+    proposal.apply(batch)
+    batch.commit(path)
+    assert not plan(cfg, [scanner.scan(tools)])
+
+    (tools / "net" / "ping.py").unlink()
+    proposal = plan(cfg, [scanner.scan(tools)])
+    assert proposal.add == [] and proposal.stale == ["ping"]
+    batch = ButtonBatch(cfg)
+    proposal.apply(batch, prune=True)
+    batch.commit(path)
+    assert "ping" not in {b["id"] for b in cfg["buttons"]}
+
+
+def test_plan_ids_unique_for_same_named_file_folder_and_stems(tmp_path, monkeypatch):
+    monkeypatch.setattr(discovery, "project_root", lambda: tmp_path)
+    monkeypatch.setattr("util.paths._PROJECT_ROOT", tmp_path)
+    tools = tmp_path / "gui_tools"
+    for rel in ["convert.py", "convert/run.py", "a/main.py", "b/main.py", "a/b/x.py"]:
+        (tools / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tools / rel).write_text("", encoding="utf-8")
+    _age(tools)
+    cfg, path = _cfg(), tmp_path / "config.json"
+    scanner = Scanner(use_cache=False)
+
+    proposal = plan(cfg, [scanner.scan(tools)])
+    ids = [b["id"] for b in proposal.add]
+    assert len(ids) == len(set(ids))
+    got = {(b["parent"], b["id"], b["action"]) for b in proposal.add}
+    assert {("gui_tools", "convert", "MENU"), ("gui_tools", "gui_tools/convert", "SCRIPT"),
+            ("a", "main", "SCRIPT"), ("b", "b/main", "SCRIPT"),
+            ("gui_tools", "b", "MENU"), ("a", "a/b", "MENU")} <= got
+
+    batch = ButtonBatch(cfg)
+    proposal.apply(batch)
+    assert batch.problems() == []
+    batch.commit(path)
+    assert not plan(cfg, [scanner.scan(tools)])
+
+
+def test_dialog_scans_in_background_and_applies(qtbot, tmp_path, monkeypatch):
+    from ui.discovery_dialog import DiscoveryDialog
+    monkeypatch.setattr(discovery, "CACHE_PATH", tmp_path / "cache.json")
+    tools = tmp_path / "gui_tools"
+    _tree(tools)
+    cfg = _cfg()
+    cfg["discovery"] = {"folders": [str(tools)], "workers": 2}
+    dlg = DiscoveryDialog(cfg, tmp_path / "config.json")
+    qtbot.addWidget(dlg)
+    dlg.scan()
+    qtbot.waitUntil(lambda: dlg.plan is not None)
+    assert len(dlg.plan.add) == 7 and "7 neue Buttons" in dlg.status.text()
+    dlg.apply()
+    assert dlg.result() == dlg.DialogCode.Accepted
+    assert len(cfg["buttons"]) == 7
+
+
+def test_malformed_cache_and_failed_scan_or_commit(qtbot, tmp_path, monkeypatch):
+    from ui.discovery_dialog import DiscoveryDialog
+    tools = tmp_path / "gui_tools"
+    _tree(tools)
+    cache = tmp_path / "cache.json"
+    cache.write_text('{"version": 1, "dirs": {"%s": {"m": 0, "i": 0, "f": 5}}}' % tools,
+                     encoding="utf-8")
+    Scanner(cache).scan(tools)                                   # kaputter Eintrag → neu gelesen
+    monkeypatch.setattr(discovery, "CACHE_PATH", cache)
+
+    cfg = _cfg()
+    cfg["discovery"] = {"folders": [str(tools)]}
+    dlg = DiscoveryDialog(cfg, tmp_path / "config.json")
+    qtbot.addWidget(dlg)
+    def broken_scan(*_):
+        raise ValueError("kaputt")
+    monkeypatch.setattr(Scanner, "scan", broken_scan)
+    dlg.scan()
+    qtbot.waitUntil(lambda: dlg.scan_btn.isEnabled())
+    assert "ValueError: kaputt" in dlg.status.text()
+    monkeypatch.undo()
+
+    monkeypatch.setattr(discovery, "CACHE_PATH", cache)
+    dlg.scan()
+    qtbot.waitUntil(lambda: dlg.plan is not None)
+    dlg.folder_list.addItem("weitere")
+    monkeypatch.setattr("ui.discovery_dialog.QMessageBox.critical", lambda *a: None)
+    dlg._cfg_path = tmp_path / "fehlt" / "config.json"           # Speichern schlägt fehl
+    dlg.apply()
+    assert cfg["discovery"] == {"folders": [str(tools)]} and cfg["buttons"] == []
@@ -0,0 +1,74 @@
+import gc
+import tracemalloc
+from pathlib import Path
+
+from core import runner
+from core.dispatcher import dispatcher
+from core.job import Job
+
+
+class _Listener:
+    def __init__(self) -> None:
+        self.lines = 0
+
+    def on_progress(self, percent: int, msg: str) -> None:
+        self.lines += 1
+
+
+def _fake_run(self, emit) -> None:
+    """Job ohne Subprozess: ein paar Events wie ein echtes Skript."""
+    emit("job_progress", self.job_id, 0, "Starte Skript …")
+    emit("job_progress", self.job_id, 50, "halb")
+    emit("job_finished", self.job_id)
+
+
+def _one_job(i: int, keep: list) -> None:
+    job_id = f"soak-{i}"
+    r = runner.ScriptRunner(job_id, Path("dummy.py"))
+    listener = _Listener()
+    dispatcher.subscribe(job_id, "job_progress", listener.on_progress)
+    if i % 100 == 0:
+        keep.append(listener)                # weiterlebender Listener: Abo muss trotzdem weg
+    r.run()
+    assert listener.lines == 2
+
+
+def test_10k_jobs_memory_flat(tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(Job, "run", _fake_run)
+    keep: list = []
+
+    for i in range(1_000):                   # Warmup (Caches, Interning …)
+        _one_job(i, keep)
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    for i in range(1_000, 10_000):
+        _one_job(i, keep)
+    gc.collect()
+    grown = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+
+    assert len(dispatcher.jobs) == 0
+    assert dispatcher.subscription_count() == 0
+    # nur die 90 absichtlich behaltenen Listener dürfen übrig sein
+    assert grown < 256 * 1024, f"{grown} Bytes Zuwachs nach 9k Jobs"
+
+
+def test_abort_reaches_only_target():
+    class Handle:
+        def __init__(self) -> None:
+            self.aborted = False
+
+        def abort(self) -> None:
+            self.aborted = True
+
+    a, b = Handle(), Handle()
+    dispatcher.jobs.register("a", a)
+    dispatcher.jobs.register("b", b)
+    try:
+        dispatcher.job_abort_req.emit("b")
+        assert (a.aborted, b.aborted) == (False, True)
+    finally:
+        dispatcher.jobs.unregister("a")
+        dispatcher.jobs.unregister("b")
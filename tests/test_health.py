@@ -0,0 +1,94 @@
+import os
+import time
+
+from core import storage
+from core.health import HealthChecker, key
+
+
+def _btn(bid, action, payload="", icon="", parent=None):
+    return {"id": bid, "action": action, "payload": payload, "icon": icon, "parent": parent}
+
+
+def _age(*dirs):
+    old = time.time() - 60
+    for d in dirs:
+        os.utime(d, (old, old))
+
+
+def test_problems_per_action(tmp_path):
+    (tmp_path / "ok.py").write_text("", encoding="utf-8")
+    tool = tmp_path / "tool.sh"
+    tool.write_text("", encoding="utf-8")
+    tool.chmod(0o644)
+    (tmp_path / "sub").mkdir()
+    checker = HealthChecker()
+    cases = [
+        (_btn("a", "SCRIPT", str(tmp_path / "ok.py")), 0),
+        (_btn("b", "SCRIPT", str(tmp_path / "fehlt.py")), 1),
+        (_btn("c", "SCRIPT", str(tool)), 0 if os.name == "nt" else 1),
+        (_btn("d", "FOLDER", str(tmp_path / "ok.py")), 1),
+        (_btn("e", "FILE", str(tmp_path / "sub")), 1),
+        (_btn("f", "LINK", "https://example.org/x"), 0),
+        (_btn("g", "LINK", "https:/example.org/x"), 1),        # so hat save_config URLs früher verstümmelt
+        (_btn("h", "LINK", "mailto:team@example.org"), 0),
+        (_btn("i", "MENU", icon="."), 0),
+        (_btn("j", "MENU", icon=str(tmp_path / "fehlt.png")), 1),
+        (_btn("k", "FILE"), 1),
+    ]
+    for btn, expected in cases:
+        assert len(checker.problems(key(btn))) == expected, btn
+
+
+def test_stat_cache_only_rechecks_changed_dirs(tmp_path):
+    tools = tmp_path / "tools"
+    tools.mkdir()
+    for i in range(200):
+        (tools / f"t{i}.py").write_text("", encoding="utf-8")
+    _age(tools)
+    buttons = [_btn(f"t{i}", "SCRIPT", str(tools / f"t{i}.py")) for i in range(200)]
+    buttons.append(_btn("neu", "SCRIPT", str(tools / "neu.py")))
+    checker = HealthChecker()
+
+    first = checker.check(key(b) for b in buttons)
+    assert checker.stats.file_stats == 201
+    assert [k[1] for k, issues in first.items() if issues] == [str(tools / "neu.py")]
+
+    checker.check(key(b) for b in buttons)
+    assert checker.stats.file_stats == 201                     # nur der Ordner wurde gestatet
+
+    (tools / "neu.py").write_text("", encoding="utf-8")        # ändert die Ordner-mtime
+    third = checker.check(key(b) for b in buttons)
+    assert not any(third.values())
+
+
+def test_save_config_keeps_urls(tmp_path):
+    cfg = {"theme": {"stylesheet": "", "background": ""},
+           "buttons": [_btn("Wiki", "LINK", "https://wiki.example.org/a")]}
+    storage.save_config(tmp_path / "config.json", cfg)
+    assert cfg["buttons"][0]["payload"] == "https://wiki.example.org/a"
+
+
+def test_badges_in_master_window_and_manager(qtbot, tmp_path):
+    from ui.button_manager import ButtonManager
+    from ui.master_window import MasterWindow
+    script = tmp_path / "job.py"
+    cfg = {"theme": {"stylesheet": "", "background": ""},
+           "buttons": [_btn("Job", "SCRIPT", str(script)), _btn("Web", "LINK", "https://x.org")]}
+    win = MasterWindow(cfg, tmp_path / "config.json")
+    qtbot.addWidget(win)
+    widgets = {c["id"]: w for w, c in win._btn_widgets}
+    qtbot.waitUntil(lambda: widgets["Job"].text() == "⚠ Job")
+    assert "Nicht gefunden" in widgets["Job"].toolTip()
+    assert widgets["Web"].text() == "Web"
+
+    mgr = ButtonManager(cfg, tmp_path / "config.json", health=win.health)
+    qtbot.addWidget(mgr)
+    mgr.show()
+    job = mgr.model.index_of("Job")
+    assert job.data(0x1) is not None                           # Qt.DecorationRole
+
+    script.write_text("", encoding="utf-8")
+    win.health.recheck()
+    qtbot.waitUntil(lambda: widgets["Job"].text() == "Job")
+    assert mgr.model.index_of("Job").data(0x1) is None
+    win.health.stop()
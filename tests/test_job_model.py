@@ -0,0 +1,114 @@
+import time
+
+from PySide6.QtWidgets import QApplication
+
+from core.dispatcher import dispatcher
+from core.log_search import LogIndex
+from core.resources import ResourceStats
+from ui import job_model
+from ui.job_model import JobFilterProxy, JobTableModel, StateRole
+from ui.task_dashboard import TaskDashboard
+
+
+def test_batched_model_with_50k_rows(qtbot):
+    app = QApplication.instance()
+    dash = TaskDashboard()
+    qtbot.addWidget(dash)
+    model = dash.model
+    model.set_retention(50_000)                      # hier alles im Speicher
+    inserted = []
+    changed = []
+    model.rowsInserted.connect(lambda *a: inserted.append(a))
+    model.dataChanged.connect(lambda *a: changed.append(a))
+
+    t0 = time.perf_counter()
+    for i in range(50_000):
+        dispatcher.job_started.emit(f"m{i}", f"skript_{i % 7}.py")
+    for i in range(0, 50_000, 2):
+        dispatcher.job_finished.emit(f"m{i}")
+    dispatcher.job_progress.emit("m1", 40, "…")
+    dispatcher.job_resources.emit("m1", ResourceStats(cpu_s=1.5, rss=1024, procs=1))
+    model.flush()
+    dash.show()
+    app.processEvents()
+    elapsed = time.perf_counter() - t0
+
+    assert model.rowCount() == 50_000
+    assert len(inserted) == 1 and len(changed) == 1        # gebündelt
+    assert model.index(1, JobTableModel.COL_CPU).data() == "1.5 s"
+    assert model.index(0, JobTableModel.COL_STATUS).data() == "✅ Fertig"
+
+    dash.state_combo.setCurrentText("Laufend")
+    dash.filter_edit.setText("skript_3")
+    proxy = dash.proxy
+    assert 0 < proxy.rowCount() < 50_000
+    assert all(
+        proxy.index(r, 0).data(StateRole) == "running"
+        and proxy.index(r, JobTableModel.COL_NAME).data() == "skript_3.py"
+        for r in range(proxy.rowCount())
+    )
+    assert elapsed < 20
+
+
+def test_hidden_dashboard_stays_idle(qtbot):
+    dash = TaskDashboard()
+    qtbot.addWidget(dash)
+    model = dash.model
+    changed = []
+    model.dataChanged.connect(lambda *a: changed.append(a))
+
+    dispatcher.job_started.emit("idle-a", "a.py")
+    dispatcher.job_started.emit("idle-b", "b.py")
+    dispatcher.job_progress.emit("idle-a", 10, "…")
+    qtbot.wait(400)
+    assert not model._frame.isActive() and not changed       # versteckt: nichts
+    assert model.rowCount() == 0
+
+    dash.show()
+    qtbot.waitUntil(lambda: model.rowCount() == 2)
+    dispatcher.job_finished.emit("idle-a")
+    qtbot.waitUntil(lambda: model.index(0, JobTableModel.COL_STATUS).data() == "✅ Fertig")
+    runtime = model.index(0, JobTableModel.COL_RUNTIME).data()
+    dispatcher.job_finished.emit("idle-b")
+    qtbot.waitUntil(lambda: not model._frame.isActive(), timeout=2_000)  # nichts läuft → Ruhe
+    qtbot.wait(1_100)
+    assert model.index(0, JobTableModel.COL_RUNTIME).data() == runtime  # eingefroren
+
+
+def test_retention_and_history_paging(qtbot, tmp_path, monkeypatch):
+    history = LogIndex(tmp_path / "search.sqlite")
+    monkeypatch.setattr(job_model, "log_index", history)
+    now = time.time()
+    for i in range(30):                              # frühere Sitzungen
+        history.job_started(f"old{i}", "alt.py", now - 1000 + i)
+        history.job_ended(f"old{i}", "finished", 0, now - 999 + i)
+    history.flush()
+
+    model = JobTableModel()
+    model.set_retention(10)
+    for i in range(50):
+        dispatcher.job_started.emit(f"r{i}", "neu.py")
+    for i in range(45):
+        dispatcher.job_finished.emit(f"r{i}")
+    model.flush()
+
+    assert model.rowCount() <= 5 + 10 + 1            # aktive + Fenster (+ Puffer)
+    model.set_retention(10)
+    assert model.rowCount() == 15
+    ids = [model.index(r, 0).data() for r in range(model.rowCount())]
+    assert ids == [f"r{i}" for i in range(35, 50)]  # jüngste abgeschlossene bleiben
+    assert model.output("r0") is None and model.output("r49") is not None
+
+    assert model.load_archived(20) == 20
+    assert model.load_archived(20) == 10
+    assert model.load_archived(20) == 0
+    assert model.rowCount() == 45
+    assert model.index(0, 0).data() == "old0"       # älteste ganz oben
+    assert model.index(0, JobTableModel.COL_STATUS).data() == "✅ Fertig"
+    dispatcher.job_finished.emit("r49")              # Zeilennummern nach dem Einfügen
+    model.flush()
+    assert model.index(44, JobTableModel.COL_STATUS).data() == "✅ Fertig"
+
+    model.drop_archived()
+    assert model.rowCount() == 15
+    history.close()
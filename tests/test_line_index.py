@@ -0,0 +1,71 @@
+import time
+
+from core.line_index import LineIndex
+
+
+def test_index_in_chunks_tail_and_growth(tmp_path):
+    path = tmp_path / "job.log"
+    path.write_bytes(b"".join(b"zeile %d\n" % i for i in range(10_000)) + b"halb")
+
+    ix = LineIndex(path)
+    ix.refresh()
+    # Tail ohne Index (konstante Öffnungszeit)
+    assert ix.tail(2) == ["zeile 9999", "halb"]
+    while not ix.complete:
+        ix.index_more(4096)                  # Grenzen mitten in Zeilen
+    assert ix.line_count() == 10_001
+    assert ix.lines(5_000, 2) == ["zeile 5000", "zeile 5001"]
+
+    with path.open("ab") as f:               # Datei wächst → nur Neues indizieren
+        f.write(b"zeile\nneu\n")
+    assert ix.refresh()
+    ix.index_all()
+    assert ix.lines(10_000, 5) == ["halbzeile", "neu"]
+
+    path.write_bytes(b"frisch\n")            # neu angelegt (kleiner) → Reset
+    assert ix.refresh()
+    ix.index_all()
+    assert ix.lines(0, 5) == ["frisch"]
+    ix.close()
+
+
+def test_log_viewer_follows_tail(qtbot, tmp_path):
+    from ui.log_viewer import LogViewer
+
+    path = tmp_path / "job.log"
+    path.write_text("".join(f"z{i}\n" for i in range(50_000)), encoding="utf-8")
+    viewer = LogViewer()
+    qtbot.addWidget(viewer)
+    viewer.resize(400, 200)
+    viewer.show()
+
+    t0 = time.perf_counter()
+    viewer.open(path)
+    assert time.perf_counter() - t0 < 0.5
+    assert viewer.visible_lines()[-1] == "z49999"
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write("neu\n")
+    qtbot.waitUntil(lambda: viewer.visible_lines()[-1:] == ["neu"], timeout=3000)
+
+    viewer.verticalScrollBar().setValue(0)   # hochscrollen → kein Tail mehr
+    assert viewer.visible_lines()[0] == "z0"
+
+
+def test_goto_line_waits_for_background_indexer(qtbot, tmp_path):
+    from ui.log_viewer import LogViewer
+
+    path = tmp_path / "gross.log"
+    path.write_text("".join(f"z{i}\n" for i in range(400_000)), encoding="utf-8")
+    viewer = LogViewer()
+    qtbot.addWidget(viewer)
+    viewer.resize(400, 200)
+    viewer.show()
+    viewer.open(path)
+    assert not viewer._index.complete
+
+    viewer.goto_line(390_000)
+    # kein Nachindexieren im Aufruf – der Sprung wartet auf den Indexer
+    assert not viewer._index.complete and viewer._index.line_count() <= 390_000
+    qtbot.waitUntil(lambda: "z390000" in viewer.visible_lines(), timeout=10_000)
+    assert viewer._mark == 390_000
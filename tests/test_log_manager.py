@@ -0,0 +1,132 @@
+import os
+import time
+
+import pytest
+
+from core.line_index import LineIndex
+from core.log_manager import LogManager, LogPolicy, parse_log_name
+from core.log_search import LogIndex
+from core.storage import StorageError, validate_config
+
+
+def test_rotation_compression_retention(tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    mgr = LogManager()
+    monkeypatch.setattr(mgr, "maintain_soon", lambda: None)  # Wartung nur explizit
+    mgr.policy = LogPolicy(rotate_mb=0.001, keep_parts=3, compress_after_h=1,
+                           max_age_days=10, max_total_mb=1)
+
+    # ~1 KB pro Teil → mehrere Teile, Anfang + letzte 2 bleiben
+    with mgr.open_job_log("job1") as log:
+        positions = [log.write_line(f"zeile {i:04d} " + "x" * 40) for i in range(100)]
+        mgr.maintain(time.time() + 86_400)                   # aktiver Job bleibt unberührt
+        assert mgr.part_path("job1").exists()
+    last_part = positions[-1][0]
+    assert last_part >= 4
+    assert [parse_log_name(p.name)[1] for p in mgr.parts("job1")] == [0, last_part - 1, last_part]
+
+    # kalt → komprimiert; Viewer liest gestreamt
+    now = time.time()
+    for p in mgr.parts("job1"):
+        os.utime(p, (now - 7200, now - 7200))
+    (tmp_path / "alt.log").write_text("uralt\n", encoding="utf-8")
+    os.utime(tmp_path / "alt.log", (now - 20 * 86_400,) * 2)
+    removed = []
+    mgr.on_removed.append(removed.extend)
+    stats = mgr.maintain(now)
+    assert stats == {"compressed": 3, "removed": 1} and removed == ["alt"]
+    gz = mgr.find("job1", last_part)
+    assert gz.name.endswith(".log.gz")
+
+    ix = LineIndex(gz)
+    ix.refresh()
+    ix.index_all()
+    part, lineno = positions[-1]
+    assert ix.lines(lineno, 1) == [f"zeile 0099 " + "x" * 40]
+    ix.close()
+
+    # Suchindex trägt komprimierte Teile nach und kennt Teil + Zeile
+    idx = LogIndex(tmp_path / "search.sqlite")
+    idx.backfill(tmp_path)
+    idx.flush()
+    hit, = idx.search("0099")
+    assert (hit.job_id, hit.part, hit.lineno) == ("job1", part, lineno)
+    idx.forget(["job1"])
+    idx.flush()
+    assert idx.search("0099") == []
+    idx.close()
+
+
+def test_live_writer_of_other_process_is_left_alone(tmp_path, monkeypatch):
+    import subprocess
+    import sys
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    writer = subprocess.Popen(
+        [sys.executable, "-c",
+         "import sys, time\n"
+         "from core.log_manager import log_manager\n"
+         "log_manager.maintain_soon = lambda: None\n"
+         "with log_manager.open_job_log('fremd') as log:\n"
+         "    log.write_line('läuft noch'); log.flush()\n"
+         "    print('bereit', flush=True); sys.stdin.readline()\n"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        cwd=os.getcwd(), env={**os.environ, "PYTHONPATH": os.getcwd()},
+    )
+    try:
+        assert writer.stdout.readline().strip() == "bereit"
+        log = tmp_path / "fremd.log"
+        old = time.time() - 40 * 86_400
+        os.utime(log, (old, old))                            # still seit Wochen – läuft aber
+        mgr = LogManager()
+        mgr.policy = LogPolicy(compress_after_h=0, max_age_days=1, max_total_mb=0)
+        assert mgr.maintain() == {"compressed": 0, "removed": 0}
+        assert log.exists()
+    finally:
+        writer.communicate("\n", timeout=10)
+    os.utime(log, (old, old))
+    assert mgr.maintain() == {"compressed": 0, "removed": 1} and not log.exists()
+
+
+def test_rotation_forgets_dropped_parts_and_viewer_follows(qtbot, tmp_path, monkeypatch):
+    from ui.log_viewer import LogViewer
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    mgr = LogManager()
+    monkeypatch.setattr(mgr, "maintain_soon", lambda: None)
+    mgr.policy = LogPolicy(rotate_mb=0.0005, keep_parts=2)   # ~500 B pro Teil
+    idx = LogIndex(tmp_path / "search.sqlite")
+    mgr.on_part_removed.append(idx.forget_part)
+    idx.job_started("rot", "rot.py", time.time())
+
+    viewer = LogViewer()
+    qtbot.addWidget(viewer)
+    viewer.resize(400, 200)
+    viewer.show()
+    with mgr.open_job_log("rot") as log:
+        def write(text):
+            part, lineno = log.write_line(text)
+            idx.add_line("rot", lineno, text, part)
+            log.flush()
+        write("erste " + "a" * 100)
+        viewer.open(mgr.latest("rot"))
+        for i in range(12):
+            part = log.part
+            write(f"mitte{i:02d} " + "b" * 100)
+            if log.part != part:                                 # rotiert → Ansicht zieht mit
+                qtbot.waitUntil(lambda: viewer._index.path.name == f"rot.{log.part}.log",
+                                timeout=3000)
+        assert log.part >= 2
+        write("zuletzt")
+        qtbot.waitUntil(lambda: viewer.visible_lines()[-1:] == ["zuletzt"], timeout=3000)
+    idx.flush()
+    kept = {parse_log_name(p.name)[1] for p in mgr.parts("rot")}
+    hits = {h.part for h in idx.search("mitte*")}
+    assert hits and hits <= kept and kept != set(range(log.part + 1))
+    assert [h.part for h in idx.search("erste")] == [0]
+    idx.close()
+
+
+def test_keep_parts_counts_the_current_part():
+    cfg = {"theme": {"stylesheet": "", "background": ""}, "buttons": []}
+    validate_config({**cfg, "logs": {"keep_parts": 2}})      # Anfang + aktueller Teil
+    with pytest.raises(StorageError):
+        validate_config({**cfg, "logs": {"keep_parts": 1}})
@@ -0,0 +1,72 @@
+import time
+
+from core.log_search import LogIndex
+
+
+def test_index_search_filters_and_backfill(tmp_path):
+    idx = LogIndex(tmp_path / "search.sqlite")
+    now = time.time()
+    idx.job_started("a1", "export.py", now - 7200)
+    for n, text in enumerate(["start", "Verbindung fehlgeschlagen: timeout", "ende"]):
+        idx.add_line("a1", n, text)
+    idx.job_ended("a1", "error", 1, now - 7100)
+    idx.job_started("b2", "backup.py", now)
+    idx.add_line("b2", 0, "timeout erhöht")
+    idx.job_ended("b2", "finished", 0, now)
+
+    old = tmp_path / "logs"
+    old.mkdir()
+    (old / "c3.log").write_text("alt\nnoch ein timeout\n", encoding="utf-8")
+    idx.backfill(old)
+    idx.flush()
+
+    hits = idx.search("timeout")
+    assert {(h.job_id, h.lineno) for h in hits} == {("b2", 0), ("c3", 1), ("a1", 1)}
+    assert hits[-1].job_id == "a1"                 # neueste Jobs zuerst
+    assert [h.job_id for h in idx.search("verbindung timeout")] == ["a1"]
+    assert [h.job_id for h in idx.search("verb*")] == ["a1"]
+    assert [h.job_id for h in idx.search("timeout", states=("error",))] == ["a1"]
+    assert [h.job_id for h in idx.search("timeout", script="backup.py")] == ["b2"]
+    assert {h.job_id for h in idx.search("timeout", since=now - 3600)} == {"b2", "c3"}
+    assert idx.search('"; DROP') == []
+    assert idx.scripts() == ["backup.py", "export.py"]
+    idx.close()
+
+
+def test_history_keeps_resource_totals(tmp_path):
+    from core.resources import ResourceStats
+    idx = LogIndex(tmp_path / "search.sqlite")
+    now = time.time()
+    idx.job_started("r1", "rechnen.py", now - 5)
+    idx.job_ended("r1", "finished", 0, now,
+                  ResourceStats(cpu_s=3.14159, rss=0, peak_rss=2048, read_bytes=10, write_bytes=20))
+    idx.job_started("r2", "ohne.py", now - 10)
+    idx.job_ended("r2", "error", 1, now - 9)
+    idx.flush()
+    got = {r.job_id: r.stats for r in idx.history()}
+    assert got["r1"] == ResourceStats(cpu_s=3.14, peak_rss=2048, read_bytes=10, write_bytes=20)
+    assert got["r2"] is None
+    idx.close()
+
+
+def test_dialog_searches_in_background(qtbot, tmp_path, monkeypatch):
+    from ui import log_search_dialog
+    from ui.log_search_dialog import LogSearchDialog
+    idx = LogIndex(tmp_path / "search.sqlite")
+    idx.job_started("s1", "suche.py", time.time())
+    idx.add_line("s1", 7, "Fehler beim Export")
+    idx.job_ended("s1", "error", 2, time.time())
+    idx.flush()
+    monkeypatch.setattr(log_search_dialog, "log_index", idx)
+    monkeypatch.setattr(idx, "backfill", lambda *a: None)
+
+    dlg = LogSearchDialog()
+    qtbot.addWidget(dlg)
+    dlg.show()
+    qtbot.waitUntil(lambda: dlg.script_combo.count() == 2)
+    dlg.query_edit.setText("export")
+    dlg.search()
+    assert dlg.busy
+    qtbot.waitUntil(lambda: not dlg.busy)
+    assert dlg.results.rowCount() == 1 and dlg.results.item(0, 3).text() == "8"
+    idx.close()
@@ -0,0 +1,89 @@
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication, QEvent
+
+from benchmarks.synthetic import make_config
+from core import runner
+from core.job import Job
+from core.memory_diag import MemoryTracker, diff
+from ui.diagnostics_dialog import DiagnosticsDialog, dispatcher_counts, widget_counts
+from ui.master_window import MasterWindow
+from ui.task_dashboard import TaskDashboard
+
+JOBS_PER_CYCLE = 5
+
+
+def _fake_run(self, emit) -> None:
+    emit("job_started", self.job_id, self.script_path.name)
+    emit("job_progress", self.job_id, 50, "halb")
+    emit("job_finished", self.job_id)
+
+
+def _settle() -> None:
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    QCoreApplication.processEvents()
+
+
+def _cycle(i: int, mw: MasterWindow, dash: TaskDashboard) -> None:
+    # Bearbeiten: Button anlegen, Seiten neu bauen, wieder entfernen
+    mw.cfg["buttons"].append({"id": f"neu-{i}", "action": "SCRIPT", "payload": "x.py",
+                              "parent": None})
+    mw._rebuild_pages()
+    mw.cfg["buttons"].pop()
+    mw._rebuild_pages()
+    # Navigieren
+    for b in [b for b in mw.cfg["buttons"] if b["action"] == "MENU" and b["parent"] is None][:3]:
+        mw._on_click(b)
+        mw._on_next_clicked()
+        mw._go_back()
+    mw._go_home()
+    # Jobs
+    for j in range(JOBS_PER_CYCLE):
+        runner.ScriptRunner(f"soak-{i}-{j}", Path("dummy.py")).run()
+    dash.model.flush()
+    _settle()
+
+
+def test_session_memory_stays_bounded(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(Job, "run", _fake_run)
+    cfg = make_config(200, depth=3, fanout=4)
+    cfg["dashboard"] = {"keep_finished": 20}
+    mw = MasterWindow(cfg, tmp_path / "config.json")
+    qtbot.addWidget(mw)
+    dash = mw.dashboard
+    dash.show()
+
+    tracker = MemoryTracker(trace=True, log_path=tmp_path / "memory.log")
+    tracker.add_probe("Widgets", widget_counts)
+    tracker.add_probe("Dispatcher", dispatcher_counts)
+    try:
+        for i in range(10):                       # Warmup: Caches, Retention greift
+            _cycle(i, mw, dash)
+        base = tracker.set_baseline()
+        for i in range(10, 60):
+            _cycle(i, mw, dash)
+        end = tracker.take("Ende")
+    finally:
+        tracker.stop_tracing()
+
+    result = diff(base, end)
+    report = result.format()
+    assert result.growth("Widgets") <= 0, report
+    assert end.probes["Dispatcher"] == {"Abos": 0, "Jobs": 0}, report
+    assert dash.model.rowCount() <= 22 + JOBS_PER_CYCLE, report
+    assert end.object_total - base.object_total < 2_000, report
+    assert end.traced_bytes - base.traced_bytes < 512 * 1024, report
+    assert len(tracker.history()) == 2
+    assert "Ende" in (tmp_path / "memory.log").read_text(encoding="utf-8")
+
+
+def test_diagnostics_memory_tab(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    dlg = DiagnosticsDialog()
+    qtbot.addWidget(dlg)
+    tab = dlg.memory_tab
+    tab._snapshot()
+    tab._snapshot()
+    assert tab.table.rowCount() >= 2
+    assert "Python-Objekte" in tab.details.toPlainText()
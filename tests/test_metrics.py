@@ -0,0 +1,89 @@
+import urllib.request
+
+from core.metrics import Histogram, JobMetrics, Registry, JOB_DURATION, JOBS_ENDED
+
+
+def test_histogram_quantiles_and_text_format():
+    reg = Registry()
+    hist = reg.histogram("t_latency_seconds", "Test", ("script",), buckets=(0.1, 1, 10))
+    for _ in range(90):
+        hist.observe(0.05, ("a.py",))
+    for _ in range(10):
+        hist.observe(5, ("a.py",))
+    count = reg.counter("t_total", "Zähler", ("state",))
+    count.inc(labels=("error",))
+    count.inc(2, labels=("error",))
+
+    assert hist.quantile(0.5, ("a.py",)) <= 0.1
+    assert 1 < hist.quantile(0.99, ("a.py",)) <= 5
+    assert hist.quantile(0.5, ("b.py",)) is None
+
+    text = reg.render()
+    assert '# TYPE t_latency_seconds histogram' in text
+    assert 't_latency_seconds_bucket{script="a.py",le="0.1"} 90' in text
+    assert 't_latency_seconds_bucket{script="a.py",le="+Inf"} 100' in text
+    assert 't_latency_seconds_count{script="a.py"} 100' in text
+    assert 't_total{state="error"} 3' in text
+
+
+def test_job_metrics_and_endpoint():
+    jm = JobMetrics()
+    jm.on_started("j1", "metrik_test.py")
+    jm.on_output(1)
+    jm.on_ended("j1", "error")
+    jm.on_ended("j1", "error")                       # doppelt → ignoriert
+    assert JOB_DURATION.count(("metrik_test.py",)) == 1
+    assert jm.failed.per_minute() == 1 and jm.lines.per_minute() == 1
+
+    reg = Registry()
+    reg.counter("t_up", "Test").inc()
+    port = reg.serve(0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+            assert "t_up 1" in resp.read().decode()
+    finally:
+        reg.shutdown()
+    assert JOBS_ENDED.value(("error",)) >= 1
+
+
+def test_queue_depth_and_output_lines(qtbot, tmp_path, monkeypatch):
+    import threading
+
+    from PySide6.QtCore import QRunnable, QThreadPool
+
+    from core.dispatcher import dispatcher
+    from core.metrics import OUTPUT_LINES, QUEUE_DEPTH
+    from core.runner import ScriptRunner
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path / "logs"))
+    script = tmp_path / "drei.py"
+    script.write_text("for i in range(3):\n    print('zeile', i)\n", encoding="utf-8")
+
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    gate = threading.Event()
+
+    class Blocker(QRunnable):
+        def run(self):
+            gate.wait(10)
+
+    base_depth, base_lines = QUEUE_DEPTH.value(), OUTPUT_LINES.value()
+    pool.start(Blocker())
+    waiting, dropped = ScriptRunner("q-run", script), ScriptRunner("q-drop", script)
+    assert QUEUE_DEPTH.value() == base_depth                 # erzeugt ≠ eingereiht
+    waiting.enqueue(pool)
+    dropped.enqueue(pool)
+    assert QUEUE_DEPTH.value() == base_depth + 2
+
+    aborted = []
+    dispatcher.job_aborted.connect(aborted.append)
+    try:
+        dropped.abort()                                      # wartet noch → verworfen
+        assert QUEUE_DEPTH.value() == base_depth + 1
+        assert aborted == ["q-drop"] and "q-drop" not in dispatcher.jobs
+        gate.set()
+        assert pool.waitForDone(10_000)
+    finally:
+        dispatcher.job_aborted.disconnect(aborted.append)
+    assert QUEUE_DEPTH.value() == base_depth
+    assert waiting.job.succeeded
+    assert OUTPUT_LINES.value() == base_lines + 3            # ohne „Starte Skript …“/„✅ Fertig“
@@ -0,0 +1,35 @@
+from core.dispatcher import dispatcher
+from core.output_buffer import OutputBuffer
+from ui.task_dashboard import TaskDashboard
+
+
+def test_ring_buffer_is_bounded():
+    buf = OutputBuffer(max_lines=100, max_samples=10)
+    for i in range(100_000):
+        buf.append(f"zeile {i}")
+        buf.add_sample(i * 100 // 100_000)
+    assert buf.line_count() == 100 and buf.dropped == 99_900
+    assert buf.tail(2) == ["zeile 99998", "zeile 99999"]
+    assert buf.lines(0, 1) == ["zeile 99900"]
+    assert len(buf.samples()) == 10
+    assert buf.eta() is not None
+
+
+def test_dashboard_switches_from_memory(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))     # keine Log-Dateien vorhanden
+    dash = TaskDashboard()
+    qtbot.addWidget(dash)
+    dash.show()
+    for jid in ("r1", "r2"):
+        dispatcher.job_started.emit(jid, f"{jid}.py")
+        for i in range(5):
+            dispatcher.job_progress.emit(jid, i * 10, f"{jid} zeile {i}")
+    dash.model.flush()
+
+    dash.table.selectRow(0)
+    assert dash.log_view.visible_lines()[-1] == "r1 zeile 4"
+    dash.table.selectRow(1)
+    assert dash.log_view.visible_lines()[-1] == "r2 zeile 4"
+    dispatcher.job_progress.emit("r2", 60, "r2 neu")
+    qtbot.waitUntil(lambda: dash.log_view.visible_lines()[-1] == "r2 neu", timeout=2000)
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,56 @@
+from core.progress_protocol import PREFIX, ProgressInfo, encode, parse_message
+from core.job import Job
+
+
+def test_roundtrip():
+    info = ProgressInfo(stage="Import", done=42, total=100, unit="Dateien",
+                        metrics={"errors": 1})
+    parsed = parse_message(encode(info))
+    assert parsed == info
+    assert parsed.effective_percent() == 42
+
+
+def test_plain_lines_are_not_messages():
+    assert parse_message("Verarbeite Datei X 42%") is None
+    assert parse_message(PREFIX + "{kaputt") is None
+    assert parse_message(PREFIX + "[1, 2]") is None
+
+
+def test_bad_types_are_dropped():
+    info = parse_message(PREFIX + '{"percent": "viel", "total": "10", "stage": 3}')
+    assert info.percent is None
+    assert info.total == 10
+    assert info.stage == "3"
+
+
+def test_fallback_percent_regex():
+    assert Job._extract_percent("Verarbeitung abgeschlossen: 100%") == 100
+    assert Job._extract_percent("[42%] Datei X") == 42
+    assert Job._extract_percent("keine Angabe") is None
+
+
+def test_non_finite_numbers_are_dropped():
+    for raw in ('{"percent": NaN}', '{"percent": 1e999}', '{"percent": -Infinity}',
+                '{"percent": "inf", "rate": NaN, "done": 1e999, "total": Infinity}'):
+        info = parse_message(PREFIX + raw)
+        assert info.percent is None and info.rate is None, raw
+        assert info.done is None and info.total is None, raw
+        assert info.effective_percent() is None
+        info.describe()
+    assert parse_message(PREFIX + '{"done": %d, "total": 3}' % 10 ** 400).effective_percent() is None
+
+
+def test_bad_progress_line_does_not_abort_job(tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path / "logs"))
+    script = tmp_path / "bad.py"
+    script.write_text(
+        f"print({PREFIX!r} + '{{\"percent\": NaN}}')\n"
+        f"print({PREFIX!r} + '{{\"percent\": 1e999}}')\n"
+        f"print({PREFIX!r} + '{{\"percent\": 50}}')\n",
+        encoding="utf-8",
+    )
+    events = []
+    Job("nan-job", script).run(lambda *a: events.append(a))
+    names = [e[0] for e in events]
+    assert "job_finished" in names and "job_error" not in names
+    assert ("job_progress", "nan-job", 50) in [e[:3] for e in events]
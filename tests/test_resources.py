@@ -0,0 +1,27 @@
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from core import resources
+from core.resources import ResourceSampler
+
+
+@pytest.mark.skipif(not resources.PROC_AVAILABLE, reason="braucht /proc")
+def test_untrack_races_sampler_without_late_samples():
+    sampler = ResourceSampler(interval=0.0)
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        for i in range(30):
+            late = []
+            ended = threading.Event()
+            sampler.track(f"j{i}", proc.pid, lambda s: ended.is_set() and late.append(s))
+            final = sampler.untrack(f"j{i}")
+            ended.set()
+            assert final is not None and final.peak_rss > 0 and final.procs == 0
+            assert sampler.snapshot(f"j{i}") is None
+            assert late == []
+    finally:
+        proc.kill()
+        proc.wait()
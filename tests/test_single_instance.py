@@ -0,0 +1,74 @@
+import threading
+
+from PySide6.QtWidgets import QMessageBox
+
+from core import instance_server, single_instance
+from core.instance_server import InstanceServer
+from ui.master_window import MasterWindow
+
+
+def _isolate(monkeypatch, tmp_path) -> None:
+    addr = str(tmp_path / "ui.sock")
+    for mod in (single_instance, instance_server):
+        monkeypatch.setattr(mod, "server_address", lambda: addr)
+        monkeypatch.setattr(mod, "lock_path", lambda: tmp_path / "instance.lock")
+
+
+def test_second_start_is_forwarded(qtbot, tmp_path, monkeypatch):
+    _isolate(monkeypatch, tmp_path)
+    monkeypatch.delenv(single_instance.ENV_FLAG, raising=False)
+    assert not single_instance.forward_if_running([])      # noch niemand da
+
+    first = InstanceServer()
+    assert first.claim() and first.listen()
+    try:
+        assert not InstanceServer().claim()                  # Lock ist vergeben
+        got, result = [], []
+        first.request.connect(got.append)
+        t = threading.Thread(target=lambda: result.append(
+            single_instance.forward_if_running(["--run", "Backup"])))
+        t.start()
+        qtbot.waitUntil(lambda: bool(got and result), timeout=3000)
+        t.join()
+    finally:
+        first.close()
+    assert result == [True]
+    assert got == [["--run", "Backup"]]
+
+
+def test_arguments():
+    assert single_instance.run_targets(["--run", "A", "--run=Tools/B", "--run"]) == ["A", "Tools/B"]
+    assert single_instance.enabled(["--run", "A"])
+    assert not single_instance.enabled(["--new-instance"])
+    assert not single_instance.enabled(["--startup-report=quit"])
+
+
+def test_window_handles_request(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    cfg = {"theme": {}, "buttons": [
+        {"id": "Tools", "action": "MENU", "payload": "", "parent": None},
+        {"id": "Backup", "action": "MENU", "payload": "", "parent": "Tools"},
+        {"id": "Nightly", "action": "LINK", "payload": "about:blank", "parent": "Backup"},
+    ]}
+    mw = MasterWindow(cfg, tmp_path / "config.json")
+    qtbot.addWidget(mw)
+    mw.handle_instance_request(["--run", "Tools/Backup", "--run", "gibt-es-nicht"])
+    assert mw.isVisible()
+    assert mw.nav_stack == [None, "Backup"]
+    box = mw.findChild(QMessageBox)
+    assert box is not None and box.isVisible() and "gibt-es-nicht" in box.text()
+
+
+def test_failed_listen_releases_lock(tmp_path, monkeypatch):
+    _isolate(monkeypatch, tmp_path)
+    bad = str(tmp_path / "fehlt" / "ui.sock")                # Verzeichnis existiert nicht
+    monkeypatch.setattr(instance_server, "server_address", lambda: bad)
+    first = InstanceServer()
+    assert first.claim()
+    assert not first.listen() and first.error
+    second = InstanceServer()
+    try:
+        assert second.claim()                                # kein Warten auf eine tote Instanz
+    finally:
+        second.close()
+        first.close()
@@ -0,0 +1,38 @@
+import time
+
+from core.stall_watchdog import ENV_FLAG, StallWatchdog, settings
+
+
+def _langsamer_slot() -> None:
+    time.sleep(0.4)
+
+
+def test_stall_captures_blocking_frame(tmp_path):
+    wd = StallWatchdog(0.1, log_path=tmp_path / "stalls.log")
+    seen = []
+    wd.on_stall.append(seen.append)
+    wd.start()
+    try:
+        for _ in range(5):                           # ruhiger Betrieb → kein Hänger
+            wd.beat()
+            time.sleep(0.02)
+        _langsamer_slot()
+        wd.beat()
+    finally:
+        wd.stop()
+
+    assert len(wd.stalls()) == 1 and seen == wd.stalls()
+    stall = wd.stalls()[0]
+    assert stall.duration >= 0.35
+    assert "_langsamer_slot" in stall.culprit or "_langsamer_slot" in " ".join(stall.frames)
+    assert "_langsamer_slot" in (tmp_path / "stalls.log").read_text(encoding="utf-8")
+
+
+def test_settings_from_env_and_config(monkeypatch):
+    monkeypatch.delenv(ENV_FLAG, raising=False)
+    assert settings(None) is None
+    assert settings({"stall_watchdog": True, "stall_ms": 500}) == 0.5
+    monkeypatch.setenv(ENV_FLAG, "1")
+    assert settings(None) == 0.25
+    monkeypatch.setenv(ENV_FLAG, "0")
+    assert settings({"stall_watchdog": True}) is None
@@ -0,0 +1,41 @@
+import sys
+
+from core.dispatcher import dispatcher
+from core.startup import StartupReport
+from ui.master_window import MasterWindow
+
+
+def test_dashboard_built_on_first_job(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path))
+    mw = MasterWindow({"buttons": [], "theme": {}, "dashboard": {"keep_finished": 5}},
+                      tmp_path / "config.json")
+    qtbot.addWidget(mw)
+    assert mw._dashboard is None
+
+    dispatcher.job_started.emit("lazy-1", "a.py")
+    dispatcher.job_finished.emit("lazy-1")
+    model = mw._dashboard.model
+    model.flush()
+    assert model.rowCount() == 1 and model.row_of("lazy-1") == 0
+    assert model._keep == 5
+
+
+def test_import_timing_and_phases(tmp_path, monkeypatch):
+    (tmp_path / "mgui_startup_probe.py").write_text("import json\nX = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    report = StartupReport()
+    report.enable_import_timing()
+    try:
+        import mgui_startup_probe  # noqa: F401
+    finally:
+        report.disable_import_timing()
+        sys.modules.pop("mgui_startup_probe", None)
+    report.mark("fertig")
+
+    assert [i.name for i in report.imports] == ["mgui_startup_probe"]
+    assert report.phases[0][0] == "fertig"
+    text = report.format()
+    assert "mgui_startup_probe" in text and "fertig" in text
+    assert StartupReport.requested(["main.py", "--startup-report=quit"])
+    assert StartupReport.quit_after(["main.py", "--startup-report=quit"])
+    assert not StartupReport.requested(["main.py"])
@@ -0,0 +1,149 @@
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from core import supervisor as sup
+from core.job import Job
+from core.models import JobLimits
+from core.resources import PROC_AVAILABLE, start_time
+from core.supervisor import Supervisor, popen_kwargs
+
+posix_only = pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX-Signale")
+
+
+def _script(tmp_path, name, body):
+    path = tmp_path / name
+    path.write_text(textwrap.dedent(body), encoding="utf-8")
+    return path
+
+
+def _run(job):
+    events = []
+    job.run(lambda name, *args: events.append((name, *args)))
+    return [e for e in events if e[0] in ("job_finished", "job_error", "job_aborted")]
+
+
+def _alive(pid):
+    """Läuft noch (Zombies zählen nicht – die räumt init ab)."""
+    try:
+        state = open(f"/proc/{pid}/stat", "rb").read().rsplit(b")", 1)[1].split()[0]
+    except OSError:
+        return False
+    return state != b"Z"
+
+
+def test_timeout_and_stall_end_the_job(tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setattr(sup.supervisor, "grace", 0.5)
+    slow = _script(tmp_path, "langsam.py", """
+        import time
+        while True:
+            print("läuft", flush=True)
+            time.sleep(0.05)
+    """)
+    t0 = time.monotonic()
+    ended = _run(Job("t-timeout", slow, JobLimits(timeout_s=0.5)))
+    assert ended == [("job_error", "t-timeout", "Zeitlimit von 0.5s überschritten")]
+    assert time.monotonic() - t0 < 5
+
+    quiet = _script(tmp_path, "still.py", """
+        import time
+        print("eine Zeile", flush=True)
+        time.sleep(30)
+    """)
+    t0 = time.monotonic()
+    ended = _run(Job("t-stall", quiet, JobLimits(stall_s=0.5)))
+    assert ended == [("job_error", "t-stall", "Keine Ausgabe seit 0.5s")]
+    assert time.monotonic() - t0 < 5
+
+
+@posix_only
+@pytest.mark.skipif(not PROC_AVAILABLE, reason="Nachkommen findet nur /proc")
+def test_tree_kill_reaches_detached_grandchild(tmp_path):
+    pid_file = tmp_path / "enkel.pid"
+    parent = _script(tmp_path, "eltern.py", f"""
+        import signal, subprocess, sys, time
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        child = subprocess.Popen(
+            [sys.executable, "-c",
+             "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(60)"],
+            start_new_session=True,                   # eigene Session → nicht in unserer Gruppe
+        )
+        open({str(pid_file)!r}, "w").write(str(child.pid))
+        time.sleep(60)
+    """)
+    proc = subprocess.Popen([sys.executable, str(parent)], **popen_kwargs())
+    deadline = time.monotonic() + 5
+    while not pid_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    time.sleep(0.1)
+    grandchild = int(pid_file.read_text())
+    expired = []
+    Supervisor(grace=0.3).watch("tree", proc, JobLimits(timeout_s=0.2), expired.append)
+
+    assert proc.wait(timeout=5) == -signal.SIGKILL            # ignoriert SIGTERM → SIGKILL
+    assert expired and "Zeitlimit" in expired[0]
+    deadline = time.monotonic() + 3
+    while _alive(grandchild) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _alive(grandchild)
+
+
+@posix_only
+@pytest.mark.skipif(not PROC_AVAILABLE, reason="braucht /proc")
+def test_reaped_job_does_not_signal_reused_pids():
+    bystander = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    done = subprocess.Popen([sys.executable, "-c", "pass"], **popen_kwargs())
+    done.wait()
+    try:
+        watchdog = Supervisor(grace=0.0)
+        w = watchdog.watch("alt", done, JobLimits(), lambda _r: None)
+        # PID gemerkt, aber mit anderer Startzeit → gilt als neu vergeben
+        w.known_pids = {bystander.pid: start_time(bystander.pid) - 1}
+        w.kill_at = 0.0
+        watchdog._kill(w)
+        time.sleep(0.1)
+        assert bystander.poll() is None
+    finally:
+        bystander.kill()
+        bystander.wait()
+
+
+@posix_only
+def test_rlimits_apply_without_preexec_fn(tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path / "logs"))
+    script = _script(tmp_path, "limits.py", """
+        import resource
+        print("nofile", resource.getrlimit(resource.RLIMIT_NOFILE)[0])
+    """)
+    job = Job("t-limits", script, JobLimits(open_files=64))
+    assert _run(job) == [("job_finished", "t-limits")]
+    assert "nofile 64" in job.output.lines(0, job.output.line_count())
+    assert "preexec_fn" not in popen_kwargs()
+
+
+@posix_only
+def test_orphaned_grandchild_in_group_is_killed(tmp_path, monkeypatch):
+    monkeypatch.setenv("MGUI_LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setattr(sup.supervisor, "grace", 0.5)
+    pid_file = tmp_path / "enkel.pid"
+    script = _script(tmp_path, "waise.py", f"""
+        import subprocess, sys
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        open({str(pid_file)!r}, "w").write(str(child.pid))
+        print("Eltern fertig", flush=True)             # Enkel erbt stdout und bleibt in der Gruppe
+    """)
+    t0 = time.monotonic()
+    ended = _run(Job("t-waise", script, JobLimits(timeout_s=1)))
+    assert time.monotonic() - t0 < 6
+    assert ended == [("job_error", "t-waise", "Zeitlimit von 1s überschritten")]
+    grandchild = int(pid_file.read_text())
+    if PROC_AVAILABLE:
+        deadline = time.monotonic() + 3
+        while _alive(grandchild) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not _alive(grandchild)
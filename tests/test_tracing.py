@@ -0,0 +1,32 @@
+import json
+import threading
+
+from core import tracing
+
+
+def test_spans_written_as_chrome_trace(tmp_path):
+    assert tracing.span("aus") is tracing.span("auch aus")     # Null-Objekt ohne Allokation
+
+    @tracing.traced("dekoriert")
+    def work(x):
+        return x * 2
+
+    tracing.enable(tmp_path / "trace.json")
+    try:
+        with tracing.span("aussen", cat="ui", seite=1):
+            assert work(21) == 42
+        t = threading.Thread(target=lambda: tracing.span("worker").__enter__().__exit__(), name="pool-1")
+        t.start()
+        t.join()
+    finally:
+        tracing.disable()
+    assert work(1) == 2                              # aus: nichts mehr aufgezeichnet
+
+    data = json.loads(tracing.write().read_text(encoding="utf-8"))
+    spans = {e["name"]: e for e in data["traceEvents"] if e["ph"] == "X"}
+    assert set(spans) >= {"aussen", "dekoriert", "worker"}
+    assert spans["aussen"]["args"] == {"seite": 1}
+    assert spans["aussen"]["dur"] >= spans["dekoriert"]["dur"]
+    assert spans["worker"]["tid"] != spans["aussen"]["tid"]
+    names = {e["args"]["name"] for e in data["traceEvents"] if e["ph"] == "M"}
+    assert "pool-1" in names
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+ui.batch_edit_dialog
+====================
+Sammel-Bearbeitung: Icon, Aktion, Parent und Beschreibung für **mehrere**
+Buttons auf einmal. Nur angehakte Felder werden geändert; gespeichert wird
+einmal über core.button_batch (alles oder nichts).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from PySide6.QtWidgets import (
+    QCheckBox, QComboBox, QDialog, QDialogButtonBox, QFileDialog, QFormLayout,
+    QHBoxLayout, QLabel, QLineEdit, QMessageBox, QPushButton, QVBoxLayout
+)
+
+from core.button_batch import ButtonBatch, BatchError
+from core.storage import StorageError
+from util.paths import to_relative
+
+ROOT_LABEL = "(Startebene)"
+
+
+class BatchEditDialog(QDialog):
+    def __init__(self, cfg: dict, cfg_path: Path, ids: List[str], parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"{len(ids)} Buttons bearbeiten")
+        self.setModal(True)
+        self._cfg = cfg
+        self._cfg_path = cfg_path
+        self._ids = ids
+        self.batch: ButtonBatch | None = None       # nach erfolgreichem Speichern
+
+        # ---------------------------------------------------------------- Felder
+        self.icon_chk = QCheckBox("Icon:")
+        self.icon_edit = QLineEdit("assets/icons/placeholder.png")
+        icon_btn = QPushButton("…")
+        icon_btn.clicked.connect(self._browse_icon)
+
+        self.action_chk = QCheckBox("Aktion:")
+        self.action_cmb = QComboBox()
+        self.action_cmb.addItems(["SCRIPT", "LINK", "FILE", "FOLDER", "MENU"])
+
+        self.parent_chk = QCheckBox("Verschieben nach:")
+        self.parent_cmb = QComboBox()
+        self.parent_cmb.addItem(ROOT_LABEL, None)
+        selected = set(ids)
+        for b in cfg["buttons"]:
+            if b["action"] == "MENU" and b["id"] not in selected:
+                self.parent_cmb.addItem(b["id"], b["id"])
+
+        self.desc_chk = QCheckBox("Beschreibung:")
+        self.desc_edit = QLineEdit()
+
+        # Editor erst aktiv, wenn das Feld angehakt ist
+        for chk, widgets in (
+            (self.icon_chk, (self.icon_edit, icon_btn)),
+            (self.action_chk, (self.action_cmb,)),
+            (self.parent_chk, (self.parent_cmb,)),
+            (self.desc_chk, (self.desc_edit,)),
+        ):
+            for w in widgets:
+                w.setEnabled(False)
+                chk.toggled.connect(w.setEnabled)
+
+        # ---------------------------------------------------------------- Layout
+        lay = QFormLayout()
+        icon_lay = QHBoxLayout()
+        icon_lay.addWidget(self.icon_edit, 1)
+        icon_lay.addWidget(icon_btn)
+        lay.addRow(self.icon_chk, icon_lay)
+        lay.addRow(self.action_chk, self.action_cmb)
+        lay.addRow(self.parent_chk, self.parent_cmb)
+        lay.addRow(self.desc_chk, self.desc_edit)
+
+        info = QLabel(", ".join(ids[:10]) + (f" … (+{len(ids) - 10})" if len(ids) > 10 else ""))
+        info.setStyleSheet("color: grey;")
+        info.setWordWrap(True)
+
+        btn_box = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
+        btn_box.accepted.connect(self._on_save)
+        btn_box.rejected.connect(self.reject)
+
+        vbox = QVBoxLayout(self)
+        vbox.addWidget(info)
+        vbox.addLayout(lay)
+        vbox.addWidget(btn_box)
+
+    # -------------------------------------------------------------------------
+    def changes(self) -> dict:
+        out: dict = {}
+        if self.icon_chk.isChecked():
+            out["icon"] = self.icon_edit.text()
+        if self.action_chk.isChecked():
+            out["action"] = self.action_cmb.currentText()
+        if self.parent_chk.isChecked():
+            out["parent"] = self.parent_cmb.currentData()
+        if self.desc_chk.isChecked():
+            out["description"] = self.desc_edit.text()
+        return out
+
+    # -------------------------------------------------------------------------
+    def _browse_icon(self):
+        fn, _ = QFileDialog.getOpenFileName(self, "Icon wählen", "assets/icons", "Bilder (*.png *.svg *.ico)")
+        if fn:
+            self.icon_edit.setText(to_relative(fn))
+
+    def _on_save(self):
+        changes = self.changes()
+        if not changes:
+            self.reject()
+            return
+        batch = ButtonBatch(self._cfg)
+        batch.edit(self._ids, **changes)
+        try:
+            batch.commit(self._cfg_path)
+        except BatchError as exc:
+            QMessageBox.warning(self, "Nicht möglich", str(exc))
+            return
+        except StorageError as exc:
+            QMessageBox.critical(self, "Fehler", str(exc))
+            return
+        self.batch = batch
+        self.accept()
@@ -140,6 +140,11 @@ class ButtonEditorDialog(QDialog):
         # MENU-Buttons haben kein Payload
         if btn_dict["action"] == "MENU":
             btn_dict["payload"] = ""
+        # Felder ohne Formular-Eingabe (z. B. "limits") beim Bearbeiten erhalten
+        if self._edit_mode:
+            orig = next((x for x in self._config["buttons"] if x["id"] == self._orig_id), {})
+            for key, val in orig.items():
+                btn_dict.setdefault(key, val)
 
         try:
             if self._edit_mode:
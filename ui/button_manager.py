@@ -2,37 +2,48 @@
 """
 ui.button_manager
 =================
-Zentrales Fenster mit einem QTreeWidget, in dem alle Buttons
-hierarchisch angezeigt und via Kontext-Buttons bearbeitet werden.
+Zentrales Fenster mit einem Baum (QTreeView + ui.button_tree_model), in
+dem alle Buttons hierarchisch angezeigt und via Kontext-Buttons bearbeitet
+werden. Kinder werden erst beim Aufklappen geladen; nach Änderungen meldet
+das Model nur die betroffenen Zeilen – Auswahl und Aufklapp-Zustand bleiben.
+
+Import (CSV/JSON), Ordner-Scan, Sammel-Bearbeitung und Löschen mehrerer
+Buttons laufen über core.button_batch: eine Prüfung, ein Speichern, ein
+Baum-Abgleich.
+
+Mit ``health`` (ui.health_monitor) bekommen defekte Buttons ein
+Warn-Symbol; nach jeder Änderung wird im Hintergrund neu geprüft.
 """
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import List
 
 from PySide6.QtCore    import Qt
 from PySide6.QtGui     import QAction
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QDialog,
-    QListWidgetItem,
+    QFileDialog,
     QMessageBox,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
     QHBoxLayout
 )
 
-from core import storage
+from core.button_batch import BatchError, ButtonBatch, read_import
+from core.storage import StorageError
 
+from .batch_edit_dialog import BatchEditDialog
 from .button_editor    import ButtonEditorDialog
+from .button_tree_model import ButtonIdRole, ButtonTreeModel
 from .position_dialog  import PositionDialog, SlotWidget, GRID_ROWS, GRID_COLS
 from PySide6.QtWidgets import QFrame, QGridLayout, QLabel
 
 class ButtonManager(QDialog):
-    def __init__(self, cfg: dict, cfg_path: Path, parent=None):
+    def __init__(self, cfg: dict, cfg_path: Path, parent=None, health=None):
         super().__init__(parent)
         self.setWindowTitle("Button-Manager")
         self.resize(500, 600)
@@ -40,21 +51,32 @@ class ButtonManager(QDialog):
         self._cfg_path = cfg_path
 
         # ------------------------------ Tree
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Name / ID"])
+        self.model = ButtonTreeModel(cfg, self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setUniformRowHeights(True)     # kein Messen pro Zeile
         self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.tree.itemDoubleClicked.connect(self._on_edit)
-        self._reload_tree()
+        self.tree.doubleClicked.connect(self._on_edit)
+        self._health = health
+        if health is not None:
+            self.model.set_issue_source(health.issues)
+            health.updated.connect(self.model.refresh_issues)
 
         # ------------------------------ Buttons
         btn_new      = QPushButton("Neu")
         btn_edit     = QPushButton("Bearbeiten")
         btn_delete   = QPushButton("Löschen")
         btn_position = QPushButton("Verschieben")
+        btn_import   = QPushButton("Importieren …")
+        btn_batch    = QPushButton("Sammel-Bearbeitung …")
+        btn_discover = QPushButton("Ordner scannen …")
         btn_new.clicked.connect(self._on_new)
         btn_edit.clicked.connect(self._on_edit)
         btn_delete.clicked.connect(self._on_delete)
         btn_position.clicked.connect(self._on_position)
+        btn_import.clicked.connect(self._on_import)
+        btn_batch.clicked.connect(self._on_batch_edit)
+        btn_discover.clicked.connect(self._on_discover)
 
         hbox = QHBoxLayout()
         hbox.addWidget(btn_new)
@@ -62,33 +84,28 @@ class ButtonManager(QDialog):
         hbox.addWidget(btn_delete)
         hbox.addWidget(btn_position)
 
+        hbox_bulk = QHBoxLayout()
+        hbox_bulk.addWidget(btn_import)
+        hbox_bulk.addWidget(btn_batch)
+        hbox_bulk.addWidget(btn_discover)
+
         vbox = QVBoxLayout(self)
         vbox.addWidget(self.tree)
         vbox.addLayout(hbox)
+        vbox.addLayout(hbox_bulk)
         
     # -------------------------------------------------------------------------
     def _reload_tree(self):
-        self.tree.clear()
-        roots: List[dict] = [b for b in self._cfg["buttons"] if b["parent"] is None]
-        for b in roots:
-            self._add_item_recursive(None, b)
-
-    def _add_item_recursive(self, parent_item: Optional[QTreeWidgetItem], cfg_btn: dict):
-        item = QTreeWidgetItem([cfg_btn["id"]])
-        item.setData(0, Qt.UserRole, cfg_btn["id"])
-        if parent_item:
-            parent_item.addChild(item)
-        else:
-            self.tree.addTopLevelItem(item)
-        # rekursiv alle Kinder
-        for c in [b for b in self._cfg["buttons"] if b["parent"] == cfg_btn["id"]]:
-            self._add_item_recursive(item, c)
+        """Config geändert → nur betroffene Zeilen im Baum aktualisieren."""
+        self.model.sync()
+        if self._health is not None:
+            self._health.recheck()
 
     # -------------------------------------------------------------------------
     def _current_ids(self) -> List[str]:
         return [
-            it.data(0, Qt.UserRole)
-            for it in self.tree.selectedItems()
+            idx.data(ButtonIdRole)
+            for idx in self.tree.selectionModel().selectedRows()
         ]
 
     # -------------------------------------------------------------------------
@@ -98,10 +115,7 @@ class ButtonManager(QDialog):
 
         # ── Blockiere Child-Anlage, wenn Parent keine MENU-Action hat ──
         if parent_id:
-            parent_cfg = next(
-                (b for b in self._cfg["buttons"] if b["id"] == parent_id),
-                None
-            )
+            parent_cfg = self.model.index_.get(parent_id)
             if parent_cfg and parent_cfg.get("action") != "MENU":
                 QMessageBox.warning(
                     self,
@@ -130,11 +144,74 @@ class ButtonManager(QDialog):
         ids = self._current_ids()
         if not ids:
             return
-        # ... (bestehende Lösch-Logik unverändert) ...
-        for bid in ids:
-            storage.delete_button_recursive(self._cfg, bid)
-        storage.save_config(self._cfg_path, self._cfg)
+        batch = ButtonBatch(self._cfg)
+        batch.delete(ids)                       # alle Teilbäume in einem Durchlauf
+        self._commit(batch)
+
+    # -------------------------------------------------------------------------
+    def _on_batch_edit(self):
+        ids = self._current_ids()
+        if not ids:
+            return
+        dlg = BatchEditDialog(self._cfg, self._cfg_path, ids, parent=self)
+        if dlg.exec():
+            self._reload_tree()
+
+    # -------------------------------------------------------------------------
+    def _on_discover(self):
+        from .discovery_dialog import DiscoveryDialog
+        dlg = DiscoveryDialog(self._cfg, self._cfg_path, parent=self)
+        if dlg.exec():
+            self._reload_tree()
+
+    # -------------------------------------------------------------------------
+    def _on_import(self):
+        fn, _ = QFileDialog.getOpenFileName(
+            self, "Buttons importieren", "", "CSV / JSON (*.csv *.json);;Alle Dateien (*)"
+        )
+        if fn:
+            self.import_file(Path(fn))
+
+    def import_file(self, path: Path, update_existing: bool | None = None) -> bool:
+        """``update_existing`` None → nachfragen, falls IDs schon vorhanden sind."""
+        try:
+            buttons = read_import(path)
+        except BatchError as exc:
+            QMessageBox.warning(self, "Import abgelehnt", str(exc))
+            return False
+        batch = ButtonBatch(self._cfg)
+        if update_existing is None:
+            known = sum(1 for b in buttons if batch.index.get(b["id"]) is not None)
+            update_existing = False
+            if known:
+                answer = QMessageBox.question(
+                    self, "Vorhandene IDs",
+                    f"{known} von {len(buttons)} IDs gibt es schon.\n"
+                    "Ja = vorhandene aktualisieren, Nein = zusätzlich anlegen.",
+                    QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+                )
+                if answer == QMessageBox.Cancel:
+                    return False
+                update_existing = answer == QMessageBox.Yes
+        batch.add(buttons, update_existing=update_existing)
+        if not self._commit(batch):
+            return False
+        QMessageBox.information(self, "Import", f"{path.name}: {batch.summary()}")
+        return True
+
+    # -------------------------------------------------------------------------
+    def _commit(self, batch: ButtonBatch) -> bool:
+        """Eine Prüfung, ein Speichern, ein Baum-Abgleich."""
+        try:
+            batch.commit(self._cfg_path)
+        except BatchError as exc:
+            QMessageBox.warning(self, "Nicht möglich", str(exc))
+            return False
+        except StorageError as exc:
+            QMessageBox.critical(self, "Fehler", str(exc))
+            return False
         self._reload_tree()
+        return True
 
     # -------------------------------------------------------------------------
     def _on_position(self):
@@ -142,10 +219,8 @@ class ButtonManager(QDialog):
         if not ids:
             return
         # Positioniert wird IMMER die ganze Ebene (Parent der Auswahl)
-        level_parent = None if not ids else next(
-            b for b in self._cfg["buttons"] if b["id"] == ids[0]
-        )["parent"]
-        same_level = [b for b in self._cfg["buttons"] if b["parent"] == level_parent]
+        level_parent = self.model.index_.get(ids[0])["parent"]
+        same_level = list(self.model.index_.children(level_parent))
 
         dlg = PositionDialog(self._cfg, self._cfg_path, same_level, parent=self)
         if dlg.exec():
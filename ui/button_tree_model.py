@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+ui.button_tree_model
+====================
+
+Baum-Model für den Button-Manager über ``config["buttons"]``
+(core.button_index statt Listensuche pro Knoten).
+
+* Kinder werden erst geladen, wenn die View sie braucht
+  (``canFetchMore``/``fetchMore``, höchstens ``FETCH_BATCH`` pro Schritt) –
+  auch eine flache Ebene mit 50 000 Buttons öffnet sofort. Ausklapp-Pfeile
+  kommen aus ``hasChildren`` ohne Laden.
+* ``sync()`` nach Änderungen an der Config gleicht nur die bereits
+  geladenen Ebenen ab und meldet gezielt ``rowsRemoved``/``rowsInserted``/
+  ``dataChanged`` – Auswahl und Aufklapp-Zustand der View bleiben erhalten.
+  Der Index ist dabei schon neu, die Kinderlisten noch nicht: bis ``sync()``
+  fertig ist, gilt nur was geladen ist (kein ``fetchMore`` aus Slots heraus,
+  ``hasChildren`` auch aus den geladenen Kindern).
+* ``set_issue_source(fn)``: ``fn(btn)`` liefert Probleme (ui.health_monitor)
+  → Warn-Symbol und Tooltip; ``refresh_issues()`` nach neuen Ergebnissen.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtWidgets import QApplication, QStyle
+
+from core.button_index import ButtonIndex
+
+# Kinder pro fetchMore-Schritt
+FETCH_BATCH = 500
+
+ButtonIdRole = Qt.UserRole          # wie früher im QTreeWidget
+
+
+class _Node:
+    __slots__ = ("btn", "parent", "row", "children")
+
+    def __init__(self, btn: Optional[dict], parent: Optional["_Node"], row: int) -> None:
+        self.btn = btn                                   # None = unsichtbare Wurzel
+        self.parent = parent
+        self.row = row
+        self.children: Optional[List[_Node]] = None      # None = noch nie geladen
+
+    @property
+    def id(self) -> Optional[str]:
+        return None if self.btn is None else self.btn["id"]
+
+
+def _keys(buttons: List[dict]) -> List[Tuple[str, int]]:
+    """(ID, Vorkommen) – macht doppelte IDs auf einer Ebene unterscheidbar."""
+    seen: Dict[str, int] = {}
+    out = []
+    for b in buttons:
+        n = seen.get(b["id"], 0)
+        seen[b["id"]] = n + 1
+        out.append((b["id"], n))
+    return out
+
+
+class ButtonTreeModel(QAbstractItemModel):
+    def __init__(self, cfg: dict, parent=None) -> None:
+        super().__init__(parent)
+        self._cfg = cfg
+        self.index_ = ButtonIndex(cfg["buttons"])
+        self._root = _Node(None, None, 0)
+        self._issues: Optional[Callable[[dict], tuple]] = None
+        self._warn_icon = None
+        self._syncing = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def button(self, index: QModelIndex) -> Optional[dict]:
+        return self._node(index).btn if index.isValid() else None
+
+    def index_of(self, btn_id: str) -> QModelIndex:
+        """Index des ersten *geladenen* Knotens mit ``btn_id`` (sonst ungültig)."""
+        todo = [self._root]
+        while todo:
+            node = todo.pop()
+            for child in node.children or ():
+                if child.id == btn_id:
+                    return self.createIndex(child.row, 0, child)
+                todo.append(child)
+        return QModelIndex()
+
+    def sync(self) -> None:
+        """Config wurde geändert → Index neu, geladene Ebenen gezielt abgleichen."""
+        full = {id(n) for n in self._loaded()
+                if len(n.children) >= len(self.index_.children(n.id))}
+        self.index_.rebuild(self._cfg["buttons"])
+        if self._root.children is None:
+            return
+        self._syncing = True
+        try:
+            self._sync_node(self._root, full)
+        finally:
+            self._syncing = False
+
+    def set_issue_source(self, fn: Optional[Callable[[dict], tuple]]) -> None:
+        self._issues = fn
+        self.refresh_issues()
+
+    def refresh_issues(self) -> None:
+        """Symbol/Tooltip aller geladenen Zeilen neu abfragen (ein Signal je Ebene)."""
+        roles = [Qt.DecorationRole, Qt.ToolTipRole]
+        for node in self._loaded():
+            if node.children:
+                first, last = node.children[0], node.children[-1]
+                self.dataChanged.emit(self.createIndex(first.row, 0, first),
+                                      self.createIndex(last.row, 0, last), roles)
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel
+    # ------------------------------------------------------------------
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self._node(parent)
+        if column != 0 or node.children is None or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:    # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        up = self._node(index).parent
+        if up is None or up is self._root:
+            return QModelIndex()
+        return self.createIndex(up.row, 0, up)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        node = self._node(parent)
+        return 0 if node.children is None else len(node.children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        return bool(node.children) or self.index_.has_children(node.id)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if self._syncing:
+            return False
+        node = self._node(parent)
+        loaded = 0 if node.children is None else len(node.children)
+        return loaded < len(self.index_.children(node.id))
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not self._syncing:
+            self._fetch(self._node(parent), parent)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        btn = self._node(index).btn
+        if role in (Qt.DisplayRole, ButtonIdRole):
+            return btn["id"]
+        if role == Qt.ToolTipRole:
+            text = btn["action"]
+            if btn.get("payload"):
+                text += f": {btn['payload']}"
+            if btn.get("description"):
+                text += f"\n{btn['description']}"
+            for issue in self._issues(btn) if self._issues else ():
+                text += f"\n⚠ {issue}"
+            return text
+        if role == Qt.DecorationRole and self._issues and self._issues(btn):
+            if self._warn_icon is None:
+                self._warn_icon = QApplication.style().standardIcon(QStyle.SP_MessageBoxWarning)
+            return self._warn_icon
+        return None
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Name / ID"
+        return None
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _node(self, index: QModelIndex | QPersistentModelIndex) -> _Node:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _qindex(self, node: _Node) -> QModelIndex:
+        return QModelIndex() if node is self._root else self.createIndex(node.row, 0, node)
+
+    def _sync_node(self, node: _Node, full: set) -> None:
+        parent = self._qindex(node)
+        new = self.index_.children(node.id)
+        new_keys = _keys(new)
+
+        # 1) Verschwundene Kinder entfernen (von hinten, zusammenhängende Blöcke)
+        wanted = set(new_keys)
+        gone = [i for i, k in enumerate(_keys([c.btn for c in node.children])) if k not in wanted]
+        for first, last in reversed(_runs(gone)):
+            self.beginRemoveRows(parent, first, last)
+            del node.children[first:last + 1]
+            self._renumber(node, first)
+            self.endRemoveRows()
+
+        # 2) Reihenfolge der verbliebenen muss zur Config passen – sonst Ebene neu laden
+        pos = {k: i for i, k in enumerate(new_keys)}
+        order = [pos[k] for k in _keys([c.btn for c in node.children])]
+        if order != sorted(order):
+            self._reload_level(node, parent)
+            return
+
+        # 3) Neue Kinder im geladenen Bereich einfügen, geänderte melden
+        #    (war die Ebene ganz geladen, bleibt sie es)
+        limit = len(new) if id(node) in full else (order[-1] + 1 if order else 0)
+        for row in range(limit):
+            btn = new[row]
+            if row < len(order) and order[row] == row:
+                child = node.children[row]
+                if child.btn is not btn:
+                    changed = child.btn != btn
+                    child.btn = btn
+                    if changed:
+                        idx = self.createIndex(row, 0, child)
+                        self.dataChanged.emit(idx, idx)
+                continue
+            self.beginInsertRows(parent, row, row)
+            node.children.insert(row, _Node(btn, node, row))
+            order.insert(row, row)
+            self._renumber(node, row + 1)
+            self.endInsertRows()
+
+        # 4) Rekursiv in geladene Unterebenen; Blätter mit neuen Kindern neu zeichnen
+        for child in node.children:
+            if child.children is not None:
+                self._sync_node(child, full)
+            elif self.index_.has_children(child.id):
+                idx = self.createIndex(child.row, 0, child)
+                self.dataChanged.emit(idx, idx)
+
+    def _fetch(self, node: _Node, parent: QModelIndex) -> None:
+        if node.children is None:
+            node.children = []
+        start = len(node.children)
+        batch = self.index_.children(node.id)[start:start + FETCH_BATCH]
+        if not batch:
+            return
+        self.beginInsertRows(parent, start, start + len(batch) - 1)
+        node.children.extend(_Node(b, node, start + i) for i, b in enumerate(batch))
+        self.endInsertRows()
+
+    def _loaded(self) -> List[_Node]:
+        out, todo = [], [self._root]
+        while todo:
+            node = todo.pop()
+            if node.children is not None:
+                out.append(node)
+                todo.extend(node.children)
+        return out
+
+    def _reload_level(self, node: _Node, parent: QModelIndex) -> None:
+        count = len(node.children or ())
+        if count:
+            self.beginRemoveRows(parent, 0, count - 1)
+            node.children = []
+            self.endRemoveRows()
+        node.children = None
+        self._fetch(node, parent)
+
+    @staticmethod
+    def _renumber(node: _Node, start: int) -> None:
+        for i in range(start, len(node.children)):
+            node.children[i].row = i
+
+
+def _runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """Aufsteigende Zeilen → zusammenhängende (erste, letzte)-Blöcke."""
+    out: List[Tuple[int, int]] = []
+    for r in rows:
+        if out and out[-1][1] == r - 1:
+            out[-1] = (out[-1][0], r)
+        else:
+            out.append((r, r))
+    return out
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+ui.diagnostics_dialog
+=====================
+Diagnose-Ansicht für Hänger der Oberfläche (core.stall_watchdog) und
+Speicherverlauf (core.memory_diag).
+
+* ``install_watchdog(app, cfg)`` startet – falls per Config/Umgebung
+  eingeschaltet – Herzschlag-Timer und Watchdog-Thread.
+* ``install_memory_tracker(app, cfg)`` nimmt periodisch Speicher-Snapshots
+  inkl. lebender Widgets je Klasse und Dispatcher-Abos.
+* ``DiagnosticsDialog``: Reiter „Hänger“ listet erkannte Hänger (Zeit,
+  Dauer, blockierender Frame); Reiter „Speicher“ zeigt den Snapshot-Verlauf,
+  Auswahl zweier Zeilen vergleicht sie.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+from collections import Counter
+from typing import Dict, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import (
+    QAbstractItemView, QApplication, QCheckBox, QDialog, QHBoxLayout, QHeaderView, QLabel,
+    QPlainTextEdit, QPushButton, QTableWidget, QTableWidgetItem, QTabWidget, QVBoxLayout,
+    QWidget,
+)
+
+from core import memory_diag
+from core.memory_diag import MemorySnapshot, MemoryTracker
+from core.stall_watchdog import ENV_FLAG, HEARTBEAT_S, Stall, StallWatchdog, settings
+
+_watchdog: Optional[StallWatchdog] = None
+_memory: Optional[MemoryTracker] = None
+_memory_interval: Optional[float] = None
+
+
+def install_watchdog(app: QObject, cfg: Optional[dict]) -> Optional[StallWatchdog]:
+    """Watchdog für den GUI-Thread starten (None = ausgeschaltet, kostet dann nichts)."""
+    global _watchdog
+    threshold = settings(cfg)
+    if threshold is None or _watchdog is not None:
+        return _watchdog
+    _watchdog = StallWatchdog(threshold)
+    heartbeat = QTimer(app)
+    heartbeat.setTimerType(Qt.PreciseTimer)
+    heartbeat.setInterval(int(HEARTBEAT_S * 1000))
+    heartbeat.timeout.connect(_watchdog.beat)
+    heartbeat.start()
+    _watchdog.start()
+    if hasattr(app, "aboutToQuit"):
+        app.aboutToQuit.connect(_watchdog.stop)
+    return _watchdog
+
+
+def active_watchdog() -> Optional[StallWatchdog]:
+    return _watchdog
+
+
+# -------------------------------------------------------------------
+# Speicher
+# -------------------------------------------------------------------
+def widget_counts() -> Dict[str, int]:
+    """Lebende Widgets je Klasse (inkl. versteckter und noch nicht gelöschter)."""
+    return dict(Counter(type(w).__name__ for w in QApplication.allWidgets()))
+
+
+def dispatcher_counts() -> Dict[str, int]:
+    from core.dispatcher import dispatcher
+    return {"Abos": dispatcher.subscription_count(), "Jobs": len(dispatcher.jobs)}
+
+
+def memory_tracker() -> MemoryTracker:
+    """Gemeinsamer Tracker (auch ohne Intervall für manuelle Snapshots)."""
+    global _memory
+    if _memory is None:
+        _memory = MemoryTracker()
+        _memory.add_probe("Widgets", widget_counts)
+        _memory.add_probe("Dispatcher", dispatcher_counts)
+    return _memory
+
+
+def install_memory_tracker(app: QObject, cfg: Optional[dict]) -> Optional[MemoryTracker]:
+    """Periodische Snapshots starten (None = ausgeschaltet, kein Timer)."""
+    global _memory_interval
+    interval = memory_diag.settings(cfg)
+    if interval is None or _memory_interval is not None:
+        return _memory if _memory_interval is not None else None
+    _memory_interval = interval
+    tracker = memory_tracker()
+    if (cfg or {}).get("tracemalloc"):
+        tracker.start_tracing()
+    tracker.set_baseline()
+    timer = QTimer(app)
+    timer.setInterval(int(interval * 1000))
+    timer.timeout.connect(tracker.take)
+    timer.start()
+    return tracker
+
+
+class DiagnosticsDialog(QDialog):
+    """Non-modal; neue Hänger erscheinen sofort (Callback im GUI-Thread)."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Diagnose")
+        self.resize(820, 520)
+        self.setWindowFlag(Qt.Window)
+        self._stalls: list[Stall] = []
+
+        self.tabs = QTabWidget()
+        stall_tab = QWidget()
+        self.memory_tab = MemoryTab()
+        self.tabs.addTab(stall_tab, "Hänger")
+        self.tabs.addTab(self.memory_tab, "Speicher")
+        QVBoxLayout(self).addWidget(self.tabs)
+
+        self.status = QLabel()
+        self.table = QTableWidget(0, 3)
+        self.table.setHorizontalHeaderLabels(["Zeit", "Dauer", "Blockiert in"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.details = QPlainTextEdit()
+        self.details.setReadOnly(True)
+
+        layout = QVBoxLayout(stall_tab)
+        layout.addWidget(self.status)
+        layout.addWidget(self.table, stretch=2)
+        layout.addWidget(self.details, stretch=1)
+
+        self.table.itemSelectionChanged.connect(self._show_details)
+
+        wd = active_watchdog()
+        if wd is None:
+            self.status.setText(
+                "Stall-Watchdog ist aus. Einschalten über config.json "
+                '("diagnostics": {"stall_watchdog": true}) oder '
+                f"{ENV_FLAG}=1 und Neustart."
+            )
+            return
+        self.status.setText(
+            f"Schwelle {wd.threshold_s * 1000:0.0f} ms · Protokoll: {wd.log_path}"
+        )
+        for stall in wd.stalls():
+            self._add(stall)
+        wd.on_stall.append(self._add)
+
+    # ------------------------------------------------------------------
+    def done(self, result: int) -> None:
+        wd = active_watchdog()
+        if wd is not None and self._add in wd.on_stall:
+            wd.on_stall.remove(self._add)
+        super().done(result)
+
+    def _add(self, stall: Stall) -> None:
+        self._stalls.append(stall)
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        when = _dt.datetime.fromtimestamp(stall.started).strftime("%H:%M:%S")
+        cells = [when, f"{stall.duration * 1000:0.0f} ms", stall.culprit]
+        for col, text in enumerate(cells):
+            self.table.setItem(row, col, QTableWidgetItem(text))
+
+    def _show_details(self) -> None:
+        rows = self.table.selectionModel().selectedRows()
+        if rows:
+            self.details.setPlainText(self._stalls[rows[0].row()].format())
+
+
+class MemoryTab(QWidget):
+    """Snapshot-Verlauf; eine Zeile → Diff zum Vorgänger, zwei Zeilen → Diff dazwischen."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.tracker = memory_tracker()
+
+        self.status = QLabel()
+        self.status.setWordWrap(True)
+        self.snap_btn = QPushButton("Snapshot jetzt")
+        self.base_btn = QPushButton("Als Basis setzen")
+        self.diff_btn = QPushButton("Diff zur Basis")
+        self.trace_box = QCheckBox("Allokationen verfolgen (tracemalloc)")
+        self.trace_box.setChecked(self.tracker.trace)
+        self.table = QTableWidget(0, 5)
+        self.table.setHorizontalHeaderLabels(["Zeit", "RSS", "Python-Objekte", "Widgets", "Abos"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.details = QPlainTextEdit()
+        self.details.setReadOnly(True)
+        self.details.setFont(QFont("monospace"))
+
+        buttons = QHBoxLayout()
+        for w in (self.snap_btn, self.base_btn, self.diff_btn):
+            buttons.addWidget(w)
+        buttons.addStretch(1)
+        buttons.addWidget(self.trace_box)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.status)
+        layout.addLayout(buttons)
+        layout.addWidget(self.table, stretch=1)
+        layout.addWidget(self.details, stretch=2)
+
+        self.snap_btn.clicked.connect(self._snapshot)
+        self.base_btn.clicked.connect(self._set_baseline)
+        self.diff_btn.clicked.connect(self._diff_to_baseline)
+        self.trace_box.toggled.connect(self._toggle_trace)
+        self.table.itemSelectionChanged.connect(self._show_diff)
+
+        if _memory_interval is None:
+            self.status.setText(
+                "Automatische Snapshots sind aus – Einschalten über config.json "
+                '("diagnostics": {"memory": true}) oder '
+                f"{memory_diag.ENV_FLAG}=1 und Neustart. Manuelle Snapshots gehen immer."
+            )
+        else:
+            self.status.setText(
+                f"Snapshot alle {_memory_interval:0.0f} s · Protokoll: {self.tracker.log_path}"
+            )
+        self._reload()
+
+    # ------------------------------------------------------------------
+    def _reload(self) -> None:
+        self._history = self.tracker.history()
+        self.table.setRowCount(0)
+        for snap in self._history:
+            self._append(snap)
+
+    def _append(self, snap: MemorySnapshot) -> None:
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        when = _dt.datetime.fromtimestamp(snap.taken).strftime("%H:%M:%S")
+        if snap is self.tracker.baseline():
+            when += "  (Basis)"
+        cells = [
+            f"{when}  {snap.label}".rstrip(),
+            "–" if snap.rss is None else f"{snap.rss / 2**20:0.1f} MB",
+            str(snap.object_total),
+            str(snap.probe_total("Widgets")),
+            str(snap.probes.get("Dispatcher", {}).get("Abos", "–")),
+        ]
+        for col, text in enumerate(cells):
+            self.table.setItem(row, col, QTableWidgetItem(text))
+
+    def _snapshot(self) -> None:
+        self.tracker.take("manuell")
+        self._reload()
+        self.table.selectRow(self.table.rowCount() - 1)
+
+    def _set_baseline(self) -> None:
+        self.tracker.set_baseline()
+        self._reload()
+
+    def _diff_to_baseline(self) -> None:
+        result = self.tracker.diff_to_baseline()
+        self._reload()
+        if result is None:
+            self.tracker.set_baseline()
+            self._reload()
+            self.details.setPlainText("Basis gesetzt – später erneut vergleichen.")
+        else:
+            self.details.setPlainText(result.format())
+
+    def _toggle_trace(self, on: bool) -> None:
+        if on:
+            self.tracker.start_tracing()
+        else:
+            self.tracker.stop_tracing()
+
+    def _show_diff(self) -> None:
+        rows = sorted(i.row() for i in self.table.selectionModel().selectedRows())
+        if not rows:
+            return
+        if len(rows) == 1:
+            if rows[0] == 0:
+                self.details.setPlainText(self._history[0].summary())
+                return
+            rows = [rows[0] - 1, rows[0]]
+        a, b = self._history[rows[0]], self._history[rows[-1]]
+        self.details.setPlainText(memory_diag.diff(a, b).format())
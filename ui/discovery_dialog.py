@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+ui.discovery_dialog
+===================
+Werkzeug-Ordner scannen (core.discovery) und daraus Buttons anlegen.
+Der Scan läuft in einem Hintergrund-Thread; übernommen wird in einer
+Transaktion über core.button_batch. Die Ordnerliste landet in
+``config["discovery"]["folders"]``.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import List
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import (
+    QCheckBox, QDialog, QDialogButtonBox, QFileDialog, QHBoxLayout, QLabel,
+    QListWidget, QMessageBox, QPlainTextEdit, QPushButton, QVBoxLayout
+)
+
+from core.button_batch import BatchError, ButtonBatch
+from core.discovery import DEFAULT_WORKERS, Plan, Scanner, plan, settings
+from core.storage import StorageError
+from util.paths import to_absolute, to_relative
+
+# so viele Vorschläge stehen in der Vorschau (übernommen werden alle)
+PREVIEW_LINES = 500
+
+
+class _ScanWorker(QObject):
+    done = Signal(object, object)           # Liste[ScanResult], Fehlertext | None
+
+    def __init__(self, scanner: Scanner, folders: List[str]) -> None:
+        super().__init__()
+        self._scanner = scanner
+        self._folders = folders
+
+    def start(self) -> None:
+        threading.Thread(target=self._run, name="discovery-scan", daemon=True).start()
+
+    def _run(self) -> None:
+        try:
+            results = [self._scanner.scan(to_absolute(f)) for f in self._folders]
+            self._scanner.save()
+        except Exception as exc:                    # sonst bliebe der Dialog im Zustand „Scanne …“
+            self.done.emit([], f"{type(exc).__name__}: {exc}")
+            return
+        self.done.emit(results, None)
+
+
+class DiscoveryDialog(QDialog):
+    def __init__(self, cfg: dict, cfg_path: Path, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Ordner scannen")
+        self.resize(640, 520)
+        self._cfg = cfg
+        self._cfg_path = cfg_path
+        opts = settings(cfg)
+        self._scanner = Scanner(workers=opts.get("workers", DEFAULT_WORKERS))
+        self._worker: _ScanWorker | None = None
+        self.plan: Plan | None = None
+
+        # ---------------------------------------------------------------- Ordner
+        self.folder_list = QListWidget()
+        self.folder_list.addItems(opts.get("folders", []))
+        btn_add = QPushButton("Ordner hinzufügen …")
+        btn_remove = QPushButton("Entfernen")
+        self.scan_btn = QPushButton("Scannen")
+        btn_add.clicked.connect(self._on_add_folder)
+        btn_remove.clicked.connect(self._on_remove_folder)
+        self.scan_btn.clicked.connect(self.scan)
+
+        folder_btns = QHBoxLayout()
+        folder_btns.addWidget(btn_add)
+        folder_btns.addWidget(btn_remove)
+        folder_btns.addStretch(1)
+        folder_btns.addWidget(self.scan_btn)
+
+        # ---------------------------------------------------------------- Vorschlag
+        self.status = QLabel("Noch nicht gescannt.")
+        self.preview = QPlainTextEdit()
+        self.preview.setReadOnly(True)
+        self.prune_chk = QCheckBox("Buttons verschwundener Dateien löschen")
+        self.prune_chk.setEnabled(False)
+
+        self.btn_box = QDialogButtonBox(QDialogButtonBox.Apply | QDialogButtonBox.Close)
+        self.btn_box.button(QDialogButtonBox.Apply).setText("Übernehmen")
+        self.btn_box.button(QDialogButtonBox.Apply).setEnabled(False)
+        self.btn_box.button(QDialogButtonBox.Apply).clicked.connect(self.apply)
+        self.btn_box.rejected.connect(self.reject)
+
+        vbox = QVBoxLayout(self)
+        vbox.addWidget(QLabel("Werkzeug-Ordner (Unterordner werden zu Menüs):"))
+        vbox.addWidget(self.folder_list, 1)
+        vbox.addLayout(folder_btns)
+        vbox.addWidget(self.status)
+        vbox.addWidget(self.preview, 2)
+        vbox.addWidget(self.prune_chk)
+        vbox.addWidget(self.btn_box)
+
+    # -------------------------------------------------------------------------
+    def folders(self) -> List[str]:
+        return [self.folder_list.item(i).text() for i in range(self.folder_list.count())]
+
+    def scan(self) -> None:
+        folders = self.folders()
+        if not folders or self._worker is not None:
+            return
+        self.scan_btn.setEnabled(False)
+        self.status.setText("Scanne …")
+        self._worker = _ScanWorker(self._scanner, folders)
+        self._worker.done.connect(self._on_scanned)
+        self._worker.start()
+
+    def apply(self) -> None:
+        if not self.plan:
+            return
+        batch = ButtonBatch(self._cfg)
+        self.plan.apply(batch, prune=self.prune_chk.isChecked())
+        # Ordnerliste erst nach erfolgreichem Speichern in die Live-Config
+        had_opts = "discovery" in self._cfg
+        old_opts = self._cfg.get("discovery")
+        self._cfg["discovery"] = {**(old_opts or {}), "folders": self.folders()}
+        try:
+            batch.commit(self._cfg_path)
+        except StorageError as exc:
+            if had_opts:
+                self._cfg["discovery"] = old_opts
+            else:
+                del self._cfg["discovery"]
+            if isinstance(exc, BatchError):
+                QMessageBox.warning(self, "Nicht möglich", str(exc))
+            else:
+                QMessageBox.critical(self, "Fehler", str(exc))
+            return
+        self.accept()
+
+    # -------------------------------------------------------------------------
+    def _on_add_folder(self) -> None:
+        fn = QFileDialog.getExistingDirectory(self, "Werkzeug-Ordner wählen")
+        if fn and to_relative(fn) not in self.folders():
+            self.folder_list.addItem(to_relative(fn))
+
+    def _on_remove_folder(self) -> None:
+        for item in self.folder_list.selectedItems():
+            self.folder_list.takeItem(self.folder_list.row(item))
+
+    def _on_scanned(self, results, error) -> None:
+        self._worker = None
+        self.scan_btn.setEnabled(True)
+        if error:
+            self.status.setText(f"Fehler: {error}")
+            return
+        self.plan = plan(self._cfg, results)
+        files = sum(r.file_count for r in results)
+        dirs = sum(len(r.dirs) for r in results)
+        fresh = sum(r.scanned for r in results)
+        ms = sum(r.seconds for r in results) * 1000
+        self.status.setText(
+            f"{files} Dateien in {dirs} Ordnern ({fresh} gelesen, {dirs - fresh} aus Cache, "
+            f"{ms:0.0f} ms) → {len(self.plan.add)} neue Buttons, {len(self.plan.stale)} veraltet"
+        )
+        lines = [f"+ {b['parent'] or ''}/{b['id']}  [{b['action']}]" for b in self.plan.add]
+        lines += [f"- {bid}  (Datei fehlt)" for bid in self.plan.stale]
+        if len(lines) > PREVIEW_LINES:
+            lines = lines[:PREVIEW_LINES] + [f"… und {len(lines) - PREVIEW_LINES} weitere"]
+        self.preview.setPlainText("\n".join(lines))
+        self.prune_chk.setEnabled(bool(self.plan.stale))
+        self.prune_chk.setText(f"Buttons verschwundener Dateien löschen ({len(self.plan.stale)})")
+        self.btn_box.button(QDialogButtonBox.Apply).setEnabled(bool(self.plan))
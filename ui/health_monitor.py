@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+ui.health_monitor
+=================
+Führt core.health im Hintergrund aus und meldet Änderungen per
+``updated``-Signal – der GUI-Thread liest nur ``config["buttons"]`` für die
+Schlüsselliste und bekommt das fertige Ergebnis zurück.
+
+* ``watch(cfg)`` prüft kurz nach dem Start und dann alle ``interval_s``
+  Sekunden (Config ``"health": {"enabled": true, "interval_s": 30}``);
+  dank Stat-Cache kostet ein Lauf ohne Änderungen ein ``stat`` pro Ordner.
+* ``recheck()`` nach Änderungen an den Buttons; läuft gerade ein Lauf,
+  folgt genau ein weiterer danach.
+* ``issues(btn)`` liefert die zuletzt gefundenen Probleme (leer = ok).
+"""
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from core.health import OK, HealthChecker, Key, key
+
+DEFAULT_INTERVAL_S = 30.0
+
+
+class HealthMonitor(QObject):
+    updated = Signal()                      # Ergebnisse haben sich geändert
+    _done = Signal(object)                  # intern: Ergebnis aus dem Worker-Thread
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._checker = HealthChecker()
+        self._cfg: Optional[dict] = None
+        self._running = False
+        self._pending = False
+        self.results: Dict[Key, Tuple[str, ...]] = {}
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.recheck)
+        self._done.connect(self._on_done)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def watch(self, cfg: dict) -> None:
+        opts = cfg.get("health") or {}
+        self._cfg = cfg
+        if not opts.get("enabled", True):
+            self._timer.stop()
+            return
+        self._timer.start(int(opts.get("interval_s", DEFAULT_INTERVAL_S) * 1000))
+        QTimer.singleShot(0, self.recheck)              # erst nach dem ersten Zeichnen
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._cfg = None
+
+    def recheck(self) -> None:
+        if self._cfg is None:
+            return
+        if self._running:
+            self._pending = True
+            return
+        keys = [key(b) for b in self._cfg["buttons"]]
+        self._running = True
+        threading.Thread(target=self._run, args=(keys,), name="health-check", daemon=True).start()
+
+    def issues(self, btn: dict) -> Tuple[str, ...]:
+        return self.results.get(key(btn), OK)
+
+    def broken_count(self) -> int:
+        return sum(1 for issues in self.results.values() if issues)
+
+    @property
+    def busy(self) -> bool:
+        return self._running
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _run(self, keys) -> None:
+        try:
+            results = self._checker.check(keys)
+        except Exception:                               # nie den Worker sterben lassen
+            results = None
+        self._done.emit(results)
+
+    def _on_done(self, results) -> None:
+        self._running = False
+        if results is not None and results != self.results:
+            self.results = results
+            self.updated.emit()
+        if self._pending:
+            self._pending = False
+            self.recheck()
+
+
+# -------------------------------------------------------------------
+_monitor: Optional[HealthMonitor] = None
+
+
+def health_monitor() -> HealthMonitor:
+    """Gemeinsamer Monitor für Hauptfenster und Button-Manager."""
+    global _monitor
+    if _monitor is None:
+        _monitor = HealthMonitor()
+    return _monitor
@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""
+ui.job_model
+============
+
+Model/View-Bausteine für das Task-Dashboard:
+
+* ``JobTableModel``  – QAbstractTableModel über alle Jobs; hängt selbst am
+  ``dispatcher`` und sammelt Änderungen, die einmal pro Frame gebündelt
+  (``rowsInserted`` + wenige ``dataChanged``-Bereiche) an die Views gehen.
+  Der Frame-Timer läuft nur, solange es etwas zu melden gibt *und* eine
+  View sichtbar ist (``set_live``); Laufzeiten zählen nur für laufende Jobs
+  und frieren beim Ende ein. Im Speicher bleiben nur laufende Jobs und die
+  letzten ``keep_finished`` abgeschlossenen; ältere stehen in der Historie
+  (core.log_search) und lassen sich per ``load_archived`` seitenweise
+  zurückholen.
+* ``JobFilterProxy`` – Sortierung + Filter nach Text und Zustand.
+* ``JobDelegate``    – malt Fortschrittsbalken und Stop-Button selbst,
+  statt pro Zeile echte Widgets anzulegen.
+
+Damit bleibt die Tabelle auch mit zehntausenden Zeilen flüssig: die View
+fragt nur sichtbare Zellen ab, und pro Zeile existiert lediglich ein
+schlankes ``_JobRow``-Objekt.
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import (
+    QAbstractTableModel, QEvent, QModelIndex, QObject, QSortFilterProxyModel,
+    Qt, QTimer,
+)
+from PySide6.QtWidgets import (
+    QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton,
+    QStyleOptionProgressBar, QStyleOptionViewItem,
+)
+
+from core.dispatcher import dispatcher
+from core.log_search import JobRecord, log_index
+from core.output_buffer import OutputBuffer
+from core.progress_protocol import ProgressInfo
+from core.resources import ResourceStats, human_bytes
+
+# Zusätzliche Rollen
+JobIdRole = Qt.UserRole + 1        # job_id der Zeile
+ProgressRole = Qt.UserRole + 2     # 0-100, -1 = unbekannt
+StateRole = Qt.UserRole + 3        # running | finished | aborted | error
+SortRole = Qt.UserRole + 4         # numerische Sortierschlüssel
+
+# Ein Frame: gesammelte Änderungen → Views
+FRAME_MS = 250
+# Laufzeitspalte laufender Jobs höchstens so oft neu melden
+RUNTIME_EVERY_S = 1.0
+# Mehr Einzelbereiche als das → ein umfassendes dataChanged
+MAX_RANGES = 8
+# Abgeschlossene Jobs im Speicher (Rest → Historie); Aufräumen erst, wenn
+# ein Zehntel mehr angefallen ist, damit nicht jedes Jobende umsortiert
+KEEP_FINISHED = 1_000
+# Jobs pro load_archived()-Seite
+HISTORY_PAGE = 200
+
+STATE_TEXT = {
+    "running": "⏳ Läuft",
+    "finished": "✅ Fertig",
+    "aborted": "⏹ Abgebrochen",
+}
+
+
+def _ranges(rows: Iterable[int]) -> List[Tuple[int, int]]:
+    """Sortierte Zeilennummern → zusammenhängende (erste, letzte)-Bereiche."""
+    out: List[Tuple[int, int]] = []
+    for row in rows:
+        if out and row == out[-1][1] + 1:
+            out[-1] = (out[-1][0], row)
+        else:
+            out.append((row, row))
+    return out
+
+
+class _JobRow:
+    __slots__ = ("job_id", "name", "state", "error", "started", "ended",
+                 "percent", "stage", "detail", "stats", "output", "own_output")
+
+    def __init__(self, job_id: str, name: str, archived: bool = False) -> None:
+        self.job_id = job_id
+        self.name = name
+        self.state = "running"
+        self.error = ""
+        self.started = time.monotonic()
+        self.ended: float | None = None
+        self.percent = 0
+        self.stage = ""
+        self.detail = ""
+        self.stats: ResourceStats | None = None
+        # Ringpuffer des lokalen Runners; bei Daemon-Jobs ein eigener,
+        # den das Model aus job_progress füllt; Historie hat keinen
+        handle = None if archived else dispatcher.jobs.get(job_id)
+        output = getattr(handle, "output", None)
+        self.own_output = output is None and not archived
+        self.output: Optional[OutputBuffer] = OutputBuffer() if self.own_output else output
+
+    @classmethod
+    def from_record(cls, rec: JobRecord) -> "_JobRow":
+        """Zeile für einen Job aus der Historie (Metadaten + Endwerte, kein Puffer)."""
+        row = cls(rec.job_id, rec.script or rec.job_id, archived=True)
+        offset = time.time() - time.monotonic()      # Wanduhr → monotonic
+        row.started = (rec.started or 0.0) - offset
+        row.ended = (rec.ended or rec.started or 0.0) - offset
+        row.state = rec.state
+        row.stats = rec.stats
+        if rec.state == "error":
+            row.error = f"Exit-Code {rec.returncode}" if rec.returncode is not None else "?"
+        if rec.state == "finished":
+            row.percent = 100
+        return row
+
+    def runtime(self) -> float:
+        return (self.ended or time.monotonic()) - self.started
+
+    def status_text(self) -> str:
+        if self.state == "error":
+            return f"❌ Fehler: {self.error}"
+        return STATE_TEXT[self.state]
+
+
+# -------------------------------------------------------------------
+class JobTableModel(QAbstractTableModel):
+    """Alle Jobs der Sitzung; Spaltenlayout wie bisher im Dashboard."""
+
+    COL_JOBID = 0
+    COL_NAME = 1
+    COL_STATUS = 2
+    COL_RUNTIME = 3
+    COL_CPU = 4
+    COL_RSS = 5
+    COL_IO = 6
+    COL_PROGRESS = 7
+    COL_STOP = 8
+
+    HEADERS = ["Job-ID", "Skript", "Status", "Laufzeit", "CPU", "RAM", "I/O", "Fortschritt", ""]
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: List[_JobRow] = []
+        self._index: Dict[str, int] = {}     # job_id → Zeile
+        self._shown = 0                      # bereits per rowsInserted gemeldet
+        self._dirty: Set[int] = set()        # Zeilen mit geänderten Daten
+        self._running: Set[int] = set()      # nur diese Zeilen ticken
+        self._live = True                    # False → nichts an Views melden
+        self._last_runtime = 0.0
+        self._keep = KEEP_FINISHED
+        self._finished: Deque[str] = deque()  # job_ids in Ende-Reihenfolge
+        self._archived: Set[str] = set()     # aus der Historie nachgeladen
+        self._history_cursor: Optional[float] = None
+
+        self._frame = QTimer(self)
+        self._frame.setInterval(FRAME_MS)
+        self._frame.timeout.connect(self._on_frame)
+
+        dispatcher.job_started.connect(self._on_job_started)
+        dispatcher.job_progress.connect(self._on_job_progress)
+        dispatcher.job_progress_info.connect(self._on_job_progress_info)
+        dispatcher.job_finished.connect(self._on_job_finished)
+        dispatcher.job_aborted.connect(self._on_job_aborted)
+        dispatcher.job_error.connect(self._on_job_error)
+        dispatcher.job_resources.connect(self._on_job_resources)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def output(self, job_id: str) -> Optional[OutputBuffer]:
+        """Ringpuffer der jüngsten Ausgabe von ``job_id`` (None = unbekannt)."""
+        row = self._index.get(job_id)
+        return None if row is None else self._rows[row].output
+
+    def set_retention(self, keep_finished: Optional[int]) -> None:
+        """Anzahl abgeschlossener Jobs, die im Speicher bleiben (None = Standard)."""
+        self._keep = KEEP_FINISHED if keep_finished is None else max(0, keep_finished)
+        self._prune(force=True)
+
+    def load_archived(self, count: int = HISTORY_PAGE) -> int:
+        """
+        Holt die nächste Seite älterer Jobs aus der Historie oben in die
+        Tabelle; liefert die Anzahl neuer Zeilen (0 = nichts mehr da).
+        """
+        rows: List[_JobRow] = []
+        while not rows:                      # Seiten überspringen, die schon in der Tabelle sind
+            records = log_index.history(before=self._history_cursor, limit=count)
+            if not records:
+                return 0
+            self._history_cursor = records[-1].started
+            rows = [_JobRow.from_record(r) for r in reversed(records)
+                    if r.job_id not in self._index]
+        self.flush()
+        running, dirty = self._ids(self._running), self._ids(self._dirty)
+        self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+        self._rows[0:0] = rows
+        self._shown += len(rows)
+        self._reindex(running, dirty)
+        self.endInsertRows()
+        self._archived.update(r.job_id for r in rows)
+        return len(rows)
+
+    def drop_archived(self) -> None:
+        """Nachgeladene Historie wieder freigeben."""
+        self._history_cursor = None
+        if self._archived:
+            self._remove(sorted(self._index[j] for j in self._archived))
+            self._archived.clear()
+
+    def row_of(self, job_id: str) -> Optional[int]:
+        row = self._index.get(job_id)
+        return row if row is not None and row < self._shown else None
+
+    def set_live(self, live: bool) -> None:
+        """
+        Views sichtbar (True) oder versteckt/minimiert (False). Versteckt wird
+        weiter gesammelt, aber nichts gemeldet – beim Wiederanzeigen folgt
+        alles in einem Schwung.
+        """
+        self._live = live
+        if live:
+            self.flush()
+            self._wake()                             # nächster Frame: Laufzeiten
+        else:
+            self._frame.stop()
+
+    def flush(self) -> None:
+        """Gesammelte Änderungen jetzt an die Views melden."""
+        if len(self._rows) > self._shown:
+            self.beginInsertRows(QModelIndex(), self._shown, len(self._rows) - 1)
+            self._shown = len(self._rows)
+            self.endInsertRows()
+        dirty = sorted(r for r in self._dirty if r < self._shown)
+        self._dirty.clear()
+        if not dirty:
+            return
+        ranges = _ranges(dirty)
+        if len(ranges) > MAX_RANGES:
+            ranges = [(dirty[0], dirty[-1])]
+        last_col = len(self.HEADERS) - 1
+        for first, last in ranges:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col))
+
+    # ------------------------------------------------------------------
+    # Qt-Model-Interface
+    # ------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._shown
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            return self._display(job, col)
+        if role == JobIdRole:
+            return job.job_id
+        if role == StateRole:
+            return job.state
+        if role == ProgressRole:
+            return job.percent
+        if role == SortRole:
+            return self._sort_key(job, col)
+        if role == Qt.ToolTipRole:
+            if col == self.COL_PROGRESS:
+                eta = job.output.eta() if job.state == "running" else None
+                hint = f"Rest ca. {eta:0.0f}s" if eta is not None else ""
+                return "\n".join(t for t in (job.detail, hint) if t) or None
+            if col == self.COL_RSS and job.stats is not None:
+                return f"Peak: {human_bytes(job.stats.peak_rss)}"
+            if col == self.COL_STATUS and job.state == "error":
+                return job.error
+        return None
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _display(self, job: _JobRow, col: int):
+        if col == self.COL_JOBID:
+            return job.job_id
+        if col == self.COL_NAME:
+            return job.name
+        if col == self.COL_STATUS:
+            return job.status_text()
+        if col == self.COL_RUNTIME:
+            return f"{int(job.runtime())}s"
+        if col == self.COL_PROGRESS:
+            return f"{job.stage} – {job.percent}%" if job.stage else f"{job.percent}%"
+        stats = job.stats
+        if col in (self.COL_CPU, self.COL_RSS, self.COL_IO) and stats is None:
+            return "–"
+        if col == self.COL_CPU:
+            return f"{stats.cpu_s:0.1f} s"
+        if col == self.COL_RSS:
+            return human_bytes(stats.rss) if stats.procs > 0 else f"max {human_bytes(stats.peak_rss)}"
+        if col == self.COL_IO:
+            return f"R {human_bytes(stats.read_bytes)} / W {human_bytes(stats.write_bytes)}"
+        return None
+
+    def _sort_key(self, job: _JobRow, col: int):
+        stats = job.stats
+        if col == self.COL_RUNTIME:
+            return job.runtime()
+        if col == self.COL_PROGRESS:
+            return job.percent
+        if col == self.COL_CPU:
+            return stats.cpu_s if stats else -1.0
+        if col == self.COL_RSS:
+            return (stats.rss if stats.procs > 0 else stats.peak_rss) if stats else -1
+        if col == self.COL_IO:
+            return stats.read_bytes + stats.write_bytes if stats else -1
+        if col == self.COL_STATUS:
+            return job.state
+        return self._display(job, col)
+
+    def _wake(self) -> None:
+        if self._live and not self._frame.isActive():
+            self._frame.start()
+
+    def _touch(self, row: int) -> None:
+        self._dirty.add(row)
+        self._wake()
+
+    def _on_frame(self) -> None:
+        """Ein Frame: Laufzeiten (max. 1×/s) + alle gesammelten Änderungen."""
+        now = time.monotonic()
+        if self._running and now - self._last_runtime >= RUNTIME_EVERY_S:
+            self._dirty.update(self._running)
+            self._last_runtime = now
+        self.flush()
+        if not self._running:                # nichts mehr, was sich von selbst ändert
+            self._frame.stop()
+
+    def _end(self, job_id: str, state: str, error: str = "") -> None:
+        row = self._index.get(job_id)
+        if row is None:
+            return
+        job = self._rows[row]
+        job.state, job.error = state, error
+        self._touch(row)
+        if job.ended is None:
+            job.ended = time.monotonic()
+            self._running.discard(row)
+            self._finished.append(job_id)
+            self._prune()
+
+    def _prune(self, force: bool = False) -> None:
+        """Älteste abgeschlossene Jobs über ``_keep`` hinaus aus dem Speicher."""
+        excess = len(self._finished) - self._keep
+        if excess <= 0 or (not force and excess <= self._keep // 10):
+            return
+        drop = [self._finished.popleft() for _ in range(excess)]
+        self._remove(sorted(self._index[j] for j in drop))
+
+    def _remove(self, rows: List[int]) -> None:
+        """Zeilen entfernen (aufsteigend sortiert) und Zeilennummern neu vergeben."""
+        running, dirty = self._ids(self._running), self._ids(self._dirty)
+        for first, last in reversed(_ranges(rows)):
+            shown_last = min(last, self._shown - 1)
+            if first <= shown_last:              # View kennt (einen Teil) davon
+                self.beginRemoveRows(QModelIndex(), first, shown_last)
+                del self._rows[first:last + 1]
+                self._shown -= shown_last - first + 1
+                self.endRemoveRows()
+            else:                                # noch nicht gemeldet → still weg
+                del self._rows[first:last + 1]
+        self._reindex(running, dirty)
+
+    def _ids(self, rows: Set[int]) -> List[str]:
+        return [self._rows[r].job_id for r in rows]
+
+    def _reindex(self, running: List[str], dirty: List[str]) -> None:
+        self._index = {job.job_id: i for i, job in enumerate(self._rows)}
+        self._running = {self._index[j] for j in running}
+        self._dirty = {self._index[j] for j in dirty if j in self._index}
+
+    # --------------------------------
+    def _on_job_started(self, job_id: str, name: str) -> None:
+        if job_id in self._index:                   # z. B. Daemon-Snapshot nach Reconnect
+            return
+        row = len(self._rows)
+        self._rows.append(_JobRow(job_id, name))
+        self._index[job_id] = row
+        self._running.add(row)
+        self._wake()
+
+    def _on_job_progress(self, job_id: str, percent: int, msg: str) -> None:
+        row = self._index.get(job_id)
+        if row is None:
+            return
+        job = self._rows[row]
+        if job.own_output:                          # Daemon-Job: Puffer selbst füllen
+            job.output.append(msg)
+            if percent >= 0:
+                job.output.add_sample(percent)
+        if percent >= 0 and job.percent != percent:
+            job.percent = percent
+            self._touch(row)
+
+    def _on_job_progress_info(self, job_id: str, info: ProgressInfo) -> None:
+        row = self._index.get(job_id)
+        if row is not None:
+            job = self._rows[row]
+            job.stage = info.stage or ""
+            job.detail = info.describe()
+            self._touch(row)
+
+    def _on_job_finished(self, job_id: str) -> None:
+        self._end(job_id, "finished")
+
+    def _on_job_aborted(self, job_id: str) -> None:
+        self._end(job_id, "aborted")
+
+    def _on_job_error(self, job_id: str, err: str) -> None:
+        self._end(job_id, "error", err)
+
+    def _on_job_resources(self, job_id: str, stats: ResourceStats) -> None:
+        row = self._index.get(job_id)
+        if row is not None:
+            self._rows[row].stats = stats
+            self._touch(row)
+
+
+# -------------------------------------------------------------------
+class JobFilterProxy(QSortFilterProxyModel):
+    """Sortiert über ``SortRole`` und filtert nach Text sowie Zustand."""
+
+    # Anzeigename → akzeptierte Zustände (None = alle)
+    STATES = {
+        "Alle": None,
+        "Laufend": {"running"},
+        "Fertig": {"finished"},
+        "Fehler/Abbruch": {"error", "aborted"},
+    }
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.setSortRole(SortRole)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setFilterKeyColumn(JobTableModel.COL_NAME)
+        self._states: Optional[Set[str]] = None
+
+    def set_state_filter(self, label: str) -> None:
+        if hasattr(self, "beginFilterChange"):       # Qt ≥ 6.10
+            self.beginFilterChange()
+            self._states = self.STATES.get(label)
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self._states = self.STATES.get(label)
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._states is not None:
+            idx = self.sourceModel().index(source_row, 0, source_parent)
+            if idx.data(StateRole) not in self._states:
+                return False
+        return super().filterAcceptsRow(source_row, source_parent)
+
+
+# -------------------------------------------------------------------
+class JobDelegate(QStyledItemDelegate):
+    """Malt Fortschrittsbalken und Stop-Button; Klick auf Stop → job_abort_req."""
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        col = index.column()
+        style = (option.widget.style() if option.widget else QApplication.style())
+        if col == JobTableModel.COL_PROGRESS:
+            bar = QStyleOptionProgressBar()
+            bar.rect = option.rect.adjusted(2, 2, -2, -2)
+            bar.minimum, bar.maximum = 0, 100
+            bar.progress = max(0, index.data(ProgressRole) or 0)
+            bar.text = index.data(Qt.DisplayRole) or ""
+            bar.textVisible = True
+            bar.state = option.state | QStyle.State_Horizontal
+            style.drawControl(QStyle.CE_ProgressBar, bar, painter, option.widget)
+            return
+        if col == JobTableModel.COL_STOP:
+            btn = QStyleOptionButton()
+            btn.rect = option.rect.adjusted(2, 2, -2, -2)
+            btn.text = "Stop"
+            btn.state = QStyle.State_Raised
+            if index.data(StateRole) == "running":
+                btn.state |= QStyle.State_Enabled
+            style.drawControl(QStyle.CE_PushButton, btn, painter, option.widget)
+            return
+        super().paint(painter, option, index)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (
+            index.column() == JobTableModel.COL_STOP
+            and event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and option.rect.contains(event.position().toPoint())
+        ):
+            if index.data(StateRole) == "running":
+                dispatcher.job_abort_req.emit(index.data(JobIdRole))   # Runner hört zu
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+ui.log_search_dialog
+====================
+Volltextsuche über alle Job-Logs (core.log_search).
+Filter: Skript, Zeitraum, Status. Doppelklick auf einen Treffer →
+``open_hit(job_id, teil, zeile)`` – das Dashboard öffnet das Log an dieser Stelle.
+Abfragen laufen in einem Hintergrund-Thread; die Tabelle füllt der
+GUI-Thread, sobald das Ergebnis da ist (ältere Antworten werden verworfen).
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import threading
+import time
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QAbstractItemView, QComboBox, QDialog, QHBoxLayout, QHeaderView, QLabel,
+    QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
+)
+
+from core.log_search import log_index
+
+# Anzeigename → Sekunden zurück (None = unbegrenzt)
+RANGES = {
+    "Gesamter Zeitraum": None,
+    "Letzte Stunde": 3_600,
+    "Letzte 24 h": 86_400,
+    "Letzte 7 Tage": 7 * 86_400,
+    "Letzte 30 Tage": 30 * 86_400,
+}
+# Anzeigename → Zustände in der jobs-Tabelle
+STATES = {
+    "Alle": None,
+    "Fertig": ("finished",),
+    "Fehler": ("error",),
+    "Abgebrochen": ("aborted",),
+    "Fehler/Abbruch": ("error", "aborted"),
+}
+STATE_TEXT = {"finished": "✅", "error": "❌", "aborted": "⏹", "running": "⏳"}
+
+
+class LogSearchDialog(QDialog):
+    """Non-modal; bleibt offen, während Treffer im Dashboard geöffnet werden."""
+
+    open_hit = Signal(str, int, int)                # job_id, Log-Teil, Zeile (0-basiert)
+    _found = Signal(int, object, float)             # intern: Nr., Treffer, Dauer (ms)
+    _scripts = Signal(object)                       # intern: Skriptnamen für den Filter
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Logs durchsuchen")
+        self.resize(760, 460)
+        self.setWindowFlag(Qt.Window)
+
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("Suchbegriffe (alle müssen vorkommen, wort* = Präfix)")
+        self.script_combo = QComboBox()
+        self.range_combo = QComboBox()
+        self.range_combo.addItems(list(RANGES))
+        self.state_combo = QComboBox()
+        self.state_combo.addItems(list(STATES))
+        search_btn = QPushButton("Suchen")
+        search_btn.setDefault(True)
+
+        filters = QHBoxLayout()
+        filters.addWidget(self.query_edit, stretch=1)
+        filters.addWidget(self.script_combo)
+        filters.addWidget(self.range_combo)
+        filters.addWidget(self.state_combo)
+        filters.addWidget(search_btn)
+
+        self.results = QTableWidget(0, 5)
+        self.results.setHorizontalHeaderLabels(["", "Zeit", "Skript", "Zeile", "Text"])
+        self.results.verticalHeader().setVisible(False)
+        self.results.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
+        self.status = QLabel()
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(filters)
+        layout.addWidget(self.results, stretch=1)
+        layout.addWidget(self.status)
+
+        self._seq = 0                               # jüngste Suche; ältere Ergebnisse verfallen
+        self.busy = False
+        self.query_edit.returnPressed.connect(self.search)
+        search_btn.clicked.connect(self.search)
+        self.results.cellDoubleClicked.connect(self._on_double_click)
+        self._found.connect(self._on_found)
+        self._scripts.connect(self._on_scripts)
+
+    # ------------------------------------------------------------------
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        log_index.backfill()                        # ältere Logs nachtragen
+        threading.Thread(target=lambda: self._scripts.emit(log_index.scripts()),
+                         name="log-search-scripts", daemon=True).start()
+
+    def search(self) -> None:
+        back = RANGES[self.range_combo.currentText()]
+        kwargs = dict(
+            script=None if self.script_combo.currentIndex() <= 0 else self.script_combo.currentText(),
+            since=None if back is None else time.time() - back,
+            states=STATES[self.state_combo.currentText()],
+        )
+        self._seq += 1
+        self.busy = True
+        self.status.setText("Suche …")
+        threading.Thread(target=self._run, args=(self._seq, self.query_edit.text(), kwargs),
+                         name="log-search", daemon=True).start()
+
+    # ------------------------------------------------------------------
+    def _run(self, seq: int, text: str, kwargs: dict) -> None:
+        t0 = time.perf_counter()
+        try:
+            hits = log_index.search(text, **kwargs)
+        except Exception:                           # nie den Worker sterben lassen
+            hits = []
+        self._found.emit(seq, hits, (time.perf_counter() - t0) * 1000)
+
+    def _on_scripts(self, scripts) -> None:
+        current = self.script_combo.currentText()
+        self.script_combo.clear()
+        self.script_combo.addItem("Alle Skripte")
+        self.script_combo.addItems(scripts)
+        if current:
+            self.script_combo.setCurrentText(current)
+
+    def _on_found(self, seq: int, hits, ms: float) -> None:
+        if seq != self._seq:                        # inzwischen neu gesucht
+            return
+        self.busy = False
+        self.results.setRowCount(len(hits))
+        for row, hit in enumerate(hits):
+            started = (_dt.datetime.fromtimestamp(hit.started).strftime("%Y-%m-%d %H:%M:%S")
+                       if hit.started else "")
+            line = str(hit.lineno + 1) if not hit.part else f"Teil {hit.part}: {hit.lineno + 1}"
+            cells = [STATE_TEXT.get(hit.state, "?"), started, hit.script or hit.job_id,
+                     line, hit.text]
+            for col, value in enumerate(cells):
+                item = QTableWidgetItem(value)
+                if col == 0:
+                    item.setData(Qt.UserRole, (hit.job_id, hit.part, hit.lineno))
+                    item.setToolTip(hit.state)
+                self.results.setItem(row, col, item)
+        self.results.resizeColumnsToContents()
+        self.status.setText(f"{len(hits)} Treffer in {ms:0.0f} ms")
+
+    def _on_double_click(self, row: int, _col: int) -> None:
+        job_id, part, lineno = self.results.item(row, 0).data(Qt.UserRole)
+        self.open_hit.emit(job_id, part, lineno)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+LogViewer – virtualisierte Anzeige einer (wachsenden) Log-Datei.
+
+* Quelle: Log-Datei (``open``) oder Ringpuffer eines Jobs (``attach``,
+  core.output_buffer – ohne jeden Plattenzugriff)
+* Datei wird per core.line_index gemappt, nicht eingelesen
+* gezeichnet werden nur die sichtbaren Zeilen
+* Index wächst im Hintergrund (ein Häppchen pro Event-Loop-Durchlauf);
+  auch ``goto_line`` wartet darauf, statt selbst bis zur Zielzeile zu lesen
+* Tail-Modus: steht der Scrollbalken unten, folgt die Ansicht neuen Zeilen;
+  gelesen werden dabei nur die neu angehängten Bytes. Rotiert das Log
+  (core.log_manager), wechselt sie in ``<job_id>.N+1.log``
+* ``set_live(False)`` (Fenster versteckt/minimiert) stoppt Polling und
+  Indexer; beim Wiederanzeigen wird einmal nachgezogen
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont, QKeySequence, QPainter
+from PySide6.QtWidgets import QAbstractScrollArea, QApplication, QWidget
+
+from core.line_index import LineIndex
+from core.log_manager import parse_log_name
+from core.output_buffer import OutputBuffer
+
+# Abfrage-Intervall für neue Bytes
+POLL_MS = 250
+PLACEHOLDER = "(Noch keine Log-Ausgabe …)"
+
+
+class LogViewer(QAbstractScrollArea):
+    """Read-only Log-Ansicht mit konstanter Öffnungszeit, auch bei GB-Dateien."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setFont(QFont("Consolas", 9))
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.horizontalScrollBar().setSingleStep(self.fontMetrics().averageCharWidth() * 4)
+        self._index: Optional[LineIndex | OutputBuffer] = None
+        self._dropped = 0                    # aus dem Ringpuffer gefallene Zeilen
+        self._follow = True                  # Ansicht klebt am Dateiende
+        self._mark: Optional[int] = None     # hervorgehobene Zeile (Suchtreffer)
+        self._goto: Optional[int] = None     # Sprungziel, bis der Index so weit ist
+        self._live = True                    # False → keine Timer
+
+        self._poll = QTimer(self)
+        self._poll.setInterval(POLL_MS)
+        self._poll.timeout.connect(self._on_poll)
+
+        self._indexer = QTimer(self)         # Interval 0 → ein Häppchen pro Loop
+        self._indexer.setInterval(0)
+        self._indexer.timeout.connect(self._index_step)
+
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def open(self, path: Path) -> None:
+        """Zeigt ``path`` an (darf noch nicht existieren) und folgt dem Ende."""
+        self.attach(LineIndex(path))
+
+    def attach(self, source: LineIndex | OutputBuffer) -> None:
+        """Zeigt eine beliebige Zeilenquelle an (Datei-Index oder Ringpuffer)."""
+        self.close_file()
+        self._index = source
+        self._follow = True
+        self._mark = None
+        self._goto = None
+        self._dropped = getattr(source, "dropped", 0)
+        self._index.refresh()
+        self._update_scrollbar()
+        if self._live:
+            self._indexer.start()
+            self._poll.start()
+        self.viewport().update()
+
+    def set_live(self, live: bool) -> None:
+        """Sichtbar (True) oder versteckt (False) – versteckt läuft kein Timer."""
+        self._live = live
+        if not live:
+            self._poll.stop()
+            self._indexer.stop()
+        elif self._index is not None:
+            self._poll.start()
+            self._on_poll()
+            if not self._index.complete:
+                self._indexer.start()
+
+    def goto_line(self, lineno: int) -> None:
+        """
+        Springt zu Zeile ``lineno`` (0-basiert) und hebt sie hervor. Ist der
+        Index noch nicht so weit, folgt der Sprung, sobald der Hintergrund-
+        Indexer die Zeile erreicht – der GUI-Thread liest dafür nie am Stück.
+        """
+        if self._index is None:
+            return
+        self._follow = False
+        self._mark = lineno
+        if self._index.line_count() <= lineno and not self._index.complete:
+            self._goto = lineno
+            if self._live:
+                self._indexer.start()
+            self.viewport().update()
+            return
+        self._scroll_to(lineno)
+
+    def close_file(self) -> None:
+        self._poll.stop()
+        self._indexer.stop()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        self.verticalScrollBar().setRange(0, 0)
+        self.horizontalScrollBar().setRange(0, 0)
+        self.viewport().update()
+
+    def clear(self) -> None:
+        self.close_file()
+
+    def visible_lines(self) -> List[str]:
+        """Aktuell sichtbarer Text (u. a. für Kopieren und Tests)."""
+        if self._index is None:
+            return []
+        rows = self._rows_per_page()
+        if self._follow and not self._index.complete:
+            return self._index.tail(rows)
+        return self._index.lines(self.verticalScrollBar().value(), rows)
+
+    # ------------------------------------------------------------------
+    # Qt-Events
+    # ------------------------------------------------------------------
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self.viewport())
+        fm = self.fontMetrics()
+        lh = fm.lineSpacing()
+        x = 4 - self.horizontalScrollBar().value()
+        lines = self.visible_lines()
+        first = self._first_visible(len(lines))
+        if not lines and (self._index is None or self._index.size == 0):
+            painter.setPen(self.palette().placeholderText().color())
+            painter.drawText(4, fm.ascent() + 2, PLACEHOLDER)
+            return
+        widest = 0
+        y = fm.ascent() + 2
+        for row, text in enumerate(lines, start=first):
+            if row == self._mark:
+                painter.fillRect(0, y - fm.ascent(), self.viewport().width(), lh,
+                                 self.palette().highlight())
+                painter.setPen(self.palette().highlightedText().color())
+                painter.drawText(x, y, text)
+                painter.setPen(self.palette().text().color())
+            else:
+                painter.drawText(x, y, text)
+            widest = max(widest, len(text))
+            y += lh
+        # horizontale Breite grob aus den sichtbaren Zeilen
+        width = widest * fm.averageCharWidth() + 8
+        hbar = self.horizontalScrollBar()
+        hbar.setRange(0, max(0, width - self.viewport().width(), hbar.maximum()))
+        hbar.setPageStep(self.viewport().width())
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._update_scrollbar()
+
+    def keyPressEvent(self, event) -> None:
+        bar = self.verticalScrollBar()
+        key = event.key()
+        if event.matches(QKeySequence.Copy):
+            QApplication.clipboard().setText("\n".join(self.visible_lines()))
+        elif key == Qt.Key_Home:
+            bar.setValue(0)
+        elif key == Qt.Key_End:
+            bar.setValue(bar.maximum())
+        elif key == Qt.Key_PageUp:
+            bar.setValue(bar.value() - bar.pageStep())
+        elif key == Qt.Key_PageDown:
+            bar.setValue(bar.value() + bar.pageStep())
+        elif key == Qt.Key_Up:
+            bar.setValue(bar.value() - 1)
+        elif key == Qt.Key_Down:
+            bar.setValue(bar.value() + 1)
+        else:
+            super().keyPressEvent(event)
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+    def _scroll_to(self, lineno: int) -> None:
+        self._goto = None
+        self._update_scrollbar()
+        bar = self.verticalScrollBar()
+        bar.blockSignals(True)
+        bar.setValue(max(0, lineno - self._rows_per_page() // 3))
+        bar.blockSignals(False)
+        self.viewport().update()
+
+    def _first_visible(self, shown: int) -> int:
+        if self._index is not None and self._follow and not self._index.complete:
+            return -shown                    # Tail ohne Zeilennummern
+        return self.verticalScrollBar().value()
+
+    def _rows_per_page(self) -> int:
+        return max(1, self.viewport().height() // self.fontMetrics().lineSpacing())
+
+    def _update_scrollbar(self) -> None:
+        bar = self.verticalScrollBar()
+        rows = self._rows_per_page()
+        total = self._index.line_count() if self._index is not None else 0
+        bar.blockSignals(True)
+        bar.setPageStep(rows)
+        bar.setRange(0, max(0, total - rows))
+        if self._follow:
+            bar.setValue(bar.maximum())
+        bar.blockSignals(False)
+
+    def _on_scrolled(self, value: int) -> None:
+        bar = self.verticalScrollBar()
+        self._goto = None                    # Benutzer scrollt selbst → Sprung verwerfen
+        self._follow = value >= bar.maximum()
+        self.viewport().update()
+
+    def _next_part(self) -> Optional[Path]:
+        """``<job_id>.N+1.log``, falls die Ansicht dem Ende von Teil N folgt und es ihn gibt."""
+        if not self._follow or not isinstance(self._index, LineIndex):
+            return None
+        path = self._index.path
+        parsed = parse_log_name(path.name)
+        if parsed is None or path.suffix != ".log":
+            return None
+        job_id, part = parsed
+        nxt = path.with_name(f"{job_id}.{part + 1}.log")
+        return nxt if nxt.exists() else None
+
+    def _index_step(self) -> None:
+        if self._index is None or self._index.complete:
+            self._indexer.stop()
+            return
+        self._index.index_more()
+        self._update_scrollbar()
+        if self._goto is not None and (self._index.line_count() > self._goto
+                                       or self._index.complete):
+            self._scroll_to(self._goto)
+        if self._index.complete:
+            self._indexer.stop()
+            self.viewport().update()
+
+    def _on_poll(self) -> None:
+        if self._index is None:
+            return
+        if not self._index.refresh():
+            # nichts Neues – ist der Job womöglich in den nächsten Teil rotiert?
+            nxt = self._next_part()
+            if nxt is not None:
+                self.open(nxt)
+            return
+        dropped = getattr(self._index, "dropped", 0)
+        if dropped != self._dropped:         # Ringpuffer rotiert → Ansicht mitschieben
+            shift, self._dropped = dropped - self._dropped, dropped
+            if not self._follow:
+                bar = self.verticalScrollBar()
+                bar.blockSignals(True)
+                bar.setValue(max(0, bar.value() - shift))
+                bar.blockSignals(False)
+                if self._mark is not None:
+                    self._mark -= shift
+        self._update_scrollbar()
+        if self._live and not self._index.complete and not self._indexer.isActive():
+            self._indexer.start()
+        self.viewport().update()
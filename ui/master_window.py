@@ -9,27 +9,43 @@ mit Prev/Next und Seitenanzeige unten.
 
 NEU (Patch B):
 - payloads werden vor der Ausführung in absolute Pfade aufgelöst (to_absolute)
-- SCRIPT-Start: im EXE-Modus (sys.frozen) via os.startfile, sonst via Python-Interpreter
+- SCRIPT-Start: im EXE-Modus (sys.frozen) via os.startfile, sonst via ScriptRunner
+  (Task-Dashboard, Log, optionale ``limits`` des Buttons)
+
+Kaltstart: Beim Start wird nur gebaut, was die erste Seite braucht.
+Task-Dashboard, Button-Manager, Runner und Dialoge werden erst bei
+erster Benutzung importiert bzw. erzeugt (das Dashboard spätestens beim
+ersten Job, damit keiner fehlt).
+
+Defekte Buttons (Payload/Icon fehlt, ungültige URL …) meldet
+ui.health_monitor aus dem Hintergrund; sie bekommen ein ⚠ und die
+Probleme im Tooltip.
 """
 from __future__ import annotations
 
 import os
 import subprocess, sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import Qt, QSize, QUrl
 from PySide6.QtGui  import QAction, QDesktopServices, QIcon, QKeySequence, QPalette, QBrush, QPixmap
 from PySide6.QtWidgets import (
-    QLabel, QMainWindow, QPushButton, QStackedWidget,
+    QLabel, QMainWindow, QMessageBox, QPushButton, QStackedWidget,
     QVBoxLayout, QHBoxLayout, QWidget, QGridLayout, QApplication
 )
 
 from core import storage
-from ui.task_dashboard import TaskDashboard
-from ui.button_manager import ButtonManager
+from core.button_index import ButtonIndex
+from core.dispatcher import dispatcher
+from core.tracing import span, traced
 from util.paths import to_absolute  # NEU
 
+from .health_monitor import HealthMonitor, health_monitor
+
+if TYPE_CHECKING:
+    from ui.task_dashboard import TaskDashboard
+
 # -------------------------------------------------------------------
 GRID_ROWS    = 5
 GRID_COLS    = 6
@@ -85,19 +101,27 @@ class MasterWindow(QMainWindow):
 
         self.setCentralWidget(central)
 
-        # Task-Dashboard & Menü-Toolbar
-        self.dashboard = TaskDashboard(self)
+        # Task-Dashboard erst bei Bedarf (Menü oder erster Job)
+        self._dashboard: Optional[TaskDashboard] = None
+        dispatcher.job_started.connect(self._on_first_job)
         self._init_menu_and_toolbar()
 
+        # Payload-/Icon-Prüfung im Hintergrund → Badges
+        self._btn_widgets: List[Tuple[QPushButton, dict]] = []
+        self.health: HealthMonitor = health_monitor()
+        self.health.updated.connect(self._apply_health)
+
         # Erste Seiten erzeugen und anzeigen
         self._rebuild_pages()
+        self.health.watch(self.cfg)
 
     # -----------------------------------------------------------------
     def _init_menu_and_toolbar(self) -> None:
         """Menü- und Toolbar-Einträge (bleiben unverändert)."""
         menu = self.menuBar()
-        menu.addAction("Task-Dashboard", self.dashboard.show)
+        menu.addAction("Task-Dashboard", lambda: self.dashboard.show())
         menu.addAction("Button-Manager", self._open_manager)
+        menu.addAction("Diagnose", self._open_diagnostics)
 
         nav_tb = self.addToolBar("Navigation")
         nav_tb.setMovable(False)
@@ -120,18 +144,38 @@ class MasterWindow(QMainWindow):
         act_settings.triggered.connect(self._open_settings)
         nav_tb.addAction(act_settings)
 
+    # -----------------------------------------------------------------
+    @property
+    def dashboard(self) -> TaskDashboard:
+        """Task-Dashboard – wird beim ersten Zugriff gebaut."""
+        if self._dashboard is None:
+            from .task_dashboard import TaskDashboard
+            with span("dashboard_init", "ui"):
+                self._dashboard = TaskDashboard(self)
+            self._dashboard.model.set_retention(self.cfg.get("dashboard", {}).get("keep_finished"))
+            dispatcher.job_started.disconnect(self._on_first_job)
+        return self._dashboard
+
+    def _on_first_job(self, job_id: str, name: str) -> None:
+        """Erster Job vor dem ersten Öffnen: Dashboard bauen und den Start nachtragen."""
+        if self._dashboard is None:
+            self.dashboard.model._on_job_started(job_id, name)
+
     # -----------------------------------------------------------------
     def _children_of(self, parent_id: str|None):
         """Alle Buttons in config, deren parent == parent_id."""
-        return [b for b in self.cfg["buttons"] if b["parent"] == parent_id]
+        return list(self._index.children(parent_id))
 
     # -----------------------------------------------------------------
+    @traced("rebuild_pages", "ui")
     def _rebuild_pages(self) -> None:
         """
         Baut für jedes Menü-Level (parent_id) statisch so viele
         Seiten à MAX_PER_PAGE Buttons, wie benötigt.
         """
+        self._index = ButtonIndex(self.cfg["buttons"])   # statt Listensuche pro Menü
         self.nav_stack = [None]
+        self._btn_widgets.clear()
         self.pages_for_parent.clear()
         self.page_for_id.clear()
 
@@ -159,13 +203,15 @@ class MasterWindow(QMainWindow):
                         r, c = divmod(idx, GRID_COLS)
                     btn = QPushButton(cfg_btn["id"])
                     if ico := cfg_btn.get("icon"):
-                        icon = QIcon(ico)
+                        with span("icon_decode", "ui", path=ico):
+                            icon = QIcon(ico)
+                            sz  = icon.availableSizes()
                         btn.setIcon(icon)
-                        sz  = icon.availableSizes()
                         btn.setIconSize(sz[0] if sz else QSize(64,64))
                     if desc := cfg_btn.get("description"):
                         btn.setToolTip(desc)
                     btn.clicked.connect(lambda _, b=cfg_btn: self._on_click(b))
+                    self._btn_widgets.append((btn, cfg_btn))
                     grid.addWidget(btn, r, c)
                 pages.append(page)
             return pages
@@ -191,6 +237,19 @@ class MasterWindow(QMainWindow):
         self.act_back.setEnabled(False)
         self._update_breadcrumb()
         self._update_pagination_controls()
+        self._apply_health()                    # letzter Stand, bis der nächste Lauf meldet
+
+    # -----------------------------------------------------------------
+    def _apply_health(self) -> None:
+        """⚠-Badge und Tooltip für Buttons mit Problemen (nur geänderte anfassen)."""
+        for widget, cfg_btn in self._btn_widgets:
+            issues = self.health.issues(cfg_btn)
+            if widget.property("health_issues") == list(issues):
+                continue
+            widget.setProperty("health_issues", list(issues))
+            widget.setText(f"⚠ {cfg_btn['id']}" if issues else cfg_btn["id"])
+            tip = "\n".join(filter(None, [cfg_btn.get("description"), *issues]))
+            widget.setToolTip(tip)
 
     # -----------------------------------------------------------------
     def _update_pagination_controls(self) -> None:
@@ -202,6 +261,7 @@ class MasterWindow(QMainWindow):
         self.page_label.setText(f"Seite {idx+1} von {total}")
 
     # -----------------------------------------------------------------
+    @traced("page_prev", "nav")
     def _on_prev_clicked(self) -> None:
         pid = self.nav_stack[-1]
         idx = self.current_page_idx[pid]
@@ -211,6 +271,7 @@ class MasterWindow(QMainWindow):
             self._update_pagination_controls()
 
     # -----------------------------------------------------------------
+    @traced("page_next", "nav")
     def _on_next_clicked(self) -> None:
         pid = self.nav_stack[-1]
         idx = self.current_page_idx[pid]
@@ -220,6 +281,7 @@ class MasterWindow(QMainWindow):
             self._update_pagination_controls()
 
     # -----------------------------------------------------------------
+    @traced("button_click", "nav")
     def _on_click(self, cfg: dict) -> None:
         act = cfg["action"]
 
@@ -245,7 +307,9 @@ class MasterWindow(QMainWindow):
                     # Fallback: py-Launcher versuchen (falls vorhanden)
                     subprocess.Popen(["py", "-3", payload_abs], shell=False)
             else:
-                subprocess.Popen([sys.executable, payload_abs], shell=False)
+                from core.models import JobLimits
+                from core.runner import run_script_async
+                run_script_async(Path(payload_abs), JobLimits.from_config(cfg.get("limits")))
 
         elif act == "FILE":
             # Datei im Standardprogramm öffnen
@@ -262,6 +326,7 @@ class MasterWindow(QMainWindow):
             subprocess.Popen(f'explorer "{payload_abs}"')
 
     # -----------------------------------------------------------------
+    @traced("go_back", "nav")
     def _go_back(self) -> None:
         if len(self.nav_stack) <= 1:
             return
@@ -274,6 +339,7 @@ class MasterWindow(QMainWindow):
         self._update_pagination_controls()
 
     # -----------------------------------------------------------------
+    @traced("go_home", "nav")
     def _go_home(self) -> None:
         self.nav_stack = [None]
         self.current_page_idx[None] = 0
@@ -287,12 +353,44 @@ class MasterWindow(QMainWindow):
         crumbs = ["Start"] + self.nav_stack[1:]
         self._breadcrumb.setText(" / ".join(crumbs))
 
+    # -----------------------------------------------------------------
+    def handle_instance_request(self, argv: list) -> None:
+        """
+        Anfrage eines weiteren Starts (core.instance_server) bzw. eigene
+        Kommandozeile: Fenster nach vorne holen, ``--run X`` ausführen.
+        Unbekannte Ziele meldet ein (nicht-modaler) Hinweis.
+        """
+        from core.cli import CliError, resolve_button
+        from core.single_instance import run_targets
+
+        if self.isMinimized():
+            self.showNormal()
+        else:
+            self.show()
+        self.raise_()
+        self.activateWindow()
+        errors = []
+        for ref in run_targets(argv):
+            try:
+                btn = resolve_button(self.cfg, ref)
+            except CliError as e:
+                errors.append(str(e))
+                continue
+            self._on_click(btn)
+        if errors:
+            box = QMessageBox(QMessageBox.Warning, "--run nicht möglich", "\n".join(errors),
+                              QMessageBox.Ok, self)
+            box.setAttribute(Qt.WA_DeleteOnClose)
+            box.open()                       # nicht blockieren – kommt evtl. aus einem Socket-Slot
+
     # -----------------------------------------------------------------
     def _open_manager(self) -> None:
-        dlg = ButtonManager(self.cfg, self.cfg_path, self)
+        from .button_manager import ButtonManager
+        dlg = ButtonManager(self.cfg, self.cfg_path, self, health=self.health)
         if dlg.exec():
             storage.save_config(self.cfg_path, self.cfg)
             self._rebuild_pages()
+        self.health.recheck()
 
     # -----------------------------------------------------------------
     def _open_settings(self) -> None:
@@ -301,6 +399,14 @@ class MasterWindow(QMainWindow):
         dlg = SettingsDialog(self.cfg, self.cfg_path, self)
         dlg.exec()
 
+    # -----------------------------------------------------------------
+    def _open_diagnostics(self) -> None:
+        """Hänger der Oberfläche und Speicherverlauf, non-modal."""
+        from .diagnostics_dialog import DiagnosticsDialog
+        dlg = DiagnosticsDialog(self)
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        dlg.show()
+
     # -----------------------------------------------------------------
     def apply_background(self, bg_path: str) -> None:
         """
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+ui.metrics_panel
+================
+Live-Kennzahlen im Task-Dashboard (Quelle: core.metrics).
+
+* ``EventLoopProbe`` misst, wie verspätet ein Timer im GUI-Thread feuert –
+  das ist die Verzögerung, die der Benutzer bei Klicks spürt. Eine Instanz
+  legt main.py beim Start an (misst unabhängig vom Dashboard).
+* ``MetricsPanel`` zeigt Jobs pro Minute, Warteschlange, Zeilen/s,
+  Spawn-Latenz, Event-Loop-Verzögerung und Laufzeit-Perzentile pro Skript;
+  aktualisiert wird nur, solange das Panel sichtbar ist. Warteschlange,
+  Zeilen/s und Spawn-Latenz gibt es nur ohne Job-Daemon (sonst „–“).
+* „Exportieren …“ schreibt alle Metriken im Prometheus-Textformat.
+"""
+from __future__ import annotations
+
+import time
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtWidgets import (
+    QAbstractItemView, QFileDialog, QGridLayout, QHeaderView, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
+)
+
+from core import runner
+from core.metrics import (
+    JOB_DURATION, JOBS_RUNNING, LOOP_LAG, QUEUE_DEPTH, SPAWN_LATENCY, job_metrics, metrics,
+)
+
+# Messintervall Event-Loop (ms) – selten genug, um im Leerlauf nicht aufzufallen
+PROBE_MS = 1_000
+# Aktualisierung des sichtbaren Panels (ms)
+REFRESH_MS = 2_000
+# Kennzahlen, die nur der ausführende Prozess misst (siehe core.metrics)
+LOCAL_ONLY = ("queued", "lines", "spawn")
+
+
+def _ms(seconds: float | None) -> str:
+    return "–" if seconds is None else f"{seconds * 1000:0.0f} ms"
+
+
+def _secs(seconds: float | None) -> str:
+    return "–" if seconds is None else f"{seconds:0.1f} s"
+
+
+class EventLoopProbe(QObject):
+    """Feuert alle PROBE_MS; die Verspätung gegenüber dem Soll landet in LOOP_LAG."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.last_lag = 0.0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(PROBE_MS)
+        self._timer.timeout.connect(self._on_timeout)
+        self._due = time.monotonic() + PROBE_MS / 1000
+        self._timer.start()
+
+    def _on_timeout(self) -> None:
+        now = time.monotonic()
+        self.last_lag = max(0.0, now - self._due)
+        LOOP_LAG.observe(self.last_lag)
+        self._due = now + PROBE_MS / 1000
+
+
+class MetricsPanel(QWidget):
+    """Kompakte Kennzahlen-Übersicht; oben Zahlen, unten Perzentile pro Skript."""
+
+    FIELDS = [
+        ("started", "Gestartet / min"),
+        ("finished", "Fertig / min"),
+        ("failed", "Fehler+Abbruch / min"),
+        ("running", "Laufend"),
+        ("queued", "Warteschlange"),
+        ("lines", "Zeilen / s"),
+        ("spawn", "Spawn-Latenz p50 / p95"),
+        ("lag", "Event-Loop-Verzögerung p95 / max"),
+    ]
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.values: dict[str, QLabel] = {}
+
+        grid = QGridLayout()
+        for i, (key, title) in enumerate(self.FIELDS):
+            label = QLabel("–")
+            label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            self.values[key] = label
+            grid.addWidget(QLabel(title + ":"), i // 4, (i % 4) * 2)
+            grid.addWidget(label, i // 4, (i % 4) * 2 + 1)
+
+        self.scripts = QTableWidget(0, 5)
+        self.scripts.setHorizontalHeaderLabels(["Skript", "Läufe", "p50", "p95", "p99"])
+        self.scripts.verticalHeader().setVisible(False)
+        self.scripts.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.scripts.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.scripts.setMaximumHeight(140)
+
+        export_btn = QPushButton("Exportieren …")
+        export_btn.setToolTip("Alle Metriken im Prometheus-Textformat speichern")
+        export_btn.clicked.connect(self._export)
+        grid.addWidget(export_btn, 0, 8)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(grid)
+        layout.addWidget(self.scripts)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    # ------------------------------------------------------------------
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._timer.stop()
+
+    def refresh(self) -> None:
+        v = self.values
+        v["started"].setText(f"{job_metrics.started.per_minute():0.0f}")
+        v["finished"].setText(f"{job_metrics.finished.per_minute():0.0f}")
+        v["failed"].setText(f"{job_metrics.failed.per_minute():0.0f}")
+        v["running"].setText(f"{JOBS_RUNNING.value():0.0f}")
+        v["queued"].setText(f"{QUEUE_DEPTH.value():0.0f}")
+        v["lines"].setText(f"{job_metrics.lines.per_minute() / 60:0.1f}")
+        v["spawn"].setText(f"{_ms(SPAWN_LATENCY.quantile(0.5))} / {_ms(SPAWN_LATENCY.quantile(0.95))}")
+        v["lag"].setText(f"{_ms(LOOP_LAG.quantile(0.95))} / {_ms(LOOP_LAG.max())}")
+        daemon = runner.backend() is not None
+        for key in LOCAL_ONLY:
+            if daemon:
+                v[key].setText("–")
+            v[key].setToolTip("Wird im Job-Daemon gemessen, nicht in dieser GUI" if daemon else "")
+
+        label_sets = JOB_DURATION.label_sets()
+        self.scripts.setRowCount(len(label_sets))
+        for row, labels in enumerate(label_sets):
+            cells = [labels[0], str(JOB_DURATION.count(labels))] + [
+                _secs(JOB_DURATION.quantile(q, labels)) for q in (0.5, 0.95, 0.99)
+            ]
+            for col, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if col:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.scripts.setItem(row, col, item)
+
+    def _export(self) -> None:
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Metriken exportieren", "metrics.prom", "Prometheus (*.prom);;Text (*.txt)"
+        )
+        if path:
+            metrics.write(path)
@@ -2,164 +2,195 @@
 """
 TaskDashboard – zeigt alle laufenden & erledigten Skripte.
 
-* Tabelle oben: ID | Skript | Status | Laufzeit | Fortschritt | Stop
-* QTextEdit unten: Live-Log des selektierten Jobs
+* Tabelle oben: ID | Skript | Status | Laufzeit | CPU | RAM | I/O | Fortschritt | Stop
+  (QTableView über ui.job_model – Balken & Stop-Button malt der Delegate)
+* Filterzeile: Freitext auf den Skript-Namen + Zustand, „Logs durchsuchen …“
+* LogViewer unten: jüngste Ausgabe des selektierten Jobs aus dem Ringpuffer
+  (sofort, ohne Plattenzugriff); „Ganzes Log“ öffnet die Datei (mmap)
+* versteckt oder minimiert ruht jede Aktualisierung (Model & Viewer);
+  beim Wiederanzeigen kommt der aktuelle Stand in einem Schwung
+* „Metriken“ blendet Live-Kennzahlen ein (ui.metrics_panel, core.metrics)
+* „Ältere Jobs laden“ holt aus dem Speicher entlassene Jobs seitenweise aus
+  der Historie; beim Schließen werden sie wieder freigegeben
 """
 from __future__ import annotations
 
-import datetime as _dt
-from pathlib import Path
-from typing import Dict
-
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QEvent, Qt
 from PySide6.QtWidgets import (
-    QDialog, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
-    QProgressBar, QTextEdit
+    QAbstractItemView, QComboBox, QDialog, QHBoxLayout, QHeaderView, QLabel,
+    QLineEdit, QPushButton, QTableView, QVBoxLayout, QWidget,
 )
 
-from core.dispatcher import dispatcher
-from core.runner import RUNNERS
+from core.log_manager import log_manager
+from ui.job_model import JobDelegate, JobFilterProxy, JobIdRole, JobTableModel
+from ui.log_search_dialog import LogSearchDialog
+from ui.log_viewer import LogViewer
+from ui.metrics_panel import MetricsPanel
 
 
 class TaskDashboard(QDialog):
     """Singleton-Fenster (non-modal) – blockiert das Hauptfenster NICHT."""
 
-    COL_JOBID = 0
-    COL_NAME = 1
-    COL_STATUS = 2
-    COL_RUNTIME = 3
-    COL_PROGRESS = 4
-    COL_STOP = 5
+    COL_JOBID = JobTableModel.COL_JOBID
+    COL_NAME = JobTableModel.COL_NAME
+    COL_STATUS = JobTableModel.COL_STATUS
+    COL_RUNTIME = JobTableModel.COL_RUNTIME
+    COL_CPU = JobTableModel.COL_CPU
+    COL_RSS = JobTableModel.COL_RSS
+    COL_IO = JobTableModel.COL_IO
+    COL_PROGRESS = JobTableModel.COL_PROGRESS
+    COL_STOP = JobTableModel.COL_STOP
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Task-Dashboard")
         self.resize(720, 480)
         self.setWindowFlag(Qt.Window)               # eigenes Fenster
-        self._rows: Dict[str, int] = {}             # job_id → Zeilennummer
-        self._starts: Dict[str, _dt.datetime] = {}
-
-        # ------------------------- Widgets
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(
-            ["Job-ID", "Skript", "Status", "Laufzeit", "Fortschritt", ""]
-        )
+        self._log_job: str | None = None            # angezeigter Job
+        self._search: LogSearchDialog | None = None
+
+        # ------------------------- Model/View
+        self.model = JobTableModel(self)
+        self.proxy = JobFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setItemDelegate(JobDelegate(self.table))
         self.table.setColumnHidden(self.COL_JOBID, True)     # nicht nötig
-        self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(-1, Qt.AscendingOrder)       # Startreihenfolge
+        vh = self.table.verticalHeader()
+        vh.setVisible(False)
+        vh.setSectionResizeMode(QHeaderView.Fixed)           # keine Höhenberechnung pro Zeile
+        vh.setDefaultSectionSize(self.fontMetrics().height() + 10)
         self.table.setColumnWidth(self.COL_STOP, 70)
-
-        self.log_view = QTextEdit()
-        self.log_view.setReadOnly(True)
-        self.log_view.setFont(QFont("Consolas", 9))
+        self.table.setColumnWidth(self.COL_PROGRESS, 140)
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter (Skript-Name) …")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.proxy.setFilterFixedString)
+        self.state_combo = QComboBox()
+        self.state_combo.addItems(list(JobFilterProxy.STATES))
+        self.state_combo.currentTextChanged.connect(self.proxy.set_state_filter)
+
+        filter_row = QHBoxLayout()
+        filter_row.addWidget(self.filter_edit, stretch=1)
+        filter_row.addWidget(self.state_combo)
+        search_btn = QPushButton("Logs durchsuchen …")
+        search_btn.clicked.connect(self._open_search)
+        filter_row.addWidget(search_btn)
+        self.history_btn = QPushButton("Ältere Jobs laden")
+        self.history_btn.setToolTip("Abgeschlossene Jobs aus der Historie nachladen")
+        self.history_btn.clicked.connect(self._load_history)
+        filter_row.addWidget(self.history_btn)
+        self.metrics_btn = QPushButton("Metriken")
+        self.metrics_btn.setCheckable(True)
+        filter_row.addWidget(self.metrics_btn)
+
+        self.metrics_panel = MetricsPanel()
+        self.metrics_panel.setVisible(False)
+        self.metrics_btn.toggled.connect(self.metrics_panel.setVisible)
+
+        self.log_view = LogViewer()
 
         layout = QVBoxLayout(self)
+        layout.addLayout(filter_row)
+        layout.addWidget(self.metrics_panel)
         layout.addWidget(self.table, stretch=3)
-        layout.addWidget(QLabel("Log-Ausgabe"), 0, Qt.AlignLeft)
+        self.full_log_btn = QPushButton("Ganzes Log")
+        self.full_log_btn.setToolTip("Vollständige Log-Datei statt der jüngsten Zeilen anzeigen")
+        self.full_log_btn.setEnabled(False)
+        self.full_log_btn.clicked.connect(self._open_full_log)
+        log_row = QHBoxLayout()
+        log_row.addWidget(QLabel("Log-Ausgabe"))
+        log_row.addStretch()
+        log_row.addWidget(self.full_log_btn)
+        layout.addLayout(log_row)
         layout.addWidget(self.log_view, stretch=2)
 
-        # ------------------------- Signale
-        dispatcher.job_started.connect(self._on_job_started)
-        dispatcher.job_progress.connect(self._on_job_progress)
-        dispatcher.job_finished.connect(self._on_job_finished)
-        dispatcher.job_aborted.connect(self._on_job_aborted)
-        dispatcher.job_error.connect(self._on_job_error)
-
-        self.table.itemSelectionChanged.connect(self._show_selected_log)
-
-        # Timer → Laufzeitspalte tickt jede Sekunde
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_runtimes)
-        self._timer.start(1_000)
+        self.table.selectionModel().selectionChanged.connect(self._show_selected_log)
+        self._set_live(False)                       # erst beim Anzeigen aktualisieren
 
     # ---------------------------------------------------------------------
-    # Slot-Implementierungen
+    # Sichtbarkeit → Aktualisierung an/aus
     # ---------------------------------------------------------------------
-    def _on_job_started(self, job_id: str, name: str) -> None:
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        self._rows[job_id] = row
-        self._starts[job_id] = _dt.datetime.now()
-
-        # ID
-        self.table.setItem(row, self.COL_JOBID, QTableWidgetItem(job_id))
-        # Skript-Name
-        self.table.setItem(row, self.COL_NAME, QTableWidgetItem(name))
-        # Status
-        self.table.setItem(row, self.COL_STATUS, QTableWidgetItem("⏳ Läuft"))
-        # Laufzeit
-        self.table.setItem(row, self.COL_RUNTIME, QTableWidgetItem("0 s"))
-        # Fortschritt
-        pb = QProgressBar()
-        pb.setRange(0, 100)
-        pb.setValue(0)
-        self.table.setCellWidget(row, self.COL_PROGRESS, pb)
-        # Stop-Button
-        stop_btn = QPushButton("Stop")
-        stop_btn.clicked.connect(lambda _, jid=job_id: self._abort_job(jid))
-        self.table.setCellWidget(row, self.COL_STOP, stop_btn)
-
-    # --------------------------------
-    def _on_job_progress(self, job_id: str, percent: int, msg: str) -> None:
-        if job_id not in self._rows:
-            return
-        row = self._rows[job_id]
-        # Fortschritt aktualisieren
-        if percent >= 0:
-            pb = self.table.cellWidget(row, self.COL_PROGRESS)
-            if isinstance(pb, QProgressBar):
-                pb.setValue(percent)
-        # Log anhängen (falls Job selektiert)
-        if self._current_job_id() == job_id:
-            self.log_view.append(msg)
-
-    # --------------------------------
-    def _on_job_finished(self, job_id: str) -> None:
-        self._set_status(job_id, "✅ Fertig")
-
-    def _on_job_aborted(self, job_id: str) -> None:
-        self._set_status(job_id, "⏹ Abgebrochen")
-
-    def _on_job_error(self, job_id: str, err: str) -> None:
-        self._set_status(job_id, f"❌ Fehler: {err}")
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._set_live(not self.isMinimized())
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._set_live(False)
+        self.model.drop_archived()                  # Speicher nur für aktive + Fenster
+        self.history_btn.setEnabled(True)
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._set_live(self.isVisible() and not self.isMinimized())
+
+    def _set_live(self, live: bool) -> None:
+        self.model.set_live(live)
+        self.log_view.set_live(live)
 
     # ---------------------------------------------------------------------
     # Helper
     # ---------------------------------------------------------------------
-    def _set_status(self, job_id: str, text: str) -> None:
-        if job_id in self._rows:
-            self.table.item(self._rows[job_id], self.COL_STATUS).setText(text)
-
-    def _abort_job(self, job_id: str) -> None:
-        dispatcher.job_abort_req.emit(job_id)                # Runner hört zu
-
-    def _update_runtimes(self) -> None:
-        now = _dt.datetime.now()
-        for job_id, start in self._starts.items():
-            if job_id in self._rows:
-                elapsed = now - start
-                sec = int(elapsed.total_seconds())
-                self.table.item(self._rows[job_id], self.COL_RUNTIME).setText(f"{sec}s")
-
-    # --------------------------------
     def _current_job_id(self) -> str | None:
         rows = self.table.selectionModel().selectedRows()
         if rows:
-            return self.table.item(rows[0].row(), self.COL_JOBID).text()
+            return rows[0].data(JobIdRole)
         return None
 
+    def _load_history(self) -> None:
+        if not self.model.load_archived():
+            self.history_btn.setEnabled(False)      # Historie erschöpft
+
+    def _open_search(self) -> None:
+        if self._search is None:
+            self._search = LogSearchDialog(self)
+            self._search.open_hit.connect(self.open_log_at)
+        self._search.show()
+        self._search.raise_()
+
+    def open_log_at(self, job_id: str, part: int, lineno: int) -> None:
+        """Log-Teil von ``job_id`` an Zeile ``lineno`` öffnen (auch ältere Sitzungen)."""
+        row = self.model.row_of(job_id)
+        proxy_index = (self.proxy.mapFromSource(self.model.index(row, 0))
+                       if row is not None else None)
+        if proxy_index is not None and proxy_index.isValid():
+            self.table.selectRow(proxy_index.row())
+            self.table.scrollTo(proxy_index)
+        else:
+            self.table.clearSelection()
+            self._log_job = job_id
+            self.full_log_btn.setEnabled(True)
+        self.log_view.open(log_manager.find(job_id, part))
+        self.log_view.goto_line(lineno)
+        self.show()
+        self.raise_()
+
     def _show_selected_log(self) -> None:
         job_id = self._current_job_id()
+        if job_id == self._log_job:
+            return
+        self._log_job = job_id
+        self.full_log_btn.setEnabled(bool(job_id))
         if not job_id:
             self.log_view.clear()
             return
-
-        log_path = Path("logs") / f"{job_id}.log"
-        if log_path.exists():
-            self.log_view.setPlainText(log_path.read_text(encoding="utf-8"))
+        buffer = self.model.output(job_id)
+        if buffer is not None:
+            self.log_view.attach(buffer)             # jüngste Zeilen aus dem RAM
         else:
-            self.log_view.setPlainText("(Noch keine Log-Ausgabe …)")
+            self.log_view.open(log_manager.latest(job_id))
+
+    def _open_full_log(self) -> None:
+        if self._log_job:
+            # nur mappen, nicht einlesen – neue Zeilen holt der Viewer selbst
+            self.log_view.open(log_manager.latest(self._log_job))
@@ -34,9 +34,10 @@ def project_root() -> Path:
 def to_relative(path: str | Path) -> str:
     """
     Wandelt einen absoluten Pfad – falls innerhalb des Projekts –
-    in einen relativen um. Externe Pfade bleiben unverändert.
+    in einen relativen um. Externe Pfade bleiben unverändert; bereits
+    relative Pfade gelten als relativ zum Projekt-Root (nicht zum CWD).
     """
-    p = Path(path).expanduser().resolve()
+    p = to_absolute(Path(path).expanduser()).resolve()
     try:
         return str(p.relative_to(_PROJECT_ROOT))
     except ValueError: